@@ -54,13 +54,9 @@ The workflow to generate the WKTs is described as follows:
 
     stop
 """
-import logging.config
-import os
-from logging import debug
 from logging import getLogger
 from logging import NullHandler
-from logging import setLogRecordFactory
-from logging import warning
+from typing import Optional
 
 from ._version import __author__
 from ._version import __author_email__
@@ -70,20 +66,44 @@ from ._version import __license__
 from ._version import __name_soft__
 from ._version import __title__
 from ._version import __url__
-from ._version import __version__
-from .custom_logging import LogRecord
-from .custom_logging import UtilsLogs
 
 getLogger(__name__).addHandler(NullHandler())
 
-UtilsLogs.add_logging_level("TRACE", 15)
-try:
-    PATH_TO_CONF = os.path.dirname(os.path.realpath(__file__))
-    logging.config.fileConfig(
-        os.path.join(PATH_TO_CONF, "logging.conf"),
-        disable_existing_loggers=False,
+# resolved by __getattr__ when it is first read
+__version__: str
+
+
+def __getattr__(name: str) -> str:
+    """Resolves the version of the package when it is first read.
+
+    Args:
+        name (str): name of the attribute
+
+    Raises:
+        AttributeError: Unknown attribute
+
+    Returns:
+        str: the version
+    """
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import _version  # pylint: disable=import-outside-toplevel
+
+    return _version.__version__
+
+
+def configure_logging(config_file: Optional[str] = None):
+    """Configures the logging of csvForWKT.
+
+    Nothing is configured when the package is imported: the CLI calls this
+    function and an application embedding the library may call it.
+
+    Args:
+        config_file (Optional[str], optional): logging configuration file.
+        Defaults to the logging.conf of the package.
+    """
+    from .custom_logging import (  # pylint: disable=import-outside-toplevel
+        UtilsLogs,
     )
-    debug(f"file {os.path.join(PATH_TO_CONF, 'logging.conf')} loaded")
-except Exception as exception:  # pylint: disable=broad-except
-    warning(f"cannot load logging.conf : {exception}")
-setLogRecordFactory(LogRecord)  # pylint: disable=no-member
+
+    UtilsLogs.configure_logging(config_file)
@@ -22,14 +22,32 @@ import logging
 import os
 import signal
 import sys
+import time
+from typing import Any
 from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
 
-from .csvforwkt import CsvforwktLib
 from csvforwkt import __author__
 from csvforwkt import __copyright__
 from csvforwkt import __description__
-from csvforwkt import __version__
+from csvforwkt import configure_logging
+from csvforwkt import tracing
+from csvforwkt._version import __name_soft__
+from csvforwkt.checkpoint import Checkpoint
+from csvforwkt.crs import BodyCrs
 from csvforwkt.crs import ICrs
+from csvforwkt.custom_logging import QueueLogging
+from csvforwkt.metrics import PipelineMetrics
+from csvforwkt.monitoring import MemoryProfiler
+from csvforwkt.perfgate import PerfGate
+from csvforwkt.profiling import CliProfiler
+from csvforwkt.profiling import ProfileFormat
+from csvforwkt.tracing import TraceFormat
+from csvforwkt.tracing import Tracer
+from csvforwkt.writer import OutputFormat
 
 
 class SmartFormatter(argparse.HelpFormatter):
@@ -53,6 +71,10 @@ class SigintHandler:  # pylint: disable=too-few-public-methods
     def signal_handler(self, sig: int, frame):
         """Trap the signal
 
+        The queued logs are written by the finally block of `run`, not in
+        the handler, which may interrupt the thread holding the lock of the
+        queue logging.
+
         Args:
             sig (int): the signal number
             frame: the current stack frame
@@ -63,6 +85,28 @@ class SigintHandler:  # pylint: disable=too-few-public-methods
         sys.exit(2)
 
 
+class VersionAction(argparse.Action):
+    """Prints the version, read from the metadata of the distribution only
+    when it is requested."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, **kwargs):
+        super().__init__(
+            option_strings,
+            dest,
+            nargs=0,
+            default=argparse.SUPPRESS,
+            help="show program's version number and exit",
+            **kwargs,
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from ._version import (  # pylint: disable=import-outside-toplevel
+            __version__,
+        )
+
+        parser.exit(message=f"{parser.prog} {__version__}\n")
+
+
 def str2bool(string_to_test: str) -> bool:
     """Checks if a given string is a boolean
 
@@ -75,9 +119,51 @@ def str2bool(string_to_test: str) -> bool:
     return string_to_test.lower() in ("yes", "true", "True", "t", "1")
 
 
-def parse_cli() -> argparse.Namespace:
+def _add_report_arguments(
+    parser: argparse.ArgumentParser, required: bool = True
+):
+    """Add the arguments describing the IAU report.
+
+    Args:
+        parser (argparse.ArgumentParser): parser
+        required (bool, optional): True when the arguments are required.
+        Defaults to True.
+    """
+    parser.add_argument(
+        "--iau_report",
+        required=required,
+        help="The location of the IAU CSV file.",
+    )
+
+    parser.add_argument(
+        "--iau_version",
+        type=int,
+        required=required,
+        help="Year of the IAU report (ex: 2015)",
+    )
+
+    parser.add_argument(
+        "--iau_doi",
+        required=required,
+        help="DOI of the IAU report (ex: doi:10.1007/s10569-017-9805-5)",
+    )
+
+    parser.add_argument(
+        "--projection_catalogue",
+        help="JSON, TOML or CSV file describing the projections (default: built-in projections)",
+    )
+
+
+def parse_cli(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse command line inputs.
 
+    Without command, the WKT-CRS are generated from the IAU report.
+
+    Parameters
+    ----------
+    argv: Optional[List[str]]
+        Command line arguments (default: sys.argv[1:])
+
     Returns
     -------
     argparse.Namespace
@@ -88,33 +174,125 @@ def parse_cli() -> argparse.Namespace:
         formatter_class=SmartFormatter,
         epilog=__author__ + " - " + __copyright__,
     )
+    parser.add_argument("-v", "--version", action=VersionAction)
+    parser.set_defaults(func=generate)
+
+    _add_report_arguments(parser, required=False)
+
     parser.add_argument(
-        "-v", "--version", action="version", version="%(prog)s " + __version__
+        "--output_directory",
+        default=os.getcwd(),
+        help="The output directory where the data products are created (default: %(default)s)",
+    )
+
+    selection = parser.add_argument_group(
+        "selection", "Generate only a subset of the CRS"
+    )
+    selection.add_argument(
+        "--bodies",
+        help="Comma separated names or Naif IDs of the bodies (ex: Mars,Moon,599)",
+    )
+    selection.add_argument(
+        "--naif_range",
+        "--naif-range",
+        help="Range of Naif IDs, bounds included (ex: 400:499)",
+    )
+    selection.add_argument(
+        "--crs_types",
+        "--crs-types",
+        help="Comma separated types of body CRS: ocentric, ographic",
+    )
+    selection.add_argument(
+        "--shapes",
+        help="Comma separated shapes: sphere, ellipse, triaxial",
+    )
+    selection.add_argument(
+        "--projections",
+        help="Comma separated offsets or methods of the projections, none for no projected CRS (ex: 10,15,Mollweide)",
+    )
+    selection.add_argument(
+        "--codes",
+        help="Comma separated IAU codes (ex: 49900,49910)",
+    )
+    selection.add_argument(
+        "--shard",
+        help="Generate only the shard i of N: the bodies whose Naif ID modulo N is i - 1 (ex: 1/4)",
     )
 
     parser.add_argument(
-        "--iau_report",
-        required=True,
-        help="The location of the IAU CSV file.",
+        "--format",
+        choices=[output_format.format_name for output_format in OutputFormat],
+        default=OutputFormat.WKT.format_name,
+        help="Format of the data product (default: %(default)s)",
     )
 
     parser.add_argument(
-        "--iau_version",
+        "--batch_size",
         type=int,
-        required=True,
-        help="Year of the IAU report (ex: 2015)",
+        default=1000,
+        help="Number of CRS written by batch (default: %(default)s)",
     )
 
     parser.add_argument(
-        "--iau_doi",
-        required=True,
-        help="DOI of the IAU report (ex: doi:10.1007/s10569-017-9805-5)",
+        "--checkpoint_interval",
+        "--checkpoint-interval",
+        type=float,
+        metavar="SECONDS",
+        help="Save a checkpoint of the wkt or jsonl output at most every SECONDS, to resume the run with --resume (default: no checkpoint, 60 with --resume)",
     )
 
     parser.add_argument(
-        "--output_directory",
-        default=os.getcwd(),
-        help="The output directory where the data products are created (default: %(default)s)",
+        "--resume",
+        action="store_true",
+        help="Resume the run from the checkpoint of the output, after checking that the inputs and the options are unchanged",
+    )
+
+    parser.add_argument(
+        "--profile",
+        metavar="PROFILE",
+        help="Profile the command with cProfile and write the profile in this file",
+    )
+
+    parser.add_argument(
+        "--profile_format",
+        "--profile-format",
+        choices=[profile_format.value for profile_format in ProfileFormat],
+        default=ProfileFormat.PSTATS.value,
+        help="Format of the profile: pstats for pstats or snakeviz, collapsed for the flame graph tools (default: %(default)s)",
+    )
+
+    parser.add_argument(
+        "--trace",
+        metavar="TRACE",
+        help="Trace the stages, the bodies and the WKT rendering and write the trace in this file",
+    )
+
+    parser.add_argument(
+        "--trace_format",
+        "--trace-format",
+        choices=[trace_format.value for trace_format in TraceFormat],
+        default=TraceFormat.CHROME.value,
+        help="Format of the trace: chrome for the trace viewers, summary for a tree of the spans (default: %(default)s)",
+    )
+
+    parser.add_argument(
+        "--metrics",
+        metavar="PROM",
+        help="Write the counters and the histograms of the run in the Prometheus text format in this file (.prom)",
+    )
+
+    parser.add_argument(
+        "--memory_profile",
+        "--memory-profile",
+        metavar="REPORT",
+        help="Record the peak and the net allocation of each stage, the memory retained by each CRS class and the top allocation sites in a report file",
+    )
+
+    parser.add_argument(
+        "--async_logging",
+        "--async-logging",
+        action="store_true",
+        help="Format and write the logs in a listener thread instead of the thread generating the CRS",
     )
 
     parser.add_argument(
@@ -127,33 +305,681 @@ def parse_cli() -> argparse.Namespace:
             "CRITICAL",
             "TRACE",
         ],
-        default="INFO",
-        help="set Level log (default: %(default)s)",
+        help="set Level log (default: INFO, WARNING for the commands writing on the standard output)",
+    )
+
+    subparsers = parser.add_subparsers(
+        dest="command", title="commands", metavar="command"
+    )
+
+    parser_resolve = subparsers.add_parser(
+        "resolve",
+        help="Write the WKT of IAU codes on the standard output without generating the whole catalogue",
+    )
+    _add_report_arguments(parser_resolve)
+    parser_resolve.add_argument(
+        "codes", type=int, nargs="+", help="IAU codes (ex: 49900 49910)"
+    )
+    parser_resolve.set_defaults(func=resolve, default_level="WARNING")
+
+    parser_serve = subparsers.add_parser(
+        "serve",
+        help="Serve the WKT of the IAU codes over HTTP (GET /IAU/<version>/<code>)",
+    )
+    _add_report_arguments(parser_serve)
+    parser_serve.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Host name (default: %(default)s)",
+    )
+    parser_serve.add_argument(
+        "--port",
+        type=int,
+        default=8080,
+        help="Port, 0 to select a free port (default: %(default)s)",
+    )
+    parser_serve.set_defaults(func=serve)
+
+    parser_bench = subparsers.add_parser(
+        "bench",
+        help="Time the stages of the pipeline and the WKT renderers for several sizes of catalogue",
+    )
+    _add_report_arguments(parser_bench)
+    parser_bench.add_argument(
+        "--sizes",
+        default="200,1000,5000",
+        help="Comma separated numbers of bodies of the catalogues (default: %(default)s)",
+    )
+    parser_bench.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of runs by size (default: %(default)s)",
+    )
+    parser_bench.add_argument(
+        "--output",
+        default="benchmark.json",
+        help="JSON file of the results (default: %(default)s)",
+    )
+    parser_bench.add_argument(
+        "--synthetic_seed",
+        type=int,
+        help="Benchmark synthetic reports generated with this seed instead of repeating the IAU report",
+    )
+    parser_bench.set_defaults(func=bench, default_level="ERROR")
+
+    parser_gate = subparsers.add_parser(
+        "gate",
+        help="Run the benchmark and compare it with a baseline, exit with 3 on a regression",
+    )
+    _add_report_arguments(parser_gate)
+    parser_gate.add_argument(
+        "--baseline",
+        default=os.path.join("benchmarks", "baseline.json"),
+        help="JSON file of the baseline (default: %(default)s)",
+    )
+    for metric, name in (
+        ("throughput", "throughput"),
+        ("peak_bytes", "memory"),
+        ("output_bytes", "bytes"),
+    ):
+        parser_gate.add_argument(
+            f"--{name}_tolerance",
+            type=float,
+            default=PerfGate.DEFAULT_TOLERANCES[metric],
+            help=f"Relative tolerance of the {metric} (default: %(default)s)",
+        )
+    parser_gate.add_argument(
+        "--memory_absolute_tolerance",
+        type=int,
+        default=int(PerfGate.DEFAULT_ABSOLUTE_TOLERANCES["peak_bytes"]),
+        help="Tolerance in bytes of the peak of memory, added to the relative tolerance (default: %(default)s)",
+    )
+    parser_gate.add_argument(
+        "--output",
+        help="JSON file where the results of the benchmark are saved",
+    )
+    parser_gate.add_argument(
+        "--update_baseline",
+        action="store_true",
+        help="Replace the baseline by the results of the benchmark",
+    )
+    parser_gate.set_defaults(func=gate, default_level="ERROR")
+
+    parser_synth = subparsers.add_parser(
+        "synth",
+        help="Generate a synthetic IAU report of any size for the scaling tests",
+    )
+    parser_synth.add_argument(
+        "--rows", type=int, required=True, help="Number of rows"
+    )
+    parser_synth.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the generator (default: %(default)s)",
+    )
+    parser_synth.add_argument(
+        "--mix",
+        help="Comma separated weights of the kinds of body: sphere, biaxial, triaxial, unknown_radii, unknown_mean, invalid_flattening (ex: sphere=0.5,triaxial=0.5)",
+    )
+    parser_synth.add_argument(
+        "--output",
+        default="synthetic.csv",
+        help="CSV file of the report (default: %(default)s)",
+    )
+    parser_synth.set_defaults(func=synth)
+
+    parser_validate = subparsers.add_parser(
+        "validate",
+        help="Check the syntax, the keywords and the IAU codes of WKT files, exit with 3 on a problem",
+    )
+    parser_validate.add_argument(
+        "files", nargs="+", help="WKT files (ex: iau.wkt)"
+    )
+    parser_validate.add_argument(
+        "--partial",
+        action="store_true",
+        help="The files are a subset of the catalogue: the base CRS of the projected CRS may be missing",
+    )
+    parser_validate.set_defaults(func=validate, default_level="WARNING")
+
+    parser_diff = subparsers.add_parser(
+        "diff",
+        help="Compare two WKT catalogues by IAU code, exit with 3 when they differ",
+    )
+    parser_diff.add_argument(
+        "old", help="Old catalogue, WKT file or zip file (ex: iau.zip)"
+    )
+    parser_diff.add_argument(
+        "new", help="New catalogue, WKT file or zip file (ex: iau.wkt)"
+    )
+    parser_diff.set_defaults(func=diff, default_level="WARNING")
+
+    parser_merge = subparsers.add_parser(
+        "merge",
+        help="Merge the outputs of the shards in the output directory, in the --format of the shards",
+    )
+    parser_merge.add_argument(
+        "files",
+        nargs="+",
+        help="Outputs of the shards (ex: shard1/iau.wkt shard2/iau.wkt)",
+    )
+    parser_merge.set_defaults(func=merge)
+
+    parser_watch = subparsers.add_parser(
+        "watch",
+        help="Regenerate the wkt or jsonl output in the output directory when the IAU report or the projection catalogue changes",
+    )
+    _add_report_arguments(parser_watch)
+    parser_watch.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="Time in seconds between two polls of the inputs (default: %(default)s)",
+    )
+    parser_watch.set_defaults(func=watch)
+
+    options: argparse.Namespace = parser.parse_args(argv)
+    if options.command is None:
+        missing: List[str] = [
+            f"--{name}"
+            for name in ("iau_report", "iau_version", "iau_doi")
+            if getattr(options, name) is None
+        ]
+        if len(missing) > 0:
+            parser.error(
+                f"the following arguments are required: {', '.join(missing)}"
+            )
+    if options.level is None:
+        options.level = getattr(options, "default_level", "INFO")
+    return options
+
+
+def _selection(options_cli: argparse.Namespace) -> Any:
+    """Creates the selection of the CRS from the command line options.
+
+    Args:
+        options_cli (argparse.Namespace): command line options
+
+    Returns:
+        Selection: the selection
+    """
+    from .selection import (  # pylint: disable=import-outside-toplevel
+        Selection,
+    )
+
+    return Selection.from_strings(
+        bodies=options_cli.bodies,
+        naif_range=options_cli.naif_range,
+        crs_types=options_cli.crs_types,
+        shapes=options_cli.shapes,
+        projections=options_cli.projections,
+        codes=options_cli.codes,
+        shard=options_cli.shard,
+    )
+
+
+def _checkpoint(options_cli: argparse.Namespace) -> Checkpoint:
+    """Creates the checkpoint of the output of the generation.
+
+    The fingerprint covers the IAU report, the projection catalogue, the
+    version of csvforwkt and the options changing the output.
+
+    Args:
+        options_cli (argparse.Namespace): command line options
+
+    Returns:
+        Checkpoint: the checkpoint
+    """
+    from ._version import (  # pylint: disable=import-outside-toplevel
+        __version__,
+    )
+
+    options: Dict[str, Any] = {
+        name: getattr(options_cli, name)
+        for name in (
+            "iau_version",
+            "iau_doi",
+            "format",
+            "bodies",
+            "naif_range",
+            "crs_types",
+            "shapes",
+            "projections",
+            "codes",
+            "shard",
+        )
+    }
+    options["csvforwkt"] = __version__
+    return Checkpoint(
+        os.path.join(
+            options_cli.output_directory,
+            OutputFormat.from_name(options_cli.format).filename,
+        ),
+        Checkpoint.create_fingerprint(
+            (options_cli.iau_report, options_cli.projection_catalogue),
+            options,
+        ),
+        (
+            Checkpoint.DEFAULT_INTERVAL
+            if options_cli.checkpoint_interval is None
+            else options_cli.checkpoint_interval
+        ),
+    )
+
+
+def generate(options_cli: argparse.Namespace):
+    """Generates the WKT-CRS from the IAU report.
+
+    Args:
+        options_cli (argparse.Namespace): command line options
+    """
+    # pylint: disable=import-outside-toplevel
+    from .csvforwkt import CsvforwktLib
+    from .csvforwkt import StageHook
+
+    start: float = time.perf_counter()
+    checkpoint: Optional[Checkpoint] = None
+    if options_cli.resume or options_cli.checkpoint_interval is not None:
+        checkpoint = _checkpoint(options_cli)
+        if options_cli.resume:
+            checkpoint.load()
+    stage_hooks: List[StageHook] = list()
+    profiler: Optional[MemoryProfiler] = None
+    if options_cli.memory_profile is not None:
+        profiler = MemoryProfiler()
+        profiler.start()
+        stage_hooks.append(profiler.stage)
+    metrics: Optional[PipelineMetrics] = None
+    if options_cli.metrics is not None:
+        metrics = PipelineMetrics()
+        stage_hooks.append(metrics.stage)
+        tracing.enable(metrics)
+    csvforwkt = CsvforwktLib(
+        options_cli.iau_report,
+        options_cli.iau_version,
+        options_cli.iau_doi,
+        options_cli.output_directory,
+        level=options_cli.level,
+        projection_catalogue=options_cli.projection_catalogue,
+        stage_hooks=stage_hooks,
+        selection=_selection(options_cli),
+    )
+    bodies: Iterable[Tuple[int, Dict[int, ICrs]]]
+    crs: Dict[int, Dict[int, ICrs]] = dict()
+    if checkpoint is not None:
+        # written as generated, from the last body of the checkpoint
+        bodies = csvforwkt.iter_process(checkpoint.naif_id)
+    elif options_cli.format == OutputFormat.JSONL.format_name:
+        # written as generated for the consumers of the stream
+        bodies = csvforwkt.iter_process()
+    else:
+        crs = csvforwkt.process()
+        bodies = crs.items()
+    try:
+        csvforwkt.save_iter(
+            (
+                bodies
+                if metrics is None
+                else metrics.count_bodies(bodies, csvforwkt.is_triaxial)
+            ),
+            options_cli.format,
+            options_cli.batch_size,
+            checkpoint,
+        )
+    finally:
+        if metrics is not None:
+            tracing.disable(metrics)
+    if metrics is not None:
+        metrics.count_projections(csvforwkt.projection_stats)
+        metrics.observe_run("generate", time.perf_counter() - start)
+        metrics.write(options_cli.metrics)
+    if profiler is not None:
+        # the body CRS first, so the objects shared with the projected CRS
+        # are accounted to the body CRS, none when the CRS are streamed
+        profiler.account(
+            sorted(
+                (
+                    body_crs
+                    for body in crs.values()
+                    for body_crs in body.values()
+                ),
+                key=lambda body_crs: not isinstance(body_crs, BodyCrs),
+            )
+        )
+        profiler.stop()
+        profiler.save(options_cli.memory_profile)
+
+
+def resolve(options_cli: argparse.Namespace):
+    """Writes the WKT of IAU codes on the standard output.
+
+    Args:
+        options_cli (argparse.Namespace): command line options
+    """
+    from .csvforwkt import (  # pylint: disable=import-outside-toplevel
+        CsvforwktLib,
+    )
+
+    csvforwkt = CsvforwktLib(
+        options_cli.iau_report,
+        options_cli.iau_version,
+        options_cli.iau_doi,
+        os.getcwd(),
+        level=options_cli.level,
+        projection_catalogue=options_cli.projection_catalogue,
+    )
+    for code in options_cli.codes:
+        sys.stdout.write(csvforwkt.resolve(code).wkt())
+        sys.stdout.write("\n\n")
+
+
+def serve(options_cli: argparse.Namespace):
+    """Serves the WKT of the IAU codes over HTTP.
+
+    Args:
+        options_cli (argparse.Namespace): command line options
+    """
+    # pylint: disable=import-outside-toplevel
+    from .csvforwkt import CsvforwktLib
+    from .server import WktRegistry
+    from .server import WktServer
+
+    start: float = time.perf_counter()
+    metrics = PipelineMetrics()
+    tracing.enable(metrics)
+    csvforwkt = CsvforwktLib(
+        options_cli.iau_report,
+        options_cli.iau_version,
+        options_cli.iau_doi,
+        os.getcwd(),
+        level=options_cli.level,
+        projection_catalogue=options_cli.projection_catalogue,
+        stage_hooks=[metrics.stage],
+    )
+    server = WktServer(
+        WktRegistry(csvforwkt, metrics),
+        options_cli.host,
+        options_cli.port,
+        metrics,
+    )
+    metrics.observe_run("serve", time.perf_counter() - start)
+    if options_cli.metrics is not None:
+        metrics.write(options_cli.metrics)
+    sys.stderr.write(f"Serving on {server.url}\n")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        tracing.disable(metrics)
+        if options_cli.metrics is not None:
+            metrics.write(options_cli.metrics)
+
+
+def bench(options_cli: argparse.Namespace):
+    """Times the stages of the pipeline and the WKT renderers.
+
+    Args:
+        options_cli (argparse.Namespace): command line options
+    """
+    # pylint: disable=import-outside-toplevel
+    from .benchmark import Benchmark
+    from .csvforwkt import CsvforwktLib
+
+    CsvforwktLib._parse_level(  # pylint: disable=protected-access
+        options_cli.level
+    )
+    benchmark = Benchmark(
+        options_cli.iau_report,
+        options_cli.iau_version,
+        options_cli.iau_doi,
+        [int(size) for size in options_cli.sizes.split(",")],
+        options_cli.repeat,
+        synthetic_seed=options_cli.synthetic_seed,
+    )
+    results = benchmark.run()
+    Benchmark.save(results, options_cli.output)
+    sys.stdout.write(Benchmark.format_table(results))
+    sys.stdout.write("\n")
+
+
+def gate(options_cli: argparse.Namespace) -> int:
+    """Runs the benchmark and compares it with the baseline.
+
+    Args:
+        options_cli (argparse.Namespace): command line options
+
+    Returns:
+        int: 3 when a regression is detected otherwise 0
+    """
+    # pylint: disable=import-outside-toplevel
+    from .benchmark import Benchmark
+    from .csvforwkt import CsvforwktLib
+
+    CsvforwktLib._parse_level(  # pylint: disable=protected-access
+        options_cli.level
+    )
+    baseline: Dict[str, Any] = PerfGate.load(options_cli.baseline)
+    parameters: Dict[str, Any] = baseline["parameters"]
+    results: Dict[str, Any] = Benchmark(
+        options_cli.iau_report,
+        options_cli.iau_version,
+        options_cli.iau_doi,
+        parameters["sizes"],
+        parameters["repeat"],
+        synthetic_seed=parameters.get("synthetic_seed"),
+    ).run()
+    if options_cli.output is not None:
+        Benchmark.save(results, options_cli.output)
+
+    perf_gate = PerfGate(
+        baseline,
+        {
+            "throughput": options_cli.throughput_tolerance,
+            "peak_bytes": options_cli.memory_tolerance,
+            "output_bytes": options_cli.bytes_tolerance,
+        },
+        {"peak_bytes": options_cli.memory_absolute_tolerance},
+    )
+    comparisons = perf_gate.compare(results)
+    sys.stdout.write(PerfGate.format_table(comparisons))
+    sys.stdout.write("\n")
+    if options_cli.update_baseline:
+        Benchmark.save(results, options_cli.baseline)
+        return 0
+    regressions = PerfGate.regressions(comparisons)
+    if len(regressions) > 0:
+        logging.getLogger(__name_soft__).error(
+            f"{len(regressions)} performance regressions against {options_cli.baseline}"
+        )
+        return 3
+    return 0
+
+
+def synth(options_cli: argparse.Namespace):
+    """Generates a synthetic IAU report.
+
+    Args:
+        options_cli (argparse.Namespace): command line options
+    """
+    from .generator import (  # pylint: disable=import-outside-toplevel
+        CatalogueGenerator,
+    )
+
+    generator = CatalogueGenerator(
+        options_cli.rows,
+        options_cli.seed,
+        (
+            None
+            if options_cli.mix is None
+            else CatalogueGenerator.parse_mix(options_cli.mix)
+        ),
+    )
+    nb_rows: int = generator.write(options_cli.output)
+    logging.getLogger(__name_soft__).info(
+        f"{nb_rows} rows written in {options_cli.output}"
+    )
+
+
+def validate(options_cli: argparse.Namespace) -> int:
+    """Validates WKT files.
+
+    Args:
+        options_cli (argparse.Namespace): command line options
+
+    Returns:
+        int: 3 when a problem is found otherwise 0
+    """
+    from .validator import (  # pylint: disable=import-outside-toplevel
+        WktValidator,
     )
 
-    return parser.parse_args()
+    logger = logging.getLogger(__name_soft__)
+    logger.setLevel(options_cli.level)
+    nb_issues: int = 0
+    for path in options_cli.files:
+        validator = WktValidator(complete=not options_cli.partial)
+        for issue in validator.validate_file(path):
+            sys.stdout.write(f"{path}: {issue}\n")
+        nb_issues += len(validator.issues)
+        logger.info(
+            f"{path} : {len(validator.codes)} CRS, {len(validator.issues)} problems"
+        )
+    return 3 if nb_issues > 0 else 0
+
+
+def diff(options_cli: argparse.Namespace) -> int:
+    """Compares two WKT catalogues.
+
+    Args:
+        options_cli (argparse.Namespace): command line options
+
+    Returns:
+        int: 3 when the catalogues differ otherwise 0
+    """
+    # pylint: disable=import-outside-toplevel
+    from .diff import CatalogueDiff
+    from .diff import CrsDifference
+
+    logger = logging.getLogger(__name_soft__)
+    logger.setLevel(options_cli.level)
+    catalogue_diff = CatalogueDiff(options_cli.old, options_cli.new)
+    differences = catalogue_diff.compare()
+    counts: Dict[str, int] = dict()
+    for difference in differences:
+        sys.stdout.write(f"{difference}\n")
+        counts[difference.status] = counts.get(difference.status, 0) + 1
+    logger.info(
+        f"{options_cli.old} ({catalogue_diff.nb_old} CRS) -> {options_cli.new} ({catalogue_diff.nb_new} CRS) : "
+        + ", ".join(
+            f"{counts.get(status, 0)} {status}"
+            for status in (
+                CrsDifference.ADDED,
+                CrsDifference.REMOVED,
+                CrsDifference.CHANGED,
+            )
+        )
+    )
+    return 3 if len(differences) > 0 else 0
+
+
+def merge(options_cli: argparse.Namespace):
+    """Merges the outputs of the shards.
+
+    Args:
+        options_cli (argparse.Namespace): command line options
+    """
+    from .merge import ShardMerger  # pylint: disable=import-outside-toplevel
+
+    logging.getLogger(__name_soft__).setLevel(options_cli.level)
+    output_format: OutputFormat = OutputFormat.from_name(options_cli.format)
+    ShardMerger(options_cli.files, output_format).merge(
+        os.path.join(options_cli.output_directory, output_format.filename),
+        options_cli.batch_size,
+    )
+
+
+def watch(options_cli: argparse.Namespace):
+    """Regenerates the output when the IAU report or the projection
+    catalogue changes.
+
+    Args:
+        options_cli (argparse.Namespace): command line options
+    """
+    # pylint: disable=import-outside-toplevel
+    from .csvforwkt import CsvforwktLib
+    from .watch import CatalogueWatcher
+
+    CsvforwktLib._parse_level(  # pylint: disable=protected-access
+        options_cli.level
+    )
+    watcher = CatalogueWatcher(
+        options_cli.iau_report,
+        options_cli.iau_version,
+        options_cli.iau_doi,
+        options_cli.output_directory,
+        OutputFormat.from_name(options_cli.format),
+        options_cli.projection_catalogue,
+        _selection(options_cli),
+    )
+    sys.stderr.write(
+        f"Watching {', '.join(watcher.inputs)}, writing {watcher.path}\n"
+    )
+    watcher.watch(options_cli.interval)
+
+
+def run_command(options_cli: argparse.Namespace) -> int:
+    """Runs the command, under the profiler when it is requested.
+
+    Args:
+        options_cli (argparse.Namespace): command line options
+
+    Returns:
+        int: the exit code
+    """
+    if options_cli.profile is None:
+        return options_cli.func(options_cli) or 0
+    profiler = CliProfiler(
+        options_cli.profile, ProfileFormat(options_cli.profile_format)
+    )
+    try:
+        return profiler.run(options_cli.func, options_cli) or 0
+    finally:
+        sys.stderr.write(
+            f"Profile written in {profiler.path}: run {profiler.elapsed:.3f} s "
+            f"including an estimated profiler overhead of {profiler.overhead:.3f} s, "
+            f"profile written in {profiler.write_time:.3f} s\n"
+        )
 
 
 def run():
     """Main function that instantiates the library."""
+    configure_logging()
     handler = SigintHandler()
     signal.signal(signal.SIGINT, handler.signal_handler)
     try:
         options_cli = parse_cli()
-
-        csvforwkt = CsvforwktLib(
-            options_cli.iau_report,
-            options_cli.iau_version,
-            options_cli.iau_doi,
-            options_cli.output_directory,
-            level=options_cli.level,
-        )
-        crs: Dict[int, Dict[int, ICrs]] = csvforwkt.process()
-        csvforwkt.save(crs)
-        sys.exit(0)
+        if options_cli.async_logging:
+            QueueLogging.start()
+        if options_cli.trace is None:
+            sys.exit(run_command(options_cli))
+        tracer = Tracer()
+        tracing.enable(tracer)
+        try:
+            with tracing.span(options_cli.command or "generate"):
+                code: int = run_command(options_cli)
+        finally:
+            tracing.disable(tracer)
+            tracer.save(
+                options_cli.trace, TraceFormat(options_cli.trace_format)
+            )
+        sys.exit(code)
     except Exception as error:  # pylint: disable=broad-except
         logging.exception(error)
         sys.exit(1)
+    finally:
+        QueueLogging.stop()
 
 
 if __name__ == "__main__":
@@ -17,14 +17,7 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with csvForWKT.  If not, see <https://www.gnu.org/licenses/>.
 """Project metadata."""
-from pkg_resources import DistributionNotFound
-from pkg_resources import get_distribution
-
 __name_soft__ = "csvforwkt"
-try:
-    __version__ = get_distribution(__name_soft__).version
-except DistributionNotFound:
-    __version__ = "0.0.0"
 __title__ = "csvForWKT"
 __description__ = "csvForWKT is a python script that creates a WKT-crs for some bodies from the solar system. The content that is filled in the WKT-crs comes from the report of IAU Working Group on Cartographic."
 __url__ = "https://github.com/pole-surfaces-planetaires/csvforwkt"
@@ -34,3 +27,32 @@ __license__ = "GNU Lesser General Public License v3"
 __copyright__ = (
     "2022, CNES (Jean-Christophe Malapert for Pôle Surfaces Planétaires)"
 )
+# resolved by __getattr__ when it is first read
+__version__: str
+
+
+def __getattr__(name: str) -> str:
+    """Resolves the version of the installed distribution when it is first
+    read, the metadata of the distributions being slow to load.
+
+    Args:
+        name (str): name of the attribute
+
+    Raises:
+        AttributeError: Unknown attribute
+
+    Returns:
+        str: the version
+    """
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # pylint: disable=import-outside-toplevel
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version
+
+    try:
+        value: str = version(__name_soft__)
+    except PackageNotFoundError:
+        value = "0.0.0"
+    globals()["__version__"] = value
+    return value
@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to measure the performances of the pipeline.
+
+Each stage of `CsvforwktLib` and each `wkt()` method are timed for several
+sizes of catalogue. The catalogue of a given size is built by repeating the
+bodies of the IAU report with new Naif IDs, or is a synthetic report. The
+results are written in JSON with the metadata of the environment so that
+the runs can be compared across commits.
+"""
+import datetime
+import functools
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import pandas as pd  # pylint: disable=import-error
+
+from ._version import __version__
+from .body import Ellipsoid
+from .body import Sphere
+from .body import Triaxial
+from .crs import BodyCrs
+from .crs import ICrs
+from .crs import ProjectionBody
+from .csvforwkt import CsvforwktLib
+from .generator import CatalogueGenerator
+from .writer import OutputFormat
+
+logger = logging.getLogger(__name__)
+
+# the Naif IDs of a copy of the report are shifted by this step
+NAIF_STEP: int = 10**8
+
+
+def scale_report(df_bodies: pd.DataFrame, size: int) -> pd.DataFrame:
+    """Builds a report of a given size by repeating the bodies of a report.
+
+    Args:
+        df_bodies (pd.DataFrame): bodies of the IAU report
+        size (int): number of rows
+
+    Returns:
+        pd.DataFrame: the report with size rows
+    """
+    nb_copies: int = -(-size // df_bodies.shape[0])
+    copies: List[pd.DataFrame] = list()
+    for copy in range(nb_copies):
+        df_copy = df_bodies.copy()
+        df_copy["Naif_id"] = df_copy["Naif_id"] + copy * NAIF_STEP
+        copies.append(df_copy)
+    return pd.concat(copies, ignore_index=True).head(size)
+
+
+def environment() -> Dict[str, Any]:
+    """Returns the metadata of the environment.
+
+    Returns:
+        Dict[str, Any]: the metadata of the environment
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel,import-error
+
+    commit: str = ""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return {
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "csvforwkt": __version__,
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+class Benchmark:
+    """Benchmark of the stages of the pipeline and of the WKT renderers."""
+
+    STAGES: Tuple[str, ...] = (
+        "init_iau_report",
+        "skip_records",
+        "split_body",
+        "biaxial",
+        "triaxial",
+        "projections",
+        "save",
+    )
+
+    RENDERERS: Tuple[str, ...] = (
+        "Ellipsoid",
+        "Sphere",
+        "Triaxial",
+        "Datum",
+        "BodyCrs",
+        "Conversion",
+        "ProjectionBody",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        iau_report: str,
+        iau_version: int,
+        iau_doi: str,
+        sizes: Iterable[int],
+        repeat: int = 3,
+        synthetic_seed: Optional[int] = None,
+    ):
+        """Creates the benchmark.
+
+        Args:
+            iau_report (str): IAU report
+            iau_version (int): version of the IAU report
+            iau_doi (str): DOI of the IAU report
+            sizes (Iterable[int]): number of bodies of the catalogues
+            repeat (int, optional): number of runs by size. Defaults to 3.
+            synthetic_seed (Optional[int], optional): seed of the synthetic
+            reports, None to repeat the bodies of the IAU report. Defaults
+            to None.
+
+        Raises:
+            ValueError: invalid size or repeat
+        """
+        self.__iau_report: str = iau_report
+        self.__iau_version: int = iau_version
+        self.__iau_doi: str = iau_doi
+        self.__sizes: List[int] = list(sizes)
+        self.__repeat: int = repeat
+        self.__synthetic_seed: Optional[int] = synthetic_seed
+        if repeat < 1 or any(size < 1 for size in self.__sizes):
+            raise ValueError("The sizes and repeat must be positive")
+
+    @property
+    def sizes(self) -> List[int]:
+        """Number of bodies of the catalogues.
+
+        :getter: Returns the sizes
+        :type: List[int]
+        """
+        return self.__sizes
+
+    @property
+    def repeat(self) -> int:
+        """Number of runs by size.
+
+        :getter: Returns the number of runs
+        :type: int
+        """
+        return self.__repeat
+
+    @staticmethod
+    def _timed(func: Callable[[], Any]) -> Tuple[Any, int]:
+        """Calls a function and measures its duration or, when tracemalloc
+        is tracing, its peak of memory.
+
+        Args:
+            func (Callable[[], Any]): function
+
+        Returns:
+            Tuple[Any, int]: result of the function and duration in ns or
+            peak of memory in bytes
+        """
+        if tracemalloc.is_tracing():
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            else:  # python < 3.9, the blocks allocated before are untraced
+                tracemalloc.clear_traces()
+            current: int = tracemalloc.get_traced_memory()[0]
+            result = func()
+            return result, tracemalloc.get_traced_memory()[1] - current
+        start: int = time.perf_counter_ns()
+        result = func()
+        return result, time.perf_counter_ns() - start
+
+    @staticmethod
+    def _summary(  # pylint: disable=too-many-arguments
+        durations: List[int],
+        items: int,
+        peak_bytes: int,
+        output_bytes: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Summarizes the measures of a stage.
+
+        Args:
+            durations (List[int]): durations in ns of the runs
+            items (int): number of items processed by a run
+            peak_bytes (int): peak of memory allocated by a run
+            output_bytes (Optional[int], optional): number of bytes produced
+            by a run. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: the summary
+        """
+        median: float = statistics.median(durations)
+        return {
+            "items": items,
+            "runs_ns": durations,
+            "min_ns": min(durations),
+            "median_ns": median,
+            "throughput": items / median * 1e9 if median > 0 else None,
+            "peak_bytes": peak_bytes,
+            "output_bytes": output_bytes,
+        }
+
+    def _run_pipeline(  # pylint: disable=protected-access
+        self, report: str, directory: str
+    ) -> Tuple[Dict[str, Tuple[int, int]], Dict[int, Dict[int, ICrs]]]:
+        """Runs the stages of the pipeline once.
+
+        Args:
+            report (str): IAU report
+            directory (str): output directory
+
+        Returns:
+            Tuple[Dict[str, Tuple[int, int]], Dict[int, Dict[int, ICrs]]]: duration
+            in ns (or peak of memory in bytes when tracemalloc is tracing)
+            and number of items by stage, and the CRS
+        """
+        library = CsvforwktLib(
+            report, self.__iau_version, self.__iau_doi, directory
+        )
+        stages: Dict[str, Tuple[int, int]] = dict()
+
+        df_bodies, duration = Benchmark._timed(library._init_iau_report)
+        stages["init_iau_report"] = (duration, df_bodies.shape[0])
+        _, duration = Benchmark._timed(library._skip_records)
+        stages["skip_records"] = (duration, df_bodies.shape[0])
+        (biaxial, triaxial), duration = Benchmark._timed(library._split_body)
+        stages["split_body"] = (
+            duration,
+            biaxial.shape[0] + triaxial.shape[0],
+        )
+
+        crs: Dict[int, Dict[int, ICrs]] = dict()
+        biaxial_crs, duration = Benchmark._timed(
+            lambda: library._process_body_crs_biaxial(biaxial)
+        )
+        stages["biaxial"] = (duration, biaxial.shape[0])
+        crs.update(biaxial_crs)
+        triaxial_crs, duration = Benchmark._timed(
+            lambda: library._process_body_crs_triaxial(triaxial)
+        )
+        stages["triaxial"] = (duration, triaxial.shape[0])
+        crs.update(triaxial_crs)
+
+        projections, duration = Benchmark._timed(
+            lambda: library._process_body_projection_crs(crs)
+        )
+        stages["projections"] = (
+            duration,
+            sum(len(body) for body in projections.values()),
+        )
+        crs = library._merge_dicts(crs, projections)
+
+        _, duration = Benchmark._timed(lambda: library.save(crs))
+        stages["save"] = (
+            duration,
+            sum(len(body) for body in crs.values()),
+        )
+        return stages, crs
+
+    @staticmethod
+    def _render(methods: List[Callable[[], str]]) -> List[str]:
+        """Calls the wkt methods of a renderer.
+
+        Args:
+            methods (List[Callable[[], str]]): wkt methods
+
+        Returns:
+            List[str]: the WKT
+        """
+        return [method() for method in methods]
+
+    @staticmethod
+    def _renderers(
+        crs: Dict[int, Dict[int, ICrs]],
+    ) -> Dict[str, List[Callable[[], str]]]:
+        """Collects the wkt methods of the catalogue by renderer.
+
+        Args:
+            crs (Dict[int, Dict[int, ICrs]]): CRS
+
+        Returns:
+            Dict[str, List[Callable[[], str]]]: wkt methods by renderer
+        """
+        renderers: Dict[str, List[Callable[[], str]]] = {
+            name: list() for name in Benchmark.RENDERERS
+        }
+        body_types = {
+            Ellipsoid: "Ellipsoid",
+            Sphere: "Sphere",
+            Triaxial: "Triaxial",
+        }
+        for body_crs in crs.values():
+            for value in body_crs.values():
+                if isinstance(value, ProjectionBody):
+                    renderers["ProjectionBody"].append(value.wkt)
+                    renderers["Conversion"].append(value.conversion.wkt)
+                elif isinstance(value, BodyCrs):
+                    renderers["BodyCrs"].append(value.wkt)
+                    renderers["Datum"].append(value.datum.wkt)
+                    body = value.datum.body
+                    renderers[body_types[type(body)]].append(body.wkt)
+        return renderers
+
+    def _run_size(self, size: int, df_bodies: pd.DataFrame) -> Dict[str, Any]:
+        """Runs the benchmark for a size of catalogue.
+
+        Args:
+            size (int): number of bodies
+            df_bodies (pd.DataFrame): bodies of the IAU report
+
+        Returns:
+            Dict[str, Any]: the results of the stages and of the renderers
+        """
+        durations: Dict[str, List[int]] = {
+            name: list() for name in Benchmark.STAGES + Benchmark.RENDERERS
+        }
+        items: Dict[str, int] = dict()
+        peaks: Dict[str, int] = dict()
+        output_bytes: Dict[str, Optional[int]] = dict()
+        with tempfile.TemporaryDirectory() as directory:
+            report: str = os.path.join(directory, "report.csv")
+            if self.__synthetic_seed is None:
+                scale_report(df_bodies, size).to_csv(report, index=False)
+            else:
+                CatalogueGenerator(size, self.__synthetic_seed).write(report)
+            for _ in range(self.__repeat):
+                stages, crs = self._run_pipeline(report, directory)
+                for name, (duration, nb_items) in stages.items():
+                    durations[name].append(duration)
+                    items[name] = nb_items
+
+                for name, methods in Benchmark._renderers(crs).items():
+                    start: int = time.perf_counter_ns()
+                    for method in methods:
+                        method()
+                    durations[name].append(time.perf_counter_ns() - start)
+                    items[name] = len(methods)
+
+            # the memory is measured by another run, tracemalloc slows down
+            # the allocations
+            tracemalloc.start()
+            try:
+                stages, crs = self._run_pipeline(report, directory)
+                for name, (peak, _) in stages.items():
+                    peaks[name] = peak
+                for name, methods in Benchmark._renderers(crs).items():
+                    wkts, peaks[name] = Benchmark._timed(
+                        functools.partial(Benchmark._render, methods)
+                    )
+                    output_bytes[name] = sum(
+                        len(wkt.encode("utf-8")) for wkt in wkts
+                    )
+            finally:
+                tracemalloc.stop()
+            output_bytes["save"] = os.path.getsize(
+                os.path.join(directory, OutputFormat.WKT.filename)
+            )
+        return {
+            "size": size,
+            "stages": {
+                name: Benchmark._summary(
+                    durations[name],
+                    items[name],
+                    peaks[name],
+                    output_bytes.get(name),
+                )
+                for name in Benchmark.STAGES
+            },
+            "renderers": {
+                name: Benchmark._summary(
+                    durations[name],
+                    items[name],
+                    peaks[name],
+                    output_bytes.get(name),
+                )
+                for name in Benchmark.RENDERERS
+            },
+        }
+
+    def run(self) -> Dict[str, Any]:
+        """Runs the benchmark.
+
+        Returns:
+            Dict[str, Any]: the environment and the results by size
+        """
+        df_bodies: pd.DataFrame = pd.read_csv(self.__iau_report)
+        results: List[Dict[str, Any]] = list()
+        for size in self.__sizes:
+            logger.info(f"Benchmark of a catalogue of {size} bodies")
+            results.append(self._run_size(size, df_bodies))
+        return {
+            "environment": environment(),
+            "parameters": {
+                "iau_report": os.path.basename(self.__iau_report),
+                "sizes": self.__sizes,
+                "repeat": self.__repeat,
+                "synthetic_seed": self.__synthetic_seed,
+            },
+            "results": results,
+        }
+
+    @staticmethod
+    def save(results: Dict[str, Any], path: str):
+        """Saves the results in JSON.
+
+        Args:
+            results (Dict[str, Any]): results of the benchmark
+            path (str): JSON file
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+            file.write("\n")
+
+    @staticmethod
+    def format_table(results: Dict[str, Any]) -> str:
+        """Formats the results as a table.
+
+        Args:
+            results (Dict[str, Any]): results of the benchmark
+
+        Returns:
+            str: the table
+        """
+        lines: List[str] = [
+            f"{'size':>8} {'name':<16} {'items':>9} {'median (ms)':>12} {'items/s':>12}"
+        ]
+        for result in results["results"]:
+            for group in ("stages", "renderers"):
+                for name, summary in result[group].items():
+                    throughput = summary["throughput"]
+                    lines.append(
+                        f"{result['size']:>8} {name:<16} {summary['items']:>9} "
+                        f"{summary['median_ns'] / 1e6:>12.3f} "
+                        f"{'-' if throughput is None else f'{throughput:.0f}':>12}"
+                    )
+        return "\n".join(lines)
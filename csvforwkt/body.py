@@ -3,18 +3,103 @@
 from abc import ABCMeta
 from abc import abstractmethod
 from abc import abstractproperty
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
 from string import Template
+from typing import Iterator
 from typing import Optional
 from typing import Union
 
 
-class IAU_REPORT:  # pylint: disable=invalid-name,too-few-public-methods
-    """Version of the IAU report."""
+class ReportContext:
+    """Metadata of the IAU report: version, DOI and source of the CRS.
 
-    VERSION: str = "2015"
-    DOI_IAU: str = "doi:10.1007/s10569-017-9805-5"
-    SOURCE_IAU: str = "Source of IAU Coordinate systems: " + DOI_IAU
+    The bodies, the datums and the CRS keep the report they are created
+    with, so that their WKT does not depend on the reports processed by the
+    other libraries of the process. The objects created without a report
+    use the current report of the context, which is set by `use` and is
+    local to the thread or to the asyncio task.
+    """
+
+    SOURCE_PREFIX: str = "Source of IAU Coordinate systems: "
+
+    def __init__(
+        self,
+        version: str = "2015",
+        doi: str = "doi:10.1007/s10569-017-9805-5",
+    ):
+        """Creates the metadata of a report.
+
+        Args:
+            version (str, optional): version of the report. Defaults to
+            "2015".
+            doi (str, optional): DOI of the report. Defaults to the DOI of
+            the 2015 report.
+        """
+        self.__version: str = str(version)
+        self.__doi: str = doi
+
+    @property
+    def version(self) -> str:
+        """The version of the report.
+
+        :getter: Returns the version
+        :type: str
+        """
+        return self.__version
+
+    @property
+    def doi(self) -> str:
+        """The DOI of the report.
+
+        :getter: Returns the DOI
+        :type: str
+        """
+        return self.__doi
+
+    @property
+    def source(self) -> str:
+        """The source of the CRS, written in their remark.
+
+        :getter: Returns the source
+        :type: str
+        """
+        return ReportContext.SOURCE_PREFIX + self.doi
+
+    def __repr__(self) -> str:
+        return f"ReportContext({self.version!r}, {self.doi!r})"
+
+    @staticmethod
+    def current() -> "ReportContext":
+        """Returns the report of the context.
+
+        Returns:
+            ReportContext: the report set by `use`, the 2015 report otherwise
+        """
+        return _CURRENT_REPORT.get()
+
+    @staticmethod
+    @contextmanager
+    def use(report: "ReportContext") -> Iterator["ReportContext"]:
+        """Sets the report of the context.
+
+        Args:
+            report (ReportContext): the report
+
+        Yields:
+            Iterator[ReportContext]: the report
+        """
+        token = _CURRENT_REPORT.set(report)
+        try:
+            yield report
+        finally:
+            _CURRENT_REPORT.reset(token)
+
+
+_CURRENT_REPORT: ContextVar[ReportContext] = ContextVar(
+    "csvforwkt_report", default=ReportContext()
+)
 
 
 class ReferenceShape(Enum):
@@ -102,6 +187,7 @@ class IBody(metaclass=ABCMeta):
         semi_minor: float,
         axisb: float,
         mean: float,
+        report: Optional[ReportContext] = None,
     ) -> "IBody":
         """Create a shape.
 
@@ -120,6 +206,8 @@ class IBody(metaclass=ABCMeta):
             semi_minor (float): semi minor axis in meter
             axisb (float): third axis in meter
             mean (float): mean radius in meter
+            report (Optional[ReportContext], optional): IAU report. Defaults
+            to the report of the context.
 
         Raises:
             ValueError: Unsupported shape
@@ -157,16 +245,16 @@ class IBody(metaclass=ABCMeta):
             else:
                 mean_radius = semi_major  # Biaxial case
                 warning = "Use semi-major radius as sphere radius for interoperability. "
-            result = Sphere(name, mean_radius)
+            result = Sphere(name, mean_radius, report)
         elif shape == ReferenceShape.ELLIPSE:
             inverse_flat: float
             if semi_major == semi_minor:
                 inverse_flat = 0
             else:
                 inverse_flat = semi_major / (semi_major - semi_minor)
-            result = Ellipsoid(name, semi_major, inverse_flat)
+            result = Ellipsoid(name, semi_major, inverse_flat, report)
         elif shape == ReferenceShape.TRIAXIAL:
-            result = Triaxial(name, semi_major, axisb, semi_minor)
+            result = Triaxial(name, semi_major, axisb, semi_minor, report)
         else:
             raise ValueError(f"Unsuported shape: {shape}")
         result.warning = warning
@@ -180,18 +268,29 @@ class Ellipsoid(IBody):
     TEMPLATE = """ELLIPSOID["$ellipsoide_name ($version)", $radius, $inverse_flat,
 \t\tLENGTHUNIT["metre", 1, ID["EPSG", 9001]]]"""
 
-    def __init__(self, name: str, radius: float, inverse_flat: float):
+    def __init__(
+        self,
+        name: str,
+        radius: float,
+        inverse_flat: float,
+        report: Optional[ReportContext] = None,
+    ):
         """Create an ellipsoid shape.
 
         Args:
             name (str): name of the shape
             radius (float): radius of the shape in meter
             inverse_flat (float): inverse flatenning of the shape in meter
+            report (Optional[ReportContext], optional): IAU report. Defaults
+            to the report of the context.
         """
         self.__name: str = name
         self.__radius: float = radius
         self.__inverse_flat: float = round(inverse_flat, 15)
         self.__warning: Optional[str] = None
+        self.__report: ReportContext = (
+            ReportContext.current() if report is None else report
+        )
 
     @property
     def name(self) -> str:
@@ -229,6 +328,15 @@ class Ellipsoid(IBody):
         """
         return ReferenceShape.ELLIPSE
 
+    @property
+    def report(self) -> ReportContext:
+        """The IAU report.
+
+        :getter: Returns the IAU report
+        :type: ReportContext
+        """
+        return self.__report
+
     @property
     def warning(self) -> Optional[str]:
         """The warning related to the body description creation.
@@ -261,7 +369,7 @@ class Ellipsoid(IBody):
         """
         datum_template: Template = Template(Ellipsoid.TEMPLATE)
         datum = datum_template.substitute(
-            version=IAU_REPORT.VERSION,
+            version=self.report.version,
             ellipsoide_name=self.name,
             radius=self._convert(self.radius),
             inverse_flat=self.inverse_flat,
@@ -276,16 +384,26 @@ class Sphere(IBody):
     TEMPLATE = """ELLIPSOID["$ellipsoide_name ($version) - Sphere", $radius, 0,
 \t\tLENGTHUNIT["metre", 1, ID["EPSG", 9001]]]"""
 
-    def __init__(self, name: str, radius: float):
+    def __init__(
+        self,
+        name: str,
+        radius: float,
+        report: Optional[ReportContext] = None,
+    ):
         """Create a sphere desctription
 
         Args:
             name (str): body name
             radius (float): radius in meter of the sphere
+            report (Optional[ReportContext], optional): IAU report. Defaults
+            to the report of the context.
         """
         self.__name: str = name
         self.__radius: float = radius
         self.__warning: Optional[str] = None
+        self.__report: ReportContext = (
+            ReportContext.current() if report is None else report
+        )
 
     @property
     def name(self) -> str:
@@ -314,6 +432,15 @@ class Sphere(IBody):
         """
         return ReferenceShape.SPHERE
 
+    @property
+    def report(self) -> ReportContext:
+        """The IAU report.
+
+        :getter: Returns the IAU report
+        :type: ReportContext
+        """
+        return self.__report
+
     @property
     def warning(self) -> Optional[str]:
         """The warning related to the body description creation.
@@ -347,7 +474,7 @@ class Sphere(IBody):
         datum_template: Template = Template(Sphere.TEMPLATE)
         datum = datum_template.substitute(
             ellipsoide_name=self.name,
-            version=IAU_REPORT.VERSION,
+            version=self.report.version,
             radius=self._convert(self.radius),
         )
         return datum
@@ -366,6 +493,7 @@ class Triaxial(IBody):
         semi_major: float,
         semi_median: float,
         semi_minor: float,
+        report: Optional[ReportContext] = None,
     ):
         """Create a triaxial shape.
 
@@ -374,12 +502,17 @@ class Triaxial(IBody):
             semi_major (float): axis one
             semi_median (float): axis two
             semi_minor (float): axis third
+            report (Optional[ReportContext], optional): IAU report. Defaults
+            to the report of the context.
         """
         self.__name: str = name
         self.__semi_major: float = semi_major
         self.__semi_minor: float = semi_minor
         self.__semi_median: float = semi_median
         self.__warning: Optional[str] = None
+        self.__report: ReportContext = (
+            ReportContext.current() if report is None else report
+        )
 
     @property
     def name(self) -> str:
@@ -426,6 +559,15 @@ class Triaxial(IBody):
         """
         return ReferenceShape.TRIAXIAL
 
+    @property
+    def report(self) -> ReportContext:
+        """The IAU report.
+
+        :getter: Returns the IAU report
+        :type: ReportContext
+        """
+        return self.__report
+
     @property
     def warning(self) -> Optional[str]:
         """The warning related to the body description creation.
@@ -449,7 +591,7 @@ class Triaxial(IBody):
         datum_template: Template = Template(Triaxial.TEMPLATE)
         datum = datum_template.substitute(
             ellipsoide_name=self.name,
-            version=IAU_REPORT.VERSION,
+            version=self.report.version,
             semi_major=self.semi_major,
             semi_median=self.semi_median,
             semi_minor=self.semi_minor,
@@ -0,0 +1,1066 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to handle the catalogue of projections.
+
+A projection is applied on each body CRS. Its IAU code is the code of the
+body CRS plus the offset of the projection. The built-in catalogue is
+described by PROJECTION_DATA and METHOD_AND_PARAM_MAPPING. Another catalogue
+can be loaded from a JSON, TOML or CSV file.
+
+The catalogue is validated once and compiled in ProjectionDefinition
+objects, indexed by offset. The compiled catalogue of a file is cached on
+disk, so that a file which has not been modified is not validated again. The
+cache key includes the built-in methods and parameters and the version of
+the package, so that an upgrade never loads a stale catalogue.
+"""
+import csv
+import hashlib
+import json
+import logging
+import os
+from string import Template
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+logger = logging.getLogger(__name__)
+
+PROJECTION_DATA: List[List[Any]] = [
+    [
+        10,
+        "Equirectangular, clon = 0",
+        "Equidistant Cylindrical",
+        "Latitude of 1st standard parallel",
+        0,
+        "Longitude of natural origin",
+        0,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+        None,
+        None,
+    ],
+    [
+        15,
+        "Equirectangular, clon = 180",
+        "Equidistant Cylindrical",
+        "Latitude of 1st standard parallel",
+        0,
+        "Longitude of natural origin",
+        180,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+        None,
+        None,
+    ],
+    [
+        20,
+        "Sinusoidal, clon = 0",
+        "Sinusoidal",
+        "Longitude of natural origin",
+        0,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+    ],
+    [
+        25,
+        "Sinusoidal, clon = 180",
+        "Sinusoidal",
+        "Longitude of natural origin",
+        180,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+    ],
+    [
+        30,
+        "North Polar",
+        "Polar Stereographic (variant A)",
+        "Latitude of natural origin",
+        90,
+        "Longitude of natural origin",
+        0,
+        "Scale factor at natural origin",
+        1,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+    ],
+    [
+        35,
+        "South Polar",
+        "Polar Stereographic (variant A)",
+        "Latitude of natural origin",
+        -90,
+        "Longitude of natural origin",
+        0,
+        "Scale factor at natural origin",
+        1,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+    ],
+    [
+        40,
+        "Mollweide, clon = 0",
+        "Mollweide",
+        "Longitude of natural origin",
+        0,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+    ],
+    [
+        45,
+        "Mollweide, clon = 180",
+        "Mollweide",
+        "Longitude of natural origin",
+        180,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+    ],
+    [
+        50,
+        "Robinson, clon = 0",
+        "Robinson",
+        "Longitude of natural origin",
+        0,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+    ],
+    [
+        55,
+        "Robinson, clon = 180",
+        "Robinson",
+        "Longitude of natural origin",
+        180,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+    ],
+    [
+        60,
+        "Tranverse Mercator",
+        "Transverse Mercator",
+        "Latitude of natural origin",
+        0,
+        "Longitude of natural origin",
+        0,
+        "Scale factor at natural origin",
+        1,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+    ],
+    [
+        65,
+        "Orthographic, clon = 0",
+        "Orthographic",
+        "Latitude of natural origin",
+        0,
+        "Longitude of natural origin",
+        0,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+        None,
+        None,
+    ],
+    [
+        70,
+        "Orthographic, clon = 180",
+        "Orthographic",
+        "Latitude of natural origin",
+        0,
+        "Longitude of natural origin",
+        180,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+        None,
+        None,
+    ],
+    [
+        75,
+        "Lambert Conic Conformal",
+        "Lambert Conic Conformal (2SP)",
+        "Latitude of false origin",
+        40,
+        "Longitude of false origin",
+        0,
+        "Latitude of 1st standard parallel",
+        20,
+        "Latitude of 2nd standard parallel",
+        60,
+        "Easting at false origin",
+        0,
+        "Northing at false origin",
+        0,
+    ],
+    [
+        80,
+        "Lambert Azimuthal Equal Area",
+        "Lambert Azimuthal Equal Area",
+        "Latitude of natural origin",
+        40,
+        "Longitude of natural origin",
+        0,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+        None,
+        None,
+    ],
+    [
+        85,
+        "Albers Equal Area",
+        "Albers Equal Area",
+        "Latitude of false origin",
+        40,
+        "Longitude of false origin",
+        0,
+        "Latitude of 1st standard parallel",
+        20,
+        "Latitude of 2nd standard parallel",
+        60,
+        "Easting at false origin",
+        0,
+        "Northing at false origin",
+        0,
+    ],
+    [
+        90,
+        "Mercator",
+        "Mercator (Spherical)",
+        "Latitude of natural origin",
+        0,
+        "Longitude of natural origin",
+        0,
+        "False easting",
+        0,
+        "False northing",
+        0,
+        None,
+        None,
+        None,
+        None,
+    ],
+]
+
+METHOD_AND_PARAM_MAPPING: Dict[str, List] = {
+    "Mercator (Spherical)": ["EPSG", 1026],
+    "Lambert Azimuthal Equal Area (Spherical)": ["EPSG", 1027],
+    "Equidistant Cylindrical": ["EPSG", 1028],
+    "Equidistant Cylindrical (Spherical)": ["EPSG", 1029],
+    "Scale factor at natural origin": [
+        "EPSG",
+        8805,
+        'SCALEUNIT["unity",1,ID["EPSG", 9201]]',
+    ],
+    "False easting": [
+        "EPSG",
+        8806,
+        'LENGTHUNIT["metre",1,ID["EPSG", 9001]]',
+    ],
+    "False northing": [
+        "EPSG",
+        8807,
+        'LENGTHUNIT["metre",1,ID["EPSG", 9001]]',
+    ],
+    "Latitude of natural origin": [
+        "EPSG",
+        8801,
+        'ANGLEUNIT["degree",0.0174532925199433,ID["EPSG", 9122]]',
+    ],
+    "Longitude of natural origin": [
+        "EPSG",
+        8802,
+        'ANGLEUNIT["degree",0.0174532925199433,ID["EPSG", 9122]]',
+    ],
+    "Latitude of false origin": [
+        "EPSG",
+        8821,
+        'ANGLEUNIT["degree",0.0174532925199433,ID["EPSG", 9122]]',
+    ],
+    "Longitude of false origin": [
+        "EPSG",
+        8822,
+        'ANGLEUNIT["degree",0.0174532925199433,ID["EPSG", 9122]]',
+    ],
+    "Latitude of 1st standard parallel": [
+        "EPSG",
+        8823,
+        'ANGLEUNIT["degree",0.0174532925199433,ID["EPSG", 9122]]',
+    ],
+    "Latitude of 2nd standard parallel": [
+        "EPSG",
+        8824,
+        'ANGLEUNIT["degree",0.0174532925199433,ID["EPSG", 9122]]',
+    ],
+    "Easting at false origin": [
+        "EPSG",
+        8826,
+        'LENGTHUNIT["metre",1,ID["EPSG", 9001]]',
+    ],
+    "Northing at false origin": [
+        "EPSG",
+        8827,
+        'LENGTHUNIT["metre",1,ID["EPSG", 9001]]',
+    ],
+    "Sinusoidal": ["PROJ", '"SINUSOIDAL"'],
+    "Robinson": ["PROJ", '"ROBINSON"'],
+    "Mollweide": ["PROJ", '"MOLLWEIDE"'],
+    "Transverse Mercator": ["EPSG", 9807],
+    "Lambert Conic Conformal (2SP)": ["EPSG", 9802],
+    "Polar Stereographic (variant A)": ["EPSG", 9810],
+    "Lambert Azimuthal Equal Area": ["EPSG", 9820],
+    "Albers Equal Area": ["EPSG", 9822],
+    "Orthographic": ["EPSG", 9840],
+    "Popular Visualisation Pseudo Mercator": ["EPSG", 1024],
+}
+
+# offset, name, method and 6 parameters with their values
+NB_COLUMNS = 15
+
+
+class ProjectionParameter:
+    """A parameter of a projection method."""
+
+    TEMPLATE = """PARAMETER["$parameter_name", $parameter_value,
+            $unit,
+            ID["$authority", $authority_code]]"""
+
+    def __init__(
+        self,
+        name: str,
+        value: Union[int, float],
+        unit: str,
+        authority: str,
+        authority_code: Union[int, str],
+    ):
+        """Creates a parameter of a projection method.
+
+        Args:
+            name (str): name of the parameter
+            value (Union[int, float]): value of the parameter
+            unit (str): WKT of the unit
+            authority (str): authority of the parameter
+            authority_code (Union[int, str]): code of the parameter in the authority
+        """
+        self.__name: str = name
+        self.__value: Union[int, float] = value
+        self.__unit: str = unit
+        self.__authority: str = authority
+        self.__authority_code: Union[int, str] = authority_code
+
+    @property
+    def name(self) -> str:
+        """The name of the parameter.
+
+        :getter: Returns the name
+        :type: str
+        """
+        return self.__name
+
+    @property
+    def value(self) -> Union[int, float]:
+        """The value of the parameter.
+
+        :getter: Returns the value
+        :type: Union[int, float]
+        """
+        return self.__value
+
+    @property
+    def unit(self) -> str:
+        """The WKT of the unit.
+
+        :getter: Returns the WKT of the unit
+        :type: str
+        """
+        return self.__unit
+
+    @property
+    def authority(self) -> str:
+        """The authority of the parameter.
+
+        :getter: Returns the authority
+        :type: str
+        """
+        return self.__authority
+
+    @property
+    def authority_code(self) -> Union[int, str]:
+        """The code of the parameter in the authority.
+
+        :getter: Returns the code
+        :type: Union[int, str]
+        """
+        return self.__authority_code
+
+    def wkt(self) -> str:
+        """Returns the WKT of the parameter.
+
+        Returns:
+            str: the WKT of the parameter
+        """
+        return Template(ProjectionParameter.TEMPLATE).substitute(
+            parameter_name=self.name,
+            parameter_value=self.value,
+            unit=self.unit,
+            authority=self.authority,
+            authority_code=self.authority_code,
+        )
+
+
+class ProjectionDefinition:
+    """A compiled projection of the catalogue."""
+
+    TEMPLATE_CONVERSION = """CONVERSION["$conversion_name",
+        METHOD["$method_name",
+            ID["$authority", $authority_code]],
+        $params],"""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        offset: int,
+        name: str,
+        method: str,
+        method_authority: str,
+        method_code: Union[int, str],
+        parameters: Tuple[ProjectionParameter, ...],
+        sphere_only: bool = False,
+    ):
+        """Creates a compiled projection.
+
+        Args:
+            offset (int): offset added to the code of the body CRS
+            name (str): name of the projection
+            method (str): name of the projection method
+            method_authority (str): authority of the method
+            method_code (Union[int, str]): code of the method in the authority
+            parameters (Tuple[ProjectionParameter, ...]): parameters of the method
+            sphere_only (bool, optional): True when the projection is only
+            defined for a sphere. Defaults to False.
+        """
+        self.__offset: int = offset
+        self.__name: str = name
+        self.__method: str = method
+        self.__method_authority: str = method_authority
+        self.__method_code: Union[int, str] = method_code
+        self.__parameters: Tuple[ProjectionParameter, ...] = parameters
+        self.__sphere_only: bool = sphere_only
+        self.__wkt: Optional[str] = None
+
+    @property
+    def offset(self) -> int:
+        """The offset added to the code of the body CRS.
+
+        :getter: Returns the offset
+        :type: int
+        """
+        return self.__offset
+
+    @property
+    def name(self) -> str:
+        """The name of the projection.
+
+        :getter: Returns the name
+        :type: str
+        """
+        return self.__name
+
+    @property
+    def method(self) -> str:
+        """The name of the projection method.
+
+        :getter: Returns the name of the method
+        :type: str
+        """
+        return self.__method
+
+    @property
+    def method_authority(self) -> str:
+        """The authority of the projection method.
+
+        :getter: Returns the authority
+        :type: str
+        """
+        return self.__method_authority
+
+    @property
+    def method_code(self) -> Union[int, str]:
+        """The code of the projection method in the authority.
+
+        :getter: Returns the code
+        :type: Union[int, str]
+        """
+        return self.__method_code
+
+    @property
+    def parameters(self) -> Tuple[ProjectionParameter, ...]:
+        """The parameters of the projection method.
+
+        :getter: Returns the parameters
+        :type: Tuple[ProjectionParameter, ...]
+        """
+        return self.__parameters
+
+    @property
+    def sphere_only(self) -> bool:
+        """True when the projection is only defined for a sphere.
+
+        :getter: Returns True when the projection is only for a sphere
+        :type: bool
+        """
+        return self.__sphere_only
+
+    def to_list(self) -> List[Any]:
+        """Returns the projection as a row of PROJECTION_DATA.
+
+        Returns:
+            List[Any]: offset, name, method then the parameters and their values
+        """
+        result: List[Any] = [self.offset, self.name, self.method]
+        for parameter in self.parameters:
+            result.extend([parameter.name, parameter.value])
+        result.extend([None] * (NB_COLUMNS - len(result)))
+        return result
+
+    def wkt(self) -> str:
+        """Returns the WKT of the conversion.
+
+        The WKT does not depend on the body, so it is rendered once.
+
+        Returns:
+            str: the WKT of the conversion
+        """
+        if self.__wkt is None:
+            self.__wkt = Template(
+                ProjectionDefinition.TEMPLATE_CONVERSION
+            ).substitute(
+                conversion_name=self.name,
+                method_name=self.method,
+                authority=self.method_authority,
+                authority_code=self.method_code,
+                params=",\n\t\t".join(
+                    parameter.wkt() for parameter in self.parameters
+                ),
+            )
+        return self.__wkt
+
+    @staticmethod
+    def create(
+        projection: Dict[str, Any],
+        mapping: Optional[Dict[str, List]] = None,
+    ) -> "ProjectionDefinition":
+        """Create and validate a projection.
+
+        Args:
+            projection (Dict[str, Any]): offset, name, method, parameters
+            (dictionary of the parameter values by name) and optionally
+            sphere_only
+            mapping (Optional[Dict[str, List]], optional): authority of the
+            methods and the parameters. Defaults to METHOD_AND_PARAM_MAPPING.
+
+        Raises:
+            ValueError: invalid projection
+
+        Returns:
+            ProjectionDefinition: the compiled projection
+        """
+        if mapping is None:
+            mapping = METHOD_AND_PARAM_MAPPING
+        if not isinstance(projection, dict):
+            raise ValueError(
+                f"Invalid projection {projection!r} : a dictionary is expected"
+            )
+        for key in ("offset", "name", "method"):
+            if key not in projection:
+                raise ValueError(f"Missing {key} in projection {projection}")
+        offset = projection["offset"]
+        name: str = projection["name"]
+        method: str = projection["method"]
+        if (
+            not isinstance(offset, int)
+            or isinstance(offset, bool)
+            or offset % 5 != 0
+            or not 5 <= offset <= 95
+        ):
+            raise ValueError(
+                f"Invalid offset {offset} for {name} : a multiple of 5 between 5 and 95 is expected"
+            )
+        if method not in mapping:
+            raise ValueError(f"Unknown method {method} for {name}")
+        ProjectionDefinition._check_mapping(mapping, method, 2, name)
+        if not isinstance(projection.get("parameters", {}), dict):
+            raise ValueError(
+                f"Invalid parameters of {name} : a dictionary is expected"
+            )
+
+        parameters: List[ProjectionParameter] = list()
+        for param_name, value in projection.get("parameters", {}).items():
+            if param_name not in mapping:
+                raise ValueError(f"Unknown parameter {param_name} for {name}")
+            ProjectionDefinition._check_mapping(mapping, param_name, 3, name)
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                raise ValueError(
+                    f"Invalid value {value} for the parameter {param_name} of {name}"
+                )
+            authority, authority_code, unit = mapping[param_name][0:3]
+            parameters.append(
+                ProjectionParameter(
+                    param_name, value, unit, authority, authority_code
+                )
+            )
+        if 3 + 2 * len(parameters) > NB_COLUMNS:
+            raise ValueError(f"Too many parameters for {name}")
+
+        return ProjectionDefinition(
+            offset,
+            name,
+            method,
+            mapping[method][0],
+            mapping[method][1],
+            tuple(parameters),
+            projection.get("sphere_only", method.endswith("(Spherical)")),
+        )
+
+    @staticmethod
+    def _check_mapping(
+        mapping: Dict[str, List], key: str, size: int, name: str
+    ):
+        """Checks the authority of a method or of a parameter.
+
+        Args:
+            mapping (Dict[str, List]): authority of the methods and the
+            parameters
+            key (str): method or parameter
+            size (int): expected number of elements, 2 for a method
+            (authority, code) and 3 for a parameter (authority, code, unit)
+            name (str): name of the projection using the key
+
+        Raises:
+            ValueError: the authority is not a list of size elements
+        """
+        entry: Any = mapping[key]
+        if not isinstance(entry, (list, tuple)) or len(entry) < size:
+            raise ValueError(
+                f"Invalid authority {entry!r} of {key} for {name} : a list with {size} elements is expected"
+            )
+
+    @staticmethod
+    def from_list(
+        projection: List[Any], mapping: Optional[Dict[str, List]] = None
+    ) -> "ProjectionDefinition":
+        """Create a projection from a row of PROJECTION_DATA.
+
+        Args:
+            projection (List[Any]): offset, name, method then the parameters
+            and their values
+            mapping (Optional[Dict[str, List]], optional): authority of the
+            methods and the parameters. Defaults to METHOD_AND_PARAM_MAPPING.
+
+        Returns:
+            ProjectionDefinition: the compiled projection
+        """
+        params: List[Any] = [
+            param for param in projection[3:] if param is not None
+        ]
+        if len(params) % 2 != 0:
+            raise ValueError(
+                f"A value is missing in the parameters of {projection[1]}"
+            )
+        return ProjectionDefinition.create(
+            {
+                "offset": int(projection[0]),
+                "name": projection[1],
+                "method": projection[2],
+                "parameters": dict(zip(params[0::2], params[1::2])),
+            },
+            mapping,
+        )
+
+
+class ProjectionCatalogue:
+    """Catalogue of projections indexed by offset."""
+
+    CACHE_VERSION = 2
+
+    _DEFAULT: Optional["ProjectionCatalogue"] = None
+
+    def __init__(self, definitions: List[ProjectionDefinition]):
+        """Creates the catalogue.
+
+        Args:
+            definitions (List[ProjectionDefinition]): compiled projections
+
+        Raises:
+            ValueError: several projections have the same offset
+        """
+        self.__definitions: Tuple[ProjectionDefinition, ...] = tuple(
+            definitions
+        )
+        self.__by_offset: Dict[int, ProjectionDefinition] = dict()
+        for definition in self.__definitions:
+            if definition.offset in self.__by_offset:
+                raise ValueError(
+                    f"Duplicated offset {definition.offset} for {definition.name} and {self.__by_offset[definition.offset].name}"
+                )
+            self.__by_offset[definition.offset] = definition
+
+    def __iter__(self) -> Iterator[ProjectionDefinition]:
+        return iter(self.__definitions)
+
+    def __len__(self) -> int:
+        return len(self.__definitions)
+
+    def __contains__(self, offset: int) -> bool:
+        return offset in self.__by_offset
+
+    def get(self, offset: int) -> ProjectionDefinition:
+        """Returns the projection for an offset.
+
+        Args:
+            offset (int): offset of the projection
+
+        Raises:
+            KeyError: unknown offset
+
+        Returns:
+            ProjectionDefinition: the projection
+        """
+        return self.__by_offset[offset]
+
+    @property
+    def offsets(self) -> Tuple[int, ...]:
+        """The offsets of the projections, in the order of the catalogue.
+
+        :getter: Returns the offsets
+        :type: Tuple[int, ...]
+        """
+        return tuple(definition.offset for definition in self.__definitions)
+
+    @staticmethod
+    def default() -> "ProjectionCatalogue":
+        """Returns the built-in catalogue, compiled once.
+
+        Returns:
+            ProjectionCatalogue: the built-in catalogue
+        """
+        if ProjectionCatalogue._DEFAULT is None:
+            ProjectionCatalogue._DEFAULT = ProjectionCatalogue(
+                [
+                    ProjectionDefinition.from_list(projection)
+                    for projection in PROJECTION_DATA
+                ]
+            )
+        return ProjectionCatalogue._DEFAULT
+
+    @staticmethod
+    def compile(content: Dict[str, Any]) -> "ProjectionCatalogue":
+        """Validate and compile a catalogue.
+
+        Args:
+            content (Dict[str, Any]): projections (list of dictionaries with
+            offset, name, method, parameters and optionally sphere_only),
+            methods and parameters. The methods and the parameters, with
+            the same structure as METHOD_AND_PARAM_MAPPING, extend the
+            built-in ones.
+
+        Raises:
+            ValueError: invalid catalogue
+
+        Returns:
+            ProjectionCatalogue: the compiled catalogue
+        """
+        if not isinstance(content, dict):
+            raise ValueError("Invalid catalogue : a dictionary is expected")
+        mapping: Dict[str, List] = dict(METHOD_AND_PARAM_MAPPING)
+        for key in ("methods", "parameters"):
+            if not isinstance(content.get(key, {}), dict):
+                raise ValueError(
+                    f"Invalid {key} in the catalogue : a dictionary is expected"
+                )
+            mapping.update(content.get(key, {}))
+        if not isinstance(content.get("projections", []), list):
+            raise ValueError(
+                "Invalid projections in the catalogue : a list is expected"
+            )
+        if len(content.get("projections", [])) == 0:
+            raise ValueError("No projection in the catalogue")
+        return ProjectionCatalogue(
+            [
+                ProjectionDefinition.create(projection, mapping)
+                for projection in content["projections"]
+            ]
+        )
+
+    @staticmethod
+    def _parse(path: str, data: bytes) -> Dict[str, Any]:
+        """Parse the content of a catalogue file according to its extension.
+
+        Args:
+            path (str): path of the catalogue
+            data (bytes): content of the catalogue
+
+        Raises:
+            ValueError: unsupported file extension
+
+        Returns:
+            Dict[str, Any]: the catalogue content
+        """
+        extension: str = os.path.splitext(path)[1].lower()
+        content: Dict[str, Any]
+        if extension == ".json":
+            content = json.loads(data.decode("utf-8"))
+        elif extension == ".toml":
+            try:
+                import tomllib  # pylint: disable=import-outside-toplevel
+            except ImportError:  # python < 3.11
+                import tomli as tomllib  # type: ignore # pylint: disable=import-outside-toplevel,import-error
+            content = tomllib.loads(data.decode("utf-8"))
+        elif extension == ".csv":
+            # offset, name, method, then the parameters and their values
+            reader = csv.reader(data.decode("utf-8").splitlines())
+            next(reader, None)  # header
+            projections: List[Dict[str, Any]] = list()
+            for row in reader:
+                if len(row) == 0:
+                    continue
+                values: List[str] = [value for value in row[3:] if value]
+                projections.append(
+                    {
+                        "offset": int(row[0]),
+                        "name": row[1],
+                        "method": row[2],
+                        "parameters": {
+                            param: ProjectionCatalogue._number(value)
+                            for param, value in zip(values[0::2], values[1::2])
+                        },
+                    }
+                )
+            content = {"projections": projections}
+        else:
+            raise ValueError(
+                f"Unsupported catalogue {path} : json, toml or csv is expected"
+            )
+        return content
+
+    @staticmethod
+    def _number(value: str) -> Union[int, float]:
+        """Converts a CSV value in number.
+
+        Args:
+            value (str): the value
+
+        Returns:
+            Union[int, float]: the number
+        """
+        try:
+            return int(value)
+        except ValueError:
+            return float(value)
+
+    @staticmethod
+    def cache_directory() -> str:
+        """Returns the directory where the compiled catalogues are cached.
+
+        Returns:
+            str: the cache directory
+        """
+        return os.path.join(
+            os.environ.get(
+                "XDG_CACHE_HOME",
+                os.path.join(os.path.expanduser("~"), ".cache"),
+            ),
+            "csvforwkt",
+        )
+
+    @staticmethod
+    def cache_key() -> bytes:
+        """Returns the part of the cache key that does not depend on the
+        file: the version of the cache and of the package, and the built-in
+        methods, parameters and projections.
+
+        Returns:
+            bytes: the key
+        """
+        # pylint: disable=import-outside-toplevel
+        from . import __version__
+
+        return json.dumps(
+            [
+                ProjectionCatalogue.CACHE_VERSION,
+                __version__,
+                METHOD_AND_PARAM_MAPPING,
+                PROJECTION_DATA,
+            ]
+        ).encode("utf-8")
+
+    @staticmethod
+    def load(
+        path: str, cache_directory: Optional[str] = None, use_cache=True
+    ) -> "ProjectionCatalogue":
+        """Load a catalogue from a JSON, TOML or CSV file.
+
+        The validated catalogue is cached as JSON in the cache directory
+        under the hash of the file content and of the cache key, and compiled
+        again when it is read.
+
+        Args:
+            path (str): path of the catalogue
+            cache_directory (Optional[str], optional): cache directory.
+            Defaults to ProjectionCatalogue.cache_directory().
+            use_cache (bool, optional): True to read and write the cache.
+            Defaults to True.
+
+        Raises:
+            ValueError: invalid catalogue
+
+        Returns:
+            ProjectionCatalogue: the compiled catalogue
+        """
+        with open(path, "rb") as file:
+            data: bytes = file.read()
+        if cache_directory is None:
+            cache_directory = ProjectionCatalogue.cache_directory()
+        digest: str = hashlib.sha256(
+            data + b"\0" + ProjectionCatalogue.cache_key()
+        ).hexdigest()
+        cache_file: str = os.path.join(
+            cache_directory, f"projections-{digest}.json"
+        )
+
+        if use_cache and os.path.exists(cache_file):
+            try:
+                with open(cache_file, encoding="utf-8") as file:
+                    catalogue = ProjectionCatalogue.compile(json.load(file))
+                logger.debug(f"Catalogue loaded from the cache {cache_file}")
+                return catalogue
+            except Exception as error:  # pylint: disable=broad-except
+                logger.debug(f"Cannot read the cache {cache_file}: {error}")
+
+        catalogue = ProjectionCatalogue.compile(
+            ProjectionCatalogue._parse(path, data)
+        )
+        logger.debug(
+            f"Catalogue {path} validated ({len(catalogue)} projections)"
+        )
+
+        if use_cache:
+            tmp_file: str = f"{cache_file}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(cache_directory, exist_ok=True)
+                with open(tmp_file, "w", encoding="utf-8") as file:
+                    json.dump(catalogue.to_dict(), file)
+                os.replace(tmp_file, cache_file)
+            except Exception as error:  # pylint: disable=broad-except
+                logger.debug(f"Cannot write the cache {cache_file}: {error}")
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+        return catalogue
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the catalogue in the format of the JSON files.
+
+        Returns:
+            Dict[str, Any]: the content that `compile` accepts
+        """
+        return {
+            "projections": [
+                {
+                    "offset": definition.offset,
+                    "name": definition.name,
+                    "method": definition.method,
+                    "parameters": {
+                        parameter.name: parameter.value
+                        for parameter in definition.parameters
+                    },
+                    "sphere_only": definition.sphere_only,
+                }
+                for definition in self
+            ]
+        }
+
+    def dump(self, path: str):
+        """Writes the catalogue as a JSON file that can be loaded again.
+
+        Args:
+            path (str): path of the JSON file
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
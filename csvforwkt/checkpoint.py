@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to checkpoint the long runs.
+
+While the CRS are streamed in a WKT or JSON Lines file, a checkpoint is saved
+periodically next to the output (iau.wkt.checkpoint). It records the last
+body that is completely written, the size of the output at that point, the
+number of CRS written and a fingerprint of the inputs and of the options. A
+resumed run checks the fingerprint, truncates the output to the recorded
+size, so that a partial body is removed, and appends the next bodies. The
+checkpoint is removed when the run is completed.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from functools import partial
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """Checkpoint of a streamed output."""
+
+    SUFFIX: str = ".checkpoint"
+
+    DEFAULT_INTERVAL: float = 60.0
+
+    def __init__(
+        self,
+        output_path: str,
+        fingerprint: str,
+        interval: float = DEFAULT_INTERVAL,
+    ):
+        """Creates the checkpoint of an output.
+
+        Args:
+            output_path (str): path of the output
+            fingerprint (str): fingerprint of the inputs and of the options
+            interval (float, optional): minimum time in seconds between two
+            checkpoints. Defaults to DEFAULT_INTERVAL.
+        """
+        self.__output_path: str = output_path
+        self.__fingerprint: str = fingerprint
+        self.__interval: float = interval
+        self.__naif_id: Optional[int] = None
+        self.__offset: int = 0
+        self.__nb_crs: int = 0
+        self.__saved_at: float = time.monotonic()
+
+    @property
+    def output_path(self) -> str:
+        """The output.
+
+        :getter: Returns the path of the output
+        :type: str
+        """
+        return self.__output_path
+
+    @property
+    def path(self) -> str:
+        """The checkpoint file.
+
+        :getter: Returns the path of the checkpoint file
+        :type: str
+        """
+        return self.__output_path + Checkpoint.SUFFIX
+
+    @property
+    def fingerprint(self) -> str:
+        """The fingerprint of the inputs and of the options.
+
+        :getter: Returns the fingerprint
+        :type: str
+        """
+        return self.__fingerprint
+
+    @property
+    def interval(self) -> float:
+        """The minimum time between two checkpoints.
+
+        :getter: Returns the interval in seconds
+        :type: float
+        """
+        return self.__interval
+
+    @property
+    def naif_id(self) -> Optional[int]:
+        """The last body completely written.
+
+        :getter: Returns the Naif ID, None when no body is written
+        :type: Optional[int]
+        """
+        return self.__naif_id
+
+    @property
+    def offset(self) -> int:
+        """The size of the output after the last body.
+
+        :getter: Returns the size in bytes
+        :type: int
+        """
+        return self.__offset
+
+    @property
+    def nb_crs(self) -> int:
+        """The number of CRS written until the last body.
+
+        :getter: Returns the number of CRS
+        :type: int
+        """
+        return self.__nb_crs
+
+    @staticmethod
+    def create_fingerprint(
+        paths: Iterable[Optional[str]], options: Dict[str, Any]
+    ) -> str:
+        """Returns the fingerprint of the inputs and of the options.
+
+        Args:
+            paths (Iterable[Optional[str]]): input files, None is ignored
+            options (Dict[str, Any]): options changing the output
+
+        Returns:
+            str: the fingerprint
+        """
+        digest = hashlib.sha256()
+        for path in paths:
+            if path is None:
+                continue
+            with open(path, "rb") as file:
+                for chunk in iter(partial(file.read, 1 << 20), b""):
+                    digest.update(chunk)
+            digest.update(b"\0")
+        digest.update(
+            json.dumps(options, sort_keys=True, default=str).encode("utf-8")
+        )
+        return digest.hexdigest()
+
+    def load(self) -> bool:
+        """Loads the checkpoint file.
+
+        Raises:
+            ValueError: the inputs or the options changed since the
+            checkpoint, or the output is shorter than the checkpoint
+
+        Returns:
+            bool: True when a checkpoint is loaded, False when there is no
+            checkpoint
+        """
+        if not os.path.exists(self.path):
+            logger.info(
+                f"No checkpoint {self.path}, starting from the beginning"
+            )
+            return False
+        with open(self.path, encoding="utf-8") as file:
+            data: Dict[str, Any] = json.load(file)
+        if data["fingerprint"] != self.fingerprint:
+            raise ValueError(
+                f"{self.path}: the inputs or the options changed since the checkpoint"
+            )
+        if (
+            not os.path.exists(self.output_path)
+            or os.path.getsize(self.output_path) < data["offset"]
+        ):
+            raise ValueError(
+                f"{self.output_path} is shorter than its checkpoint {self.path}"
+            )
+        self.__naif_id = data["naif_id"]
+        self.__offset = data["offset"]
+        self.__nb_crs = data["nb_crs"]
+        logger.info(
+            f"Resuming after the body {self.naif_id} ({self.nb_crs} CRS, {self.offset} bytes)"
+        )
+        return True
+
+    def is_due(self) -> bool:
+        """Checks if a checkpoint must be saved.
+
+        Returns:
+            bool: True when the interval is elapsed since the last checkpoint
+        """
+        return time.monotonic() - self.__saved_at >= self.interval
+
+    def save(self, naif_id: int, offset: int, nb_crs: int):
+        """Saves the checkpoint atomically.
+
+        The output must be synchronized on the disk before, so that the
+        checkpoint never references data that is lost.
+
+        Args:
+            naif_id (int): last body completely written
+            offset (int): size of the output after this body
+            nb_crs (int): number of CRS written until this body
+        """
+        self.__naif_id = naif_id
+        self.__offset = offset
+        self.__nb_crs = nb_crs
+        tmp_file: str = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "fingerprint": self.fingerprint,
+                    "naif_id": naif_id,
+                    "offset": offset,
+                    "nb_crs": nb_crs,
+                },
+                file,
+            )
+        os.replace(tmp_file, self.path)
+        self.__saved_at = time.monotonic()
+        logger.debug(f"Checkpoint after the body {naif_id} ({nb_crs} CRS)")
+
+    def remove(self):
+        """Removes the checkpoint file, once the output is completed."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
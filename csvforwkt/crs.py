@@ -50,22 +50,28 @@ from abc import abstractmethod
 from abc import abstractproperty
 from enum import Enum
 from string import Template
-from typing import cast
-from typing import Dict
+from typing import Any
 from typing import Generator
 from typing import List
 from typing import Optional
 from typing import Tuple
+from typing import TYPE_CHECKING
+from typing import Union
 
-import numpy as np  # pylint: disable=import-error
-import pandas as pd  # pylint: disable=import-error
-
-from .body import IAU_REPORT
 from .body import IBody
 from .body import ReferenceShape
+from .body import ReportContext
+from .catalogue import METHOD_AND_PARAM_MAPPING
+from .catalogue import PROJECTION_DATA
+from .catalogue import ProjectionCatalogue
+from .catalogue import ProjectionDefinition
+from .catalogue import ProjectionParameter
 from .datum import Anchor
 from .datum import Datum
 
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd  # pylint: disable=import-error
+
 
 class ICrs(metaclass=ABCMeta):
     """High level class that handles a Coordinate Reference System."""
@@ -190,8 +196,13 @@ class BodyCrs(ICrs):
 \tID["IAU", $number, $version],
 \tREMARK["$remark"]]"""
 
-    def __init__(
-        self, datum: Datum, number_body: int, direction: str, crs_type: CrsType
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        datum: Datum,
+        number_body: int,
+        direction: str,
+        crs_type: CrsType,
+        report: Optional[ReportContext] = None,
     ):
         """Create a Coordinate Reference System for a celestial body
 
@@ -200,9 +211,14 @@ class BodyCrs(ICrs):
             number_body (int): IAU code
             direction (str): rotation sens of the body
             crs_type (CrsType): type of CRS
+            report (Optional[ReportContext], optional): IAU report. Defaults
+            to the report of the context.
         """
         self.__datum: Datum = datum
         self.__crs_type: CrsType = crs_type
+        self.__report: ReportContext = (
+            ReportContext.current() if report is None else report
+        )
         self.__direction: str = self._create_direction(
             datum.name, direction, crs_type, number_body
         )
@@ -307,9 +323,9 @@ class BodyCrs(ICrs):
         """
         result: str
         if self.datum.body.warning is None:
-            result = IAU_REPORT.SOURCE_IAU
+            result = self.report.source
         else:
-            result = self.datum.body.warning + IAU_REPORT.SOURCE_IAU
+            result = self.datum.body.warning + self.report.source
         return result
 
     @property
@@ -348,6 +364,15 @@ class BodyCrs(ICrs):
         """
         return self.__direction
 
+    @property
+    def report(self) -> ReportContext:
+        """IAU report.
+
+        :getter: Returns the IAU report
+        :type: ReportContext
+        """
+        return self.__report
+
     @property
     def iau_code(self) -> int:
         """Returns the IAU code.
@@ -369,7 +394,7 @@ class BodyCrs(ICrs):
         biaxialbody_template = Template(self.__template)
         datum = biaxialbody_template.substitute(
             name=self.name,
-            version=IAU_REPORT.VERSION,
+            version=self.report.version,
             datum=self.datum.wkt(),
             number=self.iau_code,
             direction=self.direction,
@@ -381,23 +406,33 @@ class BodyCrs(ICrs):
 class Planetocentric:
     """Computes the planetocentric coordinate reference system."""
 
-    def __init__(self, row: pd.Series, ref_shape: ReferenceShape):
+    def __init__(
+        self,
+        row: "pd.Series",
+        ref_shape: ReferenceShape,
+        report: Optional[ReportContext] = None,
+    ):
         """Creates a description of a planetocentric Coordinate Reference
         System.
 
         Args:
             row (pd.Series): description of the current body
             ref_shape(ReferenceShape) : Reference of the shape
+            report (Optional[ReportContext], optional): IAU report. Defaults
+            to the report of the context.
 
         Returns:
             ICrs: Coordinate Reference System description
         """
-        self.__row: pd.dataframe = row
+        self.__row: "pd.DataFrame" = row
         self.__ref_shape: ReferenceShape = ref_shape
+        self.__report: ReportContext = (
+            ReportContext.current() if report is None else report
+        )
         self.__crs: BodyCrs = self._crs()
 
     @property
-    def row(self) -> pd.DataFrame:
+    def row(self) -> "pd.DataFrame":
         """Description of the current body.
 
         Returns:
@@ -414,6 +449,15 @@ class Planetocentric:
         """
         return self.__ref_shape
 
+    @property
+    def report(self) -> ReportContext:
+        """IAU report.
+
+        :getter: Returns the IAU report
+        :type: ReportContext
+        """
+        return self.__report
+
     @property
     def crs_type(self) -> CrsType:
         """Type of coordinate reference system.
@@ -446,6 +490,7 @@ class Planetocentric:
             self.row["IAU2015_Semiminor"],
             self.row["IAU2015_Axisb"],
             self.row["IAU2015_Mean"],
+            self.report,
         )
 
     def _create_datum(self, body: IBody) -> Datum:
@@ -460,7 +505,7 @@ class Planetocentric:
         anchor: Anchor = Anchor(
             f"{self.row['origin_long_name']} : {self.row['origin_lon_pos']}"
         )
-        return Datum.create(self.row["Body"], body, anchor)
+        return Datum.create(self.row["Body"], body, anchor, self.report)
 
     def _create_crs(self, datum: Datum) -> BodyCrs:
         """Creates a description of the planetocentric reference system based
@@ -477,6 +522,7 @@ class Planetocentric:
             self.row["Naif_id"],
             self.row["rotation"],
             CrsType.OCENTRIC,
+            self.report,
         )
 
     def _crs(self) -> BodyCrs:
@@ -527,27 +573,23 @@ class Planetographic(Planetocentric):
             self.row["Naif_id"],
             self.row["rotation"],
             CrsType.OGRAPHIC,
+            self.report,
         )
 
 
 class Conversion:
     """Projection elements."""
 
-    TEMPLATE_PARAMETER = """PARAMETER["$parameter_name", $parameter_value,
-            $unit,
-            ID["$authority", $authority_code]]"""
+    TEMPLATE_PARAMETER = ProjectionParameter.TEMPLATE
 
-    TEMPLATE_CONVERSION = """CONVERSION["$conversion_name",
-        METHOD["$method_name",
-            ID["$authority", $authority_code]],
-        $params],"""
+    TEMPLATE_CONVERSION = ProjectionDefinition.TEMPLATE_CONVERSION
 
     def __init__(
         self,
         conversion_name: str,
         method_name: str,
         method_id: str,
-        projection: List[str],
+        projection: Union[List[Any], ProjectionDefinition],
     ) -> None:
         """Creates the projection elements.
 
@@ -555,12 +597,29 @@ class Conversion:
             conversion_name (str): name of the projection
             method_name (str): name of the method
             method_id (str): method ID
-            projection (List[str]): projection elements
+            projection (Union[List[Any], ProjectionDefinition]): projection
+            elements or compiled projection
+
+        Raises:
+            ValueError: the name or the method is not the one of the
+            projection, which is rendered in the WKT
         """
         self.__conversion_name = conversion_name
         self.__method_name = method_name
         self.__method_id = method_id
-        self.__projection = projection
+        self.__definition: ProjectionDefinition = (
+            projection
+            if isinstance(projection, ProjectionDefinition)
+            else ProjectionDefinition.from_list(projection)
+        )
+        if conversion_name != self.__definition.name:
+            raise ValueError(
+                f"Conversion {conversion_name} for the projection {self.__definition.name}"
+            )
+        if method_name != self.__definition.method:
+            raise ValueError(
+                f"Method {method_name} for the projection {self.__definition.name}, expected {self.__definition.method}"
+            )
 
     @property
     def conversion_name(self) -> str:
@@ -590,13 +649,22 @@ class Conversion:
         return self.__method_id
 
     @property
-    def projection(self) -> List[str]:
+    def definition(self) -> ProjectionDefinition:
+        """Returns the compiled projection.
+
+        Returns:
+            ProjectionDefinition: the compiled projection
+        """
+        return self.__definition
+
+    @property
+    def projection(self) -> List[Any]:
         """Returns the projection elements.
 
         Returns:
-            List[str]: the projection elements
+            List[Any]: the projection elements
         """
-        return self.__projection
+        return self.__definition.to_list()
 
     def wkt(self) -> str:
         """Returns the WKT of the projection elements.
@@ -604,411 +672,16 @@ class Conversion:
         Returns:
             str: the WKT
         """
-        parameter_template = Template(Conversion.TEMPLATE_PARAMETER)
-        parameters = np.array(
-            [
-                param
-                for param in self.projection[3 : len(self.projection)]
-                if param is not None
-            ]
-        )
-        parameters = parameters.reshape(int(len(parameters) / 2), 2)
-        params: List[str] = list()
-        for parameter in parameters:
-            method_and_map: List[
-                str
-            ] = ProjectionBody.METHOD_AND_PARAM_MAPPING[parameter[0]]
-            param: str = parameter_template.substitute(
-                parameter_name=parameter[0],
-                parameter_value=parameter[1],
-                unit=method_and_map[2],
-                authority=method_and_map[0],
-                authority_code=method_and_map[1],
-            )
-            params.append(param)
-        conversion_template = Template(Conversion.TEMPLATE_CONVERSION)
-
-        conversion = conversion_template.substitute(
-            conversion_name=self.projection[1],
-            method_name=self.projection[2],
-            authority=ProjectionBody.METHOD_AND_PARAM_MAPPING[
-                self.projection[2]
-            ][0],
-            authority_code=ProjectionBody.METHOD_AND_PARAM_MAPPING[
-                self.projection[2]
-            ][1],
-            params=",\n\t\t".join(params),
-        )
-        return conversion
+        return self.__definition.wkt()
 
 
 @ICrs.register
 class ProjectionBody(ICrs):
     """Coordinate Reference System of the projected body."""
 
-    PROJECTION_DATA = [
-        [
-            10,
-            "Equirectangular, clon = 0",
-            "Equidistant Cylindrical",
-            "Latitude of 1st standard parallel",
-            0,
-            "Longitude of natural origin",
-            0,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-            None,
-            None,
-        ],
-        [
-            15,
-            "Equirectangular, clon = 180",
-            "Equidistant Cylindrical",
-            "Latitude of 1st standard parallel",
-            0,
-            "Longitude of natural origin",
-            180,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-            None,
-            None,
-        ],
-        [
-            20,
-            "Sinusoidal, clon = 0",
-            "Sinusoidal",
-            "Longitude of natural origin",
-            0,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-        ],
-        [
-            25,
-            "Sinusoidal, clon = 180",
-            "Sinusoidal",
-            "Longitude of natural origin",
-            180,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-        ],
-        [
-            30,
-            "North Polar",
-            "Polar Stereographic (variant A)",
-            "Latitude of natural origin",
-            90,
-            "Longitude of natural origin",
-            0,
-            "Scale factor at natural origin",
-            1,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-        ],
-        [
-            35,
-            "South Polar",
-            "Polar Stereographic (variant A)",
-            "Latitude of natural origin",
-            -90,
-            "Longitude of natural origin",
-            0,
-            "Scale factor at natural origin",
-            1,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-        ],
-        [
-            40,
-            "Mollweide, clon = 0",
-            "Mollweide",
-            "Longitude of natural origin",
-            0,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-        ],
-        [
-            45,
-            "Mollweide, clon = 180",
-            "Mollweide",
-            "Longitude of natural origin",
-            180,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-        ],
-        [
-            50,
-            "Robinson, clon = 0",
-            "Robinson",
-            "Longitude of natural origin",
-            0,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-        ],
-        [
-            55,
-            "Robinson, clon = 180",
-            "Robinson",
-            "Longitude of natural origin",
-            180,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-        ],
-        [
-            60,
-            "Tranverse Mercator",
-            "Transverse Mercator",
-            "Latitude of natural origin",
-            0,
-            "Longitude of natural origin",
-            0,
-            "Scale factor at natural origin",
-            1,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-        ],
-        [
-            65,
-            "Orthographic, clon = 0",
-            "Orthographic",
-            "Latitude of natural origin",
-            0,
-            "Longitude of natural origin",
-            0,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-            None,
-            None,
-        ],
-        [
-            70,
-            "Orthographic, clon = 180",
-            "Orthographic",
-            "Latitude of natural origin",
-            0,
-            "Longitude of natural origin",
-            180,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-            None,
-            None,
-        ],
-        [
-            75,
-            "Lambert Conic Conformal",
-            "Lambert Conic Conformal (2SP)",
-            "Latitude of false origin",
-            40,
-            "Longitude of false origin",
-            0,
-            "Latitude of 1st standard parallel",
-            20,
-            "Latitude of 2nd standard parallel",
-            60,
-            "Easting at false origin",
-            0,
-            "Northing at false origin",
-            0,
-        ],
-        [
-            80,
-            "Lambert Azimuthal Equal Area",
-            "Lambert Azimuthal Equal Area",
-            "Latitude of natural origin",
-            40,
-            "Longitude of natural origin",
-            0,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-            None,
-            None,
-        ],
-        [
-            85,
-            "Albers Equal Area",
-            "Albers Equal Area",
-            "Latitude of false origin",
-            40,
-            "Longitude of false origin",
-            0,
-            "Latitude of 1st standard parallel",
-            20,
-            "Latitude of 2nd standard parallel",
-            60,
-            "Easting at false origin",
-            0,
-            "Northing at false origin",
-            0,
-        ],
-        [
-            90,
-            "Mercator",
-            "Mercator (Spherical)",
-            "Latitude of natural origin",
-            0,
-            "Longitude of natural origin",
-            0,
-            "False easting",
-            0,
-            "False northing",
-            0,
-            None,
-            None,
-            None,
-            None,
-        ],
-    ]
-
-    METHOD_AND_PARAM_MAPPING: Dict[str, List] = {
-        "Mercator (Spherical)": ["EPSG", 1026],
-        "Lambert Azimuthal Equal Area (Spherical)": ["EPSG", 1027],
-        "Equidistant Cylindrical": ["EPSG", 1028],
-        "Equidistant Cylindrical (Spherical)": ["EPSG", 1029],
-        "Scale factor at natural origin": [
-            "EPSG",
-            8805,
-            'SCALEUNIT["unity",1,ID["EPSG", 9201]]',
-        ],
-        "False easting": [
-            "EPSG",
-            8806,
-            'LENGTHUNIT["metre",1,ID["EPSG", 9001]]',
-        ],
-        "False northing": [
-            "EPSG",
-            8807,
-            'LENGTHUNIT["metre",1,ID["EPSG", 9001]]',
-        ],
-        "Latitude of natural origin": [
-            "EPSG",
-            8801,
-            'ANGLEUNIT["degree",0.0174532925199433,ID["EPSG", 9122]]',
-        ],
-        "Longitude of natural origin": [
-            "EPSG",
-            8802,
-            'ANGLEUNIT["degree",0.0174532925199433,ID["EPSG", 9122]]',
-        ],
-        "Latitude of false origin": [
-            "EPSG",
-            8821,
-            'ANGLEUNIT["degree",0.0174532925199433,ID["EPSG", 9122]]',
-        ],
-        "Longitude of false origin": [
-            "EPSG",
-            8822,
-            'ANGLEUNIT["degree",0.0174532925199433,ID["EPSG", 9122]]',
-        ],
-        "Latitude of 1st standard parallel": [
-            "EPSG",
-            8823,
-            'ANGLEUNIT["degree",0.0174532925199433,ID["EPSG", 9122]]',
-        ],
-        "Latitude of 2nd standard parallel": [
-            "EPSG",
-            8824,
-            'ANGLEUNIT["degree",0.0174532925199433,ID["EPSG", 9122]]',
-        ],
-        "Easting at false origin": [
-            "EPSG",
-            8826,
-            'LENGTHUNIT["metre",1,ID["EPSG", 9001]]',
-        ],
-        "Northing at false origin": [
-            "EPSG",
-            8827,
-            'LENGTHUNIT["metre",1,ID["EPSG", 9001]]',
-        ],
-        "Sinusoidal": ["PROJ", '"SINUSOIDAL"'],
-        "Robinson": ["PROJ", '"ROBINSON"'],
-        "Mollweide": ["PROJ", '"MOLLWEIDE"'],
-        "Transverse Mercator": ["EPSG", 9807],
-        "Lambert Conic Conformal (2SP)": ["EPSG", 9802],
-        "Polar Stereographic (variant A)": ["EPSG", 9810],
-        "Lambert Azimuthal Equal Area": ["EPSG", 9820],
-        "Albers Equal Area": ["EPSG", 9822],
-        "Orthographic": ["EPSG", 9840],
-        "Popular Visualisation Pseudo Mercator": ["EPSG", 1024],
-    }
+    PROJECTION_DATA = PROJECTION_DATA
+
+    METHOD_AND_PARAM_MAPPING = METHOD_AND_PARAM_MAPPING
 
     TEMPLATE_OCENTRIC_SPHERE = """PROJCRS["$projection_name",
     BASEGEOGCRS["$name ($version) $reference",
@@ -1053,19 +726,31 @@ class ProjectionBody(ICrs):
     ID["IAU", $number, $version]]"""
 
     def __init__(
-        self, body_crs: BodyCrs, projection: List[str], template: str
+        self,
+        body_crs: BodyCrs,
+        projection: Union[List[Any], ProjectionDefinition],
+        template: str,
     ) -> None:
         """Creates the projected body.
 
         Args:
             body_crs (BodyCrs): Coordinate Reference System of the body
-            projection (List[str]): projection elements
+            projection (Union[List[Any], ProjectionDefinition]): projection
+            elements or compiled projection
+            template (str): template
         """
         self.__body_crs: BodyCrs = body_crs
-        self.__projection: List[str] = projection
         self.__template: str = template
+        self.__definition: ProjectionDefinition = (
+            projection
+            if isinstance(projection, ProjectionDefinition)
+            else ProjectionDefinition.from_list(projection)
+        )
         self.__conversion: Conversion = self._create_conversion(
-            projection[1], projection[2], "METHOD", projection
+            self.__definition.name,
+            self.__definition.method,
+            "METHOD",
+            self.__definition,
         )
 
     def _create_conversion(  # pylint: disable=no-self-use
@@ -1073,7 +758,7 @@ class ProjectionBody(ICrs):
         conversion_name: str,
         method_name: str,
         method_id: str,
-        projection: List[str],
+        projection: ProjectionDefinition,
     ) -> Conversion:
         """Create the conversion.
 
@@ -1081,7 +766,7 @@ class ProjectionBody(ICrs):
             conversion_name (str): conversion name
             method_name (str): method name
             method_id (str): method ID
-            projection (List[str]): projection elements
+            projection (ProjectionDefinition): compiled projection
 
         Returns:
             Conversion: Coversion
@@ -1095,7 +780,7 @@ class ProjectionBody(ICrs):
             str: the projection name
         """
         projection: str = (
-            f"{self.body_crs.datum.body.name} ({IAU_REPORT.VERSION}) "
+            f"{self.body_crs.datum.body.name} ({self.body_crs.report.version}) "
         )
         if (
             self.body_crs.crs_type == CrsType.OCENTRIC
@@ -1105,14 +790,14 @@ class ProjectionBody(ICrs):
                 projection
                 + "- "
                 + self.body_crs.datum.body.shape.value
-                + f" / {self.projection[1]}"
+                + f" / {self.definition.name}"
             )
         else:
             reference = (
                 projection
                 + "/ "
                 + self.body_crs.crs_type.value
-                + f" / {self.projection[1]}"
+                + f" / {self.definition.name}"
             )
         return reference
 
@@ -1142,13 +827,31 @@ class ProjectionBody(ICrs):
         return self.__body_crs
 
     @property
-    def projection(self) -> List[str]:
+    def projection(self) -> List[Any]:
         """Returns the projection elements.
 
         Returns:
-            str: the projection elements
+            List[Any]: the projection elements
         """
-        return self.__projection
+        return self.__definition.to_list()
+
+    @property
+    def definition(self) -> ProjectionDefinition:
+        """Returns the compiled projection.
+
+        Returns:
+            ProjectionDefinition: the compiled projection
+        """
+        return self.__definition
+
+    @property
+    def conversion(self) -> Conversion:
+        """Returns the conversion.
+
+        Returns:
+            Conversion: the conversion
+        """
+        return self.__conversion
 
     @property
     def template(self) -> str:
@@ -1166,7 +869,7 @@ class ProjectionBody(ICrs):
         Returns:
             int: the IAU code
         """
-        return self.body_crs.iau_code + int(self.projection[0])
+        return self.body_crs.iau_code + self.definition.offset
 
     @property
     def datum(self) -> Datum:
@@ -1178,12 +881,15 @@ class ProjectionBody(ICrs):
         return self.body_crs.datum
 
     @staticmethod
-    def create(body_crs: BodyCrs, projection: List[str]) -> "ProjectionBody":
+    def create(
+        body_crs: BodyCrs, projection: Union[List[Any], ProjectionDefinition]
+    ) -> "ProjectionBody":
         """Create a projected coordinate reference system.
 
         Args:
             body_crs (BodyCrs): body CRS description
-            projection (List[str]): projection elements
+            projection (Union[List[Any], ProjectionDefinition]): projection
+            elements or compiled projection
 
         Raises:
             ValueError: Unknown CRS type
@@ -1221,27 +927,35 @@ class ProjectionBody(ICrs):
         return proj_body_template.substitute(
             projection_name=self._create_projection(),
             name=self.body_crs.name,
-            version=IAU_REPORT.VERSION,
+            version=self.body_crs.report.version,
             datum=self.body_crs.datum.wkt(),
-            number=self.body_crs.iau_code + int(self.projection[0]),
+            number=self.iau_code,
             number_body=self.body_crs.iau_code,
             conversion=self.__conversion.wkt(),
             reference=self._create_reference(),
             direction=self.body_crs.direction,
-            direction_name="Westing (W)"
-            if self.body_crs.direction == "west"
-            else "Easting (E)",
+            direction_name=(
+                "Westing (W)"
+                if self.body_crs.direction == "west"
+                else "Easting (E)"
+            ),
         )
 
     @staticmethod
-    def iter_projection(body_crs: BodyCrs) -> Generator:
+    def iter_projection(
+        body_crs: BodyCrs, catalogue: Optional[ProjectionCatalogue] = None
+    ) -> Generator:
         """Iter on the different projections of the projected body
 
         Args:
             body_crs (BodyCrs): Body to project
+            catalogue (Optional[ProjectionCatalogue], optional): catalogue of
+            the projections. Defaults to the built-in catalogue.
 
         Yields:
             Generator: Iterator of the projections of the body.
         """
-        for projection in ProjectionBody.PROJECTION_DATA:
-            yield ProjectionBody.create(body_crs, cast(List[str], projection))
+        if catalogue is None:
+            catalogue = ProjectionCatalogue.default()
+        for definition in catalogue:
+            yield ProjectionBody.create(body_crs, definition)
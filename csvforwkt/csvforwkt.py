@@ -2,26 +2,51 @@
 """This module contains the library to convert a body description in CSV to
 WKT-CRS."""
 import collections
+import contextlib
 import logging
 import os
+from typing import Any
+from typing import Callable
 from typing import cast
+from typing import ContextManager
+from typing import Counter
 from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
 from typing import Tuple
+from typing import Union
 
+import numpy as np  # pylint: disable=import-error
 import pandas as pd  # pylint: disable=import-error
 
 from ._version import __name_soft__
-from .body import IAU_REPORT
 from .body import ReferenceShape
+from .body import ReportContext
+from .checkpoint import Checkpoint
+from .catalogue import ProjectionCatalogue
+from .catalogue import ProjectionDefinition
+from .custom_logging import TRACE
+from .custom_logging import WarningAggregator
 from .crs import BodyCrs
-from .crs import CrsType
 from .crs import ICrs
 from .crs import Planetocentric
 from .crs import Planetographic
 from .crs import ProjectionBody
+from .index import BodyIndex
+from .selection import Selection
+from .tracing import span
+from .writer import IWriter
+from .writer import OutputFormat
 
 logger = logging.getLogger(__name__)
 
+# a stage hook is called with the name and the attributes of a stage and
+# returns a context manager surrounding the stage
+StageHook = Callable[[str, Dict[str, Any]], ContextManager[Any]]
+
 
 class CsvforwktLib:
     """The library"""
@@ -44,7 +69,50 @@ class CsvforwktLib:
         self.__iau_report: str = iau_report
         self.__iau_version: int = iau_version
         self.__iau_doi: str = iau_doi
-        self.__df_bodies: pd.DataFrame = self._init_iau_report()
+        self.__report: ReportContext = ReportContext(str(iau_version), iau_doi)
+        self.__catalogue: ProjectionCatalogue = CsvforwktLib._init_catalogue(
+            kwargs.get("projection_catalogue")
+        )
+        self.__selection: Selection = kwargs.get("selection") or Selection()
+        self.__selection.check_projections(self.__catalogue)
+        self.__stage_hooks: List[StageHook] = list(
+            kwargs.get("stage_hooks", list())
+        )
+        self.__warnings = WarningAggregator(logger)
+        with self._stage("init_iau_report") as attributes:
+            self.__df_bodies: pd.DataFrame = self._init_iau_report()
+            attributes["rows"] = self.__df_bodies.shape[0]
+        self.__rows_by_naif: Optional[
+            Dict[int, Tuple[bool, Dict[str, Any]]]
+        ] = None
+        self.__indexes: Dict[int, BodyIndex] = dict()
+        self.__projection_stats: Counter = collections.Counter()
+        self.__triaxial_ids: FrozenSet[int] = frozenset()
+
+    @staticmethod
+    def _init_catalogue(
+        catalogue: Optional[Union[str, ProjectionCatalogue]],
+    ) -> ProjectionCatalogue:
+        """Returns the catalogue of projections.
+
+        Args:
+            catalogue (Optional[Union[str, ProjectionCatalogue]]): path of a
+            catalogue file, a catalogue or None for the built-in catalogue
+
+        Returns:
+            ProjectionCatalogue: the catalogue of projections
+        """
+        result: ProjectionCatalogue
+        if catalogue is None:
+            result = ProjectionCatalogue.default()
+        elif isinstance(catalogue, ProjectionCatalogue):
+            result = catalogue
+        else:
+            result = ProjectionCatalogue.load(catalogue)
+            logger.info(
+                f"Projection catalogue {catalogue} loaded ({len(result)} projections)"
+            )
+        return result
 
     @staticmethod
     def _parse_level(level: str):
@@ -66,7 +134,7 @@ class CsvforwktLib:
         elif level == "CRITICAL":
             logger_main.setLevel(logging.CRITICAL)
         elif level == "TRACE":
-            logger_main.setLevel(logging.TRACE)  # type: ignore # pylint: disable=no-member
+            logger_main.setLevel(TRACE)
         else:
             logger_main.warning(
                 "Unknown level name : %s - setting level to INFO", level
@@ -100,6 +168,81 @@ class CsvforwktLib:
         """
         return self.__iau_doi
 
+    @property
+    def report(self) -> ReportContext:
+        """The IAU report given to the created CRS.
+
+        :getter: Returns the IAU report
+        :type: ReportContext
+        """
+        return self.__report
+
+    @property
+    def catalogue(self) -> ProjectionCatalogue:
+        """The catalogue of projections.
+
+        :getter: Returns the catalogue of projections
+        :type: ProjectionCatalogue
+        """
+        return self.__catalogue
+
+    @property
+    def selection(self) -> Selection:
+        """The selection of the CRS to generate.
+
+        :getter: Returns the selection
+        :type: Selection
+        """
+        return self.__selection
+
+    def add_stage_hook(self, hook: StageHook):
+        """Adds a hook surrounding each stage of the processing.
+
+        Args:
+            hook (StageHook): function called with the name and the
+            attributes of the stage, returning a context manager
+        """
+        self.__stage_hooks.append(hook)
+
+    @contextlib.contextmanager
+    def _stage(self, name: str) -> Iterator[Dict[str, Any]]:
+        """Surrounds a stage of the processing by a span and the stage hooks.
+
+        The stage fills the attributes (rows, crs, bytes, ...) that the
+        hooks read when the stage exits. The warnings collected during the
+        stage are logged when it exits.
+
+        Args:
+            name (str): name of the stage
+
+        Yields:
+            Iterator[Dict[str, Any]]: the attributes of the stage
+        """
+        attributes: Dict[str, Any] = dict()
+        try:
+            with span(
+                name
+            ) as span_attributes, contextlib.ExitStack() as stack:
+                for hook in self.__stage_hooks:
+                    stack.enter_context(hook(name, attributes))
+                yield attributes
+                span_attributes.update(attributes)
+        finally:
+            # one warning by category for the whole stage
+            self.__warnings.flush(name)
+
+    @property
+    def projection_stats(self) -> Dict[str, int]:
+        """Number of pairs of body CRS and projection removed by each skip
+        rule during the last run of `process` or `iter_process`.
+
+        The keys are pairs, equivalent, sphere_only, selection and generated.
+
+        :getter: Returns the number of pairs by rule
+        :type: Dict[str, int]
+        """
+        return dict(self.__projection_stats)
+
     @property
     def directory(self) -> str:
         """The output directory.
@@ -110,25 +253,60 @@ class CsvforwktLib:
         return self.__directory
 
     def _init_iau_report(self) -> pd.DataFrame:
-        """Init the IAU_REPORT class."""
+        """Reads the IAU report."""
         logger.info(
             f"Creating WKT-CRS for {self.iau_version} - {self.iau_doi} ..."
         )
-        IAU_REPORT.DOI_IAU = self.iau_doi
-        IAU_REPORT.VERSION = str(self.iau_version)
         return pd.read_csv(self.iau_report)
 
-    def _skip_records(self):
-        """Skip records when not (IAU2015_Semimajor == -1 and IAU2015_Axisb == -1 and IAU2015_Semiminor == -1)"""
+    def _skip_records(self) -> int:
+        """Skip records when not (IAU2015_Semimajor == -1 and IAU2015_Axisb == -1 and IAU2015_Semiminor == -1)
+
+        Returns:
+            int: number of skipped records
+        """
         nb_records: int = self.__df_bodies.shape[0]
         query_result = self.__df_bodies.query(
             "IAU2015_Semimajor == -1 and IAU2015_Axisb == -1 and IAU2015_Semiminor == -1"
         )
         idx2 = self.__df_bodies.index.difference(query_result.index)
-        self.__df_bodies = self.__df_bodies.iloc[idx2]
+        self.__df_bodies = self.__df_bodies.loc[idx2]
         nb_records_for_processing: int = self.__df_bodies.shape[0]
         nb_records_skip: int = nb_records - nb_records_for_processing
         logger.info(f"\t\t{nb_records_skip} records have been skipped")
+        return nb_records_skip
+
+    def _select_records(self):
+        """Keep only the selected bodies, before any CRS is created."""
+        if self.selection.is_all:
+            return
+        nb_records: int = self.__df_bodies.shape[0]
+        self.__df_bodies = self.selection.filter_bodies(self.__df_bodies)
+        logger.info(
+            f"\t\t{nb_records - self.__df_bodies.shape[0]} records have not been selected"
+        )
+
+    def _select_crs(self, crs: Dict[int, ICrs]) -> Dict[int, ICrs]:
+        """Keep only the selected body CRS of a body.
+
+        The body CRS are all created because the projections of a body CRS
+        depend on the other CRS of the body. The projected CRS are already
+        selected before their creation.
+
+        Args:
+            crs (Dict[int, ICrs]): CRS of a body
+
+        Returns:
+            Dict[int, ICrs]: the selected CRS of the body
+        """
+        if self.selection.is_all:
+            return crs
+        return {
+            code: value
+            for code, value in crs.items()
+            if isinstance(value, ProjectionBody)
+            or self.selection.accept_crs(cast(BodyCrs, value))
+        }
 
     def _split_body(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """Split the bodies in two parts : biaxial and triaxial
@@ -145,11 +323,27 @@ class CsvforwktLib:
             and IAU2015_Semiminor != IAU2015_Semimajor"
         ).copy()
         biaxial: pd.DataFrame = self.__df_bodies.drop(triaxial.index).copy()
+        self.__triaxial_ids = frozenset(
+            int(naif_id) for naif_id in triaxial["Naif_id"]
+        )
         logger.info(
             f"\tSplit biaxial ({biaxial.shape[0]} records) and triaxial ({triaxial.shape[0]} records) ... OK"
         )
         return biaxial, triaxial
 
+    def is_triaxial(self, naif_id: int) -> bool:
+        """Checks if the description of a body in the IAU report is
+        triaxial, whatever the selected CRS.
+
+        Args:
+            naif_id (int): Naif ID of a body processed by `process`,
+            `iter_process` or `resolve`
+
+        Returns:
+            bool: True when the body is triaxial otherwise False
+        """
+        return naif_id in self.__triaxial_ids
+
     def _is_sphere(  # pylint: disable=no-self-use
         self, row: pd.Series
     ) -> bool:
@@ -182,13 +376,23 @@ class CsvforwktLib:
         """
 
         if row["IAU2015_Semimajor"] <= 0 and row["IAU2015_Semiminor"] > 0:
-            logger.warning(
-                f"Not valid flattening  ID:{row['Naif_id']} - Body:{row['Body']} - Semi-major:{row['IAU2015_Semimajor']}"
+            self.__warnings.warn(
+                "invalid flattening",
+                row["Naif_id"],
+                "Not valid flattening  ID:{} - Body:{} - Semi-major:{}",
+                row["Naif_id"],
+                row["Body"],
+                row["IAU2015_Semimajor"],
             )
             is_valid = False
         elif row["IAU2015_Semimajor"] > 0 and row["IAU2015_Semiminor"] <= 0:
-            logger.warning(
-                f"Not valid flattening : {row['Naif_id']} - {row['Body']} - Semi-minor:{row['IAU2015_Semiminor']}"
+            self.__warnings.warn(
+                "invalid flattening",
+                row["Naif_id"],
+                "Not valid flattening : {} - {} - Semi-minor:{}",
+                row["Naif_id"],
+                row["Body"],
+                row["IAU2015_Semiminor"],
             )
             is_valid = False
         else:
@@ -259,31 +463,56 @@ class CsvforwktLib:
         """
         crs: Dict[int, Dict[int, ICrs]] = dict()
         for _, row in body.iterrows():
-            crs[row[0]] = dict()
+            with span("body", naif_id=int(row["Naif_id"])):
+                crs[row["Naif_id"]] = self._process_row_biaxial(row)
+
+        logger.info(f"\t\tNumber of processed bodies: {len(crs.keys())}")
+        return crs
+
+    def _process_row_biaxial(self, row: pd.Series) -> Dict[int, ICrs]:
+        """Process one biaxial body.
+
+        Args:
+            row (pd.Series): current body description
+
+        Returns:
+            Dict[int, ICrs]: IAU code and CRS description of the body
+        """
+        crs: Dict[int, ICrs] = dict()
 
-            # Create a spherical planetocentric CRS
-            sphere_crs = Planetocentric(row, ReferenceShape.SPHERE)
-            crs[row[0]][sphere_crs.crs.iau_code] = sphere_crs.crs
+        # Create a spherical planetocentric CRS
+        sphere_crs = Planetocentric(row, ReferenceShape.SPHERE, self.report)
+        crs[sphere_crs.crs.iau_code] = sphere_crs.crs
 
-            # Check the body is not a spherical datum and have a valid flattening to create planetocentric CRS
-            if not self._is_sphere(row) and self._is_valid_flatenning(row):
-                ocentric_crs = Planetocentric(row, ReferenceShape.ELLIPSE)
-                crs[row[0]][ocentric_crs.crs.iau_code] = ocentric_crs.crs
+        # the flattening of a sphere is always valid, it is checked once by body
+        is_valid_flatenning: bool = self._is_valid_flatenning(row)
 
-            # Check the body is not a spherical datum and other conditions to create planetograhic CRS
-            if not (
+        # Check the body is not a spherical datum and have a valid flattening to create planetocentric CRS
+        if not self._is_sphere(row) and is_valid_flatenning:
+            ocentric_crs = Planetocentric(
+                row, ReferenceShape.ELLIPSE, self.report
+            )
+            crs[ocentric_crs.crs.iau_code] = ocentric_crs.crs
+
+        # Check the body is not a spherical datum and other conditions to create planetograhic CRS
+        if (
+            not (
                 self._is_sphere(row)
                 and (self._is_retrograde(row) or self._is_historic(row))
-            ) and self._is_valid_flatenning(row):
-                ographic = Planetographic(row, ReferenceShape.ELLIPSE)
-                if not self.has_direction(row):
-                    logger.warning(
-                        f"No direction known for {row[1]}- skip planetographic CRS"
-                    )
-                    continue
-                crs[row[0]][ographic.crs.iau_code] = ographic.crs
-
-        logger.info(f"\t\tNumber of processed bodies: {len(crs.keys())}")
+            )
+            and is_valid_flatenning
+        ):
+            ographic = Planetographic(row, ReferenceShape.ELLIPSE, self.report)
+            if not self.has_direction(row):
+                self.__warnings.warn(
+                    "no direction known, planetographic CRS skipped",
+                    row["Naif_id"],
+                    "No direction known for {}- skip planetographic CRS",
+                    row["Body"],
+                )
+            else:
+                crs[ographic.crs.iau_code] = ographic.crs
+        self._index_body(row["Naif_id"], crs)
         return crs
 
     def _process_body_crs_triaxial(  # pylint: disable=no-self-use
@@ -300,70 +529,150 @@ class CsvforwktLib:
         """
         crs: Dict[int, Dict[int, ICrs]] = dict()
         for _, row in body.iterrows():
-            crs[row[0]] = dict()
-            sphere_crs = Planetocentric(row, ReferenceShape.SPHERE)
-            crs[row[0]][sphere_crs.crs.iau_code] = sphere_crs.crs
-            ocentric_crs = Planetocentric(row, ReferenceShape.TRIAXIAL)
-            crs[row[0]][ocentric_crs.crs.iau_code] = ocentric_crs.crs
-            ographic = Planetographic(row, ReferenceShape.TRIAXIAL)
-            if not self.has_direction(row):
-                logger.warning(
-                    f"No direction known for {row[1]}- skip planetographic CRS"
-                )
-                continue
-            crs[row[0]][ographic.crs.iau_code] = ographic.crs
+            with span("body", naif_id=int(row["Naif_id"])):
+                crs[row["Naif_id"]] = self._process_row_triaxial(row)
         logger.info(f"\t\tNumber of processed bodies: {len(crs.keys())}")
         return crs
 
-    def _has_ographic_east(self, crs: Dict[int, ICrs], datum: ReferenceShape):
-        return any(
-            isinstance(body_crs, BodyCrs)
-            and body_crs.crs_type.name == CrsType.OGRAPHIC.name
-            and body_crs.direction == "east"
-            and body_crs.datum.body.shape.name == datum.name
-            for body_crs in crs.values()
+    def _process_row_triaxial(self, row: pd.Series) -> Dict[int, ICrs]:
+        """Process one triaxial body.
+
+        Args:
+            row (pd.Series): current body description
+
+        Returns:
+            Dict[int, ICrs]: IAU code and CRS description of the body
+        """
+        crs: Dict[int, ICrs] = dict()
+        sphere_crs = Planetocentric(row, ReferenceShape.SPHERE, self.report)
+        crs[sphere_crs.crs.iau_code] = sphere_crs.crs
+        ocentric_crs = Planetocentric(
+            row, ReferenceShape.TRIAXIAL, self.report
         )
+        crs[ocentric_crs.crs.iau_code] = ocentric_crs.crs
+        ographic = Planetographic(row, ReferenceShape.TRIAXIAL, self.report)
+        if not self.has_direction(row):
+            self.__warnings.warn(
+                "no direction known, planetographic CRS skipped",
+                row["Naif_id"],
+                "No direction known for {}- skip planetographic CRS",
+                row["Body"],
+            )
+        else:
+            crs[ographic.crs.iau_code] = ographic.crs
+        self._index_body(row["Naif_id"], crs)
+        return crs
+
+    def _index_body(self, naif_id: int, crs: Dict[int, ICrs]) -> BodyIndex:
+        """Index the relationships between the body CRS of a body.
+
+        Args:
+            naif_id (int): Naif ID of the body
+            crs (Dict[int, ICrs]): IAU code and body CRS of the body
+
+        Returns:
+            BodyIndex: the index of the body
+        """
+        index = BodyIndex(int(naif_id), crs)
+        self.__indexes[index.naif_id] = index
+        return index
+
+    def body_index(self, naif_id: int) -> BodyIndex:
+        """Returns the index of a body processed by `process`, `iter_process`
+        or `resolve`.
+
+        Args:
+            naif_id (int): Naif ID of the body
+
+        Raises:
+            KeyError: the body is not processed
+
+        Returns:
+            BodyIndex: the index of the body
+        """
+        return self.__indexes[naif_id]
 
     def _process_body_projection_crs(  # pylint: disable=no-self-use
-        self, crs: Dict[int, ICrs]
+        self,
+        crs: Dict[int, Dict[int, ICrs]],
+        definitions: Optional[Iterable[ProjectionDefinition]] = None,
     ) -> Dict[int, Dict[int, ICrs]]:
         """Process the projection description based on a body CRS.
 
         Args:
             crs (Dict[Dict[int, ICrs]]): bodies CRS group by body ID
+            definitions (Optional[Iterable[ProjectionDefinition]], optional):
+            projections to apply. Defaults to the projections of the catalogue.
 
         Returns:
             Dict[int, Dict[int, ICrs]]: projections CRS
         """
-        crs_projection: Dict[int, Dict[int, ICrs]] = dict()
+        projections: List[ProjectionDefinition] = list(
+            self.catalogue if definitions is None else definitions
+        )
+
+        # rows of the grid : the body CRS, in creation order
+        rows: List[Tuple[int, BodyIndex, BodyCrs]] = list()
         for body_id, body_crs in crs.items():
-            crs_projection[body_id] = dict()
-            for _, value in crs[body_id].items():
-                body_crs: BodyCrs = cast(BodyCrs, value)
-
-                if (
-                    body_crs.crs_type.name == CrsType.OCENTRIC.name
-                    and self._has_ographic_east(
-                        crs[body_id], body_crs.datum.body.shape
-                    )
-                ):
-                    # if the CRS is ocentric for a given body and it exists a, ographic one to east,We don't need to generate
-                    # projection for ocentric because it will be generated for ographic and both are equivalent
-                    logger.warning(
-                        f"Skip projection for {body_id} ocentric since it will be generated for ographic with direction east"
-                    )
-                    continue
-
-                for projection in ProjectionBody.iter_projection(body_crs):
-                    if (
-                        body_crs.datum.body.shape != ReferenceShape.SPHERE
-                        and projection.projection[0] == 90
-                    ):
-                        # see https://github.com/pdssp/planet_crs_registry/issues/6
-                        continue
-
-                    crs_projection[body_id][projection.iau_code] = projection
+            index: Optional[BodyIndex] = self.__indexes.get(body_id)
+            if index is None:
+                index = self._index_body(body_id, body_crs)
+            for code in index.equivalents:
+                # if the CRS is ocentric for a given body and it exists a, ographic one to east,We don't need to generate
+                # projection for ocentric because it will be generated for ographic and both are equivalent
+                self.__warnings.warn(
+                    "projections of the ocentric CRS skipped, generated for the equivalent ographic CRS",
+                    code,
+                    "Skip projection for {} ocentric since it will be generated for ographic with direction east",
+                    body_id,
+                )
+            rows.extend(
+                (body_id, index, cast(BodyCrs, value))
+                for value in body_crs.values()
+            )
 
+        # skip rules as masks of the grid, a pair is counted by the first
+        # rule that removes it
+        equivalent = np.array(
+            [row[2].iau_code in row[1].equivalents for row in rows],
+            dtype=bool,
+        ).reshape(-1, 1)
+        is_sphere = np.array(
+            [row[2].datum.body.shape is ReferenceShape.SPHERE for row in rows],
+            dtype=bool,
+        ).reshape(-1, 1)
+        sphere_only = np.array(
+            [definition.sphere_only for definition in projections], dtype=bool
+        ).reshape(1, -1)
+        skipped = np.zeros((len(rows), len(projections)), dtype=bool)
+        skipped |= equivalent
+        nb_equivalent = int(skipped.sum())
+        # see https://github.com/pdssp/planet_crs_registry/issues/6
+        skipped |= ~is_sphere & sphere_only
+        nb_sphere_only = int(skipped.sum()) - nb_equivalent
+        skipped |= ~self.selection.projection_mask(
+            [row[2] for row in rows], projections
+        )
+        nb_selection = int(skipped.sum()) - nb_equivalent - nb_sphere_only
+
+        crs_projection: Dict[int, Dict[int, ICrs]] = {
+            body_id: dict() for body_id in crs
+        }
+        for row_idx, col_idx in zip(*np.nonzero(~skipped)):
+            body_id, index, base_crs = rows[row_idx]
+            projection = ProjectionBody.create(base_crs, projections[col_idx])
+            crs_projection[body_id][projection.iau_code] = projection
+            index.add_projection(base_crs.iau_code, projection.iau_code)
+
+        self.__projection_stats.update(
+            {
+                "pairs": skipped.size,
+                "equivalent": nb_equivalent,
+                "sphere_only": nb_sphere_only,
+                "selection": nb_selection,
+                "generated": skipped.size - int(skipped.sum()),
+            }
+        )
         return crs_projection
 
     def _merge_dicts(
@@ -387,53 +696,311 @@ class CsvforwktLib:
         Returns:
             Dict[int, Dict[int, ICrs]]: CRS group by body
         """
-        crs: Dict[int, Dict[int, ICrs]] = {}
+        with span("process"):
+            return self._process()
+
+    def _prepare_records(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Skips, selects and splits the records of the IAU report.
+
+        The same stages prepare the records of `process` and of the bodies
+        processed one by one.
+
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: biaxial and triaxial bodies
+        """
         nb_records: int = self.__df_bodies.shape[0]
         logger.info(f"\tNumber of bodies in IAU report {nb_records}")
-        self._skip_records()
+        with self._stage("skip_records") as attributes:
+            attributes["skipped"] = self._skip_records()
+            attributes["rows"] = nb_records
+        with self._stage("select_records") as attributes:
+            self._select_records()
+            attributes["rows"] = self.__df_bodies.shape[0]
         nb_records = self.__df_bodies.shape[0]
         logger.info(f"\t\t{nb_records} records for processing")
 
+        with self._stage("split_body") as attributes:
+            result: Tuple[pd.DataFrame, pd.DataFrame] = self._split_body()
+            attributes["rows"] = nb_records
+        return result
+
+    def _process(self) -> Dict[int, Dict[int, ICrs]]:
+        """Process the bodies, stage by stage.
+
+        Returns:
+            Dict[int, Dict[int, ICrs]]: CRS group by body
+        """
+        self.__projection_stats = collections.Counter()
+        crs: Dict[int, Dict[int, ICrs]] = {}
         biaxial: pd.DataFrame
         triaxial: pd.DataFrame
-        biaxial, triaxial = self._split_body()
+        biaxial, triaxial = self._prepare_records()
 
         logger.info("\n\tProcessing of biaxial body")
-        biaxial_crs: Dict[
-            int, Dict[int, ICrs]
-        ] = self._process_body_crs_biaxial(biaxial)
+        with self._stage("biaxial") as attributes:
+            biaxial_crs: Dict[int, Dict[int, ICrs]] = (
+                self._process_body_crs_biaxial(biaxial)
+            )
+            attributes["rows"] = biaxial.shape[0]
+            attributes["crs"] = sum(len(body) for body in biaxial_crs.values())
         crs.update(biaxial_crs)
         logger.info("\t\tprocess WKT for biaxial bodies ... OK")
 
         logger.info("\n\tProcessing of triaxial body")
-        triaxial_crs: Dict[
-            int, Dict[int, ICrs]
-        ] = self._process_body_crs_triaxial(triaxial)
+        with self._stage("triaxial") as attributes:
+            triaxial_crs: Dict[int, Dict[int, ICrs]] = (
+                self._process_body_crs_triaxial(triaxial)
+            )
+            attributes["rows"] = triaxial.shape[0]
+            attributes["crs"] = sum(
+                len(body) for body in triaxial_crs.values()
+            )
         crs.update(triaxial_crs)
         logger.info("\t\tprocess WKT for triaxial bodies ... OK")
 
         logger.info(
             "\n\tProcessing of projected CRS for both baxial and triaxial"
         )
-        crs = self._merge_dicts(crs, self._process_body_projection_crs(crs))
+        with self._stage("projections") as attributes:
+            projections: Dict[int, Dict[int, ICrs]] = (
+                self._process_body_projection_crs(crs)
+            )
+            attributes["crs"] = sum(len(body) for body in projections.values())
+        crs = self._merge_dicts(crs, projections)
+        stats: Dict[str, int] = self.projection_stats
+        logger.info(
+            f"\t\t{stats['pairs']} pairs of body CRS and projection: "
+            f"{stats['equivalent']} equivalent, {stats['sphere_only']} sphere only, "
+            f"{stats['selection']} not selected"
+        )
         logger.info("\t\tprocess WKT for projected CRS ... OK")
 
+        if not self.selection.is_all:
+            crs = {
+                body_id: selected_crs
+                for body_id, selected_crs in (
+                    (body_id, self._select_crs(body_crs))
+                    for body_id, body_crs in crs.items()
+                )
+                if len(selected_crs) > 0
+            }
+
         return collections.OrderedDict(sorted(crs.items()))
 
-    def save(self, crs: Dict[int, Dict[int, ICrs]]):
+    def _index_bodies(self) -> Dict[int, Tuple[bool, Dict[str, Any]]]:
+        """Index the bodies to process by Naif ID.
+
+        The index is built once.
+
+        Returns:
+            Dict[int, Tuple[bool, Dict[str, Any]]]: True when the body is
+            triaxial and the description of the body, by Naif ID
+        """
+        if self.__rows_by_naif is None:
+            biaxial: pd.DataFrame
+            triaxial: pd.DataFrame
+            biaxial, triaxial = self._prepare_records()
+
+            # same precedence as process() : a triaxial description replaces
+            # a biaxial one with the same Naif ID
+            rows: Dict[int, Tuple[bool, Dict[str, Any]]] = dict()
+            for is_triaxial, bodies in ((False, biaxial), (True, triaxial)):
+                for record in bodies.to_dict("records"):
+                    rows[int(record["Naif_id"])] = (is_triaxial, record)
+            self.__rows_by_naif = rows
+        return self.__rows_by_naif
+
+    def _process_row(
+        self, is_triaxial: bool, row: Dict[str, Any]
+    ) -> Dict[int, ICrs]:
+        """Process the body CRS of one body.
+
+        Args:
+            is_triaxial (bool): True when the body is triaxial
+            row (Dict[str, Any]): description of the body
+
+        Returns:
+            Dict[int, ICrs]: IAU code and CRS description of the body
+        """
+        return (
+            self._process_row_triaxial(row)  # type: ignore
+            if is_triaxial
+            else self._process_row_biaxial(row)  # type: ignore
+        )
+
+    def resolve(self, code: int) -> ICrs:
+        """Returns the CRS of an IAU code without processing the other bodies.
+
+        The IAU code is decoded as Naif ID * 100 + shape/CRS code + offset of
+        the projection. Only the CRS of the body are created and the same
+        rules as `process` are applied.
+
+        Args:
+            code (int): IAU code
+
+        Raises:
+            KeyError: the IAU code is not generated
+
+        Returns:
+            ICrs: the CRS
+        """
+        with self._stage("resolve"):
+            return self._resolve(code)
+
+    def _resolve(self, code: int) -> ICrs:
+        """Returns the CRS of an IAU code, see `resolve`.
+
+        Args:
+            code (int): IAU code
+
+        Raises:
+            KeyError: the IAU code is not generated
+
+        Returns:
+            ICrs: the CRS
+        """
+        naif_id: int = code // 100
+        crs_code: int = code % 100 % 5
+        offset: int = code % 100 - crs_code
+        rows: Dict[int, Tuple[bool, Dict[str, Any]]] = self._index_bodies()
+        if naif_id not in rows:
+            raise KeyError(f"No body for the IAU code {code}")
+
+        body_crs: Dict[int, ICrs] = self._process_row(*rows[naif_id])
+        base_code: int = naif_id * 100 + crs_code
+        if base_code not in body_crs:
+            raise KeyError(f"No CRS for the IAU code {code}")
+
+        result: Optional[ICrs]
+        equivalent: Optional[int] = self.body_index(naif_id).equivalent(code)
+        if offset != 0 and equivalent is not None:
+            raise KeyError(
+                f"No CRS for the IAU code {code}, it is generated as {equivalent}"
+            )
+        if offset == 0:
+            result = self._select_crs(body_crs).get(code)
+        elif offset not in self.catalogue:
+            result = None
+        else:
+            projections: Dict[int, ICrs] = self._process_body_projection_crs(
+                {naif_id: body_crs}, [self.catalogue.get(offset)]
+            )[naif_id]
+            result = projections.get(code)
+        if result is None:
+            raise KeyError(f"No CRS for the IAU code {code}")
+        return result
+
+    def iter_process(
+        self, after: Optional[int] = None
+    ) -> Iterator[Tuple[int, Dict[int, ICrs]]]:
+        """Process the bodies one by one.
+
+        The bodies are provided in the same order and with the same CRS as
+        the ones returned by `process`, but each body is yielded as soon as
+        its CRS and its projected CRS are created.
+
+        Args:
+            after (Optional[int], optional): Naif ID of the last body already
+            processed, to resume a run. Defaults to None.
+
+        Yields:
+            Iterator[Tuple[int, Dict[int, ICrs]]]: Naif ID and the CRS of the body
+        """
+        self.__projection_stats = collections.Counter()
+        for naif_id in sorted(self._index_bodies().keys()):
+            if after is not None and naif_id <= after:
+                continue
+            body_crs: Dict[int, ICrs] = self.process_body(naif_id)
+            if len(body_crs) > 0:
+                yield naif_id, body_crs
+
+    def body_descriptions(self) -> Dict[int, Tuple[bool, Dict[str, Any]]]:
+        """Returns the description of the bodies to process.
+
+        The records of the IAU report are skipped and selected as in
+        `process`.
+
+        Returns:
+            Dict[int, Tuple[bool, Dict[str, Any]]]: True when the body is
+            triaxial and the description of the body, by Naif ID
+        """
+        return self._index_bodies()
+
+    def process_body(self, naif_id: int) -> Dict[int, ICrs]:
+        """Process the CRS and the projected CRS of one body.
+
+        The same rules as `process` are applied.
+
+        Args:
+            naif_id (int): Naif ID of the body
+
+        Raises:
+            KeyError: no body for this Naif ID
+
+        Returns:
+            Dict[int, ICrs]: the selected CRS of the body by IAU code
+        """
+        rows: Dict[int, Tuple[bool, Dict[str, Any]]] = self._index_bodies()
+        if naif_id not in rows:
+            raise KeyError(f"No body for the Naif ID {naif_id}")
+        is_triaxial, row = rows[naif_id]
+        with span("body", naif_id=naif_id) as attributes:
+            # the warnings are labelled by generation stage, a streamed body
+            # is generated in the stage writing it
+            with self.__warnings.labelled(
+                "triaxial" if is_triaxial else "biaxial"
+            ):
+                body_crs: Dict[int, ICrs] = self._process_row(is_triaxial, row)
+            with self.__warnings.labelled("projections"):
+                projections: Dict[int, Dict[int, ICrs]] = (
+                    self._process_body_projection_crs({naif_id: body_crs})
+                )
+            body_crs.update(projections[naif_id])
+            attributes["crs"] = len(body_crs)
+        return self._select_crs(body_crs)
+
+    def save(
+        self,
+        crs: Dict[int, Dict[int, ICrs]],
+        output_format: str = OutputFormat.WKT.format_name,
+        batch_size: int = 1000,
+    ):
         """Save the result as file
 
         Args:
             crs (Dict[int, Dict[int, ICrs]]): CRS
+            output_format (str, optional): wkt, jsonl, parquet or arrow. Defaults to wkt.
+            batch_size (int, optional): number of CRS written by batch.
+            Defaults to 1000.
         """
-        with open(
-            os.path.join(self.directory, "iau.wkt"), "w", encoding="utf-8"
-        ) as file:
-            for a, body_crs in crs.items():
-                for id, wkt in body_crs.items():
-                    file.write(wkt.wkt())
-                    file.write("\n\n")
-        logger.info(
-            f"\n\tSave the WKTs in {os.path.join(self.directory, 'iau.wkt')} ... OK"
+        self.save_iter(crs.items(), output_format, batch_size)
+
+    def save_iter(
+        self,
+        bodies: Iterable[Tuple[int, Dict[int, ICrs]]],
+        output_format: str = OutputFormat.WKT.format_name,
+        batch_size: int = 1000,
+        checkpoint: Optional[Checkpoint] = None,
+    ):
+        """Save the CRS group by body as soon as they are provided.
+
+        Args:
+            bodies (Iterable[Tuple[int, Dict[int, ICrs]]]): CRS group by body
+            output_format (str, optional): wkt, jsonl, parquet or arrow. Defaults to wkt.
+            batch_size (int, optional): number of CRS written by batch.
+            Defaults to 1000.
+            checkpoint (Optional[Checkpoint], optional): checkpoint of the
+            output, the bodies start after its last body. Defaults to None.
+        """
+        writer: IWriter = IWriter.create(
+            OutputFormat.from_name(output_format),
+            self.directory,
+            batch_size,
+            checkpoint,
         )
+        with self._stage("save") as attributes:
+            nb_crs: int = writer.write(bodies)
+            attributes["crs"] = nb_crs
+            attributes["bytes"] = os.path.getsize(writer.path)
+        logger.info(f"\n\tSave the {nb_crs} CRS in {writer.path} ... OK")
         logger.info("Finished.")
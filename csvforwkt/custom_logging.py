@@ -17,8 +17,24 @@
 # You should have received a copy of the GNU Lesser General Public License v3
 # along with csvForWKT.  If not, see <https://www.gnu.org/licenses/>.
 """Module for customizing ths logs."""
+import atexit
+import contextlib
 import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
+
+# level between DEBUG and INFO, named by UtilsLogs.configure_logging
+TRACE: int = 15
 
 
 class UtilsLogs:  # pylint: disable=R0903
@@ -68,6 +84,34 @@ class UtilsLogs:  # pylint: disable=R0903
         setattr(logging.getLoggerClass(), method_name, log_for_level)
         setattr(logging, method_name, log_to_root)
 
+    @staticmethod
+    def configure_logging(config_file: Optional[str] = None) -> None:
+        """Configures the logging from a configuration file.
+
+        The TRACE level is added, the configuration file is loaded and the
+        log records format their message with str.format.
+
+        Args:
+            config_file (Optional[str], optional): logging configuration
+            file. Defaults to the logging.conf of the package.
+        """
+        # pylint: disable=import-outside-toplevel
+        from logging import config as logging_config
+
+        UtilsLogs.add_logging_level("TRACE", TRACE)
+        if config_file is None:
+            config_file = os.path.join(
+                os.path.dirname(os.path.realpath(__file__)), "logging.conf"
+            )
+        try:
+            logging_config.fileConfig(
+                config_file, disable_existing_loggers=False
+            )
+            logging.debug(f"file {config_file} loaded")
+        except Exception as exception:  # pylint: disable=broad-except
+            logging.warning(f"cannot load {config_file} : {exception}")
+        logging.setLogRecordFactory(LogRecord)
+
 
 class LogRecord(logging.LogRecord):  # pylint: disable=R0903
     """Specific class to handle output in logs."""
@@ -92,12 +136,11 @@ class LogRecord(logging.LogRecord):  # pylint: disable=R0903
 class CustomColorFormatter(logging.Formatter):
     """Color formatter."""
 
-    UtilsLogs.add_logging_level("TRACE", 15)
     # Reset
     color_Off = "\033[0m"  # Text Reset
 
     log_colors = {
-        logging.TRACE: "\033[0;36m",  # type: ignore # pylint: disable=no-member # cyan
+        TRACE: "\033[0;36m",  # cyan
         logging.DEBUG: "\033[1;34m",  # blue
         logging.INFO: "\033[0;32m",  # green
         logging.WARNING: "\033[1;33m",  # yellow
@@ -167,3 +210,191 @@ class ShellColorFormatter(CustomColorFormatter):
             CustomColorFormatter.color_Off,
         )
         return record.msg
+
+
+class WarningAggregator:
+    """Collects the repeated warnings of a loop by category.
+
+    Instead of one warning by item, the number of items of each category and
+    a few sample IDs are logged as one warning when the aggregator is
+    flushed. The detail of each item is logged at the TRACE level, formatted
+    only when this level is enabled.
+
+    The warnings are logged under the name of the flushed stage, or under
+    the label of the step that recorded them, so that the warnings of the
+    bodies generated while they are streamed are not attributed to the
+    stage writing them.
+    """
+
+    SAMPLES: int = 5
+
+    def __init__(self, logger: logging.Logger, samples: int = SAMPLES):
+        """Creates the aggregator.
+
+        Args:
+            logger (logging.Logger): logger of the warnings
+            samples (int, optional): number of sample IDs by category.
+            Defaults to SAMPLES.
+        """
+        self.__logger: logging.Logger = logger
+        self.__samples: int = samples
+        self.__label: Optional[str] = None
+        # label and category: number of items, sample IDs
+        self.__categories: Dict[Tuple[Optional[str], str], List[Any]] = dict()
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Number of items by category since the last flush.
+
+        :getter: Returns the number of items by category
+        :type: Dict[str, int]
+        """
+        counts: Dict[str, int] = dict()
+        for (_, category), values in self.__categories.items():
+            counts[category] = counts.get(category, 0) + values[0]
+        return counts
+
+    @contextlib.contextmanager
+    def labelled(self, label: str) -> Iterator[None]:
+        """Records the warnings of a step under a label instead of the name
+        of the flushed stage.
+
+        Args:
+            label (str): label of the warnings, the name of the step
+
+        Yields:
+            Iterator[None]: nothing
+        """
+        previous: Optional[str] = self.__label
+        self.__label = label
+        try:
+            yield
+        finally:
+            self.__label = previous
+
+    def warn(self, category: str, item: Any, message: str, *args):
+        """Records a warning about an item.
+
+        Args:
+            category (str): category of the warning
+            item (Any): ID of the item
+            message (str): detail of the warning, with {} placeholders
+            args: arguments of the detail
+        """
+        key: Tuple[Optional[str], str] = (self.__label, category)
+        values: Optional[List[Any]] = self.__categories.get(key)
+        if values is None:
+            values = [0, list()]
+            self.__categories[key] = values
+        values[0] += 1
+        if len(values[1]) < self.__samples:
+            values[1].append(item)
+        if self.__logger.isEnabledFor(TRACE):
+            # formatted here, whatever the record factory is
+            self.__logger.log(TRACE, message.format(*args))
+
+    def flush(self, stage: str) -> Dict[str, int]:
+        """Logs one warning by category and resets the counters.
+
+        Args:
+            stage (str): name of the stage
+
+        Returns:
+            Dict[str, int]: number of items by category
+        """
+        counts: Dict[str, int] = self.counts
+        for (label, category), (count, samples) in self.__categories.items():
+            more: str = ", ..." if count > len(samples) else ""
+            self.__logger.warning(
+                f"{label or stage} - {category} : {count} (e.g. "
+                f"{', '.join(str(sample) for sample in samples)}{more})"
+            )
+        self.__categories.clear()
+        return counts
+
+
+class _LocalQueueHandler(QueueHandler):
+    """Queue handler keeping the records as they are.
+
+    The listener runs in the same process, so the records are neither
+    formatted nor made picklable in the thread logging them.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class QueueLogging:
+    """Moves the formatting and the writing of the logs to listener threads.
+
+    The handlers of the loggers are replaced by a queue handler and each
+    logger has a listener thread calling its former handlers. The arguments
+    of a log are formatted in the listener thread, so they must not be
+    modified after the call.
+    """
+
+    LOGGERS: Tuple[str, ...] = ("", "csvforwkt")
+
+    __listeners: List[QueueListener] = list()
+    __handlers: Dict[str, List[logging.Handler]] = dict()
+    # reentrant: stop may be called by atexit or by an exception raised in
+    # the thread holding the lock
+    __lock = threading.RLock()
+
+    @staticmethod
+    def is_started() -> bool:
+        """Checks if the logs are written by listener threads.
+
+        Returns:
+            bool: True when the listeners are started
+        """
+        return len(QueueLogging.__handlers) > 0
+
+    @staticmethod
+    def start(logger_names: Iterable[str] = LOGGERS):
+        """Replaces the handlers of the loggers by queue handlers.
+
+        Args:
+            logger_names (Iterable[str], optional): names of the loggers,
+            the empty name for the root logger. Defaults to LOGGERS.
+        """
+        with QueueLogging.__lock:
+            if len(QueueLogging.__handlers) > 0:
+                return
+            for name in logger_names:
+                logger = logging.getLogger(name)
+                handlers: List[logging.Handler] = list(logger.handlers)
+                if len(handlers) == 0:
+                    continue
+                log_queue: "queue.SimpleQueue[logging.LogRecord]" = (
+                    queue.SimpleQueue()
+                )
+                listener = QueueListener(
+                    log_queue, *handlers, respect_handler_level=True
+                )
+                for handler in handlers:
+                    logger.removeHandler(handler)
+                logger.addHandler(_LocalQueueHandler(log_queue))
+                QueueLogging.__handlers[name] = handlers
+                QueueLogging.__listeners.append(listener)
+                listener.start()
+            atexit.register(QueueLogging.stop)
+
+    @staticmethod
+    def stop():
+        """Writes the queued logs and restores the handlers of the loggers."""
+        with QueueLogging.__lock:
+            for listener in QueueLogging.__listeners:
+                # the queued records are handled before the thread ends
+                listener.stop()
+            for name, handlers in QueueLogging.__handlers.items():
+                logger = logging.getLogger(name)
+                for handler in list(logger.handlers):
+                    if isinstance(handler, _LocalQueueHandler):
+                        logger.removeHandler(handler)
+                for handler in handlers:
+                    logger.addHandler(handler)
+                    handler.flush()
+            QueueLogging.__listeners.clear()
+            QueueLogging.__handlers.clear()
+            atexit.unregister(QueueLogging.stop)
@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 """This module is responsible to handle a datum."""
 from string import Template
+from typing import Optional
 
-from .body import IAU_REPORT
 from .body import IBody
 from .body import ReferenceShape
+from .body import ReportContext
 
 
 class Anchor:
@@ -61,8 +62,13 @@ class Datum:
     \tPRIMEM["Reference Meridian", 0,
             ANGLEUNIT["degree", 0.0174532925199433, ID["EPSG", 9122]]]"""
 
-    def __init__(
-        self, name: str, body: IBody, anchor: Anchor, template: str
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        name: str,
+        body: IBody,
+        anchor: Anchor,
+        template: str,
+        report: Optional[ReportContext] = None,
     ) -> None:
         """Creates a datum description for a body.
 
@@ -71,17 +77,23 @@ class Datum:
             body (IBody): body
             anchor (Anchor): anchor
             template (str): template
+            report (Optional[ReportContext], optional): IAU report. Defaults
+            to the report of the context.
         """
         self.__name: str = name
         self.__body: IBody = body
         self.__anchor: Anchor = anchor
         self.__template: str = template
+        self.__report: ReportContext = (
+            ReportContext.current() if report is None else report
+        )
 
     @staticmethod
     def create(
         name: str,
         body: IBody,
         anchor: Anchor,
+        report: Optional[ReportContext] = None,
     ) -> "Datum":
         """Create a datum
 
@@ -89,15 +101,17 @@ class Datum:
             name (str): datum name
             body (IBody): body description
             anchor (Anchor): anchor description
+            report (Optional[ReportContext], optional): IAU report. Defaults
+            to the report of the context.
 
         Returns:
             Datum: datum description
         """
         result: Datum
         if body.shape == ReferenceShape.SPHERE:
-            result = Datum(name, body, anchor, Datum.TEMPLATE_SPHERE)
+            result = Datum(name, body, anchor, Datum.TEMPLATE_SPHERE, report)
         else:
-            result = Datum(name, body, anchor, Datum.TEMPLATE)
+            result = Datum(name, body, anchor, Datum.TEMPLATE, report)
         return result
 
     @property
@@ -127,6 +141,15 @@ class Datum:
         """
         return self.__anchor
 
+    @property
+    def report(self) -> ReportContext:
+        """IAU report.
+
+        :getter: Returns the IAU report
+        :type: ReportContext
+        """
+        return self.__report
+
     def wkt(self) -> str:
         """Returns the datum WKT.
 
@@ -135,11 +158,13 @@ class Datum:
         """
         datum_template = Template(self.__template)
         datum = datum_template.substitute(
-            version=IAU_REPORT.VERSION,
+            version=self.report.version,
             datum_name=self.name,
-            body=self.body.wkt()
-            if self.anchor.wkt() == ""
-            else self.body.wkt() + ",",
+            body=(
+                self.body.wkt()
+                if self.anchor.wkt() == ""
+                else self.body.wkt() + ","
+            ),
             anchor=self.anchor.wkt(),
         )
         return datum
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to compare two WKT catalogues.
+
+Each catalogue is read by chunks and indexed by IAU code. The index only
+keeps a digest of the WKT of each CRS, so that large catalogues can be
+compared. When the WKT of a CRS differs, the CRS is normalized before it is
+compared again: the spaces are collapsed, the spaces around the commas and
+the brackets are removed and the known equivalences (wording of the
+remarks, identifier of the unity) are applied. The CRS that changed are
+parsed to report the fields that differ: body, radius, inverse flattening,
+anchor, direction, projection, parameters, remark, version.
+"""
+import hashlib
+import logging
+import re
+from contextlib import closing
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Set
+from typing import Tuple
+
+from .reader import parse
+from .reader import WktNode
+from .reader import WktReader
+
+logger = logging.getLogger(__name__)
+
+# spaces removed around the punctuation, once the spaces are collapsed
+PUNCTUATION: Tuple[Tuple[str, str], ...] = (
+    (", ", ","),
+    (" ,", ","),
+    ("[ ", "["),
+    (" [", "["),
+    ("] ", "]"),
+    (" ]", "]"),
+)
+
+
+class CrsDifference:  # pylint: disable=too-few-public-methods
+    """Difference of a CRS between two catalogues."""
+
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+
+    def __init__(
+        self,
+        code: int,
+        status: str,
+        fields: Optional[List[Tuple[str, Any, Any]]] = None,
+    ):
+        """Creates a difference.
+
+        Args:
+            code (int): IAU code
+            status (str): added, removed or changed
+            fields (Optional[List[Tuple[str, Any, Any]]], optional): name,
+            old value and new value of the fields that changed. Defaults to
+            none.
+        """
+        self.__code: int = code
+        self.__status: str = status
+        self.__fields: List[Tuple[str, Any, Any]] = (
+            list() if fields is None else fields
+        )
+
+    @property
+    def code(self) -> int:
+        """The IAU code.
+
+        :getter: Returns the code
+        :type: int
+        """
+        return self.__code
+
+    @property
+    def status(self) -> str:
+        """The status of the CRS: added, removed or changed.
+
+        :getter: Returns the status
+        :type: str
+        """
+        return self.__status
+
+    @property
+    def fields(self) -> List[Tuple[str, Any, Any]]:
+        """The fields that changed.
+
+        :getter: Returns the name, the old value and the new value of the
+            fields
+        :type: List[Tuple[str, Any, Any]]
+        """
+        return self.__fields
+
+    def __str__(self) -> str:
+        if self.status != CrsDifference.CHANGED:
+            return f"{self.code} {self.status}"
+        return f"{self.code} {self.status}: " + ", ".join(
+            f"{name} {old!r} -> {new!r}" for name, old, new in self.fields
+        )
+
+
+class CatalogueDiff:
+    """Compares two WKT catalogues."""
+
+    # equivalent writings of the same CRS, applied to the normalized WKT
+    EQUIVALENCES: List[Tuple[Pattern, str]] = [
+        (
+            re.compile(r"Use mean radius as sphere for interoperability\."),
+            "Use mean radius as sphere radius for interoperability.",
+        ),
+        (re.compile(r"Use R_m = \(a\+b\+c\)/3 as mean radius\. ?"), ""),
+        (
+            re.compile(r'SCALEUNIT\["unity",1\]'),
+            'SCALEUNIT["unity",1,ID["EPSG",9201]]',
+        ),
+    ]
+
+    def __init__(self, old_path: str, new_path: str):
+        """Creates the comparison of two catalogues.
+
+        Args:
+            old_path (str): WKT file or zip file of the old catalogue
+            new_path (str): WKT file or zip file of the new catalogue
+        """
+        self.__old_path: str = old_path
+        self.__new_path: str = new_path
+        self.__nb_old: int = 0
+        self.__nb_new: int = 0
+
+    @property
+    def old_path(self) -> str:
+        """The old catalogue.
+
+        :getter: Returns the path of the old catalogue
+        :type: str
+        """
+        return self.__old_path
+
+    @property
+    def new_path(self) -> str:
+        """The new catalogue.
+
+        :getter: Returns the path of the new catalogue
+        :type: str
+        """
+        return self.__new_path
+
+    @property
+    def nb_old(self) -> int:
+        """The number of CRS of the old catalogue.
+
+        :getter: Returns the number of CRS
+        :type: int
+        """
+        return self.__nb_old
+
+    @property
+    def nb_new(self) -> int:
+        """The number of CRS of the new catalogue.
+
+        :getter: Returns the number of CRS
+        :type: int
+        """
+        return self.__nb_new
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Returns the normalized WKT of a CRS.
+
+        Args:
+            text (str): WKT of a CRS
+
+        Returns:
+            str: the WKT without the insignificant spaces and with the
+            equivalences applied
+        """
+        result: str = " ".join(text.split())
+        for spaced, unspaced in PUNCTUATION:
+            result = result.replace(spaced, unspaced)
+        for pattern, replacement in CatalogueDiff.EQUIVALENCES:
+            result = pattern.sub(replacement, result)
+        return result
+
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        """Returns the digest of a CRS.
+
+        Args:
+            text (str): WKT
+
+        Returns:
+            bytes: the digest
+        """
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _index(self) -> Dict[int, bytes]:
+        """Indexes the old catalogue.
+
+        Returns:
+            Dict[int, bytes]: the digest of the WKT of the CRS by code
+        """
+        index: Dict[int, bytes] = dict()
+        with closing(WktReader(self.old_path).coded_blocks()) as crs:
+            for code, text in crs:
+                if code in index:
+                    logger.warning(f"{self.old_path}: duplicated code {code}")
+                index[code] = self._digest(text)
+        self.__nb_old = len(index)
+        return index
+
+    def compare(self) -> List[CrsDifference]:
+        """Compares the catalogues.
+
+        The WKT are compared first as they are written, which is enough for
+        the catalogues written by the same version of the library. Only the
+        CRS whose WKT differ are normalized: the old catalogue is read again
+        to normalize them, then the new one to get the fields of the CRS
+        that changed.
+
+        Returns:
+            List[CrsDifference]: the differences, sorted by code
+        """
+        index: Dict[int, bytes] = self._index()
+        differences: List[CrsDifference] = list()
+        seen: Set[int] = set()
+        # digest of the normalized new WKT by code
+        candidates: Dict[int, bytes] = dict()
+        with closing(WktReader(self.new_path).coded_blocks()) as crs:
+            for code, text in crs:
+                if code in seen:
+                    logger.warning(f"{self.new_path}: duplicated code {code}")
+                seen.add(code)
+                digest: Optional[bytes] = index.get(code)
+                if digest is None:
+                    differences.append(
+                        CrsDifference(code, CrsDifference.ADDED)
+                    )
+                elif digest != self._digest(text):
+                    candidates[code] = self._digest(self.normalize(text))
+        self.__nb_new = len(seen)
+        differences.extend(
+            CrsDifference(code, CrsDifference.REMOVED)
+            for code in index.keys() - seen
+        )
+        # normalized old WKT of the CRS that changed
+        changed: Dict[int, str] = dict()
+        if len(candidates) > 0:
+            with closing(WktReader(self.old_path).coded_blocks()) as crs:
+                for code, text in crs:
+                    if code in candidates:
+                        normalized: str = self.normalize(text)
+                        if self._digest(normalized) != candidates[code]:
+                            changed[code] = normalized
+        if len(changed) > 0:
+            with closing(WktReader(self.new_path).coded_blocks()) as crs:
+                for code, text in crs:
+                    if code in changed:
+                        differences.append(
+                            CrsDifference(
+                                code,
+                                CrsDifference.CHANGED,
+                                self.fields_differences(
+                                    changed[code], self.normalize(text)
+                                ),
+                            )
+                        )
+        differences.sort(key=lambda difference: difference.code)
+        return differences
+
+    @staticmethod
+    def fields(text: str) -> Dict[str, Any]:
+        """Returns the fields of a CRS that are compared.
+
+        Args:
+            text (str): WKT of the CRS
+
+        Returns:
+            Dict[str, Any]: the fields by name
+        """
+        root: WktNode = parse(text)
+        base: WktNode = (
+            root.child("BASEGEOGCRS", "BASEGEODCRS")
+            if root.keyword == "PROJCRS"
+            else root
+        )
+        datum: WktNode = base.child("DATUM")
+        body: WktNode = datum.child("ELLIPSOID", "TRIAXIAL")
+        anchor: Optional[WktNode] = datum.find("ANCHOR")
+        axes: List[Any] = [
+            axis.values[1] for axis in root.children if axis.keyword == "AXIS"
+        ]
+        remark: Optional[WktNode] = root.find("REMARK")
+        result: Dict[str, Any] = {
+            "crs": f"{root.keyword} {root.values[0]}",
+            "body": body.values[0],
+            "radius": (
+                tuple(body.values[1:4])
+                if body.keyword == "TRIAXIAL"
+                else body.values[1]
+            ),
+            "inverse_flattening": (
+                None if body.keyword == "TRIAXIAL" else body.values[2]
+            ),
+            "anchor": None if anchor is None else anchor.values[0],
+            "direction": tuple(axes),
+            "remark": None if remark is None else remark.values[0],
+            "version": root.child("ID").values[2],
+        }
+        conversion: Optional[WktNode] = root.find("CONVERSION")
+        if conversion is not None:
+            result["projection"] = (
+                f"{conversion.values[0]} ({conversion.child('METHOD').values[0]})"
+            )
+            result["parameters"] = {
+                parameter.values[0]: parameter.values[1]
+                for parameter in conversion.children
+                if parameter.keyword == "PARAMETER"
+            }
+        return result
+
+    @staticmethod
+    def fields_differences(
+        old_text: str, new_text: str
+    ) -> List[Tuple[str, Any, Any]]:
+        """Returns the fields that differ between two versions of a CRS.
+
+        Args:
+            old_text (str): old WKT
+            new_text (str): new WKT
+
+        Returns:
+            List[Tuple[str, Any, Any]]: the name, the old value and the new
+            value of the fields that differ. The field wkt is returned when
+            the difference is not in a compared field.
+        """
+        old_fields: Dict[str, Any] = CatalogueDiff.fields(old_text)
+        new_fields: Dict[str, Any] = CatalogueDiff.fields(new_text)
+        differences: List[Tuple[str, Any, Any]] = [
+            (name, old_fields.get(name), new_fields.get(name))
+            for name in dict.fromkeys([*old_fields, *new_fields])
+            if old_fields.get(name) != new_fields.get(name)
+        ]
+        if len(differences) == 0:
+            differences.append(("wkt", old_text, new_text))
+        return differences
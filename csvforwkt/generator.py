@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to generate synthetic IAU reports.
+
+The synthetic reports have the columns of the IAU report and a mix of the
+cases found in the real report: spheres, biaxial and triaxial bodies,
+retrograde rotations, unknown rotations, unknown mean radius, invalid
+flattening, unknown radii (skipped records) and anchors. The generation is
+seeded, so a report is reproducible, and written by blocks, so the size of
+the report is not limited by the memory.
+"""
+from enum import Enum
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+
+import numpy as np  # pylint: disable=import-error
+import pandas as pd  # pylint: disable=import-error
+
+
+class BodyKind(Enum):
+    """Kind of body in a synthetic report."""
+
+    SPHERE = "sphere"
+    BIAXIAL = "biaxial"
+    TRIAXIAL = "triaxial"
+    UNKNOWN_RADII = "unknown_radii"
+    UNKNOWN_MEAN = "unknown_mean"
+    INVALID_FLATTENING = "invalid_flattening"
+
+
+class CatalogueGenerator:
+    """Generator of synthetic IAU reports."""
+
+    COLUMNS = [
+        "Naif_id",
+        "Body",
+        "IAU2015_Mean",
+        "IAU2015_Semimajor",
+        "IAU2015_Axisb",
+        "IAU2015_Semiminor",
+        "rotation",
+        "origin_long_name",
+        "origin_lon_pos",
+    ]
+
+    DEFAULT_MIX: Dict[BodyKind, float] = {
+        BodyKind.SPHERE: 0.25,
+        BodyKind.BIAXIAL: 0.2,
+        BodyKind.TRIAXIAL: 0.25,
+        BodyKind.UNKNOWN_RADII: 0.2,
+        BodyKind.UNKNOWN_MEAN: 0.05,
+        BodyKind.INVALID_FLATTENING: 0.05,
+    }
+
+    ROTATIONS = {"Direct": 0.6, "Retrograde": 0.2, "": 0.2}
+
+    ANCHOR_RATIO: float = 0.3
+
+    # the synthetic Naif IDs do not overlap the ones of the IAU report
+    FIRST_NAIF_ID: int = 50_000_000
+
+    BLOCK_SIZE: int = 100_000
+
+    def __init__(
+        self,
+        nb_rows: int,
+        seed: int = 0,
+        mix: Optional[Dict[BodyKind, float]] = None,
+    ):
+        """Creates the generator.
+
+        Args:
+            nb_rows (int): number of rows of the report
+            seed (int, optional): seed of the generator. Defaults to 0.
+            mix (Optional[Dict[BodyKind, float]], optional): weight of each
+            kind of body. Defaults to DEFAULT_MIX.
+
+        Raises:
+            ValueError: invalid number of rows or mix
+        """
+        if nb_rows < 0:
+            raise ValueError(f"Invalid number of rows: {nb_rows}")
+        mix = CatalogueGenerator.DEFAULT_MIX if mix is None else mix
+        total: float = sum(mix.values())
+        if total <= 0 or any(weight < 0 for weight in mix.values()):
+            raise ValueError(f"Invalid mix: {mix}")
+        self.__nb_rows: int = nb_rows
+        self.__seed: int = seed
+        self.__mix: Dict[BodyKind, float] = {
+            kind: weight / total for kind, weight in mix.items()
+        }
+
+    @property
+    def nb_rows(self) -> int:
+        """Number of rows of the report.
+
+        :getter: Returns the number of rows
+        :type: int
+        """
+        return self.__nb_rows
+
+    @property
+    def seed(self) -> int:
+        """Seed of the generator.
+
+        :getter: Returns the seed
+        :type: int
+        """
+        return self.__seed
+
+    @property
+    def mix(self) -> Dict[BodyKind, float]:
+        """Probability of each kind of body.
+
+        :getter: Returns the probabilities
+        :type: Dict[BodyKind, float]
+        """
+        return self.__mix
+
+    def _block(self, index: int, size: int) -> pd.DataFrame:
+        """Generates a block of rows.
+
+        The block only depends on the seed and on its index.
+
+        Args:
+            index (int): index of the block
+            size (int): number of rows
+
+        Returns:
+            pd.DataFrame: the rows
+        """
+        rng = np.random.default_rng([self.__seed, index])
+        kinds = list(self.__mix.keys())
+        kind = rng.choice(len(kinds), size=size, p=list(self.__mix.values()))
+
+        def is_kind(body_kind: BodyKind) -> np.ndarray:
+            return (
+                kind == kinds.index(body_kind)
+                if body_kind in kinds
+                else np.zeros(size, dtype=bool)
+            )
+
+        # radius from 1 km to 10000 km
+        semi_major = np.round(10 ** rng.uniform(3, 7, size), 2)
+        axis_b = np.round(semi_major * (1 - rng.uniform(0.05, 0.5, size)), 2)
+        semi_minor = np.round(
+            semi_major * (1 - rng.uniform(0.001, 0.1, size)), 2
+        )
+        triaxial_minor = np.round(
+            axis_b * (1 - rng.uniform(0.05, 0.5, size)), 2
+        )
+
+        sphere = is_kind(BodyKind.SPHERE)
+        biaxial = is_kind(BodyKind.BIAXIAL) | is_kind(
+            BodyKind.INVALID_FLATTENING
+        )
+        axis_b = np.where(sphere | biaxial, semi_major, axis_b)
+        semi_minor = np.where(
+            sphere,
+            semi_major,
+            np.where(biaxial, semi_minor, triaxial_minor),
+        )
+        semi_minor = np.where(
+            is_kind(BodyKind.INVALID_FLATTENING), -1.0, semi_minor
+        )
+        mean = np.round((semi_major + axis_b + semi_minor) / 3, 2)
+        mean = np.where(is_kind(BodyKind.UNKNOWN_MEAN), -1.0, mean)
+
+        unknown = is_kind(BodyKind.UNKNOWN_RADII)
+        naif_ids = (
+            CatalogueGenerator.FIRST_NAIF_ID
+            + index * CatalogueGenerator.BLOCK_SIZE
+            + np.arange(size, dtype=np.int64)
+        )
+        rotations = list(CatalogueGenerator.ROTATIONS.keys())
+        rotation = np.array(rotations, dtype=object)[
+            rng.choice(
+                len(rotations),
+                size=size,
+                p=list(CatalogueGenerator.ROTATIONS.values()),
+            )
+        ]
+        anchor = rng.random(size) < CatalogueGenerator.ANCHOR_RATIO
+        longitude = np.round(rng.uniform(0, 360, size), 2)
+        names = pd.Series(naif_ids).astype(str)
+        return pd.DataFrame(
+            {
+                "Naif_id": naif_ids,
+                "Body": "Synthetic " + names,
+                "IAU2015_Mean": np.where(unknown, -1.0, mean),
+                "IAU2015_Semimajor": np.where(unknown, -1.0, semi_major),
+                "IAU2015_Axisb": np.where(unknown, -1.0, axis_b),
+                "IAU2015_Semiminor": np.where(unknown, -1.0, semi_minor),
+                "rotation": np.where(unknown, "", rotation),
+                "origin_long_name": np.where(anchor, "Crater " + names, ""),
+                "origin_lon_pos": np.where(
+                    anchor,
+                    np.where(
+                        longitude > 0,
+                        pd.Series(longitude).astype(str) + " W",
+                        "0",
+                    ),
+                    "",
+                ),
+            },
+            columns=CatalogueGenerator.COLUMNS,
+        )
+
+    def iter_blocks(self) -> Iterator[pd.DataFrame]:
+        """Generates the report by blocks of BLOCK_SIZE rows.
+
+        Yields:
+            Iterator[pd.DataFrame]: the blocks
+        """
+        for index, start in enumerate(
+            range(0, self.__nb_rows, CatalogueGenerator.BLOCK_SIZE)
+        ):
+            yield self._block(
+                index,
+                min(CatalogueGenerator.BLOCK_SIZE, self.__nb_rows - start),
+            )
+
+    def write(self, path: str) -> int:
+        """Writes the report in CSV.
+
+        Args:
+            path (str): CSV file
+
+        Returns:
+            int: the number of written rows
+        """
+        nb_rows: int = 0
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            file.write(",".join(CatalogueGenerator.COLUMNS) + "\n")
+            for block in self.iter_blocks():
+                block.to_csv(
+                    file, header=False, index=False, float_format="%.2f"
+                )
+                nb_rows += block.shape[0]
+        return nb_rows
+
+    @staticmethod
+    def parse_mix(value: str) -> Dict[BodyKind, float]:
+        """Parses a mix like sphere=0.5,triaxial=0.5.
+
+        Args:
+            value (str): comma separated kind=weight
+
+        Raises:
+            ValueError: invalid mix
+
+        Returns:
+            Dict[BodyKind, float]: weight by kind of body
+        """
+        mix: Dict[BodyKind, float] = dict()
+        for item in value.split(","):
+            try:
+                name, weight = item.split("=")
+                mix[BodyKind(name.strip().lower())] = float(weight)
+            except ValueError as error:
+                raise ValueError(
+                    f"Invalid mix {item} : kind=weight is expected with kind in {', '.join(kind.value for kind in BodyKind)}"
+                ) from error
+        return mix
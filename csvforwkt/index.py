@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""This module contains the relationships between the CRS of a body.
+
+The index is built once, when the body CRS are created, and it is reused to
+create the projected CRS, to resolve a code and to export the CRS. It only
+keeps IAU codes, not the CRS, so that the CRS of a streamed body can be freed
+once the body is written.
+"""
+from typing import cast
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import Optional
+
+from .body import ReferenceShape
+from .crs import BodyCrs
+from .crs import CrsType
+from .crs import ICrs
+
+
+class BodyIndex:
+    """Relationships between the CRS of a body.
+
+    * the shapes having an ographic CRS with direction east
+    * the base CRS whose projected CRS are generated
+    * the equivalent CRS : an ocentric CRS is equivalent to the ographic CRS
+      with direction east of the same shape, so its projected CRS are not
+      generated
+    * the projected CRS of each base CRS
+    """
+
+    def __init__(self, naif_id: int, crs: Dict[int, ICrs]):
+        """Creates the index of the body CRS of a body.
+
+        Args:
+            naif_id (int): Naif ID of the body
+            crs (Dict[int, ICrs]): IAU code and body CRS of the body
+        """
+        self.__naif_id: int = naif_id
+        ographic_east: Dict[ReferenceShape, int] = {
+            body_crs.datum.body.shape: code
+            for code, body_crs in crs.items()
+            if isinstance(body_crs, BodyCrs)
+            and body_crs.crs_type is CrsType.OGRAPHIC
+            and body_crs.direction == "east"
+        }
+        self.__east_ographic_shapes: FrozenSet[ReferenceShape] = frozenset(
+            ographic_east
+        )
+        self.__equivalents: Dict[int, int] = dict()
+        self.__bases: List[int] = list()
+        for code, body_crs in crs.items():
+            body_crs = cast(BodyCrs, body_crs)
+            shape: ReferenceShape = body_crs.datum.body.shape
+            if (
+                body_crs.crs_type is CrsType.OCENTRIC
+                and shape in ographic_east
+            ):
+                self.__equivalents[code] = ographic_east[shape]
+            else:
+                self.__bases.append(code)
+        self.__projections: Dict[int, List[int]] = {
+            code: list() for code in self.__bases
+        }
+
+    @property
+    def naif_id(self) -> int:
+        """Naif ID of the body.
+
+        :getter: Returns the Naif ID
+        :type: int
+        """
+        return self.__naif_id
+
+    @property
+    def east_ographic_shapes(self) -> FrozenSet[ReferenceShape]:
+        """Shapes having an ographic CRS with direction east.
+
+        :getter: Returns the shapes
+        :type: FrozenSet[ReferenceShape]
+        """
+        return self.__east_ographic_shapes
+
+    @property
+    def bases(self) -> List[int]:
+        """IAU codes of the body CRS whose projected CRS are generated, in
+        creation order.
+
+        :getter: Returns the IAU codes of the body CRS
+        :type: List[int]
+        """
+        return self.__bases
+
+    @property
+    def equivalents(self) -> Dict[int, int]:
+        """IAU code of the ocentric CRS and of its equivalent ographic CRS.
+
+        :getter: Returns the equivalent codes
+        :type: Dict[int, int]
+        """
+        return self.__equivalents
+
+    @property
+    def projections(self) -> Dict[int, List[int]]:
+        """IAU codes of the projected CRS by IAU code of base CRS.
+
+        :getter: Returns the IAU codes of the projected CRS
+        :type: Dict[int, List[int]]
+        """
+        return self.__projections
+
+    def equivalent(self, code: int) -> Optional[int]:
+        """Returns the equivalent code of a CRS or of a projected CRS.
+
+        Args:
+            code (int): IAU code
+
+        Returns:
+            Optional[int]: the equivalent IAU code or None
+        """
+        offset: int = code % 100 - code % 100 % 5
+        base: Optional[int] = self.__equivalents.get(code - offset)
+        return None if base is None else base + offset
+
+    def base_of(self, code: int) -> Optional[int]:
+        """Returns the IAU code of the base CRS of a projected CRS.
+
+        Args:
+            code (int): IAU code of the projected CRS
+
+        Returns:
+            Optional[int]: the IAU code of the base CRS or None when the
+            projected CRS is not generated
+        """
+        offset: int = code % 100 - code % 100 % 5
+        base: int = code - offset
+        projections: Optional[List[int]] = self.__projections.get(base)
+        if offset == 0 or projections is None or code not in projections:
+            return None
+        return base
+
+    def add_projection(self, base_code: int, code: int):
+        """Records a projected CRS.
+
+        Args:
+            base_code (int): IAU code of the base CRS
+            code (int): IAU code of the projected CRS
+        """
+        projections: List[int] = self.__projections[base_code]
+        if code not in projections:
+            projections.append(code)
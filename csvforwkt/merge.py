@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to merge the outputs of the shards of a run.
+
+A run split with `--shard i/N` generates, on each node, the CRS of the bodies
+whose Naif ID modulo N is i - 1, in the order of `CsvforwktLib.process`. The
+outputs of the shards are merged by Naif ID with a k-way merge that reads one
+CRS at a time from each shard. The CRS are copied as they were written, so
+the merged output is identical to the output of a run that is not split.
+"""
+import heapq
+import logging
+import os
+import re
+from contextlib import closing
+from typing import Any
+from typing import Generator
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from .reader import WktReader
+from .writer import ArrowWriter
+from .writer import OutputFormat
+
+logger = logging.getLogger(__name__)
+
+# the code is the first key of a JSON line
+JSONL_CODE = re.compile(r'\{"code": (\d+),')
+
+
+class ShardMerger:
+    """Merges the outputs of the shards of a run."""
+
+    def __init__(self, paths: List[str], output_format: OutputFormat):
+        """Creates the merger.
+
+        Args:
+            paths (List[str]): outputs of the shards
+            output_format (OutputFormat): format of the outputs
+        """
+        self.__paths: List[str] = paths
+        self.__output_format: OutputFormat = output_format
+
+    @property
+    def paths(self) -> List[str]:
+        """The outputs of the shards.
+
+        :getter: Returns the paths of the outputs
+        :type: List[str]
+        """
+        return self.__paths
+
+    @property
+    def output_format(self) -> OutputFormat:
+        """The format of the outputs.
+
+        :getter: Returns the output format
+        :type: OutputFormat
+        """
+        return self.__output_format
+
+    @staticmethod
+    def _wkt(path: str) -> Generator[Tuple[int, Any], None, None]:
+        """Iterates on the CRS of a WKT output.
+
+        Args:
+            path (str): WKT file
+
+        Yields:
+            Generator[Tuple[int, Any], None, None]: the Naif ID and the WKT
+        """
+        with closing(WktReader(path).coded_blocks()) as crs:
+            for code, text in crs:
+                yield code // 100, text
+
+    @staticmethod
+    def _jsonl(path: str) -> Generator[Tuple[int, Any], None, None]:
+        """Iterates on the CRS of a JSON Lines output.
+
+        Args:
+            path (str): JSON Lines file
+
+        Raises:
+            ValueError: line without code
+
+        Yields:
+            Generator[Tuple[int, Any], None, None]: the Naif ID and the line
+        """
+        with open(path, encoding="utf-8") as file:
+            for number, line in enumerate(file, 1):
+                match: Optional[re.Match] = JSONL_CODE.match(line)
+                if match is None:
+                    raise ValueError(f"{path}, line {number}: no code")
+                yield int(match.group(1)) // 100, line
+
+    def _columnar(self, path: str) -> Generator[Tuple[int, Any], None, None]:
+        """Iterates on the CRS of a Parquet or Arrow output.
+
+        Args:
+            path (str): Parquet or Arrow IPC file
+
+        Yields:
+            Generator[Tuple[int, Any], None, None]: the Naif ID and the record
+        """
+        # pylint: disable=import-outside-toplevel
+        # explicit error when pyarrow is not installed
+        ArrowWriter.schema()
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        batches: Iterator[Any]
+        if self.output_format == OutputFormat.PARQUET:
+            batches = pq.ParquetFile(path).iter_batches()
+        else:
+            reader = pa.ipc.open_file(path)
+            batches = (
+                reader.get_batch(index)
+                for index in range(reader.num_record_batches)
+            )
+        for batch in batches:
+            for record in batch.to_pylist():
+                yield record["naif_id"], record
+
+    def _crs(self, index: int) -> Generator[Tuple[int, int, Any], None, None]:
+        """Iterates on the CRS of the output of a shard.
+
+        Args:
+            index (int): index of the shard in the paths
+
+        Raises:
+            ValueError: the bodies are not sorted by Naif ID
+
+        Yields:
+            Generator[Tuple[int, int, Any], None, None]: the Naif ID, the
+            index of the shard and the CRS, as written
+        """
+        path: str = self.paths[index]
+        crs: Generator[Tuple[int, Any], None, None]
+        if self.output_format == OutputFormat.WKT:
+            crs = ShardMerger._wkt(path)
+        elif self.output_format == OutputFormat.JSONL:
+            crs = ShardMerger._jsonl(path)
+        else:
+            crs = self._columnar(path)
+        previous: Optional[int] = None
+        with closing(crs):
+            for naif_id, value in crs:
+                if previous is not None and naif_id < previous:
+                    raise ValueError(
+                        f"{path}: body {naif_id} after body {previous}, the output is not sorted by Naif ID"
+                    )
+                previous = naif_id
+                yield naif_id, index, value
+
+    def records(self) -> Generator[Tuple[int, Any], None, None]:
+        """Iterates on the CRS of all the shards, in the order of `process`.
+
+        The CRS of a body stay in the order of their shard.
+
+        Raises:
+            ValueError: a body is in several shards
+
+        Yields:
+            Generator[Tuple[int, Any], None, None]: the Naif ID and the CRS,
+            as written
+        """
+        shards: List[Generator[Tuple[int, int, Any], None, None]] = [
+            self._crs(index) for index in range(len(self.paths))
+        ]
+        previous_id: Optional[int] = None
+        previous_index: int = 0
+        try:
+            for naif_id, index, value in heapq.merge(
+                *shards, key=lambda item: item[0]
+            ):
+                if naif_id == previous_id and index != previous_index:
+                    raise ValueError(
+                        f"Body {naif_id} in {self.paths[previous_index]} and {self.paths[index]}"
+                    )
+                previous_id = naif_id
+                previous_index = index
+                yield naif_id, value
+        finally:
+            # heapq.merge abandons the shards when the merge stops early
+            for shard in shards:
+                shard.close()
+
+    def merge(self, path: str, batch_size: int = 1000) -> int:
+        """Writes the merged output.
+
+        Args:
+            path (str): merged output
+            batch_size (int, optional): number of CRS by record batch of the
+            columnar formats, the one of the shards. Defaults to 1000.
+
+        Raises:
+            ValueError: the merged output is the output of a shard
+
+        Returns:
+            int: number of written CRS
+        """
+        if any(
+            os.path.realpath(path) == os.path.realpath(shard)
+            for shard in self.paths
+        ):
+            raise ValueError(f"{path} is the output of a shard")
+        nb_crs: int = 0
+        with closing(self.records()) as records:
+            if self.output_format in (
+                OutputFormat.PARQUET,
+                OutputFormat.ARROW,
+            ):
+                nb_crs = ArrowWriter(
+                    path, self.output_format, batch_size
+                ).write_records(record for _, record in records)
+            else:
+                separator: str = (
+                    "\n\n" if self.output_format == OutputFormat.WKT else ""
+                )
+                with open(path, "w", encoding="utf-8") as file:
+                    for _, text in records:
+                        file.write(text)
+                        file.write(separator)
+                        nb_crs += 1
+        logger.info(
+            f"{nb_crs} CRS of {len(self.paths)} shards merged in {path}"
+        )
+        return nb_crs
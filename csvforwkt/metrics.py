@@ -0,0 +1,516 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to export the metrics of a run.
+
+The metrics are written in the Prometheus text format, for the textfile
+collector of node-exporter, or served on /metrics by the serve command:
+
+* counters: rows read and skipped, bodies by shape, CRS by class, type and
+  shape, projected CRS generated and skipped by rule, bytes written, HTTP
+  requests
+* histograms: rendering time of the WKT by class of CRS, duration of the
+  run, duration of the HTTP requests
+"""
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from .crs import BodyCrs
+from .crs import ICrs
+from .crs import ProjectionBody
+
+# sorted label names and values
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:  # pylint: disable=too-few-public-methods
+    """Cumulative histogram of a metric for a set of labels."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        """Creates an empty histogram.
+
+        Args:
+            buckets (Tuple[float, ...]): upper bounds of the buckets
+        """
+        self.buckets: Tuple[float, ...] = buckets
+        self.counts: List[int] = [0] * len(buckets)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float):
+        """Adds an observation.
+
+        Args:
+            value (float): observed value
+        """
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+
+class MetricsRegistry:
+    """Counters and histograms in the Prometheus text format."""
+
+    COUNTER = "counter"
+    HISTOGRAM = "histogram"
+
+    def __init__(self):
+        """Creates an empty registry."""
+        # name: type, help, buckets
+        self.__definitions: Dict[str, Tuple[str, str, Tuple[float, ...]]] = (
+            dict()
+        )
+        self.__counters: Dict[str, Dict[Labels, float]] = dict()
+        self.__histograms: Dict[str, Dict[Labels, Histogram]] = dict()
+        self.__lock = threading.Lock()
+
+    def define(
+        self,
+        name: str,
+        metric_type: str,
+        description: str,
+        buckets: Tuple[float, ...] = (),
+    ):
+        """Defines a metric.
+
+        Args:
+            name (str): name of the metric
+            metric_type (str): counter or histogram
+            description (str): help of the metric
+            buckets (Tuple[float, ...], optional): upper bounds of the
+            buckets of a histogram. Defaults to ().
+
+        Raises:
+            ValueError: unknown type of metric
+        """
+        if metric_type not in (
+            MetricsRegistry.COUNTER,
+            MetricsRegistry.HISTOGRAM,
+        ):
+            raise ValueError(f"Unknown type of metric {metric_type}")
+        self.__definitions[name] = (metric_type, description, buckets)
+        if metric_type == MetricsRegistry.COUNTER:
+            self.__counters[name] = dict()
+        else:
+            self.__histograms[name] = dict()
+
+    @staticmethod
+    def _labels(labels: Optional[Dict[str, str]]) -> Labels:
+        """Returns the labels of a sample as a key.
+
+        Args:
+            labels (Optional[Dict[str, str]]): labels of the sample
+
+        Returns:
+            Labels: the sorted labels
+        """
+        if labels is None:
+            return tuple()
+        return tuple(sorted(labels.items()))
+
+    def inc(
+        self,
+        name: str,
+        value: float = 1,
+        labels: Optional[Dict[str, str]] = None,
+    ):
+        """Increments a counter.
+
+        Args:
+            name (str): name of the counter
+            value (float, optional): increment. Defaults to 1.
+            labels (Optional[Dict[str, str]], optional): labels of the
+            sample. Defaults to no label.
+        """
+        key: Labels = MetricsRegistry._labels(labels)
+        with self.__lock:
+            counter: Dict[Labels, float] = self.__counters[name]
+            counter[key] = counter.get(key, 0) + value
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        labels: Optional[Dict[str, str]] = None,
+    ):
+        """Adds an observation to a histogram.
+
+        Args:
+            name (str): name of the histogram
+            value (float): observed value
+            labels (Optional[Dict[str, str]], optional): labels of the
+            sample. Defaults to no label.
+        """
+        key: Labels = MetricsRegistry._labels(labels)
+        with self.__lock:
+            histograms: Dict[Labels, Histogram] = self.__histograms[name]
+            if key not in histograms:
+                histograms[key] = Histogram(self.__definitions[name][2])
+            histograms[key].observe(value)
+
+    def value(
+        self, name: str, labels: Optional[Dict[str, str]] = None
+    ) -> float:
+        """Returns the value of a counter.
+
+        Args:
+            name (str): name of the counter
+            labels (Optional[Dict[str, str]], optional): labels of the
+            sample. Defaults to no label.
+
+        Returns:
+            float: the value, 0 when the counter is not incremented
+        """
+        return self.__counters[name].get(MetricsRegistry._labels(labels), 0)
+
+    def histogram(
+        self, name: str, labels: Optional[Dict[str, str]] = None
+    ) -> Histogram:
+        """Returns a histogram.
+
+        Args:
+            name (str): name of the histogram
+            labels (Optional[Dict[str, str]], optional): labels of the
+            sample. Defaults to no label.
+
+        Raises:
+            KeyError: no observation
+
+        Returns:
+            Histogram: the histogram
+        """
+        return self.__histograms[name][MetricsRegistry._labels(labels)]
+
+    @staticmethod
+    def _format(name: str, labels: Labels, value: float) -> str:
+        """Formats a sample.
+
+        Args:
+            name (str): name of the sample
+            labels (Labels): labels of the sample
+            value (float): value of the sample
+
+        Returns:
+            str: the line of the sample
+        """
+        number: str = (
+            str(int(value)) if float(value).is_integer() else repr(value)
+        )
+        if len(labels) == 0:
+            return f"{name} {number}"
+        formatted: str = ",".join(
+            '{}="{}"'.format(
+                key,
+                label.replace("\\", "\\\\")
+                .replace('"', '\\"')
+                .replace("\n", "\\n"),
+            )
+            for key, label in labels
+        )
+        return f"{name}{{{formatted}}} {number}"
+
+    def exposition(self) -> str:
+        """Returns the metrics in the Prometheus text format.
+
+        Returns:
+            str: the metrics
+        """
+        lines: List[str] = list()
+        with self.__lock:
+            for name, (
+                metric_type,
+                description,
+                _,
+            ) in self.__definitions.items():
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                if metric_type == MetricsRegistry.COUNTER:
+                    for labels, value in sorted(self.__counters[name].items()):
+                        lines.append(
+                            MetricsRegistry._format(name, labels, value)
+                        )
+                    continue
+                for labels, histogram in sorted(
+                    self.__histograms[name].items()
+                ):
+                    for bound, count in zip(
+                        histogram.buckets, histogram.counts
+                    ):
+                        lines.append(
+                            MetricsRegistry._format(
+                                f"{name}_bucket",
+                                labels + (("le", f"{bound:g}"),),
+                                count,
+                            )
+                        )
+                    lines.append(
+                        MetricsRegistry._format(
+                            f"{name}_bucket",
+                            labels + (("le", "+Inf"),),
+                            histogram.count,
+                        )
+                    )
+                    lines.append(
+                        MetricsRegistry._format(
+                            f"{name}_sum", labels, histogram.sum
+                        )
+                    )
+                    lines.append(
+                        MetricsRegistry._format(
+                            f"{name}_count", labels, histogram.count
+                        )
+                    )
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Writes the metrics atomically.
+
+        The metrics are written in a temporary file of the same directory,
+        which replaces the file, so that the collector never reads a
+        partial file.
+
+        Args:
+            path (str): .prom file
+        """
+        directory: str = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(
+            dir=directory, prefix=".", suffix=".prom.tmp"
+        )
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                file.write(self.exposition())
+            os.chmod(temporary, 0o644)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+class PipelineMetrics(MetricsRegistry):
+    """Metrics of the generation of the CRS.
+
+    The metrics are collected as a stage hook of CsvforwktLib, as a tracer
+    of the WKT rendering and from the generated CRS.
+    """
+
+    RENDER_BUCKETS: Tuple[float, ...] = (
+        1e-5,
+        2.5e-5,
+        5e-5,
+        1e-4,
+        2.5e-4,
+        5e-4,
+        1e-3,
+        2.5e-3,
+        1e-2,
+    )
+
+    RUN_BUCKETS: Tuple[float, ...] = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+    REQUEST_BUCKETS: Tuple[float, ...] = (
+        1e-4,
+        5e-4,
+        1e-3,
+        5e-3,
+        1e-2,
+        5e-2,
+        0.1,
+        0.5,
+        1,
+    )
+
+    def __init__(self):
+        """Creates the metrics."""
+        super().__init__()
+        self.define(
+            "csvforwkt_rows_read_total",
+            MetricsRegistry.COUNTER,
+            "Rows read in the IAU report",
+        )
+        self.define(
+            "csvforwkt_rows_skipped_total",
+            MetricsRegistry.COUNTER,
+            "Rows of the IAU report skipped for unknown radii",
+        )
+        self.define(
+            "csvforwkt_bodies_total",
+            MetricsRegistry.COUNTER,
+            "Bodies having CRS by shape (biaxial, triaxial)",
+        )
+        self.define(
+            "csvforwkt_crs_total",
+            MetricsRegistry.COUNTER,
+            "CRS by class, type and shape",
+        )
+        self.define(
+            "csvforwkt_projections_total",
+            MetricsRegistry.COUNTER,
+            "Pairs of body CRS and projection generated or skipped, by rule",
+        )
+        self.define(
+            "csvforwkt_bytes_written_total",
+            MetricsRegistry.COUNTER,
+            "Bytes written in the output file",
+        )
+        self.define(
+            "csvforwkt_http_requests_total",
+            MetricsRegistry.COUNTER,
+            "HTTP requests by method and status",
+        )
+        self.define(
+            "csvforwkt_render_seconds",
+            MetricsRegistry.HISTOGRAM,
+            "Rendering time of a WKT by class of CRS",
+            PipelineMetrics.RENDER_BUCKETS,
+        )
+        self.define(
+            "csvforwkt_run_seconds",
+            MetricsRegistry.HISTOGRAM,
+            "Duration of a run by command",
+            PipelineMetrics.RUN_BUCKETS,
+        )
+        self.define(
+            "csvforwkt_http_request_seconds",
+            MetricsRegistry.HISTOGRAM,
+            "Duration of the HTTP requests by method",
+            PipelineMetrics.REQUEST_BUCKETS,
+        )
+
+    @contextmanager
+    def stage(self, name: str, attributes: Dict[str, Any]) -> Iterator[None]:
+        """Counts the rows and the bytes of a stage (stage hook).
+
+        Args:
+            name (str): name of the stage
+            attributes (Dict[str, Any]): attributes filled by the stage
+
+        Yields:
+            Iterator[None]: the stage is run
+        """
+        yield
+        if name == "init_iau_report":
+            self.inc("csvforwkt_rows_read_total", attributes.get("rows", 0))
+        elif name == "skip_records":
+            self.inc(
+                "csvforwkt_rows_skipped_total", attributes.get("skipped", 0)
+            )
+        elif name == "save":
+            self.inc(
+                "csvforwkt_bytes_written_total", attributes.get("bytes", 0)
+            )
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Dict[str, Any]]:
+        """Measures the rendering of the WKT (tracer).
+
+        Args:
+            name (str): name of the span
+
+        Yields:
+            Iterator[Dict[str, Any]]: the attributes of the span
+        """
+        start: int = time.perf_counter_ns()
+        yield attributes
+        if name == "wkt":
+            self.observe(
+                "csvforwkt_render_seconds",
+                (time.perf_counter_ns() - start) / 1e9,
+                {"class": attributes.get("kind", "")},
+            )
+
+    def count_crs(self, crs: ICrs):
+        """Counts a CRS by class, type and shape.
+
+        Args:
+            crs (ICrs): the CRS
+        """
+        body_crs: BodyCrs = (
+            crs.body_crs if isinstance(crs, ProjectionBody) else crs  # type: ignore
+        )
+        self.inc(
+            "csvforwkt_crs_total",
+            labels={
+                "class": type(crs).__name__,
+                "type": body_crs.crs_type.value.lower(),
+                "shape": body_crs.datum.body.shape.value.lower(),
+            },
+        )
+
+    def count_bodies(
+        self,
+        bodies: Iterable[Tuple[int, Dict[int, ICrs]]],
+        is_triaxial: Callable[[int], bool],
+    ) -> Iterator[Tuple[int, Dict[int, ICrs]]]:
+        """Counts the bodies and their CRS as they are provided.
+
+        The shape of a body is the one of its description, the selected CRS
+        of a triaxial body may not be triaxial.
+
+        Args:
+            bodies (Iterable[Tuple[int, Dict[int, ICrs]]]): CRS group by
+            body
+            is_triaxial (Callable[[int], bool]): True when the description
+            of a body is triaxial, CsvforwktLib.is_triaxial
+
+        Yields:
+            Iterator[Tuple[int, Dict[int, ICrs]]]: the bodies
+        """
+        for naif_id, body_crs in bodies:
+            for crs in body_crs.values():
+                self.count_crs(crs)
+            self.inc(
+                "csvforwkt_bodies_total",
+                labels={
+                    "shape": "triaxial" if is_triaxial(naif_id) else "biaxial"
+                },
+            )
+            yield naif_id, body_crs
+
+    def count_projections(self, stats: Dict[str, int]):
+        """Counts the projected CRS generated and skipped by rule.
+
+        Args:
+            stats (Dict[str, int]): projection statistics of CsvforwktLib
+        """
+        for rule in ("generated", "equivalent", "sphere_only", "selection"):
+            self.inc(
+                "csvforwkt_projections_total",
+                stats.get(rule, 0),
+                {"rule": rule},
+            )
+
+    def observe_run(self, command: str, seconds: float):
+        """Adds the duration of a run.
+
+        Args:
+            command (str): name of the command
+            seconds (float): duration of the run
+        """
+        self.observe("csvforwkt_run_seconds", seconds, {"command": command})
+
+    def observe_request(self, method: str, status: int, seconds: float):
+        """Counts an HTTP request and adds its duration.
+
+        Args:
+            method (str): HTTP method
+            status (int): HTTP status
+            seconds (float): duration of the request
+        """
+        self.inc(
+            "csvforwkt_http_requests_total",
+            labels={"method": method, "status": str(status)},
+        )
+        self.observe(
+            "csvforwkt_http_request_seconds", seconds, {"method": method}
+        )
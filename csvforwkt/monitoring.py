@@ -21,10 +21,23 @@
 """Some Utilities."""
 import logging
 import os
+import sys
 import time
 import tracemalloc
+from contextlib import contextmanager
 from functools import partial
 from functools import wraps
+from types import FunctionType
+from types import MethodType
+from types import ModuleType
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
 
 
 class UtilsMonitoring:  # noqa: R0205
@@ -100,15 +113,19 @@ class UtilsMonitoring:  # noqa: R0205
         object : the result of the function
         """
         if func is None:
-            return partial(UtilsMonitoring.time_spend, level=level)
+            return partial(
+                UtilsMonitoring.time_spend,
+                level=level,
+                threshold_in_ms=threshold_in_ms,
+            )
 
         @wraps(func)
         def newfunc(*args, **kwargs):
             name = func.__qualname__
             logger = logging.getLogger(__name__ + "." + name)
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = func(*args, **kwargs)
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             logger.log(
                 level,
                 "function [{}] finished in {:.2f} ms".format(
@@ -189,16 +206,253 @@ class UtilsMonitoring:  # noqa: R0205
         def newfunc(*args, **kwargs):
             name = func.__qualname__
             logger = logging.getLogger(__name__ + "." + name)
-            tracemalloc.start()
+            is_tracing = tracemalloc.is_tracing()
+            if is_tracing:
+                start_current = tracemalloc.get_traced_memory()[0]
+            else:
+                start_current = 0
+                tracemalloc.start()
             result = func(*args, **kwargs)
             current, peak = tracemalloc.get_traced_memory()
+            current -= start_current
+            peak -= start_current
             msg = f"""
             \033[37mFunction Name       :\033[35;1m {func.__name__}\033[0m
             \033[37mCurrent memory usage:\033[36m {current / 10 ** 6}MB\033[0m
             \033[37mPeak                :\033[36m {peak / 10 ** 6}MB\033[0m
             """
             logger.log(level, msg)
-            tracemalloc.stop()
+            if not is_tracing:
+                tracemalloc.stop()
             return result
 
         return newfunc
+
+
+class StageMemory:  # pylint: disable=too-few-public-methods
+    """Memory allocated by a stage."""
+
+    def __init__(
+        self,
+        name: str,
+        peak: int,
+        net: int,
+        top: List[tracemalloc.StatisticDiff],
+    ):
+        """Creates the memory of a stage.
+
+        Args:
+            name (str): name of the stage
+            peak (int): peak of memory above the memory at the beginning of
+            the stage, in bytes
+            net (int): memory still allocated at the end of the stage, in
+            bytes
+            top (List[tracemalloc.StatisticDiff]): top allocation sites of
+            the stage
+        """
+        self.name: str = name
+        self.peak: int = peak
+        self.net: int = net
+        self.top: List[tracemalloc.StatisticDiff] = top
+
+
+class MemoryProfiler:
+    """Memory accounting by stage with tracemalloc snapshots.
+
+    For each stage, the peak and the net allocation are recorded and the
+    snapshot taken at the end of the stage is compared with the one taken
+    at its beginning to find the top allocation sites. The stages can be
+    nested and tracemalloc is only stopped by the profiler that started it.
+    """
+
+    FILTERS = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ]
+
+    def __init__(self, top: int = 10):
+        """Creates the profiler.
+
+        Args:
+            top (int, optional): number of allocation sites by stage.
+            Defaults to 10.
+        """
+        self.__top: int = top
+        self.__started: bool = False
+        self.__stages: List[StageMemory] = list()
+        # running peak of the enclosing stages
+        self.__peaks: List[int] = list()
+        self.__classes: Dict[str, Tuple[int, int]] = dict()
+
+    @property
+    def stages(self) -> List[StageMemory]:
+        """Memory of the stages, in the order they end.
+
+        :getter: Returns the memory of the stages
+        :type: List[StageMemory]
+        """
+        return self.__stages
+
+    @property
+    def classes(self) -> Dict[str, Tuple[int, int]]:
+        """Number of instances and retained bytes by class.
+
+        :getter: Returns the number of instances and bytes by class name
+        :type: Dict[str, Tuple[int, int]]
+        """
+        return self.__classes
+
+    def start(self):
+        """Starts tracing the allocations if they are not already traced."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__started = True
+
+    def stop(self):
+        """Stops tracing the allocations if the profiler started it."""
+        if self.__started:
+            tracemalloc.stop()
+            self.__started = False
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            MemoryProfiler.FILTERS
+        )
+
+    @contextmanager
+    def stage(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Iterator[None]:
+        """Measures the memory allocated by a stage.
+
+        Args:
+            name (str): name of the stage
+            attributes (Optional[Dict[str, Any]], optional): attributes of
+            the stage, not used. Defaults to None.
+
+        Yields:
+            Iterator[None]: the stage is run
+        """
+        # pylint: disable=unused-argument
+        if not tracemalloc.is_tracing():
+            yield
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        if len(self.__peaks) > 0:
+            self.__peaks[-1] = max(self.__peaks[-1], peak)
+        before: tracemalloc.Snapshot = self._snapshot()
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        # python < 3.9: the peak of the stage includes the peak of the
+        # previous stages, the traces must be kept for the snapshots
+        self.__peaks.append(0)
+        try:
+            yield
+        finally:
+            running_peak: int = self.__peaks.pop()
+            after_current, after_peak = tracemalloc.get_traced_memory()
+            stage_peak: int = max(running_peak, after_peak)
+            if len(self.__peaks) > 0:
+                self.__peaks[-1] = max(self.__peaks[-1], stage_peak)
+            after: tracemalloc.Snapshot = self._snapshot()
+            self.__stages.append(
+                StageMemory(
+                    name,
+                    stage_peak - current,
+                    after_current - current,
+                    after.compare_to(before, "lineno")[: self.__top],
+                )
+            )
+
+    @staticmethod
+    def _deep_sizeof(obj: Any, seen: Set[int]) -> int:
+        """Returns the size of an object and of the objects it references
+        that are not already seen.
+
+        Args:
+            obj (Any): object
+            seen (Set[int]): id of the objects already measured
+
+        Returns:
+            int: the size in bytes
+        """
+        size: int = 0
+        stack: List[Any] = [obj]
+        while len(stack) > 0:
+            current = stack.pop()
+            if id(current) in seen or isinstance(
+                current, (type, ModuleType, FunctionType, MethodType)
+            ):
+                continue
+            seen.add(id(current))
+            size += sys.getsizeof(current)
+            if isinstance(current, dict):
+                stack.extend(current.keys())
+                stack.extend(current.values())
+            elif isinstance(current, (list, tuple, set, frozenset)):
+                stack.extend(current)
+            elif hasattr(current, "__dict__"):
+                stack.append(current.__dict__)
+        return size
+
+    def account(self, objects: Iterable[Any]):
+        """Accounts the memory retained by objects, by class.
+
+        An object referenced by several objects is accounted to the class
+        of the first object referencing it.
+
+        Args:
+            objects (Iterable[Any]): objects
+        """
+        seen: Set[int] = set()
+        for obj in objects:
+            name: str = type(obj).__name__
+            count, size = self.__classes.get(name, (0, 0))
+            self.__classes[name] = (
+                count + 1,
+                size + MemoryProfiler._deep_sizeof(obj, seen),
+            )
+
+    def report(self) -> str:
+        """Returns the report of the memory.
+
+        Returns:
+            str: the report
+        """
+        lines: List[str] = [
+            "Memory by stage",
+            f"{'stage':<20} {'peak (KiB)':>12} {'net (KiB)':>12}",
+        ]
+        for stage in self.__stages:
+            lines.append(
+                f"{stage.name:<20} {stage.peak / 1024:>12.1f} {stage.net / 1024:>12.1f}"
+            )
+        if len(self.__classes) > 0:
+            lines.extend(
+                [
+                    "",
+                    "Memory retained by class",
+                    f"{'class':<20} {'instances':>10} {'KiB':>12} {'bytes/instance':>15}",
+                ]
+            )
+            for name, (count, size) in sorted(
+                self.__classes.items(), key=lambda item: -item[1][1]
+            ):
+                lines.append(
+                    f"{name:<20} {count:>10} {size / 1024:>12.1f} {size / count:>15.0f}"
+                )
+        for stage in self.__stages:
+            lines.extend(["", f"Top allocation sites of {stage.name}"])
+            lines.extend(str(statistic) for statistic in stage.top)
+        return "\n".join(lines) + "\n"
+
+    def save(self, path: str):
+        """Writes the report of the memory.
+
+        Args:
+            path (str): report file
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.report())
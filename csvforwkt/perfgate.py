@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to detect the performance regressions.
+
+The results of a benchmark are compared, stage by stage, with the results
+of a baseline for the throughput, the peak of memory and the number of
+bytes produced. A regression is a change beyond the tolerance in the bad
+direction: a relative tolerance plus an absolute tolerance, so that the
+small peaks of memory do not fail on a few allocations.
+
+The throughput is the one of the fastest run (min of N), which is the least
+sensitive to the load of the machine, and it is only gated for the largest
+catalogue and for the stages whose runs last at least MIN_DURATION_NS: the
+other ones are reported as skipped.
+"""
+import json
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+class Comparison:  # pylint: disable=too-few-public-methods
+    """Comparison of a metric of a stage with the baseline."""
+
+    REGRESSION = "regression"
+    IMPROVED = "improved"
+    OK = "ok"
+    NEW = "new"
+    SKIPPED = "skipped"
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        size: int,
+        name: str,
+        metric: str,
+        baseline: Optional[float],
+        current: Optional[float],
+        status: str,
+    ):
+        """Creates the comparison.
+
+        Args:
+            size (int): size of the catalogue
+            name (str): name of the stage or of the renderer
+            metric (str): name of the metric
+            baseline (Optional[float]): value of the baseline
+            current (Optional[float]): current value
+            status (str): ok, improved, regression, new or skipped
+        """
+        self.size: int = size
+        self.name: str = name
+        self.metric: str = metric
+        self.baseline: Optional[float] = baseline
+        self.current: Optional[float] = current
+        self.status: str = status
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change of the metric.
+
+        :getter: Returns the relative change or None
+        :type: Optional[float]
+        """
+        if self.baseline is None or self.current is None or not self.baseline:
+            return None
+        return (self.current - self.baseline) / self.baseline
+
+
+class PerfGate:
+    """Compares the results of a benchmark with a baseline."""
+
+    # metric and True when a higher value is better
+    METRICS: Tuple[Tuple[str, bool], ...] = (
+        ("throughput", True),
+        ("peak_bytes", False),
+        ("output_bytes", False),
+    )
+
+    DEFAULT_TOLERANCES: Dict[str, float] = {
+        "throughput": 0.25,
+        "peak_bytes": 0.25,
+        "output_bytes": 0.0,
+    }
+
+    # added to the relative tolerance, in the unit of the metric
+    DEFAULT_ABSOLUTE_TOLERANCES: Dict[str, float] = {
+        "throughput": 0.0,
+        "peak_bytes": 256 * 1024,
+        "output_bytes": 0.0,
+    }
+
+    # shorter runs are too sensitive to the machine to gate the throughput
+    MIN_DURATION_NS: int = 250_000_000
+
+    def __init__(
+        self,
+        baseline: Dict[str, Any],
+        tolerances: Optional[Dict[str, float]] = None,
+        absolute_tolerances: Optional[Dict[str, float]] = None,
+    ):
+        """Creates the gate.
+
+        Args:
+            baseline (Dict[str, Any]): results of the baseline
+            tolerances (Optional[Dict[str, float]], optional): relative
+            tolerance by metric. Defaults to DEFAULT_TOLERANCES.
+            absolute_tolerances (Optional[Dict[str, float]], optional):
+            absolute tolerance by metric. Defaults to
+            DEFAULT_ABSOLUTE_TOLERANCES.
+        """
+        self.__baseline: Dict[str, Any] = baseline
+        self.__tolerances: Dict[str, float] = dict(PerfGate.DEFAULT_TOLERANCES)
+        self.__tolerances.update(tolerances or dict())
+        self.__absolute_tolerances: Dict[str, float] = dict(
+            PerfGate.DEFAULT_ABSOLUTE_TOLERANCES
+        )
+        self.__absolute_tolerances.update(absolute_tolerances or dict())
+
+    @property
+    def baseline(self) -> Dict[str, Any]:
+        """Results of the baseline.
+
+        :getter: Returns the results of the baseline
+        :type: Dict[str, Any]
+        """
+        return self.__baseline
+
+    @property
+    def tolerances(self) -> Dict[str, float]:
+        """Relative tolerance by metric.
+
+        :getter: Returns the tolerances
+        :type: Dict[str, float]
+        """
+        return self.__tolerances
+
+    @property
+    def absolute_tolerances(self) -> Dict[str, float]:
+        """Absolute tolerance by metric.
+
+        :getter: Returns the absolute tolerances
+        :type: Dict[str, float]
+        """
+        return self.__absolute_tolerances
+
+    @staticmethod
+    def load(path: str) -> Dict[str, Any]:
+        """Loads the results of a benchmark.
+
+        Args:
+            path (str): JSON file
+
+        Returns:
+            Dict[str, Any]: the results
+        """
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+
+    @staticmethod
+    def _index(
+        results: Dict[str, Any],
+    ) -> Dict[Tuple[int, str], Dict[str, Any]]:
+        """Indexes the summaries by size and name.
+
+        Args:
+            results (Dict[str, Any]): results of a benchmark
+
+        Returns:
+            Dict[Tuple[int, str], Dict[str, Any]]: summaries by size and name
+        """
+        index: Dict[Tuple[int, str], Dict[str, Any]] = dict()
+        for result in results["results"]:
+            for group in ("stages", "renderers"):
+                for name, summary in result[group].items():
+                    index[(result["size"], name)] = summary
+        return index
+
+    @staticmethod
+    def _value(summary: Dict[str, Any], metric: str) -> Optional[float]:
+        """Returns a metric of a summary.
+
+        Args:
+            summary (Dict[str, Any]): summary of a stage
+            metric (str): name of the metric
+
+        Returns:
+            Optional[float]: the value, the throughput of the fastest run for
+            the throughput
+        """
+        if metric == "throughput" and summary.get("min_ns"):
+            return summary["items"] / summary["min_ns"] * 1e9
+        return summary.get(metric)
+
+    @staticmethod
+    def _is_timed(*summaries: Dict[str, Any]) -> bool:
+        """Checks if the runs are long enough to gate the throughput.
+
+        Args:
+            summaries (Dict[str, Any]): summaries of a stage
+
+        Returns:
+            bool: True when no run is shorter than MIN_DURATION_NS
+        """
+        return all(
+            summary.get("min_ns") is None
+            or summary["min_ns"] >= PerfGate.MIN_DURATION_NS
+            for summary in summaries
+        )
+
+    def _status(
+        self,
+        metric: str,
+        higher_is_better: bool,
+        baseline: Optional[float],
+        current: Optional[float],
+    ) -> str:
+        """Returns the status of a change.
+
+        Args:
+            metric (str): name of the metric
+            higher_is_better (bool): True when a higher value is better
+            baseline (Optional[float]): value of the baseline
+            current (Optional[float]): current value
+
+        Returns:
+            str: ok, improved or regression
+        """
+        if baseline is None or current is None:
+            return Comparison.OK
+        signed: float = (
+            current - baseline if higher_is_better else baseline - current
+        )
+        tolerance: float = (
+            self.__tolerances[metric] * abs(baseline)
+            + self.__absolute_tolerances[metric]
+        )
+        if signed < -tolerance:
+            return Comparison.REGRESSION
+        if signed > tolerance:
+            return Comparison.IMPROVED
+        return Comparison.OK
+
+    def compare(self, results: Dict[str, Any]) -> List[Comparison]:
+        """Compares the results of a benchmark with the baseline.
+
+        Args:
+            results (Dict[str, Any]): results of the benchmark
+
+        Returns:
+            List[Comparison]: the comparisons by size, stage and metric
+        """
+        baseline = PerfGate._index(self.__baseline)
+        largest: int = max(
+            (result["size"] for result in results["results"]), default=0
+        )
+        comparisons: List[Comparison] = list()
+        for (size, name), summary in PerfGate._index(results).items():
+            reference: Optional[Dict[str, Any]] = baseline.get((size, name))
+            for metric, higher_is_better in PerfGate.METRICS:
+                current: Optional[float] = PerfGate._value(summary, metric)
+                if current is None and (
+                    reference is None or reference.get(metric) is None
+                ):
+                    # the metric is not measured for this stage
+                    continue
+                if reference is None:
+                    comparisons.append(
+                        Comparison(
+                            size, name, metric, None, current, Comparison.NEW
+                        )
+                    )
+                    continue
+                comparison = Comparison(
+                    size,
+                    name,
+                    metric,
+                    PerfGate._value(reference, metric),
+                    current,
+                    Comparison.SKIPPED,
+                )
+                if metric != "throughput" or (
+                    size == largest and PerfGate._is_timed(reference, summary)
+                ):
+                    comparison.status = self._status(
+                        metric,
+                        higher_is_better,
+                        comparison.baseline,
+                        comparison.current,
+                    )
+                comparisons.append(comparison)
+        return comparisons
+
+    @staticmethod
+    def regressions(comparisons: List[Comparison]) -> List[Comparison]:
+        """Returns the regressions.
+
+        Args:
+            comparisons (List[Comparison]): comparisons
+
+        Returns:
+            List[Comparison]: the regressions
+        """
+        return [
+            comparison
+            for comparison in comparisons
+            if comparison.status == Comparison.REGRESSION
+        ]
+
+    @staticmethod
+    def format_table(comparisons: List[Comparison]) -> str:
+        """Formats the comparisons as a table.
+
+        Args:
+            comparisons (List[Comparison]): comparisons
+
+        Returns:
+            str: the table
+        """
+
+        def value(number: Optional[float]) -> str:
+            return "-" if number is None else f"{number:.0f}"
+
+        lines: List[str] = [
+            f"{'size':>8} {'name':<16} {'metric':<13} {'baseline':>14} {'current':>14} {'change':>8}  status"
+        ]
+        for comparison in comparisons:
+            change: Optional[float] = comparison.change
+            lines.append(
+                f"{comparison.size:>8} {comparison.name:<16} {comparison.metric:<13} "
+                f"{value(comparison.baseline):>14} {value(comparison.current):>14} "
+                f"{'-' if change is None else f'{change:+.1%}':>8}  {comparison.status}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to profile a command of the CLI.
+
+The command is run under cProfile and the profile is written either in the
+pstats format, to be read by pstats or snakeviz, or as collapsed stacks, one
+line per stack with its time in microseconds, to be read by the flame graph
+tools (flamegraph.pl, speedscope, inferno).
+
+The profiler is enabled only while the command runs: the calibration of
+its overhead and the writing of the profile are done outside of the
+profiled run and reported separately.
+"""
+import cProfile
+import pstats
+import time
+from enum import Enum
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+# file, line, function name, as in pstats
+Function = Tuple[str, int, str]
+
+
+class ProfileFormat(Enum):
+    """Format of the profile."""
+
+    PSTATS = "pstats"
+    COLLAPSED = "collapsed"
+
+
+class CliProfiler:
+    """Profiler of a command of the CLI."""
+
+    # calls used to estimate the overhead of the profiler by call
+    CALIBRATION_CALLS: int = 100_000
+
+    # the deeper stacks are truncated in the collapsed stacks
+    MAX_DEPTH: int = 100
+
+    def __init__(self, path: str, profile_format: ProfileFormat):
+        """Creates the profiler.
+
+        Args:
+            path (str): profile file
+            profile_format (ProfileFormat): format of the profile
+        """
+        self.__path: str = path
+        self.__format: ProfileFormat = profile_format
+        self.__profile: cProfile.Profile = cProfile.Profile()
+        self.__elapsed: float = 0.0
+        self.__overhead: float = 0.0
+        self.__write_time: float = 0.0
+
+    @property
+    def path(self) -> str:
+        """Profile file.
+
+        :getter: Returns the profile file
+        :type: str
+        """
+        return self.__path
+
+    @property
+    def elapsed(self) -> float:
+        """Wall time of the profiled run, in seconds.
+
+        :getter: Returns the wall time
+        :type: float
+        """
+        return self.__elapsed
+
+    @property
+    def overhead(self) -> float:
+        """Estimated time spent by the profiler in the profiled run, in
+        seconds.
+
+        :getter: Returns the overhead
+        :type: float
+        """
+        return self.__overhead
+
+    @property
+    def write_time(self) -> float:
+        """Time to write the profile, in seconds.
+
+        :getter: Returns the time to write the profile
+        :type: float
+        """
+        return self.__write_time
+
+    def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Runs a function under the profiler and writes the profile.
+
+        Args:
+            func (Callable[..., Any]): function to profile
+
+        Returns:
+            Any: the result of the function
+        """
+        start: float = time.perf_counter()
+        try:
+            return self.__profile.runcall(func, *args, **kwargs)
+        finally:
+            self.__elapsed = time.perf_counter() - start
+            stats = pstats.Stats(self.__profile)
+            self.__overhead = CliProfiler._overhead_by_call() * int(
+                stats.total_calls  # type: ignore[attr-defined]
+            )
+            start = time.perf_counter()
+            self.save(stats)
+            self.__write_time = time.perf_counter() - start
+
+    @staticmethod
+    def _overhead_by_call() -> float:
+        """Estimates the time added by the profiler to a function call.
+
+        Returns:
+            float: the overhead by call, in seconds
+        """
+
+        def noop():
+            pass
+
+        def calls():
+            for _ in range(CliProfiler.CALIBRATION_CALLS):
+                noop()
+
+        start: float = time.perf_counter()
+        calls()
+        reference: float = time.perf_counter() - start
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        profile.runcall(calls)
+        profiled: float = time.perf_counter() - start
+        return max(profiled - reference, 0.0) / CliProfiler.CALIBRATION_CALLS
+
+    def save(self, stats: pstats.Stats):
+        """Writes the profile.
+
+        Args:
+            stats (pstats.Stats): statistics of the profile
+        """
+        if self.__format is ProfileFormat.PSTATS:
+            stats.dump_stats(self.__path)
+        else:
+            with open(self.__path, "w", encoding="utf-8") as file:
+                for stack, microseconds in CliProfiler.collapsed_stacks(stats):
+                    file.write(f"{stack} {microseconds}\n")
+
+    @staticmethod
+    def _label(function: Function) -> str:
+        """Returns the name of a function in a stack.
+
+        Args:
+            function (Function): file, line, function name
+
+        Returns:
+            str: the name, without the separator of the frames
+        """
+        file, line, name = function
+        label: str = f"{file}:{line}({name})"
+        if (file, line) == ("~", 0):
+            # built-in function
+            label = (
+                f"{{{name[1:-1]}}}"
+                if name.startswith("<") and name.endswith(">")
+                else name
+            )
+        return label.replace(";", ",")
+
+    @staticmethod
+    def collapsed_stacks(stats: pstats.Stats) -> Iterator[Tuple[str, int]]:
+        """Rebuilds the stacks from the caller graph of the profile.
+
+        cProfile does not record the stacks: the own time of a function is
+        split between its callers in proportion to the time spent in the
+        function by each caller. The recursive calls are cut.
+
+        Args:
+            stats (pstats.Stats): statistics of the profile
+
+        Yields:
+            Iterator[Tuple[str, int]]: the stack, frames separated by a
+            semicolon, and its own time in microseconds
+        """
+        # function: (primitive calls, calls, own time, cumulative time, callers)
+        raw: Dict[Function, Tuple[Any, ...]] = stats.stats  # type: ignore[attr-defined]
+        callees: Dict[Function, List[Tuple[Function, float]]] = {
+            function: list() for function in raw
+        }
+        for function, (_, _, _, _, callers) in raw.items():
+            for caller, edge in callers.items():
+                # edge: calls, primitive calls, own time, cumulative time
+                callees.setdefault(caller, list()).append((function, edge[3]))
+        roots: List[Function] = [
+            function
+            for function, (_, _, _, _, callers) in raw.items()
+            if len(callers) == 0
+        ]
+        # function, frames of the stack, share of the function time
+        pending: List[Tuple[Function, Tuple[str, ...], float]] = [
+            (root, (CliProfiler._label(root),), 1.0)
+            for root in reversed(roots)
+        ]
+        path: List[Function] = list()
+        while len(pending) > 0:
+            function, frames, share = pending.pop()
+            path = path[: len(frames) - 1] + [function]
+            _, _, own_time, cumulative_time, _ = raw[function]
+            microseconds: int = round(own_time * share * 1e6)
+            if microseconds > 0:
+                yield ";".join(frames), microseconds
+            if len(frames) >= CliProfiler.MAX_DEPTH:
+                continue
+            for callee, edge_time in reversed(callees.get(function, [])):
+                callee_time: float = raw[callee][3]
+                if callee in path or callee_time <= 0 or cumulative_time <= 0:
+                    continue
+                child_share: float = share * edge_time / callee_time
+                if child_share * callee_time * 1e6 < 1:
+                    continue
+                pending.append(
+                    (
+                        callee,
+                        frames + (CliProfiler._label(callee),),
+                        child_share,
+                    )
+                )
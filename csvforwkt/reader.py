@@ -0,0 +1,742 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to read a WKT catalogue written by csvforwkt.
+
+The catalogue is read by chunks, from a file or from a member of a zip file,
+and split in blocks separated by blank lines. Each block is tokenized in a
+tree of keywords, then the objects of the library are rebuilt from the tree:
+`BodyCrs` with its `Datum`, `Anchor` and `Sphere`, `Ellipsoid` or `Triaxial`
+body, and `ProjectionBody` with its `Conversion`. The WKT of a rebuilt CRS is
+identical to the text that was read.
+
+The reader only supports the subset of WKT written by this project. The CRS
+of a body share the same datum and the projections of the bodies share the
+same conversions: they are rebuilt once and reused. The datums and the body
+CRS are only kept for the current body, so that the memory does not grow
+with the catalogue.
+"""
+import io
+import logging
+import re
+import zipfile
+from contextlib import closing
+from functools import partial
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import Generator
+from typing import IO
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from .body import Ellipsoid
+from .body import IBody
+from .body import ReferenceShape
+from .body import ReportContext
+from .body import Sphere
+from .body import Triaxial
+from .catalogue import ProjectionDefinition
+from .catalogue import ProjectionParameter
+from .crs import BodyCrs
+from .crs import CrsType
+from .crs import ICrs
+from .crs import ProjectionBody
+from .datum import Anchor
+from .datum import Datum
+from .validator import blocks
+
+logger = logging.getLogger(__name__)
+
+# after the spaces and the commas: keyword followed by [, closing bracket,
+# quoted string, number, identifier, any other character. The last character
+# is neither a space nor a comma, so that the spaces and the commas are never
+# given back to it (no possessive quantifiers before Python 3.11).
+TOKEN = re.compile(
+    r'[\s,]*(?:([A-Za-z]\w*)\s*\[|(\])|"((?:[^"]|"")*)"'
+    r"|([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)"
+    r"|([A-Za-z]\w*)|([^\s,]))"
+)
+
+# text until the next bracket, outside of the quoted strings
+BRACKET = re.compile(r'[^\[\]"]*(?:"[^"]*"[^\[\]"]*)*([\[\]])')
+
+# a number without decimal part and exponent is an integer
+INTEGER = re.compile(r"[-+]?\d+")
+
+# IAU identifier and its code
+IAU_CODE = re.compile(r'ID\["IAU",\s*(\d+),')
+
+
+class WktNode:  # pylint: disable=too-few-public-methods
+    """Keyword of a WKT with its values and its children."""
+
+    __slots__ = ("keyword", "values", "children", "start", "end")
+
+    def __init__(self, keyword: str, start: int):
+        """Creates a node.
+
+        Args:
+            keyword (str): keyword
+            start (int): position of the keyword in the text
+        """
+        self.keyword: str = keyword
+        self.values: List[Union[str, int, float]] = list()
+        self.children: List["WktNode"] = list()
+        self.start: int = start
+        self.end: int = start
+
+    def child(self, *keywords: str) -> "WktNode":
+        """Returns the first child having one of the keywords.
+
+        Args:
+            keywords (str): the accepted keywords
+
+        Raises:
+            ValueError: no child with these keywords
+
+        Returns:
+            WktNode: the child
+        """
+        for node in self.children:
+            if node.keyword in keywords:
+                return node
+        raise ValueError(f"{self.keyword} without {' or '.join(keywords)}")
+
+    def find(self, keyword: str) -> Optional["WktNode"]:
+        """Returns the first child having the keyword.
+
+        Args:
+            keyword (str): keyword
+
+        Returns:
+            Optional[WktNode]: the child or None
+        """
+        for node in self.children:
+            if node.keyword == keyword:
+                return node
+        return None
+
+
+def _skip(text: str, position: int) -> int:
+    """Returns the end of a keyword without tokenizing its content.
+
+    Args:
+        text (str): the WKT
+        position (int): position after the opening bracket of the keyword
+
+    Raises:
+        ValueError: the keyword is not closed
+
+    Returns:
+        int: the position after the closing bracket of the keyword
+    """
+    depth: int = 1
+    while depth > 0:
+        match: Optional[re.Match] = BRACKET.match(text, position)
+        if match is None:
+            raise ValueError(f"keyword not closed at {position}")
+        depth += 1 if match.group(1) == "[" else -1
+        position = match.end()
+    return position
+
+
+def parse(text: str, skipped: FrozenSet[str] = frozenset()) -> WktNode:
+    """Parses the WKT of a CRS.
+
+    The quoted strings are returned without their quotes, the numbers as int
+    or float and the identifiers (north, ellipsoidal, ...) as strings. The
+    commas are not checked, the validator checks the syntax.
+
+    Args:
+        text (str): the WKT of a CRS
+        skipped (FrozenSet[str], optional): keywords whose content is not
+        tokenized, only their position is set. Defaults to none.
+
+    Raises:
+        ValueError: the text is not a WKT
+
+    Returns:
+        WktNode: the root keyword
+    """
+    root: Optional[WktNode] = None
+    stack: List[WktNode] = list()
+    position: int = 0
+    match: Optional[re.Match] = TOKEN.match(text)
+    while match is not None:
+        position = match.end()
+        group: int = match.lastindex  # type: ignore[assignment]
+        if group == 1:
+            node = WktNode(match.group(1), match.start(1))
+            if stack:
+                stack[-1].children.append(node)
+            elif root is None:
+                root = node
+            else:
+                raise ValueError(f"second root {node.keyword} at {node.start}")
+            if node.keyword in skipped:
+                position = _skip(text, position)
+                node.end = position
+            else:
+                stack.append(node)
+        elif group == 2:
+            if not stack:
+                raise ValueError(f"unexpected ] at {match.start(2)}")
+            stack.pop().end = position
+        elif not stack or group == 6:
+            raise ValueError(
+                f"unexpected {match.group(group)!r} at {match.start(group)}"
+            )
+        elif group == 3:
+            stack[-1].values.append(match.group(3).replace('""', '"'))
+        elif group == 4:
+            token: str = match.group(4)
+            stack[-1].values.append(
+                int(token) if INTEGER.fullmatch(token) else float(token)
+            )
+        else:
+            stack[-1].values.append(match.group(5))
+        match = TOKEN.match(text, position)
+    if root is None:
+        raise ValueError("no keyword")
+    if stack:
+        raise ValueError(f"{stack[0].keyword} not closed")
+    return root
+
+
+def iau_code(text: str) -> Optional[int]:
+    """Returns the IAU code of a CRS without parsing its WKT.
+
+    Args:
+        text (str): WKT of the CRS
+
+    Returns:
+        Optional[int]: the code of the last IAU identifier, None when there
+        is no IAU identifier
+    """
+    # the identifier of the CRS is the last one
+    match: Optional[re.Match] = IAU_CODE.match(
+        text, max(text.rfind('ID["IAU"'), 0)
+    )
+    return None if match is None else int(match.group(1))
+
+
+class WktReader:
+    """Reads the CRS of a WKT catalogue.
+
+    The rebuilt CRS are created with the version and the DOI of the
+    catalogue, read in their identifiers and their remarks, so that they
+    return the WKT that was read.
+    """
+
+    CHUNK_SIZE: int = 1 << 20
+
+    # keywords shared by several CRS, tokenized once
+    SHARED: FrozenSet[str] = frozenset(("DATUM", "CONVERSION"))
+
+    def __init__(self, path: str, member: Optional[str] = None):
+        """Creates a reader.
+
+        Args:
+            path (str): WKT file or zip file
+            member (Optional[str], optional): member of the zip file.
+            Defaults to the first .wkt member.
+        """
+        self.__path: str = path
+        self.__member: Optional[str] = member
+        # body CRS by code and version and datums of the current body
+        self.__naif_id: Optional[int] = None
+        self.__bodies: Dict[Tuple[int, str], BodyCrs] = dict()
+        self.__datums: Dict[Tuple[ReportContext, str], Datum] = dict()
+        self.__reports: Dict[Tuple[str, str], ReportContext] = dict()
+        # DOI of the last remark, the projected CRS have no remark
+        self.__doi: str = ReportContext.current().doi
+        self.__definitions: Dict[Tuple[int, str], ProjectionDefinition] = (
+            dict()
+        )
+
+    @property
+    def path(self) -> str:
+        """The WKT file or the zip file.
+
+        :getter: Returns the path
+        :type: str
+        """
+        return self.__path
+
+    @property
+    def member(self) -> Optional[str]:
+        """The member of the zip file.
+
+        :getter: Returns the member, None for a WKT file
+        :type: Optional[str]
+        """
+        return self.__member
+
+    def open(self) -> IO[str]:
+        """Opens the WKT, in the zip file when the path is a zip file.
+
+        The caller closes the file, the zip file is closed with it.
+
+        Raises:
+            ValueError: no WKT in the zip file
+
+        Returns:
+            IO[str]: the text file
+        """
+        if not zipfile.is_zipfile(self.path):
+            return open(self.path, encoding="utf-8")
+        with zipfile.ZipFile(self.path) as archive:
+            if self.__member is None:
+                members: List[str] = [
+                    name
+                    for name in archive.namelist()
+                    if name.lower().endswith(".wkt")
+                ]
+                if len(members) == 0:
+                    raise ValueError(f"No WKT file in {self.path}")
+                self.__member = members[0]
+            # the member keeps the zip file open until it is closed
+            return io.TextIOWrapper(
+                archive.open(self.__member), encoding="utf-8"
+            )
+
+    def blocks(self) -> Generator[Tuple[int, str], None, None]:
+        """Iterates on the WKT of the CRS, without rebuilding them.
+
+        The file is closed at the end of the iteration or when the iterator
+        is closed: a consumer that stops early closes it with
+        `contextlib.closing`.
+
+        Yields:
+            Generator[Tuple[int, str], None, None]: the number of the first
+            line of the CRS and its WKT
+        """
+        with self.open() as file:
+            yield from blocks(iter(partial(file.read, self.CHUNK_SIZE), ""))
+
+    def coded_blocks(self) -> Generator[Tuple[int, str], None, None]:
+        """Iterates on the WKT of the CRS with their IAU code, without
+        rebuilding them.
+
+        The file is closed as in `blocks`.
+
+        Raises:
+            ValueError: CRS without IAU code
+
+        Yields:
+            Generator[Tuple[int, str], None, None]: the code and the WKT of
+            the CRS
+        """
+        with closing(self.blocks()) as texts:
+            for line, text in texts:
+                code: Optional[int] = iau_code(text)
+                if code is None:
+                    raise ValueError(f"{self.path}, line {line}: no IAU code")
+                yield code, text
+
+    def __iter__(self) -> Iterator[ICrs]:
+        """Iterates on the CRS of the catalogue, in the order of the file.
+
+        Yields:
+            Iterator[ICrs]: the CRS
+        """
+        with closing(self.blocks()) as texts:
+            for line, text in texts:
+                try:
+                    yield self.crs(text)
+                except ValueError as error:
+                    raise ValueError(
+                        f"{self.path}, line {line}: {error}"
+                    ) from error
+
+    def bodies(self) -> Iterator[Tuple[int, Dict[int, ICrs]]]:
+        """Iterates on the CRS grouped by body.
+
+        The structure is the one of `CsvforwktLib.process`, so the CRS can be
+        written again by the writers.
+
+        Yields:
+            Iterator[Tuple[int, Dict[int, ICrs]]]: the Naif ID of the body and
+            its CRS by IAU code
+        """
+        naif_id: Optional[int] = None
+        body: Dict[int, ICrs] = dict()
+        for crs in self:
+            if crs.iau_code // 100 != naif_id:
+                if naif_id is not None:
+                    yield naif_id, body
+                naif_id = crs.iau_code // 100
+                body = dict()
+            body[crs.iau_code] = crs
+        if naif_id is not None:
+            yield naif_id, body
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Iterates on the compact records of the CRS.
+
+        Yields:
+            Iterator[Dict[str, Any]]: the record of each CRS, with the keys of
+            CrsRecord.FIELDS
+        """
+        # pylint: disable=import-outside-toplevel
+        from .writer import CrsRecord
+
+        for crs in self:
+            yield CrsRecord.create(crs.iau_code // 100, crs)
+
+    def crs(self, text: str) -> ICrs:
+        """Rebuilds a CRS from its WKT.
+
+        Args:
+            text (str): the WKT of a CRS
+
+        Raises:
+            ValueError: the WKT is not a CRS written by csvforwkt
+
+        Returns:
+            ICrs: the CRS
+        """
+        root: WktNode = parse(text, WktReader.SHARED)
+        code, version = self._identifier(root)
+        if code // 100 != self.__naif_id:
+            # the CRS of a body are consecutive
+            self.__naif_id = code // 100
+            self.__bodies.clear()
+            self.__datums.clear()
+        result: ICrs
+        if root.keyword in ("GEOGCRS", "GEODCRS"):
+            result = self._body_crs(root, text, code, version)
+        elif root.keyword == "PROJCRS":
+            result = self._projection(
+                root, text, code, self._report(version, self.__doi)
+            )
+        else:
+            raise ValueError(f"Unsupported CRS {root.keyword}")
+        return result
+
+    def _report(self, version: str, doi: str) -> ReportContext:
+        """Returns the report of a CRS, once by version and DOI.
+
+        Args:
+            version (str): version of the report
+            doi (str): DOI of the report
+
+        Returns:
+            ReportContext: the report
+        """
+        report: Optional[ReportContext] = self.__reports.get((version, doi))
+        if report is None:
+            logger.info(f"Reading WKT-CRS for {version} - {doi}")
+            report = ReportContext(version, doi)
+            self.__reports[version, doi] = report
+        return report
+
+    @staticmethod
+    def _identifier(node: WktNode) -> Tuple[int, str]:
+        """Returns the IAU code and the version of a CRS.
+
+        Args:
+            node (WktNode): the CRS
+
+        Raises:
+            ValueError: no IAU identifier
+
+        Returns:
+            Tuple[int, str]: the code and the version
+        """
+        identifier: WktNode = node.child("ID")
+        if (
+            len(identifier.values) != 3
+            or identifier.values[0] != "IAU"
+            or not isinstance(identifier.values[1], int)
+        ):
+            raise ValueError(f"{node.keyword} without IAU identifier")
+        return identifier.values[1], str(identifier.values[2])
+
+    @staticmethod
+    def _name(label: Any, version: str, suffix: str = "") -> str:
+        """Returns the name of a body from a label.
+
+        Args:
+            label (Any): label, the name followed by the version and the
+            suffix
+            version (str): version of the report
+            suffix (str, optional): suffix of the label. Defaults to "".
+
+        Raises:
+            ValueError: the label does not end with the version and the
+            suffix
+
+        Returns:
+            str: the name
+        """
+        end: str = f" ({version}){suffix}"
+        if not isinstance(label, str) or not label.endswith(end):
+            raise ValueError(f"{label!r} does not end with {end!r}")
+        return label[: -len(end)]
+
+    def _body(self, node: WktNode, report: ReportContext) -> IBody:
+        """Rebuilds a body from an ELLIPSOID or TRIAXIAL keyword.
+
+        Args:
+            node (WktNode): the body
+            report (ReportContext): IAU report
+
+        Raises:
+            ValueError: invalid body
+
+        Returns:
+            IBody: the body
+        """
+        values: List[Any] = node.values
+        result: IBody
+        if node.keyword == "TRIAXIAL" and len(values) == 4:
+            result = Triaxial(
+                self._name(values[0], report.version),
+                values[1],
+                values[2],
+                values[3],
+                report,
+            )
+        elif node.keyword == "ELLIPSOID" and len(values) == 3:
+            if isinstance(values[0], str) and values[0].endswith(" - Sphere"):
+                result = Sphere(
+                    self._name(values[0], report.version, " - Sphere"),
+                    values[1],
+                    report,
+                )
+            else:
+                result = Ellipsoid(
+                    self._name(values[0], report.version),
+                    values[1],
+                    values[2],
+                    report,
+                )
+        else:
+            raise ValueError(f"Invalid {node.keyword} {values}")
+        return result
+
+    def _datum(self, node: WktNode, text: str, report: ReportContext) -> Datum:
+        """Rebuilds a datum, once by body and by report.
+
+        Args:
+            node (WktNode): the DATUM keyword, not tokenized
+            text (str): the WKT containing the datum
+            report (ReportContext): IAU report
+
+        Returns:
+            Datum: the datum
+        """
+        wkt: str = text[node.start : node.end]
+        datum: Optional[Datum] = self.__datums.get((report, wkt))
+        if datum is None:
+            node = parse(wkt)
+            body: IBody = self._body(
+                node.child("ELLIPSOID", "TRIAXIAL"), report
+            )
+            anchor_node: Optional[WktNode] = node.find("ANCHOR")
+            anchor: Anchor = (
+                Anchor()
+                if anchor_node is None
+                else Anchor(str(anchor_node.values[0]))
+            )
+            name: str = self._name(
+                node.values[0],
+                report.version,
+                " - Sphere" if body.shape == ReferenceShape.SPHERE else "",
+            )
+            datum = Datum.create(name, body, anchor, report)
+            self.__datums[report, wkt] = datum
+        return datum
+
+    @staticmethod
+    def _crs_type(label: Any) -> CrsType:
+        """Returns the type of CRS from the label of a CRS.
+
+        Args:
+            label (Any): label of the CRS
+
+        Returns:
+            CrsType: the type of CRS
+        """
+        return (
+            CrsType.OGRAPHIC
+            if str(label).endswith(CrsType.OGRAPHIC.value)
+            else CrsType.OCENTRIC
+        )
+
+    @staticmethod
+    def _create_body_crs(
+        datum: Datum, code: int, crs_type: CrsType, direction: Any
+    ) -> BodyCrs:
+        """Creates a body CRS and checks its code and its direction.
+
+        Args:
+            datum (Datum): datum
+            code (int): IAU code of the CRS
+            crs_type (CrsType): type of CRS
+            direction (Any): direction of the longitude
+
+        Raises:
+            ValueError: the code or the direction is not the one of the CRS
+
+        Returns:
+            BodyCrs: the body CRS
+        """
+        crs = BodyCrs(
+            datum,
+            code // 100,
+            "Direct" if direction == "west" else "Retrograde",
+            crs_type,
+            datum.report,
+        )
+        if crs.iau_code != code:
+            raise ValueError(
+                f"code {code} for a {crs_type.value} {datum.body.shape.value}, expected {crs.iau_code}"
+            )
+        if crs.direction != direction:
+            raise ValueError(
+                f"longitude to the {direction} for {code}, expected {crs.direction}"
+            )
+        return crs
+
+    def _body_crs(
+        self, node: WktNode, text: str, code: int, version: str
+    ) -> BodyCrs:
+        """Rebuilds a body CRS.
+
+        Args:
+            node (WktNode): the GEOGCRS or GEODCRS keyword
+            text (str): the WKT of the CRS
+            code (int): IAU code
+            version (str): version of the report
+
+        Raises:
+            ValueError: invalid CRS
+
+        Returns:
+            BodyCrs: the body CRS
+        """
+        remark: str = str(node.child("REMARK").values[0])
+        position: int = remark.find(ReportContext.SOURCE_PREFIX)
+        if position == -1:
+            raise ValueError(f"no source in the remark of {code}")
+        self.__doi = remark[position + len(ReportContext.SOURCE_PREFIX) :]
+        datum: Datum = self._datum(
+            node.child("DATUM"), text, self._report(version, self.__doi)
+        )
+        axes: List[WktNode] = [
+            axis for axis in node.children if axis.keyword == "AXIS"
+        ]
+        if len(axes) != 2:
+            raise ValueError(f"{len(axes)} axes for {code}")
+        # the body of a datum is shared by the CRS of the body
+        if position > 0:
+            datum.body.warning = remark[:position]
+        crs: BodyCrs = self._create_body_crs(
+            datum, code, self._crs_type(node.values[0]), axes[1].values[1]
+        )
+        self.__bodies[code, version] = crs
+        return crs
+
+    def _definition(
+        self, node: WktNode, text: str, offset: int
+    ) -> ProjectionDefinition:
+        """Rebuilds a projection, once by offset.
+
+        Args:
+            node (WktNode): the CONVERSION keyword, not tokenized
+            text (str): the WKT containing the conversion
+            offset (int): offset of the projection
+
+        Returns:
+            ProjectionDefinition: the projection
+        """
+        conversion: str = text[node.start : node.end]
+        definition: Optional[ProjectionDefinition] = self.__definitions.get(
+            (offset, conversion)
+        )
+        if definition is None:
+            node = parse(conversion)
+            method: WktNode = node.child("METHOD")
+            method_id: WktNode = method.child("ID")
+            parameters: List[ProjectionParameter] = list()
+            for parameter in node.children:
+                if parameter.keyword != "PARAMETER":
+                    continue
+                unit: WktNode = parameter.children[0]
+                parameter_id: WktNode = parameter.child("ID")
+                parameters.append(
+                    ProjectionParameter(
+                        str(parameter.values[0]),
+                        parameter.values[1],  # type: ignore[arg-type]
+                        conversion[unit.start : unit.end],
+                        str(parameter_id.values[0]),
+                        self._code(parameter_id.values[1]),
+                    )
+                )
+            method_name: str = str(method.values[0])
+            definition = ProjectionDefinition(
+                offset,
+                str(node.values[0]),
+                method_name,
+                str(method_id.values[0]),
+                self._code(method_id.values[1]),
+                tuple(parameters),
+                method_name.endswith("(Spherical)"),
+            )
+            self.__definitions[offset, conversion] = definition
+        return definition
+
+    @staticmethod
+    def _code(value: Any) -> Union[int, str]:
+        """Returns the code of an authority as written in the templates.
+
+        Args:
+            value (Any): the code read in the WKT
+
+        Returns:
+            Union[int, str]: the code, quoted when it is a string
+        """
+        return f'"{value}"' if isinstance(value, str) else value
+
+    def _projection(
+        self, node: WktNode, text: str, code: int, report: ReportContext
+    ) -> ProjectionBody:
+        """Rebuilds a projected CRS.
+
+        The base CRS is the body CRS read before with the same code, it is
+        rebuilt from the base of the projected CRS otherwise.
+
+        Args:
+            node (WktNode): the PROJCRS keyword
+            text (str): the WKT of the CRS
+            code (int): IAU code
+            report (ReportContext): IAU report
+
+        Raises:
+            ValueError: invalid CRS
+
+        Returns:
+            ProjectionBody: the projected CRS
+        """
+        base: WktNode = node.child("BASEGEOGCRS", "BASEGEODCRS")
+        base_code, _ = self._identifier(base)
+        direction: Any = node.child("AXIS").values[1]
+        body_crs: Optional[BodyCrs] = self.__bodies.get(
+            (base_code, report.version)
+        )
+        if body_crs is None:
+            body_crs = self._create_body_crs(
+                self._datum(base.child("DATUM"), text, report),
+                base_code,
+                self._crs_type(base.values[0]),
+                direction,
+            )
+            self.__bodies[base_code, report.version] = body_crs
+        definition: ProjectionDefinition = self._definition(
+            node.child("CONVERSION"), text, code - base_code
+        )
+        return ProjectionBody.create(body_crs, definition)
@@ -0,0 +1,401 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to select a subset of the CRS to generate.
+
+The selection is applied as early as possible: the bodies are selected in
+the IAU report before any CRS is created and the projections are selected
+before the projected CRS are created.
+
+A run can be split in shards, one by node: the shard i of N only generates
+the bodies whose Naif ID modulo N is i - 1. A body and all its CRS belong to
+a single shard, so the outputs of the shards can be merged by Naif ID.
+"""
+from typing import Any
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+import numpy as np  # pylint: disable=import-error
+import pandas as pd  # pylint: disable=import-error
+
+from .body import ReferenceShape
+from .catalogue import ProjectionCatalogue
+from .catalogue import ProjectionDefinition
+from .crs import BodyCrs
+from .crs import CrsType
+
+
+class Selection:
+    """Selection of the bodies, CRS and projections to generate.
+
+    A criterion set to None selects everything.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        bodies: Optional[Iterable[Any]] = None,
+        naif_range: Optional[Tuple[int, int]] = None,
+        crs_types: Optional[Iterable[CrsType]] = None,
+        shapes: Optional[Iterable[ReferenceShape]] = None,
+        projections: Optional[Iterable[Any]] = None,
+        codes: Optional[Iterable[int]] = None,
+        shard: Optional[Tuple[int, int]] = None,
+    ):
+        """Creates a selection.
+
+        Args:
+            bodies (Optional[Iterable[Any]], optional): names or Naif IDs of
+            the bodies. Defaults to None.
+            naif_range (Optional[Tuple[int, int]], optional): first and last
+            Naif ID (included). Defaults to None.
+            crs_types (Optional[Iterable[CrsType]], optional): types of the
+            body CRS. Defaults to None.
+            shapes (Optional[Iterable[ReferenceShape]], optional): shapes of
+            the body CRS. Defaults to None.
+            projections (Optional[Iterable[Any]], optional): offsets, names
+            or methods of the projections. An empty list selects no
+            projected CRS. Defaults to None.
+            codes (Optional[Iterable[int]], optional): IAU codes. Defaults
+            to None.
+            shard (Optional[Tuple[int, int]], optional): index of the shard,
+            from 1, and number of shards. Defaults to None.
+
+        Raises:
+            ValueError: invalid shard
+        """
+        if shard is not None and not 1 <= shard[0] <= shard[1]:
+            raise ValueError(
+                f"Invalid shard {shard[0]}/{shard[1]} : 1 <= i <= N is expected"
+            )
+        self.__names: Optional[Set[str]] = None
+        self.__naif_ids: Optional[Set[int]] = None
+        if bodies is not None:
+            self.__names = set()
+            self.__naif_ids = set()
+            for body in bodies:
+                if isinstance(body, int) or str(body).strip().isdigit():
+                    self.__naif_ids.add(int(body))
+                else:
+                    self.__names.add(str(body).strip().upper())
+        self.__naif_range: Optional[Tuple[int, int]] = naif_range
+        self.__crs_types: Optional[Set[CrsType]] = (
+            None if crs_types is None else set(crs_types)
+        )
+        self.__shapes: Optional[Set[ReferenceShape]] = (
+            None if shapes is None else set(shapes)
+        )
+        self.__projections: Optional[Set[Any]] = (
+            None if projections is None else set(projections)
+        )
+        self.__codes: Optional[Set[int]] = (
+            None if codes is None else {int(code) for code in codes}
+        )
+        self.__shard: Optional[Tuple[int, int]] = shard
+
+    @property
+    def shard(self) -> Optional[Tuple[int, int]]:
+        """The shard of the run.
+
+        :getter: Returns the index of the shard, from 1, and the number of
+            shards, None when the run is not split
+        :type: Optional[Tuple[int, int]]
+        """
+        return self.__shard
+
+    @property
+    def is_all(self) -> bool:
+        """True when everything is selected.
+
+        :getter: Returns True when no criterion is set
+        :type: bool
+        """
+        return (
+            self.__names is None
+            and self.__naif_range is None
+            and self.__crs_types is None
+            and self.__shapes is None
+            and self.__projections is None
+            and self.__codes is None
+            and self.__shard is None
+        )
+
+    def filter_bodies(self, df_bodies: pd.DataFrame) -> pd.DataFrame:
+        """Select the bodies of the IAU report.
+
+        Args:
+            df_bodies (pd.DataFrame): bodies of the IAU report
+
+        Returns:
+            pd.DataFrame: the selected bodies
+        """
+        mask = pd.Series(True, index=df_bodies.index)
+        if self.__names is not None and self.__naif_ids is not None:
+            mask &= df_bodies["Naif_id"].isin(self.__naif_ids) | df_bodies[
+                "Body"
+            ].astype(str).str.upper().isin(self.__names)
+        if self.__naif_range is not None:
+            mask &= df_bodies["Naif_id"].between(*self.__naif_range)
+        if self.__codes is not None:
+            mask &= df_bodies["Naif_id"].isin(
+                {code // 100 for code in self.__codes}
+            )
+        if self.__shard is not None:
+            index, count = self.__shard
+            mask &= df_bodies["Naif_id"] % count == index - 1
+        return df_bodies[mask]
+
+    def accept_crs(self, crs: BodyCrs) -> bool:
+        """Checks if a body CRS is selected.
+
+        Args:
+            crs (BodyCrs): body CRS
+
+        Returns:
+            bool: True when the body CRS is selected
+        """
+        return (
+            (self.__crs_types is None or crs.crs_type in self.__crs_types)
+            and (
+                self.__shapes is None or crs.datum.body.shape in self.__shapes
+            )
+            and (self.__codes is None or crs.iau_code in self.__codes)
+        )
+
+    def accept_projection(
+        self, crs: BodyCrs, definition: ProjectionDefinition
+    ) -> bool:
+        """Checks if the projection of a body CRS is selected.
+
+        The type and the shape of a projected CRS are the ones of its body CRS.
+
+        Args:
+            crs (BodyCrs): body CRS
+            definition (ProjectionDefinition): projection
+
+        Returns:
+            bool: True when the projected CRS is selected
+        """
+        return (
+            (self.__crs_types is None or crs.crs_type in self.__crs_types)
+            and (
+                self.__shapes is None or crs.datum.body.shape in self.__shapes
+            )
+            and (
+                self.__projections is None
+                or definition.offset in self.__projections
+                or definition.name in self.__projections
+                or definition.method in self.__projections
+            )
+            and (
+                self.__codes is None
+                or crs.iau_code + definition.offset in self.__codes
+            )
+        )
+
+    def projection_mask(
+        self, crs: List[BodyCrs], definitions: List[ProjectionDefinition]
+    ) -> np.ndarray:
+        """Checks which pairs of body CRS and projection are selected.
+
+        Same rules as `accept_projection` for the whole grid.
+
+        Args:
+            crs (List[BodyCrs]): body CRS (rows of the grid)
+            definitions (List[ProjectionDefinition]): projections (columns
+            of the grid)
+
+        Returns:
+            np.ndarray: boolean grid, True when the projected CRS is selected
+        """
+        mask = np.ones((len(crs), len(definitions)), dtype=bool)
+        if self.__crs_types is not None or self.__shapes is not None:
+            mask &= np.array(
+                [
+                    (
+                        self.__crs_types is None
+                        or body_crs.crs_type in self.__crs_types
+                    )
+                    and (
+                        self.__shapes is None
+                        or body_crs.datum.body.shape in self.__shapes
+                    )
+                    for body_crs in crs
+                ],
+                dtype=bool,
+            ).reshape(-1, 1)
+        if self.__projections is not None:
+            projections: Set[Any] = self.__projections
+            mask &= np.array(
+                [
+                    definition.offset in projections
+                    or definition.name in projections
+                    or definition.method in projections
+                    for definition in definitions
+                ],
+                dtype=bool,
+            ).reshape(1, -1)
+        if self.__codes is not None:
+            base_codes = np.array(
+                [body_crs.iau_code for body_crs in crs], dtype=np.int64
+            )
+            offsets = np.array(
+                [definition.offset for definition in definitions],
+                dtype=np.int64,
+            )
+            mask &= np.isin(
+                base_codes.reshape(-1, 1) + offsets.reshape(1, -1),
+                list(self.__codes),
+            )
+        return mask
+
+    def check_projections(self, catalogue: ProjectionCatalogue):
+        """Checks that the selected projections exist in the catalogue.
+
+        Args:
+            catalogue (ProjectionCatalogue): catalogue of projections
+
+        Raises:
+            ValueError: unknown projection
+        """
+        if self.__projections is None:
+            return
+        known: Set[Any] = set()
+        for definition in catalogue:
+            known.update(
+                [definition.offset, definition.name, definition.method]
+            )
+        unknown = self.__projections - known
+        if len(unknown) > 0:
+            raise ValueError(
+                f"Unknown projections: {sorted(map(str, unknown))}"
+            )
+
+    @staticmethod
+    def _split(value: Optional[str]) -> Optional[Tuple[str, ...]]:
+        """Splits a comma separated list.
+
+        Args:
+            value (Optional[str]): comma separated list
+
+        Returns:
+            Optional[Tuple[str, ...]]: the items
+        """
+        if value is None:
+            return None
+        return tuple(item.strip() for item in value.split(",") if item.strip())
+
+    @staticmethod
+    def from_strings(  # pylint: disable=too-many-arguments
+        bodies: Optional[str] = None,
+        naif_range: Optional[str] = None,
+        crs_types: Optional[str] = None,
+        shapes: Optional[str] = None,
+        projections: Optional[str] = None,
+        codes: Optional[str] = None,
+        shard: Optional[str] = None,
+    ) -> "Selection":
+        """Create a selection from the command line values.
+
+        Args:
+            bodies (Optional[str], optional): comma separated names or Naif
+            IDs. Defaults to None.
+            naif_range (Optional[str], optional): min:max. Defaults to None.
+            crs_types (Optional[str], optional): comma separated CRS types
+            (ocentric, ographic). Defaults to None.
+            shapes (Optional[str], optional): comma separated shapes
+            (sphere, ellipse, triaxial). Defaults to None.
+            projections (Optional[str], optional): comma separated offsets,
+            names or methods of projections, or none. Defaults to None.
+            codes (Optional[str], optional): comma separated IAU codes.
+            Defaults to None.
+            shard (Optional[str], optional): i/N. Defaults to None.
+
+        Raises:
+            ValueError: invalid value
+
+        Returns:
+            Selection: the selection
+        """
+        range_naif: Optional[Tuple[int, int]] = None
+        if naif_range is not None:
+            try:
+                first, last = naif_range.split(":")
+                range_naif = (
+                    int(first) if first else 0,
+                    int(last) if last else 2**63 - 1,
+                )
+            except ValueError as error:
+                raise ValueError(
+                    f"Invalid Naif range {naif_range} : min:max is expected"
+                ) from error
+
+        shard_numbers: Optional[Tuple[int, int]] = None
+        if shard is not None:
+            try:
+                index, count = shard.split("/")
+                shard_numbers = (int(index), int(count))
+            except ValueError as error:
+                raise ValueError(
+                    f"Invalid shard {shard} : i/N is expected"
+                ) from error
+
+        types: Optional[Tuple[str, ...]] = Selection._split(crs_types)
+        shape_names: Optional[Tuple[str, ...]] = Selection._split(shapes)
+        projection_names: Optional[Tuple[str, ...]] = Selection._split(
+            projections
+        )
+        code_names: Optional[Tuple[str, ...]] = Selection._split(codes)
+        return Selection(
+            bodies=Selection._split(bodies),
+            naif_range=range_naif,
+            crs_types=(
+                None
+                if types is None
+                else [Selection._enum(CrsType, name) for name in types]
+            ),
+            shapes=(
+                None
+                if shape_names is None
+                else [
+                    Selection._enum(ReferenceShape, name)
+                    for name in shape_names
+                ]
+            ),
+            projections=(
+                None
+                if projection_names is None
+                else [
+                    int(name) if name.isdigit() else name
+                    for name in projection_names
+                    if name.lower() != "none"
+                ]
+            ),
+            codes=(
+                None
+                if code_names is None
+                else [int(code) for code in code_names]
+            ),
+            shard=shard_numbers,
+        )
+
+    @staticmethod
+    def _enum(enum_class, name: str):
+        """Returns the member of an enum from its value, case insensitive.
+
+        Args:
+            enum_class: CrsType or ReferenceShape
+            name (str): value of the member
+
+        Raises:
+            ValueError: unknown value
+
+        Returns:
+            the member of the enum
+        """
+        for member in enum_class:
+            if member.value.lower() == name.lower():
+                return member
+        raise ValueError(
+            f"Unknown value {name} : {', '.join(member.value.lower() for member in enum_class)} are expected"
+        )
@@ -0,0 +1,465 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to serve the generated WKT-CRS over HTTP.
+
+The catalogue is generated once when the server starts. The encoded
+responses are cached, so a request only costs a lookup.
+
+Routes:
+    * GET /IAU/<version> : the list of the IAU codes (JSON)
+    * GET /IAU/<version>/<code> : the WKT of the code, or the PROJJSON with
+      ?format=projjson (needs pyproj)
+    * POST /IAU/<version> : the WKT of several codes. The body is a JSON
+      list of codes or {"codes": [...], "format": "wkt" or "projjson"}, of
+      at most MAX_CONTENT_LENGTH bytes
+    * GET /metrics : the metrics in the Prometheus text format, when the
+      server has metrics
+"""
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+from .crs import ICrs
+from .csvforwkt import CsvforwktLib
+from .metrics import PipelineMetrics
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+# entity tag of an If-None-Match header, weak or strong, or *
+ENTITY_TAG = re.compile(r'\s*(\*|(?:W/)?"[^"]*")\s*(?:,|$)')
+
+
+class WktRegistry:
+    """Registry of the CRS with a cache of the encoded responses."""
+
+    FORMATS: Tuple[str, ...] = ("wkt", "projjson")
+
+    def __init__(
+        self,
+        csvforwkt: CsvforwktLib,
+        metrics: Optional[PipelineMetrics] = None,
+    ):
+        """Creates the registry by generating the catalogue once.
+
+        Args:
+            csvforwkt (CsvforwktLib): the library
+            metrics (Optional[PipelineMetrics], optional): metrics counting
+            the generated CRS. Defaults to None.
+        """
+        self.__version: str = str(csvforwkt.iau_version)
+        self.__crs: Dict[int, ICrs] = dict()
+        bodies: Iterable[Tuple[int, Dict[int, ICrs]]] = (
+            csvforwkt.process().items()
+        )
+        if metrics is not None:
+            bodies = metrics.count_bodies(bodies, csvforwkt.is_triaxial)
+            metrics.count_projections(csvforwkt.projection_stats)
+        for _, body_crs in bodies:
+            self.__crs.update(body_crs)
+        self.__cache: Dict[Tuple[int, str], Tuple[bytes, str]] = dict()
+        self.__lock = threading.Lock()
+        self.__codes: bytes = json.dumps(list(self.__crs.keys())).encode(
+            "utf-8"
+        )
+        for code in self.__crs:
+            self.encoded(code, "wkt")
+        logger.info(f"{len(self.__crs)} CRS loaded in the registry")
+
+    @property
+    def version(self) -> str:
+        """The version of the IAU report.
+
+        :getter: Returns the version
+        :type: str
+        """
+        return self.__version
+
+    @property
+    def codes(self) -> bytes:
+        """The list of the IAU codes as JSON.
+
+        :getter: Returns the encoded list of the IAU codes
+        :type: bytes
+        """
+        return self.__codes
+
+    def __contains__(self, code: int) -> bool:
+        return code in self.__crs
+
+    def __len__(self) -> int:
+        return len(self.__crs)
+
+    def text(self, code: int, output_format: str) -> str:
+        """Returns the description of a CRS.
+
+        Args:
+            code (int): IAU code
+            output_format (str): wkt or projjson
+
+        Raises:
+            KeyError: unknown IAU code
+            ValueError: unknown format or the WKT is rejected by pyproj
+            ImportError: pyproj is needed for projjson
+
+        Returns:
+            str: the description of the CRS
+        """
+        crs: ICrs = self.__crs[code]
+        with span("wkt", code=code, kind=type(crs).__name__):
+            wkt: str = crs.wkt()
+        if output_format == "wkt":
+            return wkt
+        if output_format == "projjson":
+            # pylint: disable=import-outside-toplevel,import-error
+            from pyproj import CRS  # type: ignore
+            from pyproj.exceptions import CRSError  # type: ignore
+
+            try:
+                return CRS.from_wkt(wkt).to_json()
+            except CRSError as error:
+                raise ValueError(
+                    f"Cannot convert the IAU code {code} to PROJJSON: {error}"
+                ) from error
+        raise ValueError(f"Unknown format: {output_format}")
+
+    def encoded(self, code: int, output_format: str) -> Tuple[bytes, str]:
+        """Returns the encoded description of a CRS and its ETag.
+
+        Args:
+            code (int): IAU code
+            output_format (str): wkt or projjson
+
+        Returns:
+            Tuple[bytes, str]: the encoded description and its ETag
+        """
+        key: Tuple[int, str] = (code, output_format)
+        result: Optional[Tuple[bytes, str]] = self.__cache.get(key)
+        if result is None:
+            content: bytes = self.text(code, output_format).encode("utf-8")
+            result = (content, f'"{hashlib.sha1(content).hexdigest()}"')
+            with self.__lock:
+                self.__cache[key] = result
+        return result
+
+
+class WktRequestHandler(BaseHTTPRequestHandler):
+    """Handles the requests on the registry."""
+
+    protocol_version = "HTTP/1.1"
+    # the headers and the body are sent by two writes
+    disable_nagle_algorithm = True
+
+    CONTENT_TYPES: Dict[str, str] = {
+        "wkt": "text/plain; charset=utf-8",
+        "projjson": "application/json",
+    }
+
+    METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    # maximum size of the body of a POST request
+    MAX_CONTENT_LENGTH: int = 1 << 20
+
+    @property
+    def registry(self) -> WktRegistry:
+        """The registry of the server.
+
+        :getter: Returns the registry
+        :type: WktRegistry
+        """
+        return self.server.registry  # type: ignore
+
+    def handle_one_request(self):
+        """Handles a request, its status and its duration are recorded when
+        its headers are sent."""
+        # pylint: disable=attribute-defined-outside-init
+        self.status: int = 0
+        self.start: float = time.perf_counter()
+        super().handle_one_request()
+
+    def send_response(self, code, message=None):
+        # pylint: disable=attribute-defined-outside-init
+        # str(HTTPStatus.OK) is HTTPStatus.OK before Python 3.11
+        self.status = int(code)
+        super().send_response(code, message)
+
+    def end_headers(self):
+        """Records the request before its body is sent, so that a client
+        reading the metrics after the response sees the request."""
+        metrics: Optional[PipelineMetrics] = self.server.metrics  # type: ignore
+        if metrics is not None and self.status != 0:
+            metrics.observe_request(
+                self.command, self.status, time.perf_counter() - self.start
+            )
+        super().end_headers()
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{self.address_string()} - {format % args}")
+
+    def _send(
+        self,
+        status: HTTPStatus,
+        content: bytes,
+        content_type: str,
+        etag: Optional[str] = None,
+    ):
+        """Sends a response.
+
+        Args:
+            status (HTTPStatus): status of the response
+            content (bytes): body of the response
+            content_type (str): content type of the body
+            etag (Optional[str], optional): ETag of the body. Defaults to None.
+        """
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "public, max-age=86400")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(content)
+
+    def _send_error(self, status: HTTPStatus, message: str):
+        """Sends an error as JSON.
+
+        Args:
+            status (HTTPStatus): status of the response
+            message (str): error message
+        """
+        self._send(
+            status,
+            json.dumps({"error": message}).encode("utf-8"),
+            "application/json",
+        )
+
+    def _route(self) -> Tuple[Optional[List[str]], Dict[str, List[str]]]:
+        """Splits the path of the request.
+
+        Returns:
+            Tuple[Optional[List[str]], Dict[str, List[str]]]: the parts of
+            the path after /IAU/<version> or None when the path is not
+            handled, and the query
+        """
+        url = urlsplit(self.path)
+        parts: List[str] = [part for part in url.path.split("/") if part]
+        if (
+            len(parts) < 2
+            or parts[0].upper() != "IAU"
+            or parts[1] != self.registry.version
+        ):
+            return None, {}
+        return parts[2:], parse_qs(url.query)
+
+    def _output_format(self, query: Dict[str, List[str]]) -> str:
+        """Returns the format requested by the query or the Accept header.
+
+        Args:
+            query (Dict[str, List[str]]): query of the request
+
+        Returns:
+            str: wkt or projjson
+        """
+        if "format" in query:
+            return query["format"][0].lower()
+        if "application/json" in self.headers.get("Accept", ""):
+            return "projjson"
+        return "wkt"
+
+    @staticmethod
+    def _matches(etag: str, if_none_match: str) -> bool:
+        """Checks if an ETag matches an If-None-Match header.
+
+        The entity tags are compared with the weak comparison: W/"x"
+        matches "x".
+
+        Args:
+            etag (str): strong ETag of the response
+            if_none_match (str): comma-separated list of entity tags or *
+
+        Returns:
+            bool: True when the ETag is in the list or the list is *
+        """
+        for match in ENTITY_TAG.finditer(if_none_match):
+            tag: str = match.group(1)
+            if tag == "*" or tag.replace("W/", "", 1) == etag:
+                return True
+        return False
+
+    def do_HEAD(self):  # pylint: disable=invalid-name
+        """Handles the HEAD requests."""
+        self.do_GET()
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handles the GET requests."""
+        metrics: Optional[PipelineMetrics] = self.server.metrics  # type: ignore
+        if metrics is not None and urlsplit(self.path).path == "/metrics":
+            self._send(
+                HTTPStatus.OK,
+                metrics.exposition().encode("utf-8"),
+                WktRequestHandler.METRICS_CONTENT_TYPE,
+            )
+            return
+        parts, query = self._route()
+        if parts is None or len(parts) > 1:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path {self.path}")
+            return
+        if len(parts) == 0:
+            self._send(HTTPStatus.OK, self.registry.codes, "application/json")
+            return
+
+        output_format: str = self._output_format(query)
+        if output_format not in WktRegistry.FORMATS:
+            self._send_error(
+                HTTPStatus.BAD_REQUEST, f"Unknown format {output_format}"
+            )
+            return
+        try:
+            code = int(parts[0])
+        except ValueError:
+            self._send_error(
+                HTTPStatus.BAD_REQUEST, f"Invalid IAU code {parts[0]}"
+            )
+            return
+        if code not in self.registry:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown IAU code {code}")
+            return
+
+        try:
+            content, etag = self.registry.encoded(code, output_format)
+        except ImportError:
+            self._send_error(
+                HTTPStatus.NOT_IMPLEMENTED, "pyproj is needed for PROJJSON"
+            )
+            return
+        except ValueError as error:
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(error))
+            return
+        if WktRequestHandler._matches(
+            etag, self.headers.get("If-None-Match", "")
+        ):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send(
+            HTTPStatus.OK,
+            content,
+            WktRequestHandler.CONTENT_TYPES[output_format],
+            etag,
+        )
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Handles the batch lookups."""
+        parts, _ = self._route()
+        try:
+            length: int = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if not 0 <= length <= WktRequestHandler.MAX_CONTENT_LENGTH:
+            # the body is not read, the connection cannot be reused
+            self.close_connection = True
+            self._send_error(
+                (
+                    HTTPStatus.BAD_REQUEST
+                    if length < 0
+                    else HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+                ),
+                f"Invalid Content-Length, at most {WktRequestHandler.MAX_CONTENT_LENGTH} bytes are accepted",
+            )
+            return
+        body: bytes = self.rfile.read(length)
+        if parts is None or len(parts) != 0:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path {self.path}")
+            return
+        try:
+            request: Any = json.loads(body.decode("utf-8"))
+            if isinstance(request, list):
+                request = {"codes": request}
+            codes: List[int] = [int(code) for code in request["codes"]]
+            output_format: str = request.get("format", "wkt").lower()
+            if output_format not in WktRegistry.FORMATS:
+                raise ValueError(f"Unknown format {output_format}")
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            self._send_error(
+                HTTPStatus.BAD_REQUEST, f"Invalid request: {error}"
+            )
+            return
+
+        result: Dict[str, Optional[str]] = dict()
+        try:
+            for code in codes:
+                result[str(code)] = (
+                    self.registry.encoded(code, output_format)[0].decode(
+                        "utf-8"
+                    )
+                    if code in self.registry
+                    else None
+                )
+        except ImportError:
+            self._send_error(
+                HTTPStatus.NOT_IMPLEMENTED, "pyproj is needed for PROJJSON"
+            )
+            return
+        except ValueError as error:
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(error))
+            return
+        self._send(
+            HTTPStatus.OK,
+            json.dumps(result).encode("utf-8"),
+            "application/json",
+        )
+
+
+class WktServer(ThreadingHTTPServer):
+    """HTTP server of the registry."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        registry: WktRegistry,
+        host: str,
+        port: int,
+        metrics: Optional[PipelineMetrics] = None,
+    ):
+        """Creates the server.
+
+        Args:
+            registry (WktRegistry): the registry
+            host (str): host name
+            port (int): port, 0 to select a free port
+            metrics (Optional[PipelineMetrics], optional): metrics of the
+            requests, served on /metrics. Defaults to None.
+        """
+        self.registry: WktRegistry = registry
+        self.metrics: Optional[PipelineMetrics] = metrics
+        super().__init__((host, port), WktRequestHandler)
+
+    @property
+    def url(self) -> str:
+        """The URL of the catalogue.
+
+        :getter: Returns the URL of the catalogue
+        :type: str
+        """
+        host, port = self.server_address[0:2]
+        if isinstance(host, bytes):
+            host = host.decode("ascii")
+        return f"http://{host}:{port}/IAU/{self.registry.version}"
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to trace the stages of the pipeline.
+
+A span measures a section of the code with the monotonic clock in
+nanoseconds. The spans are nested (process, biaxial, body, wkt, ...) and
+carry attributes (rows, CRS, bytes). The trace is written as a JSON file
+for the trace viewers (chrome://tracing, Perfetto, speedscope) or as a
+summary tree.
+
+The code is instrumented with `span`. Until a tracer is enabled, `span`
+returns a shared context manager doing nothing, so the instrumentation
+costs a function call.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextlib import ExitStack
+from enum import Enum
+from typing import Any
+from typing import ContextManager
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+class TraceFormat(Enum):
+    """Format of the trace."""
+
+    CHROME = "chrome"
+    SUMMARY = "summary"
+
+
+class Span:  # pylint: disable=too-few-public-methods
+    """Timed section of the code."""
+
+    __slots__ = ("name", "path", "thread_id", "start", "end", "attributes")
+
+    def __init__(
+        self, name: str, path: Tuple[str, ...], attributes: Dict[str, Any]
+    ):
+        """Starts a span.
+
+        Args:
+            name (str): name of the span
+            path (Tuple[str, ...]): names of the enclosing spans and of the
+            span
+            attributes (Dict[str, Any]): attributes of the span
+        """
+        self.name: str = name
+        self.path: Tuple[str, ...] = path
+        self.thread_id: int = threading.get_ident()
+        self.start: int = time.perf_counter_ns()
+        self.end: int = self.start
+        self.attributes: Dict[str, Any] = attributes
+
+    @property
+    def duration(self) -> int:
+        """Duration of the span in nanoseconds.
+
+        :getter: Returns the duration
+        :type: int
+        """
+        return self.end - self.start
+
+
+class Tracer:
+    """Records the spans."""
+
+    # attributes summed in the summary, the other ones are identifiers
+    SUMMED: Tuple[str, ...] = ("rows", "crs", "bytes")
+
+    def __init__(self):
+        """Creates a tracer."""
+        self.__spans: List[Span] = list()
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+        self.__origin: int = time.perf_counter_ns()
+
+    @property
+    def spans(self) -> List[Span]:
+        """Ended spans, in the order they end.
+
+        :getter: Returns the spans
+        :type: List[Span]
+        """
+        return self.__spans
+
+    def _path(self) -> List[str]:
+        """Returns the names of the open spans of the current thread.
+
+        Returns:
+            List[str]: the names of the open spans
+        """
+        path: Optional[List[str]] = getattr(self.__local, "path", None)
+        if path is None:
+            path = list()
+            self.__local.path = path
+        return path
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Dict[str, Any]]:
+        """Records a span.
+
+        Args:
+            name (str): name of the span
+
+        Yields:
+            Iterator[Dict[str, Any]]: the attributes of the span, which can
+            be completed before the span ends
+        """
+        path: List[str] = self._path()
+        path.append(name)
+        current = Span(name, tuple(path), attributes)
+        try:
+            yield current.attributes
+        finally:
+            current.end = time.perf_counter_ns()
+            path.pop()
+            with self.__lock:
+                self.__spans.append(current)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Returns the trace in the Trace Event Format.
+
+        Returns:
+            Dict[str, Any]: the trace
+        """
+        pid: int = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "ph": "X",
+                    "ts": (span.start - self.__origin) / 1000,
+                    "dur": span.duration / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": span.attributes,
+                }
+                for span in sorted(self.__spans, key=lambda span: span.start)
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def summary(self) -> str:
+        """Returns the spans aggregated by path as a tree.
+
+        Returns:
+            str: the tree with the number of spans, the total and mean
+            durations and the sum of the counted attributes
+        """
+        # path: count, duration, attributes
+        nodes: Dict[Tuple[str, ...], List[Any]] = dict()
+        for record in sorted(self.__spans, key=lambda item: item.start):
+            node: List[Any] = nodes.setdefault(record.path, [0, 0, dict()])
+            node[0] += 1
+            node[1] += record.duration
+            for key in Tracer.SUMMED:
+                if key in record.attributes:
+                    node[2][key] = node[2].get(key, 0) + record.attributes[key]
+        lines: List[str] = [
+            f"{'span':<40} {'count':>8} {'total (ms)':>12} {'mean (ms)':>12}  attributes"
+        ]
+        for path, (count, duration, attributes) in nodes.items():
+            label: str = "  " * (len(path) - 1) + path[-1]
+            details: str = " ".join(
+                f"{key}={value}" for key, value in attributes.items()
+            )
+            lines.append(
+                f"{label:<40} {count:>8} {duration / 1e6:>12.3f} {duration / count / 1e6:>12.3f}  {details}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def save(self, path: str, trace_format: TraceFormat):
+        """Writes the trace.
+
+        Args:
+            path (str): trace file
+            trace_format (TraceFormat): format of the trace
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            if trace_format is TraceFormat.CHROME:
+                json.dump(self.chrome_trace(), file, default=str)
+            else:
+                file.write(self.summary())
+
+
+class _NoSpan:  # pylint: disable=too-few-public-methods
+    """Span doing nothing, used when the tracing is disabled."""
+
+    def __enter__(self) -> Dict[str, Any]:
+        return dict()
+
+    def __exit__(self, *args) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+_TRACERS: List[Any] = list()
+
+
+def enable(tracer: Any):
+    """Records the spans of the instrumented code in a tracer.
+
+    Several tracers can be enabled, each of them records the spans.
+
+    Args:
+        tracer (Any): tracer, an object with the `span` method of Tracer
+    """
+    _TRACERS.append(tracer)
+
+
+def disable(tracer: Optional[Any] = None):
+    """Stops recording the spans of the instrumented code.
+
+    Args:
+        tracer (Optional[Any], optional): tracer to disable. Defaults to
+        all the tracers.
+    """
+    if tracer is None:
+        _TRACERS.clear()
+    elif tracer in _TRACERS:
+        _TRACERS.remove(tracer)
+
+
+@contextmanager
+def _spans(name: str, attributes: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Records a span in several tracers.
+
+    Args:
+        name (str): name of the span
+        attributes (Dict[str, Any]): attributes of the span
+
+    Yields:
+        Iterator[Dict[str, Any]]: the attributes of the span in the first
+        tracer, copied to the other tracers when the span ends
+    """
+    with ExitStack() as stack:
+        spans: List[Dict[str, Any]] = [
+            stack.enter_context(tracer.span(name, **attributes))
+            for tracer in list(_TRACERS)
+        ]
+        try:
+            yield spans[0]
+        finally:
+            for other in spans[1:]:
+                other.update(spans[0])
+
+
+def span(name: str, **attributes) -> ContextManager[Dict[str, Any]]:
+    """Records a span in the enabled tracers.
+
+    Args:
+        name (str): name of the span
+
+    Returns:
+        ContextManager[Dict[str, Any]]: the span, yielding its attributes
+    """
+    if len(_TRACERS) == 0:
+        return _NO_SPAN
+    if len(_TRACERS) == 1:
+        return _TRACERS[0].span(name, **attributes)
+    return _spans(name, attributes)
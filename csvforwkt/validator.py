@@ -0,0 +1,850 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to validate the generated WKT-CRS.
+
+The WKT file is read once, by chunks, without external tools. The
+validator checks:
+
+    * the balance of the brackets and the separators
+    * the grammar of the keywords: parent keyword, arguments and required
+      children (GEOGCRS, GEODCRS, PROJCRS, DATUM, ELLIPSOID, TRIAXIAL,
+      CONVERSION, ...)
+    * the number of axes given by the coordinate system
+    * the unicity of the IAU codes and of the version of the report
+    * the structure of the codes: the offset of a body CRS matches its
+      shape and its type, a projected CRS references the code of its base
+      CRS, which is in the catalogue
+
+The CRS are separated by blank lines. Most CRS of a catalogue only differ by
+their names and their numbers: the skeleton of a CRS, its text without the
+strings and with the digits replaced by 0, is parsed once. The next CRS with
+the same skeleton reuse its structure and only their codes are read.
+"""
+import re
+from functools import partial
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from .crs import BodyCrsCode
+from .crs import CrsType
+
+# arguments of a keyword: everything but the brackets and the keywords. An
+# identifier is taken whole, so that it is not the prefix of a keyword. The
+# quantifiers are greedy (no possessive quantifiers before Python 3.11): the
+# segment ends the match, so it never backtracks.
+_SEGMENT = (
+    r'(?:[^\[\]"A-Za-z]+|"[^"]*(?:""[^"]*)*"|[A-Za-z]\w*(?!\w)(?!\s*\[))*'
+)
+
+# keyword followed by [ and its first arguments, or ] followed by the
+# arguments of the enclosing keyword
+ITEM = re.compile(rf"([A-Za-z]\w*)\s*\[({_SEGMENT})|\]({_SEGMENT})")
+
+# comma, quoted string, number, identifier, any other character
+SCALAR = re.compile(
+    r'(,)|"((?:[^"]|"")*)"'
+    r"|([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)"
+    r"|([A-Za-z]\w*)|(\S)"
+)
+
+# kinds of the groups of SCALAR
+COMMA = ","
+STRING = "s"
+NUMBER = "n"
+IDENTIFIER = "i"
+UNKNOWN = "?"
+KINDS: Tuple[str, ...] = ("", COMMA, STRING, NUMBER, IDENTIFIER, UNKNOWN)
+
+# blank lines between two CRS
+SEPARATOR = re.compile(r"\n(?:[ \t]*\n)+")
+
+STRINGS = re.compile(r'"[^"]*(?:""[^"]*)*"')
+ZEROS = re.compile("0+")
+DIGITS = str.maketrans("123456789", "000000000")
+
+IAU_ID = re.compile(r'ID\["IAU",\s*(\d+),\s*(\d+)\]')
+CS_DIMENSION = re.compile(r"CS\[\w+,\s*(\d+)\]")
+
+
+def blocks(chunks: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    """Splits a WKT text in blocks separated by blank lines.
+
+    Args:
+        chunks (Iterable[str]): the text, by lines or by chunks of any size
+
+    Yields:
+        Iterator[Tuple[int, str]]: the number of the first line, starting at
+        1, and the text of the block
+    """
+    pending: str = ""
+    line: int = 1
+    for chunk in chunks:
+        pending += chunk
+        start: int = 0
+        for match in SEPARATOR.finditer(pending):
+            if match.end() == len(pending):
+                # the next chunk may continue the blank lines
+                break
+            block: str = pending[start : match.start()]
+            if block.strip():
+                yield line, block
+            line += pending.count("\n", start, match.end())
+            start = match.end()
+        pending = pending[start:]
+    # blank lines at the end of the text
+    end: Optional[re.Match] = SEPARATOR.search(pending)
+    if end is not None:
+        pending = pending[: end.start()]
+    if pending.strip():
+        yield line, pending
+
+
+def skeleton(text: str) -> str:
+    """Returns the text of a CRS without its values.
+
+    The strings are emptied and the digits are replaced by a single 0, so
+    that the CRS having the same structure have the same skeleton.
+
+    Args:
+        text (str): WKT of a CRS
+
+    Returns:
+        str: the skeleton
+    """
+    return ZEROS.sub("0", STRINGS.sub('""', text).translate(DIGITS))
+
+
+class Segment:  # pylint: disable=too-few-public-methods
+    """Arguments between two keywords or brackets."""
+
+    __slots__ = (
+        "signature",
+        "values",
+        "empty",
+        "leading",
+        "trailing",
+        "error",
+    )
+
+    def __init__(self, text: str):
+        """Splits the arguments.
+
+        Args:
+            text (str): text between two keywords or brackets
+        """
+        self.signature: str = ""
+        self.values: List[str] = list()
+        self.error: Optional[str] = None
+        kinds: List[str] = list()
+        for match in SCALAR.finditer(text):
+            # each alternative of the pattern is a group
+            group: int = match.lastindex or 0
+            kind: str = KINDS[group]
+            previous: str = kinds[-1] if kinds else ""
+            if kind == UNKNOWN:
+                self.error = f"unexpected {match.group()}"
+            elif kind == COMMA and previous == COMMA:
+                self.error = "two commas"
+            elif kind != COMMA and previous not in ("", COMMA):
+                self.error = f"missing comma before {match.group()}"
+            if kind not in (COMMA, UNKNOWN):
+                self.signature += kind
+                self.values.append(match.group(group))
+            kinds.append(kind)
+        self.empty: bool = not kinds
+        self.leading: bool = not self.empty and kinds[0] == COMMA
+        self.trailing: bool = not self.empty and kinds[-1] == COMMA
+
+
+class ValidationIssue:  # pylint: disable=too-few-public-methods
+    """Problem found in a WKT file."""
+
+    def __init__(self, line: int, code: Optional[int], message: str):
+        """Creates the issue.
+
+        Args:
+            line (int): line of the problem
+            code (Optional[int]): IAU code of the CRS or None when it is not
+            known
+            message (str): description of the problem
+        """
+        self.line: int = line
+        self.code: Optional[int] = code
+        self.message: str = message
+
+    def __str__(self) -> str:
+        code: str = "" if self.code is None else f" IAU:{self.code}"
+        return f"line {self.line}{code}: {self.message}"
+
+
+class _Node:  # pylint: disable=too-few-public-methods
+    """Keyword being parsed."""
+
+    __slots__ = (
+        "keyword",
+        "signature",
+        "args",
+        "children",
+        "state",
+        "first_line",
+        "text",
+        "position",
+    )
+
+    def __init__(
+        self,
+        keyword: str,
+        segment: Segment,
+        block: Tuple[int, str],
+        position: int,
+    ):
+        self.keyword: str = keyword
+        self.signature: str = segment.signature
+        self.args: List[str] = segment.values
+        self.children: List["_Node"] = list()
+        # 0: no element, 1: after an element, 2: after a comma
+        self.state: int = 0 if segment.empty else 2 if segment.trailing else 1
+        self.first_line, self.text = block
+        self.position: int = position
+
+    @property
+    def line(self) -> int:
+        """Line of the keyword, computed for the messages only.
+
+        :getter: Returns the line
+        :type: int
+        """
+        return self.first_line + self.text.count("\n", 0, self.position)
+
+    def child(self, keyword: str) -> Optional["_Node"]:
+        """Returns the last child with a keyword.
+
+        Args:
+            keyword (str): keyword of the child
+
+        Returns:
+            Optional[_Node]: the child or None
+        """
+        for child in reversed(self.children):
+            if child.keyword == keyword:
+                return child
+        return None
+
+
+class Rule:  # pylint: disable=too-few-public-methods
+    """Grammar of a keyword."""
+
+    def __init__(
+        self,
+        parents: Optional[Tuple[str, ...]],
+        signature: str,
+        required: Tuple[str, ...] = (),
+    ):
+        """Creates the rule.
+
+        Args:
+            parents (Optional[Tuple[str, ...]]): allowed parent keywords, ""
+            for the root, None for any parent
+            signature (str): regular expression of the kinds of the
+            arguments (s: string, n: number, i: identifier)
+            required (Tuple[str, ...], optional): required children, the
+            alternatives are separated by |. Defaults to ().
+        """
+        self.parents: Optional[FrozenSet[str]] = (
+            None if parents is None else frozenset(parents)
+        )
+        self.signature: str = signature
+        self.pattern: Any = re.compile(signature)
+        self.required: Tuple[FrozenSet[str], ...] = tuple(
+            frozenset(children.split("|")) for children in required
+        )
+
+
+BODY_CRS: Tuple[str, ...] = ("GEOGCRS", "GEODCRS")
+BASE_CRS: Tuple[str, ...] = ("BASEGEOGCRS", "BASEGEODCRS")
+ROOTS: Tuple[str, ...] = BODY_CRS + ("PROJCRS",)
+SHAPES: Tuple[str, ...] = ("ELLIPSOID", "TRIAXIAL")
+
+GRAMMAR: Dict[str, Rule] = {
+    "GEOGCRS": Rule(("",), "s", ("DATUM", "PRIMEM", "CS", "AXIS", "ID")),
+    "GEODCRS": Rule(("",), "s", ("DATUM", "PRIMEM", "CS", "AXIS", "ID")),
+    "PROJCRS": Rule(
+        ("",),
+        "s",
+        ("BASEGEOGCRS|BASEGEODCRS", "CONVERSION", "CS", "AXIS", "ID"),
+    ),
+    "BASEGEOGCRS": Rule(("PROJCRS",), "s", ("DATUM", "PRIMEM", "ID")),
+    "BASEGEODCRS": Rule(("PROJCRS",), "s", ("DATUM", "PRIMEM", "ID")),
+    "DATUM": Rule(BODY_CRS + BASE_CRS, "s", ("ELLIPSOID|TRIAXIAL",)),
+    "ELLIPSOID": Rule(("DATUM",), "snn", ("LENGTHUNIT",)),
+    "TRIAXIAL": Rule(("DATUM",), "snnn", ("LENGTHUNIT",)),
+    "ANCHOR": Rule(("DATUM",), "s"),
+    "PRIMEM": Rule(BODY_CRS + BASE_CRS, "sn", ("ANGLEUNIT",)),
+    "CONVERSION": Rule(("PROJCRS",), "s", ("METHOD",)),
+    "METHOD": Rule(("CONVERSION",), "s"),
+    "PARAMETER": Rule(("CONVERSION",), "sn"),
+    "CS": Rule(ROOTS, "in"),
+    "AXIS": Rule(ROOTS, "si", ("ORDER",)),
+    "ORDER": Rule(("AXIS",), "n"),
+    "LENGTHUNIT": Rule(None, "sn"),
+    "ANGLEUNIT": Rule(None, "sn"),
+    "SCALEUNIT": Rule(None, "sn"),
+    "ID": Rule(None, "s[ns][ns]?"),
+    "REMARK": Rule(ROOTS, "s"),
+}
+
+
+class CrsStructure:  # pylint: disable=too-few-public-methods
+    """Keywords of a CRS checked against its IAU code."""
+
+    __slots__ = ("keyword", "shape", "base_keyword", "base_shape", "axes")
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        keyword: str,
+        shape: str,
+        base_keyword: Optional[str],
+        base_shape: str,
+        axes: int,
+    ):
+        """Creates the structure.
+
+        Args:
+            keyword (str): keyword of the CRS
+            shape (str): shape of the datum of the CRS, ELLIPSOID, TRIAXIAL
+            or empty
+            base_keyword (Optional[str]): keyword of the base CRS or None
+            base_shape (str): shape of the datum of the base CRS
+            axes (int): number of axes
+        """
+        self.keyword: str = keyword
+        self.shape: str = shape
+        self.base_keyword: Optional[str] = base_keyword
+        self.base_shape: str = base_shape
+        self.axes: int = axes
+
+
+class WktValidator:
+    """Validates a WKT file generated by csvForWKT in a single pass."""
+
+    # size of the chunks read in the file
+    CHUNK_SIZE: int = 1 << 20
+
+    # parsed arguments kept in the cache
+    MAX_SEGMENTS: int = 100_000
+
+    def __init__(self, complete: bool = True):
+        """Creates the validator.
+
+        Args:
+            complete (bool, optional): True when the base CRS of each
+            projected CRS must be in the file, False for a subset of the
+            catalogue. Defaults to True.
+        """
+        self.__complete: bool = complete
+        self.__issues: List[ValidationIssue] = list()
+        self.__codes: Set[int] = set()
+        self.__bases: Dict[int, Tuple[int, int]] = dict()
+        self.__version: Optional[str] = None
+        self.__segments: Dict[str, Segment] = dict()
+        # keyword, parent, signature, children: errors of grammar
+        self.__grammar: Dict[
+            Tuple[str, str, str, FrozenSet[str]], Tuple[str, ...]
+        ] = dict()
+        # skeleton of the valid CRS: structure
+        self.__structures: Dict[str, CrsStructure] = dict()
+        # offset of the body CRS: keyword and shape keyword
+        self.__body_codes: Dict[int, Tuple[str, str]] = {
+            body_code.code: (
+                (
+                    "GEODCRS"
+                    if body_code.reference == CrsType.OCENTRIC.value
+                    and body_code.shape != "Sphere"
+                    else "GEOGCRS"
+                ),
+                "TRIAXIAL" if body_code.shape == "Triaxial" else "ELLIPSOID",
+            )
+            for body_code in BodyCrsCode
+        }
+
+    @property
+    def issues(self) -> List[ValidationIssue]:
+        """Problems found by the validation.
+
+        :getter: Returns the problems
+        :type: List[ValidationIssue]
+        """
+        return self.__issues
+
+    @property
+    def codes(self) -> Set[int]:
+        """IAU codes of the validated CRS.
+
+        :getter: Returns the IAU codes
+        :type: Set[int]
+        """
+        return self.__codes
+
+    def _issue(self, line: int, code: Optional[int], message: str):
+        """Records a problem.
+
+        Args:
+            line (int): line of the problem
+            code (Optional[int]): IAU code of the CRS or None
+            message (str): description of the problem
+        """
+        self.__issues.append(ValidationIssue(line, code, message))
+
+    def validate(self, chunks: Iterable[str]) -> List[ValidationIssue]:
+        """Validates a WKT text.
+
+        Args:
+            chunks (Iterable[str]): the text, by lines or by chunks of any
+            size
+
+        Returns:
+            List[ValidationIssue]: the problems found in the text
+        """
+        for block in blocks(chunks):
+            if not self._validate_known(*block):
+                self._validate_block(block)
+        if self.__complete:
+            for base, (code, line) in self.__bases.items():
+                if base not in self.__codes:
+                    self._issue(line, code, f"base CRS {base} not found")
+        return self.__issues
+
+    def validate_file(self, path: str) -> List[ValidationIssue]:
+        """Validates a WKT file.
+
+        Args:
+            path (str): WKT file
+
+        Returns:
+            List[ValidationIssue]: the problems found in the file
+        """
+        with open(path, encoding="utf-8") as file:
+            return self.validate(
+                iter(partial(file.read, WktValidator.CHUNK_SIZE), "")
+            )
+
+    def _validate_known(self, first_line: int, text: str) -> bool:
+        """Validates a CRS whose skeleton is the one of a valid CRS.
+
+        Args:
+            first_line (int): number of the first line of the block
+            text (str): block of a CRS
+
+        Returns:
+            bool: False when the skeleton is not known
+        """
+        structure: Optional[CrsStructure] = self.__structures.get(
+            skeleton(text)
+        )
+        if structure is None:
+            return False
+        identifiers: List[Tuple[str, str]] = IAU_ID.findall(text)
+        dimensions: List[str] = CS_DIMENSION.findall(text)
+        if (
+            len(identifiers) != (1 if structure.base_keyword is None else 2)
+            or len(dimensions) != 1
+        ):
+            # an identifier or a dimension is not a number
+            return False
+        code, version = identifiers[-1]
+        line: int = first_line + text.count(
+            "\n", 0, len(text) - len(text.lstrip())
+        )
+        self._check_crs(
+            line,
+            structure,
+            int(code),
+            version,
+            (
+                None
+                if structure.base_keyword is None
+                else (int(identifiers[0][0]), identifiers[0][1])
+            ),
+            int(dimensions[0]),
+        )
+        return True
+
+    def _validate_block(self, block: Tuple[int, str]):
+        """Parses a block keyword by keyword.
+
+        A CRS does not span several blocks: the keywords not closed at the
+        end of the block are reported, so that an error does not spread to
+        the next CRS.
+
+        Args:
+            block (Tuple[int, str]): number of the first line and text of
+            the block
+        """
+        first_line, text = block
+        stack: List[_Node] = list()
+        nb_issues: int = len(self.__issues)
+        roots: List[_Node] = list()
+        end: int = 0
+        for match in ITEM.finditer(text):
+            if match.start() != end and text[end : match.start()].strip():
+                self._issue(
+                    first_line + text.count("\n", 0, end),
+                    None,
+                    f"unexpected {text[end:match.start()].strip()[:20]}",
+                )
+            end = match.end()
+            if match.lastindex == 3:
+                if not stack:
+                    self._issue(
+                        first_line + text.count("\n", 0, end),
+                        None,
+                        "unbalanced ]",
+                    )
+                    continue
+                root: Optional[_Node] = self._close(
+                    stack, self._segment(match.group(3))
+                )
+                if root is not None:
+                    roots.append(root)
+                continue
+            segment: Segment = self._segment(match.group(2))
+            node = _Node(match.group(1), segment, block, match.start())
+            if segment.leading:
+                self._issue(node.line, None, f"comma after {node.keyword}[")
+            if segment.error is not None:
+                self._issue(
+                    node.line, None, f"{node.keyword} : {segment.error}"
+                )
+            if stack:
+                parent: _Node = stack[-1]
+                if parent.state == 1:
+                    self._issue(
+                        node.line, None, f"missing comma before {node.keyword}"
+                    )
+                parent.children.append(node)
+            stack.append(node)
+        if end != len(text) and text[end:].strip():
+            self._issue(
+                first_line + text.count("\n", 0, end),
+                None,
+                f"unexpected {text[end:].strip()[:20]}",
+            )
+        for node in stack:
+            self._issue(node.line, None, f"{node.keyword} not closed")
+        valid: bool = (
+            not stack and len(roots) == 1 and len(self.__issues) == nb_issues
+        )
+        for root in roots:
+            self._check_root(root, text if valid else None)
+
+    def _segment(self, text: str) -> Segment:
+        """Returns the arguments of a text, parsed once by distinct text.
+
+        Args:
+            text (str): text between two keywords or brackets
+
+        Returns:
+            Segment: the arguments
+        """
+        segment: Optional[Segment] = self.__segments.get(text)
+        if segment is None:
+            if len(self.__segments) >= WktValidator.MAX_SEGMENTS:
+                self.__segments.clear()
+            segment = Segment(text)
+            self.__segments[text] = segment
+        return segment
+
+    def _close(self, stack: List[_Node], segment: Segment) -> Optional[_Node]:
+        """Checks the keyword closed by a bracket and the arguments
+        following the bracket.
+
+        Args:
+            stack (List[_Node]): open keywords
+            segment (Segment): arguments following the bracket
+
+        Returns:
+            Optional[_Node]: the closed keyword when it is a CRS at the root
+            of the file otherwise None
+        """
+        node: _Node = stack.pop()
+        if node.state == 2:
+            self._issue(node.line, None, f"comma before ] in {node.keyword}")
+        parent: Optional[_Node] = stack[-1] if stack else None
+        self._check_keyword(node, parent)
+        if parent is None:
+            if not segment.empty:
+                self._issue(node.line, None, "unexpected text after the CRS")
+            return node
+        parent.state = 1
+        if segment.empty:
+            return None
+        if segment.error is not None or not segment.leading:
+            self._issue(
+                node.line,
+                None,
+                f"{parent.keyword} : "
+                f"{segment.error or f'missing comma after {node.keyword}'}",
+            )
+        if segment.signature:
+            self._issue(
+                node.line,
+                None,
+                f"{parent.keyword} : value {segment.values[0]} after a keyword",
+            )
+        parent.state = 2 if segment.trailing else 1
+        return None
+
+    def _check_keyword(self, node: _Node, parent: Optional[_Node]):
+        """Checks the grammar of a keyword.
+
+        Args:
+            node (_Node): keyword
+            parent (Optional[_Node]): parent keyword or None for the root
+        """
+        key: Tuple[str, str, str, FrozenSet[str]] = (
+            node.keyword,
+            "" if parent is None else parent.keyword,
+            node.signature,
+            frozenset(child.keyword for child in node.children),
+        )
+        errors: Optional[Tuple[str, ...]] = self.__grammar.get(key)
+        if errors is None:
+            errors = WktValidator._grammar_errors(*key)
+            self.__grammar[key] = errors
+        for error in errors:
+            self._issue(node.line, None, error)
+
+    @staticmethod
+    def _grammar_errors(
+        keyword: str, parent: str, signature: str, children: FrozenSet[str]
+    ) -> Tuple[str, ...]:
+        """Returns the errors of grammar of a keyword.
+
+        Args:
+            keyword (str): keyword
+            parent (str): parent keyword, empty for the root
+            signature (str): kinds of the arguments
+            children (FrozenSet[str]): keywords of the children
+
+        Returns:
+            Tuple[str, ...]: the errors
+        """
+        rule: Optional[Rule] = GRAMMAR.get(keyword)
+        if rule is None:
+            return (f"unknown keyword {keyword}",)
+        errors: List[str] = list()
+        if rule.parents is not None and parent not in rule.parents:
+            errors.append(f"{keyword} not expected in {parent or 'the file'}")
+        if rule.pattern.fullmatch(signature) is None:
+            errors.append(
+                f"{keyword} : arguments {signature[:20] or 'none'} "
+                f"instead of {rule.signature}"
+            )
+        for required in rule.required:
+            if required.isdisjoint(children):
+                errors.append(
+                    f"{keyword} without {'|'.join(sorted(required))}"
+                )
+        return tuple(errors)
+
+    def _code(
+        self, node: _Node, code: Optional[int]
+    ) -> Optional[Tuple[int, str]]:
+        """Returns the IAU code and the version identifying a CRS.
+
+        Args:
+            node (_Node): CRS or base CRS
+            code (Optional[int]): IAU code of the root CRS for the messages
+
+        Returns:
+            Optional[Tuple[int, str]]: the IAU code and the version or None
+            when the CRS has no IAU identifier
+        """
+        identifier: Optional[_Node] = node.child("ID")
+        if (
+            identifier is None
+            or identifier.signature != "snn"
+            or identifier.args[0] != "IAU"
+            or not identifier.args[1].isdigit()
+        ):
+            self._issue(
+                node.line,
+                code,
+                f'{node.keyword} without ID["IAU", code, version]',
+            )
+            return None
+        return int(identifier.args[1]), identifier.args[2]
+
+    @staticmethod
+    def _shape(node: _Node) -> str:
+        """Returns the shape of the datum of a CRS.
+
+        Args:
+            node (_Node): CRS or base CRS
+
+        Returns:
+            str: ELLIPSOID, TRIAXIAL or empty
+        """
+        datum: Optional[_Node] = node.child("DATUM")
+        if datum is not None:
+            for child in datum.children:
+                if child.keyword in SHAPES:
+                    return child.keyword
+        return ""
+
+    def _check_root(self, node: _Node, text: Optional[str]):
+        """Checks a CRS parsed keyword by keyword.
+
+        Args:
+            node (_Node): CRS at the root of the file
+            text (Optional[str]): text of the block when it only contains
+            this CRS without error, so that its skeleton is recorded
+        """
+        if node.keyword not in ROOTS:
+            return
+        identifier: Optional[Tuple[int, str]] = self._code(node, None)
+        if identifier is None:
+            return
+        code, version = identifier
+        base: Optional[_Node] = None
+        base_identifier: Optional[Tuple[int, str]] = None
+        for child in node.children:
+            if child.keyword in BASE_CRS:
+                base = child
+        if base is not None:
+            base_identifier = self._code(base, code)
+            if base_identifier is None:
+                return
+        cs_node: Optional[_Node] = node.child("CS")
+        dimension: Optional[int] = (
+            int(cs_node.args[1])
+            if cs_node is not None and cs_node.signature == "in"
+            else None
+        )
+        structure = CrsStructure(
+            node.keyword,
+            WktValidator._shape(node),
+            None if base is None else base.keyword,
+            "" if base is None else WktValidator._shape(base),
+            sum(1 for child in node.children if child.keyword == "AXIS"),
+        )
+        if (
+            text is not None
+            and dimension is not None
+            and len(IAU_ID.findall(text)) == (1 if base is None else 2)
+            and len(CS_DIMENSION.findall(text)) == 1
+        ):
+            self.__structures[skeleton(text)] = structure
+        self._check_crs(
+            node.line, structure, code, version, base_identifier, dimension
+        )
+
+    def _check_crs(  # pylint: disable=too-many-arguments
+        self,
+        line: int,
+        structure: CrsStructure,
+        code: int,
+        version: str,
+        base_identifier: Optional[Tuple[int, str]],
+        dimension: Optional[int],
+    ):
+        """Checks the IAU code of a CRS and its structure.
+
+        Args:
+            line (int): line of the CRS
+            structure (CrsStructure): keywords of the CRS
+            code (int): IAU code of the CRS
+            version (str): version of the IAU report
+            base_identifier (Optional[Tuple[int, str]]): IAU code and
+            version of the base CRS or None
+            dimension (Optional[int]): dimension of the coordinate system
+        """
+        if self.__version is None:
+            self.__version = version
+        elif version != self.__version:
+            self._issue(
+                line, code, f"version {version} instead of {self.__version}"
+            )
+        if code in self.__codes:
+            self._issue(line, code, "duplicated code")
+        self.__codes.add(code)
+        if dimension is not None and dimension != structure.axes:
+            self._issue(
+                line,
+                code,
+                f"{structure.axes} axes for a CS of dimension {dimension}",
+            )
+
+        offset: int = code % 100
+        projection_offset: int = offset - offset % 5
+        if structure.keyword in BODY_CRS:
+            if projection_offset != 0:
+                self._issue(line, code, f"offset {offset} of a projected CRS")
+                return
+            self._check_body(
+                line, code, offset, structure.keyword, structure.shape
+            )
+        elif structure.keyword == "PROJCRS":
+            if projection_offset == 0:
+                self._issue(line, code, f"offset {offset} of a body CRS")
+                return
+            if base_identifier is None or structure.base_keyword is None:
+                return
+            base_code, base_version = base_identifier
+            if base_version != version:
+                self._issue(
+                    line,
+                    code,
+                    f"version {base_version} of the base CRS instead of {version}",
+                )
+            if base_code != code - projection_offset:
+                self._issue(
+                    line,
+                    code,
+                    f"base CRS {base_code} instead of {code - projection_offset}",
+                )
+                return
+            self.__bases.setdefault(base_code, (code, line))
+            self._check_body(
+                line,
+                code,
+                base_code % 100,
+                structure.base_keyword.replace("BASE", ""),
+                structure.base_shape,
+            )
+
+    def _check_body(  # pylint: disable=too-many-arguments
+        self, line: int, code: int, offset: int, keyword: str, shape: str
+    ):
+        """Checks that the keywords of a body CRS match its code.
+
+        Args:
+            line (int): line of the CRS
+            code (int): IAU code of the CRS for the messages
+            offset (int): offset of the body CRS
+            keyword (str): keyword of the body CRS, without BASE
+            shape (str): shape of the datum
+        """
+        expected: Optional[Tuple[str, str]] = self.__body_codes.get(offset)
+        if expected is None:
+            self._issue(line, code, f"unknown offset {offset}")
+            return
+        expected_keyword, expected_shape = expected
+        if keyword != expected_keyword:
+            self._issue(
+                line,
+                code,
+                f"{keyword} for offset {offset}, expected {expected_keyword}",
+            )
+        if shape != expected_shape:
+            self._issue(
+                line,
+                code,
+                f"datum without {expected_shape} for offset {offset}",
+            )
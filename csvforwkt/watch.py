@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to regenerate the output when its inputs
+change.
+
+The watcher keeps in memory the compiled projection catalogue, the
+description of each body and the text of its CRS. The IAU report and the
+projection catalogue are polled: when the report changes, it is read again
+and only the bodies whose description changed are generated again. When the
+catalogue changes, it is compiled again and all the bodies are generated
+again. When the text of a body changes, the output is written in a temporary
+file that replaces it, so that a reader never sees a partial output.
+"""
+import logging
+import os
+import tempfile
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from .catalogue import ProjectionCatalogue
+from .crs import ICrs
+from .csvforwkt import CsvforwktLib
+from .selection import Selection
+from .writer import IWriter
+from .writer import OutputFormat
+from .writer import TextWriter
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogueWatcher:
+    """Regenerates a WKT or JSON Lines output when its inputs change."""
+
+    DEFAULT_INTERVAL: float = 0.5
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        iau_report: str,
+        iau_version: int,
+        iau_doi: str,
+        directory: str,
+        output_format: OutputFormat = OutputFormat.WKT,
+        projection_catalogue: Optional[str] = None,
+        selection: Optional[Selection] = None,
+    ):
+        """Creates a watcher.
+
+        Args:
+            iau_report (str): IAU report
+            iau_version (int): year of the IAU report
+            iau_doi (str): DOI of the IAU report
+            directory (str): output directory
+            output_format (OutputFormat, optional): WKT or JSONL. Defaults
+            to OutputFormat.WKT.
+            projection_catalogue (Optional[str], optional): file of the
+            projection catalogue. Defaults to the built-in catalogue.
+            selection (Optional[Selection], optional): selection of the CRS.
+            Defaults to everything.
+
+        Raises:
+            ValueError: the format is not a text format
+        """
+        writer: IWriter = IWriter.create(output_format, directory)
+        if not isinstance(writer, TextWriter):
+            raise ValueError(
+                f"The {output_format.format_name} format cannot be watched"
+            )
+        self.__writer: TextWriter = writer
+        self.__iau_report: str = iau_report
+        self.__iau_version: int = iau_version
+        self.__iau_doi: str = iau_doi
+        self.__directory: str = directory
+        self.__projection_catalogue: Optional[str] = projection_catalogue
+        self.__selection: Optional[Selection] = selection
+        self.__catalogue: Optional[ProjectionCatalogue] = None
+        # modification time and size of the inputs
+        self.__stamps: Dict[str, Tuple[int, int]] = dict()
+        # signature of the description and text of the CRS, by Naif ID
+        self.__signatures: Dict[int, str] = dict()
+        self.__texts: Dict[int, str] = dict()
+
+    @property
+    def path(self) -> str:
+        """The output.
+
+        :getter: Returns the path of the output
+        :type: str
+        """
+        return self.__writer.path
+
+    @property
+    def inputs(self) -> List[str]:
+        """The watched inputs.
+
+        :getter: Returns the IAU report and the projection catalogue
+        :type: List[str]
+        """
+        if self.__projection_catalogue is None:
+            return [self.__iau_report]
+        return [self.__iau_report, self.__projection_catalogue]
+
+    def _changed_inputs(self) -> List[str]:
+        """Returns the inputs modified since the last refresh.
+
+        Returns:
+            List[str]: the modified inputs
+        """
+        changed: List[str] = list()
+        for path in self.inputs:
+            stat: os.stat_result = os.stat(path)
+            stamp: Tuple[int, int] = (stat.st_mtime_ns, stat.st_size)
+            if self.__stamps.get(path) != stamp:
+                self.__stamps[path] = stamp
+                changed.append(path)
+        return changed
+
+    def _text(self, library: CsvforwktLib, naif_id: int) -> str:
+        """Returns the text of the CRS of a body.
+
+        Args:
+            library (CsvforwktLib): library reading the current report
+            naif_id (int): Naif ID of the body
+
+        Returns:
+            str: the text of the CRS, empty when no CRS is selected
+        """
+        body_crs: Dict[int, ICrs] = library.process_body(naif_id)
+        return "".join(
+            self.__writer.to_text(naif_id, crs) + self.__writer.SEPARATOR
+            for crs in body_crs.values()
+        )
+
+    def refresh(self) -> Optional[List[int]]:
+        """Regenerates the bodies whose inputs changed.
+
+        Returns:
+            Optional[List[int]]: the sorted Naif IDs of the bodies generated
+            again or removed, None when the inputs are not modified
+        """
+        changed: List[str] = self._changed_inputs()
+        if len(changed) == 0:
+            return None
+        start: float = time.perf_counter()
+        if self.__catalogue is None or self.__projection_catalogue in changed:
+            self.__catalogue = (
+                ProjectionCatalogue.default()
+                if self.__projection_catalogue is None
+                else ProjectionCatalogue.load(self.__projection_catalogue)
+            )
+            # the projections of all the bodies may change
+            self.__signatures.clear()
+        library = CsvforwktLib(
+            self.__iau_report,
+            self.__iau_version,
+            self.__iau_doi,
+            self.__directory,
+            projection_catalogue=self.__catalogue,
+            selection=self.__selection,
+        )
+        descriptions: Dict[int, Tuple[bool, Dict[str, Any]]] = (
+            library.body_descriptions()
+        )
+        bodies: List[int] = sorted(self.__texts.keys() - descriptions.keys())
+        for naif_id in bodies:
+            del self.__texts[naif_id]
+            self.__signatures.pop(naif_id, None)
+        modified: bool = len(bodies) > 0
+        for naif_id, description in descriptions.items():
+            # repr is stable for the missing values (nan)
+            signature: str = repr(description)
+            if self.__signatures.get(naif_id) != signature:
+                text: str = self._text(library, naif_id)
+                modified |= self.__texts.get(naif_id) != text
+                self.__texts[naif_id] = text
+                self.__signatures[naif_id] = signature
+                bodies.append(naif_id)
+        if modified:
+            self._write()
+        logger.info(
+            f"{len(bodies)} bodies generated again in {time.perf_counter() - start:.3f} s"
+        )
+        return sorted(bodies)
+
+    def _write(self):
+        """Replaces the output by the text of the bodies, sorted by Naif ID."""
+        descriptor, temporary = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(self.path)),
+            prefix=".",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                for naif_id in sorted(self.__texts.keys()):
+                    file.write(self.__texts[naif_id])
+            os.chmod(temporary, 0o644)
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def watch(self, interval: float = DEFAULT_INTERVAL):
+        """Polls the inputs and regenerates the output until interrupted.
+
+        An invalid input is reported and the output is kept until the input
+        is modified again.
+
+        Args:
+            interval (float, optional): time in seconds between two polls.
+            Defaults to DEFAULT_INTERVAL.
+        """
+        while True:
+            try:
+                self.refresh()
+            except Exception as error:  # pylint: disable=broad-except
+                logger.error(f"The output is not updated: {error}")
+            time.sleep(interval)
@@ -0,0 +1,546 @@
+# -*- coding: utf-8 -*-
+"""This module is responsible to write the generated Coordinate Reference
+Systems in the different output formats.
+
+The writers consume an iterable of (Naif_id, {IAU code: CRS}) tuples, the
+same structure as the one returned by `CsvforwktLib.process`, so that the
+CRS can be written as soon as they are generated.
+"""
+import json
+import logging
+import os
+from abc import ABCMeta
+from abc import abstractmethod
+from enum import Enum
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from .body import Ellipsoid
+from .body import Sphere
+from .body import Triaxial
+from .checkpoint import Checkpoint
+from .crs import BodyCrs
+from .crs import ICrs
+from .crs import ProjectionBody
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+
+class OutputFormat(Enum):
+    """The supported output formats."""
+
+    WKT = ("wkt", "iau.wkt")
+    PARQUET = ("parquet", "iau.parquet")
+    ARROW = ("arrow", "iau.arrow")
+    JSONL = ("jsonl", "iau.jsonl")
+
+    def __init__(self, format_name: str, filename: str):
+        """Creates the enum
+
+        Args:
+            format_name (str): name of the format
+            filename (str): name of the file that is written
+        """
+        self.format_name: str = format_name
+        self.filename: str = filename
+
+    @staticmethod
+    def from_name(format_name: str) -> "OutputFormat":
+        """Returns the output format from its name.
+
+        Args:
+            format_name (str): name of the format
+
+        Raises:
+            ValueError: Unknown output format
+
+        Returns:
+            OutputFormat: the output format
+        """
+        for output_format in OutputFormat:
+            if output_format.format_name == format_name.lower():
+                return output_format
+        raise ValueError(f"Unknown output format: {format_name}")
+
+
+class CrsRecord:  # pylint: disable=too-few-public-methods
+    """Flat description of a Coordinate Reference System."""
+
+    FIELDS: Tuple[str, ...] = (
+        "iau_code",
+        "naif_id",
+        "body",
+        "crs_type",
+        "shape",
+        "radius",
+        "semi_major",
+        "semi_median",
+        "semi_minor",
+        "inverse_flattening",
+        "projection_id",
+        "projection_name",
+        "projection_method",
+        "direction",
+        "wkt",
+    )
+
+    @staticmethod
+    def create(naif_id: int, crs: ICrs) -> Dict[str, Any]:
+        """Create the flat description of a CRS.
+
+        The radius is the sphere radius, the semi major axis of the ellipsoid
+        or the semi major axis of the triaxial body. The semi axes are only
+        filled for triaxial bodies.
+
+        Args:
+            naif_id (int): Naif ID of the body
+            crs (ICrs): the CRS to describe
+
+        Returns:
+            Dict[str, Any]: the record, with the keys defined in FIELDS
+        """
+        body_crs: BodyCrs
+        projection: Optional[List[Any]]
+        if isinstance(crs, ProjectionBody):
+            body_crs = crs.body_crs
+            projection = crs.projection
+        else:
+            body_crs = crs  # type: ignore
+            projection = None
+
+        body = body_crs.datum.body
+        record: Dict[str, Any] = dict.fromkeys(CrsRecord.FIELDS)
+        record["iau_code"] = int(crs.iau_code)
+        record["naif_id"] = int(naif_id)
+        record["body"] = body.name
+        record["crs_type"] = body_crs.crs_type.value
+        record["shape"] = body.shape.value
+        record["direction"] = body_crs.direction
+        if isinstance(body, Sphere):
+            record["radius"] = float(body.radius)
+            record["inverse_flattening"] = 0.0
+        elif isinstance(body, Ellipsoid):
+            record["radius"] = float(body.radius)
+            record["inverse_flattening"] = float(body.inverse_flat)
+        elif isinstance(body, Triaxial):
+            record["radius"] = float(body.semi_major)
+            record["semi_major"] = float(body.semi_major)
+            record["semi_median"] = float(body.semi_median)
+            record["semi_minor"] = float(body.semi_minor)
+        if projection is not None:
+            record["projection_id"] = int(projection[0])
+            record["projection_name"] = projection[1]
+            record["projection_method"] = projection[2]
+        with span("wkt", code=crs.iau_code, kind=type(crs).__name__):
+            record["wkt"] = crs.wkt()
+        return record
+
+
+class IWriter(metaclass=ABCMeta):
+    """Interface describing a writer of CRS."""
+
+    def __init__(self, path: str, batch_size: int = 1000):
+        """Creates a writer.
+
+        Args:
+            path (str): path of the file to write
+            batch_size (int, optional): number of CRS written before the
+            output is flushed. Defaults to 1000.
+        """
+        self.__path: str = path
+        self.__batch_size: int = batch_size
+
+    @property
+    def path(self) -> str:
+        """The path of the written file.
+
+        :getter: Returns the path of the file
+        :type: str
+        """
+        return self.__path
+
+    @property
+    def batch_size(self) -> int:
+        """The number of CRS written before the output is flushed.
+
+        :getter: Returns the batch size
+        :type: int
+        """
+        return self.__batch_size
+
+    @abstractmethod
+    def write(self, bodies: Iterable[Tuple[int, Dict[int, ICrs]]]) -> int:
+        """Writes the CRS.
+
+        Args:
+            bodies (Iterable[Tuple[int, Dict[int, ICrs]]]): CRS group by body
+
+        Raises:
+            NotImplementedError: Not implemented
+
+        Returns:
+            int: number of written CRS
+        """
+        raise NotImplementedError("Not implemented")
+
+    @staticmethod
+    def create(
+        output_format: OutputFormat,
+        directory: str,
+        batch_size: int = 1000,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> "IWriter":
+        """Create a writer.
+
+        Args:
+            output_format (OutputFormat): format of the output
+            directory (str): output directory
+            batch_size (int, optional): number of CRS written before the
+            output is flushed. Defaults to 1000.
+            checkpoint (Optional[Checkpoint], optional): checkpoint of the
+            output, for the WKT and JSON Lines formats. Defaults to None.
+
+        Raises:
+            ValueError: Unsupported output format
+
+        Returns:
+            IWriter: the writer
+        """
+        path: str = os.path.join(directory, output_format.filename)
+        result: IWriter
+        if checkpoint is not None and output_format in (
+            OutputFormat.PARQUET,
+            OutputFormat.ARROW,
+        ):
+            raise ValueError(
+                f"The {output_format.format_name} format cannot be checkpointed"
+            )
+        if output_format == OutputFormat.WKT:
+            result = WktWriter(path, batch_size, checkpoint)
+        elif output_format in (OutputFormat.PARQUET, OutputFormat.ARROW):
+            result = ArrowWriter(path, output_format, batch_size)
+        elif output_format == OutputFormat.JSONL:
+            result = JsonlWriter(path, batch_size, checkpoint)
+        else:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        return result
+
+
+class TextWriter(IWriter):
+    """Writes the CRS as text, one after the other.
+
+    With a checkpoint, the progress is saved after the bodies once the
+    interval of the checkpoint is elapsed. When the checkpoint is loaded, the
+    output is truncated after the last body of the checkpoint and the
+    following bodies are appended.
+    """
+
+    # written after each CRS
+    SEPARATOR: str = "\n"
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 1000,
+        checkpoint: Optional[Checkpoint] = None,
+    ):
+        """Creates a text writer.
+
+        Args:
+            path (str): path of the file to write
+            batch_size (int, optional): number of CRS written before the
+            output is flushed. Defaults to 1000.
+            checkpoint (Optional[Checkpoint], optional): checkpoint of the
+            output. Defaults to None.
+        """
+        super().__init__(path, batch_size)
+        self.__checkpoint: Optional[Checkpoint] = checkpoint
+
+    @property
+    def checkpoint(self) -> Optional[Checkpoint]:
+        """The checkpoint of the output.
+
+        :getter: Returns the checkpoint, None without checkpoint
+        :type: Optional[Checkpoint]
+        """
+        return self.__checkpoint
+
+    @abstractmethod
+    def to_text(self, naif_id: int, crs: ICrs) -> str:
+        """Returns the text of a CRS, without the separator.
+
+        Args:
+            naif_id (int): Naif ID of the body
+            crs (ICrs): the CRS
+
+        Raises:
+            NotImplementedError: Not implemented
+
+        Returns:
+            str: the text
+        """
+        raise NotImplementedError("Not implemented")
+
+    def write(self, bodies: Iterable[Tuple[int, Dict[int, ICrs]]]) -> int:
+        """Writes the CRS.
+
+        The bodies already written according to the checkpoint must be
+        removed from the bodies by the caller.
+
+        Args:
+            bodies (Iterable[Tuple[int, Dict[int, ICrs]]]): CRS group by body
+
+        Returns:
+            int: number of written CRS, including the ones written before
+            the checkpoint
+        """
+        checkpoint: Optional[Checkpoint] = self.checkpoint
+        nb_crs: int = 0
+        mode: str = "w"
+        if checkpoint is not None and checkpoint.naif_id is not None:
+            # removes the partial body written after the checkpoint
+            os.truncate(self.path, checkpoint.offset)
+            nb_crs = checkpoint.nb_crs
+            mode = "a"
+        with open(self.path, mode, encoding="utf-8") as file:
+            for naif_id, body_crs in bodies:
+                for crs in body_crs.values():
+                    file.write(self.to_text(naif_id, crs))
+                    file.write(self.SEPARATOR)
+                    nb_crs += 1
+                    if nb_crs % self.batch_size == 0:
+                        file.flush()
+                if checkpoint is not None and checkpoint.is_due():
+                    file.flush()
+                    os.fsync(file.fileno())
+                    checkpoint.save(naif_id, file.tell(), nb_crs)
+        if checkpoint is not None:
+            checkpoint.remove()
+        return nb_crs
+
+
+class WktWriter(TextWriter):
+    """Writes the CRS as WKT separated by a blank line."""
+
+    SEPARATOR: str = "\n\n"
+
+    def to_text(self, naif_id: int, crs: ICrs) -> str:
+        """Returns the WKT of a CRS.
+
+        Args:
+            naif_id (int): Naif ID of the body
+            crs (ICrs): the CRS
+
+        Returns:
+            str: the WKT
+        """
+        with span("wkt", code=crs.iau_code, kind=type(crs).__name__):
+            return crs.wkt()
+
+
+class JsonlWriter(TextWriter):
+    """Writes one JSON object by CRS and by line (JSON Lines).
+
+    The file is flushed every `batch_size` CRS so that a consumer reading
+    the file can process the CRS before the end of the run.
+    """
+
+    @staticmethod
+    def to_json(naif_id: int, crs: ICrs) -> str:
+        """Returns the self-describing JSON object of a CRS on one line.
+
+        Args:
+            naif_id (int): Naif ID of the body
+            crs (ICrs): the CRS
+
+        Returns:
+            str: the JSON object
+        """
+        record: Dict[str, Any] = CrsRecord.create(naif_id, crs)
+        projection: Optional[Dict[str, Any]] = None
+        if record["projection_id"] is not None:
+            projection = {
+                "id": record["projection_id"],
+                "name": record["projection_name"],
+                "method": record["projection_method"],
+            }
+        return json.dumps(
+            {
+                "code": record["iau_code"],
+                "body": record["body"],
+                "naif_id": record["naif_id"],
+                "type": record["crs_type"],
+                "shape": record["shape"],
+                "direction": record["direction"],
+                "projection": projection,
+                "wkt": record["wkt"],
+            },
+            ensure_ascii=False,
+        )
+
+    def to_text(self, naif_id: int, crs: ICrs) -> str:
+        """Returns the JSON object of a CRS on one line.
+
+        Args:
+            naif_id (int): Naif ID of the body
+            crs (ICrs): the CRS
+
+        Returns:
+            str: the JSON object
+        """
+        return JsonlWriter.to_json(naif_id, crs)
+
+
+class ArrowWriter(IWriter):
+    """Writes the CRS as a columnar table (Parquet or Arrow IPC file).
+
+    The table is written by record batches of `batch_size` CRS. Each batch is
+    a row group in the Parquet file, so that readers can filter the rows
+    with the column statistics.
+    """
+
+    def __init__(
+        self, path: str, output_format: OutputFormat, batch_size: int = 1000
+    ):
+        """Creates a columnar writer.
+
+        Args:
+            path (str): path of the file to write
+            output_format (OutputFormat): PARQUET or ARROW
+            batch_size (int, optional): number of CRS by record batch.
+            Defaults to 1000.
+        """
+        super().__init__(path, batch_size)
+        self.__output_format: OutputFormat = output_format
+
+    @property
+    def output_format(self) -> OutputFormat:
+        """The columnar format.
+
+        :getter: Returns the columnar format
+        :type: OutputFormat
+        """
+        return self.__output_format
+
+    @staticmethod
+    def schema():
+        """Returns the Arrow schema of the CRS records.
+
+        Raises:
+            ImportError: pyarrow is not installed
+
+        Returns:
+            pyarrow.Schema: the schema
+        """
+        try:
+            import pyarrow as pa  # pylint: disable=import-outside-toplevel
+        except ImportError as error:
+            raise ImportError(
+                "pyarrow is required for the parquet and arrow formats: pip install pyarrow"
+            ) from error
+        return pa.schema(
+            [
+                ("iau_code", pa.int64()),
+                ("naif_id", pa.int64()),
+                ("body", pa.string()),
+                ("crs_type", pa.string()),
+                ("shape", pa.string()),
+                ("radius", pa.float64()),
+                ("semi_major", pa.float64()),
+                ("semi_median", pa.float64()),
+                ("semi_minor", pa.float64()),
+                ("inverse_flattening", pa.float64()),
+                ("projection_id", pa.int32()),
+                ("projection_name", pa.string()),
+                ("projection_method", pa.string()),
+                ("direction", pa.string()),
+                ("wkt", pa.string()),
+            ]
+        )
+
+    def _open(self, schema):
+        """Opens the file writer.
+
+        Args:
+            schema (pyarrow.Schema): schema of the table
+
+        Returns:
+            the Parquet or Arrow IPC writer
+        """
+        # pylint: disable=import-outside-toplevel
+        if self.output_format == OutputFormat.PARQUET:
+            import pyarrow.parquet as pq
+
+            return pq.ParquetWriter(self.path, schema)
+
+        import pyarrow as pa
+
+        return pa.ipc.new_file(self.path, schema)
+
+    def write(self, bodies: Iterable[Tuple[int, Dict[int, ICrs]]]) -> int:
+        """Writes the CRS as a columnar table.
+
+        Args:
+            bodies (Iterable[Tuple[int, Dict[int, ICrs]]]): CRS group by body
+
+        Returns:
+            int: number of written CRS
+        """
+        return self.write_records(
+            CrsRecord.create(naif_id, crs)
+            for naif_id, body_crs in bodies
+            for crs in body_crs.values()
+        )
+
+    def write_records(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Writes the records of the CRS as a columnar table.
+
+        Args:
+            records (Iterable[Dict[str, Any]]): records with the keys defined
+            in CrsRecord.FIELDS
+
+        Returns:
+            int: number of written CRS
+        """
+        schema = ArrowWriter.schema()
+        columns: Dict[str, List[Any]] = {
+            field: list() for field in CrsRecord.FIELDS
+        }
+        nb_crs: int = 0
+        writer = self._open(schema)
+        try:
+            for record in records:
+                for field in CrsRecord.FIELDS:
+                    columns[field].append(record[field])
+                nb_crs += 1
+                if nb_crs % self.batch_size == 0:
+                    self._write_batch(writer, columns, schema)
+            if len(columns["iau_code"]) > 0:
+                self._write_batch(writer, columns, schema)
+        finally:
+            writer.close()
+        logger.debug(f"{nb_crs} CRS written in {self.path}")
+        return nb_crs
+
+    def _write_batch(self, writer, columns: Dict[str, List[Any]], schema):
+        """Writes the pending rows as one record batch and clears them.
+
+        Args:
+            writer: Parquet or Arrow IPC writer
+            columns (Dict[str, List[Any]]): pending rows by column
+            schema (pyarrow.Schema): schema of the table
+        """
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+        batch = pa.RecordBatch.from_pydict(columns, schema=schema)
+        if self.output_format == OutputFormat.PARQUET:
+            writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            writer.write_batch(batch)
+        for values in columns.values():
+            values.clear()
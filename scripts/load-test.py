@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Load test of the WKT service (csvforwkt serve).
+
+Sends GET requests on random IAU codes with several clients and reports
+the throughput and the latency percentiles.
+
+Example:
+    python scripts/load-test.py http://127.0.0.1:8080/IAU/2015 \
+        --clients 8 --requests 10000
+"""
+import argparse
+import http.client
+import json
+import random
+import statistics
+import threading
+import time
+from typing import List
+from urllib.parse import urlsplit
+
+
+def percentile(values: List[float], rank: float) -> float:
+    """Returns the percentile of sorted values.
+
+    Args:
+        values (List[float]): sorted values
+        rank (float): percentile between 0 and 100
+
+    Returns:
+        float: the percentile
+    """
+    index = min(len(values) - 1, max(0, round(rank / 100 * len(values)) - 1))
+    return values[index]
+
+
+def client(
+    url: str,
+    codes: List[int],
+    nb_requests: int,
+    etag: bool,
+    latencies: List[float],
+):
+    """Sends the requests with a persistent connection.
+
+    Args:
+        url (str): URL of the catalogue
+        codes (List[int]): IAU codes
+        nb_requests (int): number of requests
+        etag (bool): True to send the conditional requests
+        latencies (List[float]): latencies in s
+    """
+    split = urlsplit(url)
+    connection = http.client.HTTPConnection(split.hostname, split.port)
+    etags = dict()
+    result: List[float] = list()
+    for _ in range(nb_requests):
+        code = random.choice(codes)
+        headers = {}
+        if etag and code in etags:
+            headers["If-None-Match"] = etags[code]
+        start = time.perf_counter()
+        connection.request("GET", f"{split.path}/{code}", headers=headers)
+        response = connection.getresponse()
+        response.read()
+        result.append(time.perf_counter() - start)
+        if response.status not in (200, 304):
+            raise RuntimeError(f"{code}: HTTP {response.status}")
+        etags[code] = response.getheader("ETag")
+    connection.close()
+    latencies.extend(result)
+
+
+def main():
+    """Runs the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("url", help="URL of the catalogue")
+    parser.add_argument(
+        "--clients", type=int, default=4, help="Number of concurrent clients"
+    )
+    parser.add_argument(
+        "--requests", type=int, default=1000, help="Requests per client"
+    )
+    parser.add_argument(
+        "--etag", action="store_true", help="Send conditional requests"
+    )
+    options = parser.parse_args()
+
+    split = urlsplit(options.url)
+    connection = http.client.HTTPConnection(split.hostname, split.port)
+    connection.request("GET", split.path)
+    codes: List[int] = json.loads(connection.getresponse().read())
+    connection.close()
+
+    latencies: List[float] = list()
+    threads = [
+        threading.Thread(
+            target=client,
+            args=(options.url, codes, options.requests, options.etag, latencies),
+        )
+        for _ in range(options.clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"requests   : {len(latencies)}")
+    print(f"throughput : {len(latencies) / elapsed:.0f} req/s")
+    print(f"mean       : {statistics.mean(latencies) * 1000:.3f} ms")
+    for rank in (50, 95, 99):
+        print(f"p{rank:<9} : {percentile(latencies, rank) * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -46,8 +46,13 @@ setuptools.setup(
         "License :: OSI Approved :: GNU General Public License v3 (GPLv3)GNU Lesser General Public License v3 (LGPLv3)",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.8",
     install_requires=required,
+    extras_require={
+        "arrow": ["pyarrow"],
+        "toml": ["tomli; python_version < '3.11'"],
+        "projjson": ["pyproj"],
+    },
     entry_points={
         "console_scripts": [
             about["__name_soft__"]
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pandas as pd
+
+from csvforwkt.benchmark import Benchmark
+from csvforwkt.benchmark import scale_report
+
+IAU_DATA = "data/naifcodes_radii_m_wAsteroids_IAU2015.csv"
+IAU_DOI = "doi:10.1007/s10569-017-9805-5"
+
+
+def test_scale_report():
+    df_bodies = pd.read_csv(IAU_DATA)
+    scaled = scale_report(df_bodies, 400)
+    assert scaled.shape[0] == 400
+    nb_rows = df_bodies.shape[0]
+    first = set(scaled["Naif_id"][:nb_rows])
+    assert first.isdisjoint(scaled["Naif_id"][nb_rows:])
+
+
+def test_benchmark(tmp_path):
+    benchmark = Benchmark(IAU_DATA, 2015, IAU_DOI, [50, 300], repeat=1)
+    results = benchmark.run()
+    assert results["environment"]["python"]
+    assert [result["size"] for result in results["results"]] == [50, 300]
+    for result in results["results"]:
+        assert set(result["stages"]) == set(Benchmark.STAGES)
+        assert set(result["renderers"]) == set(Benchmark.RENDERERS)
+        assert result["stages"]["init_iau_report"]["items"] == result["size"]
+        assert result["stages"]["save"]["output_bytes"] > 0
+        assert result["renderers"]["BodyCrs"]["peak_bytes"] > 0
+
+    path = tmp_path / "benchmark.json"
+    Benchmark.save(results, str(path))
+    assert json.loads(path.read_text())["results"][0]["size"] == 50
+    assert "ProjectionBody" in Benchmark.format_table(results)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from csvforwkt import catalogue as catalogue_module
+
+from csvforwkt.catalogue import PROJECTION_DATA
+from csvforwkt.catalogue import ProjectionCatalogue
+from csvforwkt.catalogue import ProjectionDefinition
+from csvforwkt.crs import Conversion
+from csvforwkt.csvforwkt import CsvforwktLib
+
+IAU_DATA = "data/naifcodes_radii_m_wAsteroids_IAU2015.csv"
+IAU_DOI = "doi:10.1007/s10569-017-9805-5"
+
+
+def test_default_catalogue():
+    catalogue = ProjectionCatalogue.default()
+    assert len(catalogue) == len(PROJECTION_DATA)
+    assert catalogue.get(90).sphere_only
+    assert not catalogue.get(10).sphere_only
+    assert [definition.to_list() for definition in catalogue] == [
+        list(projection) for projection in PROJECTION_DATA
+    ]
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        ProjectionDefinition.create(
+            {"offset": 12, "name": "bad", "method": "Mollweide"}
+        )
+    with pytest.raises(ValueError):
+        ProjectionDefinition.create(
+            {"offset": 10, "name": "bad", "method": "Unknown"}
+        )
+    with pytest.raises(ValueError):
+        ProjectionDefinition.create(
+            {
+                "offset": 10,
+                "name": "bad",
+                "method": "Mollweide",
+                "parameters": {"Unknown": 0},
+            }
+        )
+    definition = ProjectionDefinition.create(
+        {"offset": 10, "name": "Mollweide", "method": "Mollweide"}
+    )
+    with pytest.raises(ValueError):
+        ProjectionCatalogue([definition, definition])
+
+
+@pytest.mark.parametrize(
+    "content,message",
+    [
+        ([], "a dictionary is expected"),
+        ({"projections": {"offset": 10}}, "a list is expected"),
+        ({"projections": ["Mollweide"]}, "Invalid projection 'Mollweide'"),
+        (
+            {
+                "methods": {"Custom": ["EPSG"]},
+                "projections": [
+                    {"offset": 10, "name": "custom", "method": "Custom"}
+                ],
+            },
+            "of Custom for custom",
+        ),
+        (
+            {
+                "parameters": {"Custom": ["EPSG", 1]},
+                "projections": [
+                    {
+                        "offset": 10,
+                        "name": "custom",
+                        "method": "Mollweide",
+                        "parameters": {"Custom": 0},
+                    }
+                ],
+            },
+            "of Custom for custom",
+        ),
+        ({"methods": ["Custom"], "projections": []}, "Invalid methods"),
+    ],
+)
+def test_invalid_catalogue(content, message):
+    with pytest.raises(ValueError, match=message):
+        ProjectionCatalogue.compile(content)
+
+
+def test_conversion():
+    definition = ProjectionCatalogue.default().get(40)
+    conversion = Conversion(
+        definition.name, definition.method, "METHOD", definition
+    )
+    assert conversion.wkt() == definition.wkt()
+    with pytest.raises(ValueError, match="Conversion other"):
+        Conversion("other", definition.method, "METHOD", definition)
+    with pytest.raises(ValueError, match="Method Robinson"):
+        Conversion(definition.name, "Robinson", "METHOD", definition)
+
+
+def test_load_catalogue(tmp_path):
+    path = os.path.join(tmp_path, "projections.json")
+    ProjectionCatalogue.default().dump(path)
+    cache = os.path.join(tmp_path, "cache")
+    catalogue = ProjectionCatalogue.load(path, cache_directory=cache)
+    assert len(os.listdir(cache)) == 1
+    cached = ProjectionCatalogue.load(path, cache_directory=cache)
+    assert [definition.wkt() for definition in cached] == [
+        definition.wkt() for definition in ProjectionCatalogue.default()
+    ]
+    assert catalogue.offsets == cached.offsets
+
+    # the cache is plain data, an invalid cache is compiled again
+    (cache_file,) = os.listdir(cache)
+    assert cache_file.endswith(".json")
+    with open(os.path.join(cache, cache_file), "w", encoding="utf-8") as file:
+        file.write('{"projections": 1}')
+    cached = ProjectionCatalogue.load(path, cache_directory=cache)
+    assert catalogue.offsets == cached.offsets
+
+
+def test_cache_key_of_the_built_ins(tmp_path, monkeypatch):
+    path = os.path.join(tmp_path, "projections.json")
+    ProjectionCatalogue.default().dump(path)
+    cache = os.path.join(tmp_path, "cache")
+    ProjectionCatalogue.load(path, cache_directory=cache)
+    mapping = dict(catalogue_module.METHOD_AND_PARAM_MAPPING)
+    mapping["Mollweide"] = ["EPSG", 1]
+    monkeypatch.setattr(catalogue_module, "METHOD_AND_PARAM_MAPPING", mapping)
+    catalogue = ProjectionCatalogue.load(path, cache_directory=cache)
+    assert len(os.listdir(cache)) == 2
+    assert 'ID["EPSG", 1]' in catalogue.get(40).wkt()
+
+
+def test_load_csv_catalogue(tmp_path):
+    path = os.path.join(tmp_path, "projections.csv")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("offset,name,method,parameters\n")
+        file.write(
+            '10,"Mollweide, clon = 0",Mollweide,Longitude of natural origin,0,False easting,0,False northing,0\n'
+        )
+    catalogue = ProjectionCatalogue.load(path, use_cache=False)
+    library = CsvforwktLib(
+        IAU_DATA, 2015, IAU_DOI, str(tmp_path), projection_catalogue=catalogue
+    )
+    crs = library.process()
+    assert 49910 in crs[499]
+    assert 49915 not in crs[499]
+    assert 'METHOD["Mollweide"' in crs[499][49910].wkt()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import os
+import zipfile
+
+import pytest
+
+from csvforwkt.__main__ import _checkpoint
+from csvforwkt.__main__ import generate
+from csvforwkt.__main__ import parse_cli
+from csvforwkt.checkpoint import Checkpoint
+from csvforwkt.csvforwkt import CsvforwktLib
+
+IAU_DATA = "data/naifcodes_radii_m_wAsteroids_IAU2015.csv"
+IAU_DOI = "doi:10.1007/s10569-017-9805-5"
+IAU_ZIP = "tests/iau.zip"
+
+
+def interrupted(bodies, nb_bodies):
+    for index, body in enumerate(bodies):
+        if index == nb_bodies:
+            raise RuntimeError("interrupted")
+        yield body
+
+
+def test_resume(tmp_path):
+    path = str(tmp_path / "iau.wkt")
+    fingerprint = Checkpoint.create_fingerprint([IAU_DATA], {"format": "wkt"})
+    library = CsvforwktLib(IAU_DATA, 2015, IAU_DOI, str(tmp_path))
+    with pytest.raises(RuntimeError):
+        library.save_iter(
+            interrupted(library.iter_process(), 40),
+            "wkt",
+            checkpoint=Checkpoint(path, fingerprint, 0),
+        )
+    # a partial body after the checkpoint
+    with open(path, "a", encoding="utf-8") as file:
+        file.write('GEOGCRS["Partial')
+
+    checkpoint = Checkpoint(path, fingerprint, 0)
+    assert checkpoint.load()
+    assert checkpoint.nb_crs > 0
+    library = CsvforwktLib(IAU_DATA, 2015, IAU_DOI, str(tmp_path))
+    library.save_iter(
+        library.iter_process(checkpoint.naif_id), "wkt", checkpoint=checkpoint
+    )
+    with zipfile.ZipFile(IAU_ZIP) as archive:
+        with open(path, "rb") as file:
+            assert file.read() == archive.read("iau.wkt")
+    assert not os.path.exists(checkpoint.path)
+
+
+def test_invalid_checkpoint(tmp_path):
+    path = str(tmp_path / "iau.jsonl")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("{}\n")
+    Checkpoint(path, "abc").save(10, 3, 1)
+    with pytest.raises(ValueError, match="changed"):
+        Checkpoint(path, "abd").load()
+    Checkpoint(path, "abc").save(10, 4, 1)
+    with pytest.raises(ValueError, match="shorter"):
+        Checkpoint(path, "abc").load()
+    library = CsvforwktLib(IAU_DATA, 2015, IAU_DOI, str(tmp_path))
+    with pytest.raises(ValueError, match="cannot be checkpointed"):
+        library.save_iter(
+            library.iter_process(), "parquet", checkpoint=Checkpoint(path, "")
+        )
+
+
+def test_resume_cli(tmp_path):
+    arguments = [
+        "--iau_report",
+        IAU_DATA,
+        "--iau_version",
+        "2015",
+        "--iau_doi",
+        IAU_DOI,
+        "--output_directory",
+        str(tmp_path),
+        "--format",
+        "jsonl",
+        "--bodies",
+        "Mars,Phobos",
+        "--resume",
+    ]
+    # without checkpoint, the run starts from the beginning
+    generate(parse_cli(arguments))
+    expected = (tmp_path / "iau.jsonl").read_text()
+    assert not os.path.exists(str(tmp_path / "iau.jsonl.checkpoint"))
+
+    # Phobos written, Mars partially written
+    options = parse_cli(arguments)
+    checkpoint = _checkpoint(options)
+    offset = expected.index('{"code": 49900')
+    checkpoint.save(
+        401,
+        len(expected[:offset].encode("utf-8")),
+        expected[:offset].count("\n"),
+    )
+    (tmp_path / "iau.jsonl").write_text(expected[: offset + 10])
+    generate(options)
+    assert (tmp_path / "iau.jsonl").read_text() == expected
+    checkpoint.save(401, offset, 0)
+    with pytest.raises(ValueError, match="changed"):
+        generate(parse_cli(arguments + ["--shard", "1/1"]))
@@ -2,13 +2,18 @@
 import logging
 import re
 import subprocess
+import threading
 from typing import Dict
 
 import pytest
 
 import csvforwkt
+from csvforwkt.__main__ import SigintHandler
 from csvforwkt.crs import ICrs
 from csvforwkt.csvforwkt import CsvforwktLib
+from csvforwkt.custom_logging import QueueLogging
+from csvforwkt.custom_logging import TRACE
+from csvforwkt.custom_logging import WarningAggregator
 
 # import numpy as np
 
@@ -118,6 +123,151 @@ def test_color_formatter():
     shell_formatter.format(record)
 
 
+def test_warning_aggregator(caplog):
+    aggregator = WarningAggregator(
+        logging.getLogger("test.aggregator"), samples=2
+    )
+    with caplog.at_level(TRACE, logger="test.aggregator"):
+        for naif_id in (506, 507, 508):
+            aggregator.warn(
+                "no direction", naif_id, "No direction known for {}", naif_id
+            )
+        aggregator.warn("invalid flattening", 1000005, "Not valid {}", 1)
+        assert aggregator.counts == {
+            "no direction": 3,
+            "invalid flattening": 1,
+        }
+        assert aggregator.flush("biaxial") == {
+            "no direction": 3,
+            "invalid flattening": 1,
+        }
+    # the color formatter of logging.conf colours the messages
+    warnings = [
+        re.sub(r"\x1b\[[0-9;]*m", "", record.getMessage())
+        for record in caplog.records
+        if record.levelno == logging.WARNING
+    ]
+    assert warnings == [
+        "biaxial - no direction : 3 (e.g. 506, 507, ...)",
+        "biaxial - invalid flattening : 1 (e.g. 1000005)",
+    ]
+    details = [
+        re.sub(r"\x1b\[[0-9;]*m", "", record.getMessage())
+        for record in caplog.records
+        if record.levelno == TRACE
+    ]
+    assert details[0] == "No direction known for 506"
+    assert len(details) == 4
+    assert aggregator.counts == {}
+
+
+def test_warning_aggregator_labels(caplog):
+    aggregator = WarningAggregator(logging.getLogger("test.labels"))
+    with caplog.at_level(logging.WARNING, logger="test.labels"):
+        with aggregator.labelled("biaxial"):
+            aggregator.warn("no direction", 506, "No direction")
+            with aggregator.labelled("projections"):
+                aggregator.warn("skipped", 50602, "Skipped")
+            aggregator.warn("no direction", 507, "No direction")
+        aggregator.warn("no direction", 508, "No direction")
+        assert aggregator.flush("save") == {"no direction": 3, "skipped": 1}
+    warnings = [
+        re.sub(r"\x1b\[[0-9;]*m", "", record.getMessage())
+        for record in caplog.records
+    ]
+    assert warnings == [
+        "biaxial - no direction : 2 (e.g. 506, 507)",
+        "projections - skipped : 1 (e.g. 50602)",
+        "save - no direction : 1 (e.g. 508)",
+    ]
+
+
+def test_streamed_warnings(caplog):
+    library = CsvforwktLib(
+        "data/naifcodes_radii_m_wAsteroids_IAU2015.csv",
+        2015,
+        "doi:10.1007/s10569-017-9805-5",
+        "/tmp",
+    )
+    with caplog.at_level(logging.WARNING, logger="csvforwkt"):
+        with library._stage("save"):
+            for _ in library.iter_process():
+                pass
+    warnings = [
+        re.sub(r"\x1b\[[0-9;]*m", "", record.getMessage())
+        for record in caplog.records
+        if " : " in record.getMessage()
+    ]
+    assert len(warnings) > 0
+    assert not any(warning.startswith("save") for warning in warnings)
+    assert any(
+        warning.startswith("biaxial - invalid flattening")
+        for warning in warnings
+    )
+
+
+def test_queue_logging():
+    class ListHandler(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.messages = list()
+            self.threads = set()
+
+        def emit(self, record):
+            self.messages.append(record.getMessage())
+            self.threads.add(threading.get_ident())
+
+    test_logger = logging.getLogger("test.queue")
+    # the color formatter of the root logger modifies the records
+    test_logger.propagate = False
+    handler = ListHandler()
+    test_logger.addHandler(handler)
+    try:
+        QueueLogging.start(["test.queue"])
+        assert QueueLogging.is_started()
+        assert handler not in test_logger.handlers
+        for index in range(100):
+            test_logger.warning(f"message {index}")
+        QueueLogging.stop()
+        assert not QueueLogging.is_started()
+        # the queued logs are written when the listener stops
+        assert handler.messages == [f"message {index}" for index in range(100)]
+        assert threading.get_ident() not in handler.threads
+        assert test_logger.handlers == [handler]
+    finally:
+        QueueLogging.stop()
+        test_logger.removeHandler(handler)
+
+
+def test_sigint_during_queue_logging():
+    test_logger = logging.getLogger("test.sigint")
+    test_logger.propagate = False
+    handler = logging.NullHandler()
+    test_logger.addHandler(handler)
+    sigint = SigintHandler()
+    try:
+        QueueLogging.start(["test.sigint"])
+        # the handler exits, the queued logs are written by run
+        with pytest.raises(SystemExit):
+            sigint.signal_handler(2, None)
+        assert sigint.SIGINT
+        assert QueueLogging.is_started()
+
+        # stop called by the thread holding the lock
+        def stop_with_lock():
+            with QueueLogging._QueueLogging__lock:
+                QueueLogging.stop()
+
+        thread = threading.Thread(target=stop_with_lock, daemon=True)
+        thread.start()
+        thread.join(5)
+        assert not thread.is_alive()
+        assert not QueueLogging.is_started()
+    finally:
+        QueueLogging.stop()
+        test_logger.removeHandler(handler)
+
+
 def test_iau(data):
     """Test the library output with the GDAL output.
 
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import time
+import zipfile
+
+import pytest
+
+from csvforwkt.__main__ import diff
+from csvforwkt.__main__ import parse_cli
+from csvforwkt.diff import CatalogueDiff
+from csvforwkt.diff import CrsDifference
+
+IAU_ZIP = "tests/iau.zip"
+
+
+@pytest.fixture(scope="module")
+def text():
+    with zipfile.ZipFile(IAU_ZIP) as archive:
+        return archive.read("iau.wkt").decode("utf-8")
+
+
+def write(directory, name, text):
+    path = directory / name
+    path.write_text(text)
+    return str(path)
+
+
+def test_normalize():
+    assert (
+        CatalogueDiff.normalize('A[ "x  y" ,\n\t B [1 , 2 ] ]')
+        == 'A["x y",B[1,2]]'
+    )
+    assert CatalogueDiff.normalize(
+        'REMARK["Use R_m = (a+b+c)/3 as mean radius. '
+        'Use mean radius as sphere for interoperability. "]'
+    ) == CatalogueDiff.normalize(
+        'REMARK["Use mean radius as sphere radius for interoperability. "]'
+    )
+
+
+def test_identical(text, tmp_path):
+    # same catalogue, in a zip file and with another layout
+    layout = write(tmp_path, "iau.wkt", text.replace("\t", "  "))
+    catalogue_diff = CatalogueDiff(IAU_ZIP, layout)
+    start = time.perf_counter()
+    assert catalogue_diff.compare() == []
+    assert time.perf_counter() - start < 2
+    assert catalogue_diff.nb_old == catalogue_diff.nb_new == 3462
+
+
+def test_differences(text, tmp_path):
+    crs = text.split("\n\n")
+    new = "\n\n".join(crs[2:] + [crs[0].replace("1000,", "1001,")])
+    new = new.replace('ANCHOR["Hun Kal : 20 W"]', 'ANCHOR["Hun Kal : 21 W"]')
+    new = new.replace("13000.0, 11400.0", "13000.0, 11500.0")
+    new = new.replace(
+        'AXIS["geodetic longitude (Lon)", west',
+        'AXIS["geodetic longitude (Lon)", east',
+        1,
+    )
+    differences = {
+        difference.code: difference
+        for difference in CatalogueDiff(
+            IAU_ZIP, write(tmp_path, "new.wkt", new)
+        ).compare()
+    }
+    assert differences[1000].status == CrsDifference.REMOVED
+    assert differences[1010].status == CrsDifference.REMOVED
+    assert differences[1001].status == CrsDifference.ADDED
+    assert differences[19900].fields == [
+        ("anchor", "Hun Kal : 20 W", "Hun Kal : 21 W")
+    ]
+    assert differences[19901].fields == [
+        ("anchor", "Hun Kal : 20 W", "Hun Kal : 21 W"),
+        ("direction", ("north", "west"), ("north", "east")),
+    ]
+    assert differences[40184].fields == [
+        ("radius", (13000.0, 11400.0, 9100.0), (13000.0, 11500.0, 9100.0))
+    ]
+    assert str(differences[1001]) == "1001 added"
+
+
+def test_diff_cli(text, tmp_path, capsys):
+    options = parse_cli(["diff", IAU_ZIP, IAU_ZIP])
+    assert options.level == "WARNING"
+    assert diff(options) == 0
+    new = write(tmp_path, "new.wkt", text.replace("695700000, 0", "1, 0"))
+    assert diff(parse_cli(["diff", IAU_ZIP, new])) == 3
+    assert "1000 changed: radius 695700000 -> 1" in capsys.readouterr().out
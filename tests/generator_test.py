@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+import pandas as pd
+import pytest
+
+from csvforwkt.csvforwkt import CsvforwktLib
+from csvforwkt.generator import BodyKind
+from csvforwkt.generator import CatalogueGenerator
+
+IAU_DOI = "doi:10.1007/s10569-017-9805-5"
+
+
+def test_reproducible(tmp_path):
+    first = tmp_path / "first.csv"
+    second = tmp_path / "second.csv"
+    assert CatalogueGenerator(2000, seed=7).write(str(first)) == 2000
+    CatalogueGenerator(2000, seed=7).write(str(second))
+    assert first.read_bytes() == second.read_bytes()
+    CatalogueGenerator(2000, seed=8).write(str(second))
+    assert first.read_bytes() != second.read_bytes()
+
+
+def test_process_synthetic_report(tmp_path):
+    report = tmp_path / "report.csv"
+    CatalogueGenerator(1000, seed=1).write(str(report))
+    df_bodies = pd.read_csv(report)
+    assert list(df_bodies.columns) == CatalogueGenerator.COLUMNS
+    assert df_bodies["Naif_id"].is_unique
+    assert (df_bodies["IAU2015_Semimajor"] == -1).any()
+    assert (df_bodies["IAU2015_Mean"] == -1).any()
+    assert df_bodies["rotation"].isna().any()
+    assert (df_bodies["rotation"] == "Retrograde").any()
+    assert df_bodies["origin_long_name"].notna().any()
+
+    crs = CsvforwktLib(str(report), 2015, IAU_DOI, str(tmp_path)).process()
+    assert len(crs) > 0
+
+
+def test_parse_mix():
+    mix = CatalogueGenerator.parse_mix("sphere=1,triaxial=3")
+    assert mix == {BodyKind.SPHERE: 1.0, BodyKind.TRIAXIAL: 3.0}
+    assert CatalogueGenerator(10, mix=mix).mix[BodyKind.TRIAXIAL] == 0.75
+    with pytest.raises(ValueError):
+        CatalogueGenerator.parse_mix("cube=1")
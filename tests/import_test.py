@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""Tests for the import time of the package."""
+import os
+import subprocess
+import sys
+from typing import Dict
+from typing import List
+
+import pytest
+
+# budget of the cumulative import time of the package, in microseconds,
+# checked by the performance gate only, the time depends on the machine
+IMPORT_BUDGET_US = 100_000
+TIMED = os.environ.get("CSVFORWKT_TIMED_TESTS") == "1"
+
+HEAVY_MODULES = ("pandas", "numpy", "logging.config")
+
+
+def import_times(*args: str) -> Dict[str, int]:
+    """Runs python with -X importtime and returns the cumulative import time
+    of each module in microseconds."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    times: Dict[str, int] = dict()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields: List[str] = line[len("import time:") :].split("|")
+        if not fields[1].strip().isdigit():
+            continue
+        times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def test_import_is_light():
+    times = import_times("-c", "import csvforwkt")
+    assert "csvforwkt" in times
+    for module in HEAVY_MODULES:
+        assert module not in times
+
+
+def test_version_is_light():
+    times = import_times("-m", "csvforwkt", "--version")
+    assert "pandas" not in times
+    assert "numpy" not in times
+    assert "importlib.metadata" in times
+
+
+@pytest.mark.skipif(not TIMED, reason="CSVFORWKT_TIMED_TESTS=1 is not set")
+def test_import_budget():
+    # the best of several runs, the first one can fill the caches
+    best: int = min(
+        import_times("-c", "import csvforwkt")["csvforwkt"] for _ in range(3)
+    )
+    assert best <= IMPORT_BUDGET_US
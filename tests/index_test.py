@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import gc
+import weakref
+
+import pytest
+
+from csvforwkt.body import ReferenceShape
+from csvforwkt.csvforwkt import CsvforwktLib
+
+IAU_DATA = "data/naifcodes_radii_m_wAsteroids_IAU2015.csv"
+IAU_DOI = "doi:10.1007/s10569-017-9805-5"
+
+
+def test_body_index():
+    library = CsvforwktLib(IAU_DATA, 2015, IAU_DOI, "/tmp")
+    crs = library.process()
+
+    earth = library.body_index(399)
+    assert earth.east_ographic_shapes == {ReferenceShape.ELLIPSE}
+    assert earth.equivalents == {39902: 39901}
+    assert earth.bases == [39900, 39901]
+    assert earth.equivalent(39912) == 39911
+    assert earth.base_of(39911) == 39901
+    assert earth.base_of(39912) is None
+
+    for naif_id, body_crs in crs.items():
+        index = library.body_index(naif_id)
+        projections = [
+            code for codes in index.projections.values() for code in codes
+        ]
+        assert sorted(projections) == sorted(
+            code for code in body_crs if code % 100 >= 5
+        )
+
+
+def test_resolve_equivalent():
+    library = CsvforwktLib(IAU_DATA, 2015, IAU_DOI, "/tmp")
+    with pytest.raises(KeyError, match="39911"):
+        library.resolve(39912)
+
+
+def test_streamed_bodies_are_freed():
+    library = CsvforwktLib(IAU_DATA, 2015, IAU_DOI, "/tmp")
+    bodies = library.iter_process()
+    naif_id, body_crs = next(bodies)
+    first = weakref.ref(body_crs[naif_id * 100])
+    del body_crs
+    next(bodies)
+    gc.collect()
+    assert first() is None
+    assert library.body_index(naif_id).bases[0] == naif_id * 100
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import os
+import zipfile
+
+import pytest
+
+from csvforwkt.__main__ import merge
+from csvforwkt.__main__ import parse_cli
+from csvforwkt.csvforwkt import CsvforwktLib
+from csvforwkt.merge import ShardMerger
+from csvforwkt.reader import WktReader
+from csvforwkt.selection import Selection
+from csvforwkt.writer import OutputFormat
+
+IAU_DATA = "data/naifcodes_radii_m_wAsteroids_IAU2015.csv"
+IAU_DOI = "doi:10.1007/s10569-017-9805-5"
+IAU_ZIP = "tests/iau.zip"
+
+
+def generate(directory, output_format, selection=None):
+    os.makedirs(directory, exist_ok=True)
+    library = CsvforwktLib(
+        IAU_DATA, 2015, IAU_DOI, str(directory), selection=selection
+    )
+    library.save_iter(library.iter_process(), output_format, 300)
+    return os.path.join(
+        directory, OutputFormat.from_name(output_format).filename
+    )
+
+
+def test_merge_wkt(tmp_path):
+    shards = [
+        generate(tmp_path / str(index), "wkt", Selection(shard=(index, 3)))
+        for index in (1, 2, 3)
+    ]
+    options = parse_cli(
+        ["--output_directory", str(tmp_path), "merge", *reversed(shards)]
+    )
+    merge(options)
+    with zipfile.ZipFile(IAU_ZIP) as archive:
+        assert (tmp_path / "iau.wkt").read_bytes() == archive.read("iau.wkt")
+    with pytest.raises(ValueError, match="Body 10 in"):
+        ShardMerger([shards[1], shards[1]], OutputFormat.WKT).merge(
+            str(tmp_path / "twice.wkt")
+        )
+    with pytest.raises(ValueError, match="output of a shard"):
+        ShardMerger(shards, OutputFormat.WKT).merge(shards[0])
+
+
+@pytest.mark.parametrize("output_format", ["jsonl", "parquet"])
+def test_merge_formats(tmp_path, output_format):
+    if output_format == "parquet":
+        pytest.importorskip("pyarrow")
+    selection = {"naif_range": (400, 699)}
+    single = generate(
+        tmp_path / "single", output_format, Selection(**selection)
+    )
+    shards = [
+        generate(
+            tmp_path / str(index),
+            output_format,
+            Selection(shard=(index, 2), **selection),
+        )
+        for index in (1, 2)
+    ]
+    merged = str(tmp_path / os.path.basename(single))
+    nb_crs = ShardMerger(shards, OutputFormat.from_name(output_format)).merge(
+        merged, 300
+    )
+    assert nb_crs > 300
+    with open(single, "rb") as expected, open(merged, "rb") as result:
+        assert result.read() == expected.read()
+
+
+def test_merge_closes_the_shards(tmp_path, monkeypatch):
+    shard = generate(tmp_path, "wkt", Selection(naif_range=(10, 199)))
+    files = list()
+    open_wkt = WktReader.open
+
+    def recorded_open(reader):
+        files.append(open_wkt(reader))
+        return files[-1]
+
+    monkeypatch.setattr(WktReader, "open", recorded_open)
+    # the merge stops at the first body, found in both shards, and the
+    # traceback keeps the frames of the merge alive
+    with pytest.raises(ValueError, match="Body 10 in") as error:
+        ShardMerger([shard, shard], OutputFormat.WKT).merge(
+            str(tmp_path / "twice.wkt")
+        )
+    assert error.traceback
+    assert len(files) == 2
+    assert all(file.closed for file in files)
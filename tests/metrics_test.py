@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from csvforwkt import tracing
+from csvforwkt.csvforwkt import CsvforwktLib
+from csvforwkt.metrics import MetricsRegistry
+from csvforwkt.metrics import PipelineMetrics
+from csvforwkt.selection import Selection
+
+IAU_DATA = "data/naifcodes_radii_m_wAsteroids_IAU2015.csv"
+IAU_DOI = "doi:10.1007/s10569-017-9805-5"
+
+
+def test_exposition():
+    registry = MetricsRegistry()
+    registry.define("rows_total", MetricsRegistry.COUNTER, "Rows")
+    registry.define(
+        "render_seconds", MetricsRegistry.HISTOGRAM, "Render", (0.1, 1)
+    )
+    registry.inc("rows_total", 4314952)
+    registry.inc("rows_total", 2, {"shape": 'a"b'})
+    for value in (0.05, 0.5, 5):
+        registry.observe("render_seconds", value, {"kind": "BodyCrs"})
+    lines = registry.exposition().splitlines()
+    assert "# TYPE rows_total counter" in lines
+    assert "rows_total 4314952" in lines
+    assert 'rows_total{shape="a\\"b"} 2' in lines
+    assert 'render_seconds_bucket{kind="BodyCrs",le="0.1"} 1' in lines
+    assert 'render_seconds_bucket{kind="BodyCrs",le="1"} 2' in lines
+    assert 'render_seconds_bucket{kind="BodyCrs",le="+Inf"} 3' in lines
+    assert 'render_seconds_count{kind="BodyCrs"} 3' in lines
+    assert (
+        registry.histogram("render_seconds", {"kind": "BodyCrs"}).sum == 5.55
+    )
+
+
+def test_unknown_type():
+    with pytest.raises(ValueError):
+        MetricsRegistry().define("rows", "gauge", "Rows")
+
+
+def test_atomic_write(tmp_path):
+    registry = MetricsRegistry()
+    registry.define("rows_total", MetricsRegistry.COUNTER, "Rows")
+    registry.inc("rows_total")
+    path = tmp_path / "csvforwkt.prom"
+    path.write_text("old", encoding="utf-8")
+    registry.write(str(path))
+    assert path.read_text(encoding="utf-8") == registry.exposition()
+    assert os.listdir(tmp_path) == ["csvforwkt.prom"]
+
+
+def test_pipeline_metrics(tmp_path):
+    metrics = PipelineMetrics()
+    tracing.enable(metrics)
+    try:
+        library = CsvforwktLib(
+            IAU_DATA,
+            2015,
+            IAU_DOI,
+            str(tmp_path),
+            stage_hooks=[metrics.stage],
+        )
+        crs = library.process()
+        library.save_iter(
+            metrics.count_bodies(crs.items(), library.is_triaxial)
+        )
+    finally:
+        tracing.disable(metrics)
+    metrics.count_projections(library.projection_stats)
+
+    assert metrics.value("csvforwkt_rows_read_total") == 182
+    assert metrics.value("csvforwkt_rows_skipped_total") == 85
+    nb_bodies = metrics.value(
+        "csvforwkt_bodies_total", {"shape": "biaxial"}
+    ) + metrics.value("csvforwkt_bodies_total", {"shape": "triaxial"})
+    assert nb_bodies == len(crs)
+    assert metrics.value(
+        "csvforwkt_projections_total", {"rule": "generated"}
+    ) == metrics.value(
+        "csvforwkt_crs_total",
+        {"class": "ProjectionBody", "type": "ocentric", "shape": "sphere"},
+    ) + sum(
+        metrics.value(
+            "csvforwkt_crs_total",
+            {"class": "ProjectionBody", "type": crs_type, "shape": shape},
+        )
+        for crs_type in ("ocentric", "ographic")
+        for shape in ("ellipse", "triaxial")
+    )
+    assert metrics.value("csvforwkt_bytes_written_total") == os.path.getsize(
+        tmp_path / "iau.wkt"
+    )
+    nb_crs = sum(len(body) for body in crs.values())
+    nb_projections = metrics.value(
+        "csvforwkt_projections_total", {"rule": "generated"}
+    )
+    assert (
+        metrics.histogram(
+            "csvforwkt_render_seconds", {"class": "BodyCrs"}
+        ).count
+        == nb_crs - nb_projections
+    )
+    assert (
+        metrics.histogram(
+            "csvforwkt_render_seconds", {"class": "ProjectionBody"}
+        ).count
+        == nb_projections
+    )
+
+
+def test_shape_of_the_bodies():
+    # only the spheres are selected, the triaxial bodies stay triaxial
+    library = CsvforwktLib(
+        IAU_DATA,
+        2015,
+        IAU_DOI,
+        "/tmp",
+        selection=Selection.from_strings(shapes="sphere", projections="none"),
+    )
+    metrics = PipelineMetrics()
+    crs = dict(
+        metrics.count_bodies(library.iter_process(), library.is_triaxial)
+    )
+    triaxial = [
+        naif_id
+        for naif_id, (is_triaxial, _) in library.body_descriptions().items()
+        if is_triaxial
+    ]
+    assert len(triaxial) > 0
+    assert metrics.value(
+        "csvforwkt_bodies_total", {"shape": "triaxial"}
+    ) == len(triaxial)
+    assert metrics.value(
+        "csvforwkt_bodies_total", {"shape": "biaxial"}
+    ) == len(crs) - len(triaxial)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import logging
+import tracemalloc
+
+from csvforwkt.monitoring import MemoryProfiler
+from csvforwkt.monitoring import UtilsMonitoring
+
+
+class Node:  # pylint: disable=too-few-public-methods
+    def __init__(self, payload, child=None):
+        self.payload = payload
+        self.child = child
+
+
+def test_nested_stages():
+    profiler = MemoryProfiler(top=5)
+    profiler.start()
+    with profiler.stage("outer", dict()):
+        kept = [bytearray(100_000)]
+        with profiler.stage("inner", dict()):
+            temporary = bytearray(1_000_000)
+            del temporary
+    profiler.stop()
+    assert not tracemalloc.is_tracing()
+    inner, outer = profiler.stages
+    assert inner.name == "inner" and outer.name == "outer"
+    assert inner.peak >= 1_000_000
+    assert inner.net < 100_000
+    # the peak of the nested stage is the peak of the outer stage
+    assert outer.peak >= inner.peak
+    assert 100_000 <= outer.net < 1_000_000
+    assert len(inner.top) <= 5
+    assert len(kept) == 1
+
+
+def test_stage_without_tracing():
+    profiler = MemoryProfiler()
+    with profiler.stage("stage", dict()):
+        pass
+    assert profiler.stages == []
+
+
+def test_profiler_keeps_tracing():
+    tracemalloc.start()
+    try:
+        profiler = MemoryProfiler()
+        profiler.start()
+        profiler.stop()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_account_shared_objects():
+    shared = Node("x" * 10_000)
+    profiler = MemoryProfiler()
+    profiler.account([Node("a", shared), Node("b", shared), shared])
+    count, size = profiler.classes["Node"]
+    assert count == 3
+    # the shared payload is accounted once
+    assert 10_000 < size < 20_000
+
+
+def test_report(tmp_path):
+    profiler = MemoryProfiler()
+    profiler.start()
+    with profiler.stage("split_body", dict()):
+        _ = [str(index) for index in range(1000)]
+    profiler.stop()
+    profiler.account([Node("a")])
+    path = tmp_path / "memory.txt"
+    profiler.save(str(path))
+    report = path.read_text(encoding="utf-8")
+    assert "split_body" in report
+    assert "Node" in report
+    assert "Top allocation sites of split_body" in report
+
+
+def test_measure_memory_nested():
+    @UtilsMonitoring.measure_memory(level=logging.DEBUG)
+    def inner():
+        return bytearray(1000)
+
+    @UtilsMonitoring.measure_memory(level=logging.DEBUG)
+    def outer():
+        inner()
+        # the inner measure does not stop the tracing of the outer one
+        return tracemalloc.is_tracing()
+
+    assert outer()
+    assert not tracemalloc.is_tracing()
+
+
+def test_time_spend_threshold(caplog):
+    @UtilsMonitoring.time_spend(level=logging.DEBUG, threshold_in_ms=0)
+    def function():
+        return 1
+
+    with caplog.at_level(logging.WARNING):
+        assert function() == 1
+    assert "too long to compute" in caplog.text
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+import copy
+
+from csvforwkt.perfgate import Comparison
+from csvforwkt.perfgate import PerfGate
+
+
+def _results(throughput, peak_bytes, output_bytes):
+    return {
+        "results": [
+            {
+                "size": 100,
+                "stages": {
+                    "save": {
+                        "throughput": throughput,
+                        "peak_bytes": peak_bytes,
+                        "output_bytes": output_bytes,
+                    },
+                    "split_body": {
+                        "throughput": 1000.0,
+                        "peak_bytes": 10,
+                        "output_bytes": None,
+                    },
+                },
+                "renderers": {},
+            }
+        ]
+    }
+
+
+def _status(comparisons, name, metric):
+    return next(
+        comparison.status
+        for comparison in comparisons
+        if comparison.name == name and comparison.metric == metric
+    )
+
+
+def test_no_regression():
+    baseline = _results(1000.0, 10_000_000, 500)
+    comparisons = PerfGate(baseline).compare(copy.deepcopy(baseline))
+    assert PerfGate.regressions(comparisons) == []
+    # the output bytes are not measured for split_body
+    assert len(comparisons) == 5
+
+
+def test_regressions():
+    gate = PerfGate(_results(1000.0, 10_000_000, 500), {"throughput": 0.1})
+    comparisons = gate.compare(_results(850.0, 20_000_000, 501))
+    assert _status(comparisons, "save", "throughput") == Comparison.REGRESSION
+    assert _status(comparisons, "save", "peak_bytes") == Comparison.REGRESSION
+    assert (
+        _status(comparisons, "save", "output_bytes") == Comparison.REGRESSION
+    )
+    assert len(PerfGate.regressions(comparisons)) == 3
+    assert "regression" in PerfGate.format_table(comparisons)
+
+
+def test_improvement_and_new_stage():
+    gate = PerfGate(_results(1000.0, 10_000_000, 500))
+    current = _results(2000.0, 5_000_000, 500)
+    current["results"][0]["stages"]["load"] = {"throughput": 1.0}
+    comparisons = gate.compare(current)
+    assert _status(comparisons, "save", "throughput") == Comparison.IMPROVED
+    assert _status(comparisons, "save", "peak_bytes") == Comparison.IMPROVED
+    assert _status(comparisons, "load", "throughput") == Comparison.NEW
+    assert PerfGate.regressions(comparisons) == []
+
+
+def test_absolute_memory_tolerance():
+    gate = PerfGate(_results(1000.0, 10_000, 500))
+    # a few allocations on a small peak are not a regression
+    comparisons = gate.compare(_results(1000.0, 100_000, 500))
+    assert _status(comparisons, "save", "peak_bytes") == Comparison.OK
+    comparisons = gate.compare(_results(1000.0, 1_000_000, 500))
+    assert _status(comparisons, "save", "peak_bytes") == Comparison.REGRESSION
+    gate = PerfGate(_results(1000.0, 10_000, 500), None, {"peak_bytes": 0})
+    comparisons = gate.compare(_results(1000.0, 100_000, 500))
+    assert _status(comparisons, "save", "peak_bytes") == Comparison.REGRESSION
+
+
+def test_throughput_of_the_fastest_run():
+    baseline = _results(1000.0, 100, 500)
+    baseline["results"][0]["stages"]["save"].update(
+        {"items": 100, "min_ns": 500_000_000}
+    )
+    current = copy.deepcopy(baseline)
+    # a slow run does not change the fastest one
+    current["results"][0]["stages"]["save"]["throughput"] = 500.0
+    comparisons = PerfGate(baseline).compare(current)
+    assert _status(comparisons, "save", "throughput") == Comparison.OK
+    current["results"][0]["stages"]["save"]["min_ns"] = 1_000_000_000
+    comparisons = PerfGate(baseline).compare(current)
+    assert _status(comparisons, "save", "throughput") == Comparison.REGRESSION
+    # the short runs are not gated
+    for results in (baseline, current):
+        results["results"][0]["stages"]["save"]["min_ns"] //= 100
+    comparisons = PerfGate(baseline).compare(current)
+    assert _status(comparisons, "save", "throughput") == Comparison.SKIPPED
+    assert PerfGate.regressions(comparisons) == []
+
+
+def test_throughput_of_the_largest_size():
+    baseline = _results(1000.0, 100, 500)
+    larger = copy.deepcopy(baseline["results"][0])
+    larger["size"] = 1000
+    baseline["results"].append(larger)
+    current = copy.deepcopy(baseline)
+    for result in current["results"]:
+        result["stages"]["save"]["throughput"] = 500.0
+    comparisons = PerfGate(baseline).compare(current)
+    statuses = {
+        comparison.size: comparison.status
+        for comparison in comparisons
+        if comparison.name == "save" and comparison.metric == "throughput"
+    }
+    assert statuses == {100: Comparison.SKIPPED, 1000: Comparison.REGRESSION}
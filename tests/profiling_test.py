@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+import cProfile
+import pstats
+import time
+
+from csvforwkt.profiling import CliProfiler
+from csvforwkt.profiling import ProfileFormat
+
+
+def _leaf():
+    time.sleep(0.01)
+
+
+def _middle():
+    _leaf()
+    _leaf()
+
+
+def _root():
+    _middle()
+    _leaf()
+    return 42
+
+
+def test_collapsed_stacks():
+    profile = cProfile.Profile()
+    profile.runcall(_root)
+    stacks = dict(CliProfiler.collapsed_stacks(pstats.Stats(profile)))
+    nested = [
+        stack
+        for stack in stacks
+        if stack.count("_root") == 1
+        and "_middle" in stack
+        and "sleep" in stack
+    ]
+    assert len(nested) == 1
+    direct = [
+        stack
+        for stack in stacks
+        if "_root" in stack and "_middle" not in stack and "sleep" in stack
+    ]
+    assert len(direct) == 1
+    # the time of the sleep is split between its two callers: 2/3 and 1/3
+    assert stacks[nested[0]] > stacks[direct[0]]
+    total = sum(stacks.values()) / 1e6
+    assert 0.02 < total < 1
+
+
+def test_run_pstats(tmp_path):
+    path = tmp_path / "profile.pstats"
+    profiler = CliProfiler(str(path), ProfileFormat.PSTATS)
+    assert profiler.run(_root) == 42
+    stats = pstats.Stats(str(path))
+    assert any(function[2] == "_middle" for function in stats.stats)
+    assert profiler.elapsed > 0.03
+    assert profiler.overhead >= 0
+    assert profiler.write_time >= 0
+
+
+def test_run_collapsed(tmp_path):
+    path = tmp_path / "profile.collapsed"
+    profiler = CliProfiler(str(path), ProfileFormat.COLLAPSED)
+    profiler.run(_root)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) > 0
+    for line in lines:
+        stack, microseconds = line.rsplit(" ", 1)
+        assert stack
+        assert int(microseconds) > 0
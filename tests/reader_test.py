@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+import gc
+import time
+import weakref
+import zipfile
+
+import pytest
+
+from csvforwkt.body import ReportContext
+from csvforwkt.body import Sphere
+from csvforwkt.crs import BodyCrs
+from csvforwkt.crs import ProjectionBody
+from csvforwkt.reader import parse
+from csvforwkt.reader import WktReader
+from csvforwkt.writer import WktWriter
+
+IAU_ZIP = "tests/iau.zip"
+
+
+@pytest.fixture(scope="module")
+def text():
+    with zipfile.ZipFile(IAU_ZIP) as archive:
+        return archive.read("iau.wkt").decode("utf-8")
+
+
+def test_parse():
+    root = parse('ID["PROJ", "SINUSOIDAL"]')
+    assert root.values == ["PROJ", "SINUSOIDAL"]
+    root = parse(
+        'ELLIPSOID["Sun (2015)", 695700000, 1.5e3,\n\tLENGTHUNIT["metre", 1]]'
+    )
+    assert root.values == ["Sun (2015)", 695700000, 1500.0]
+    assert root.child("LENGTHUNIT").values == ["metre", 1]
+    root = parse("A[B[1, C[2]], north]", frozenset(("B",)))
+    assert root.values == ["north"]
+    assert root.children[0].children == []
+    assert root.children[0].end == len("A[B[1, C[2]]")
+    assert parse("A[1, ] ,").values == [1]
+    for invalid in ("A[1", "A[1]]", "A[1] B[2]", "A[1 ; 2]", "1", ","):
+        with pytest.raises(ValueError):
+            parse(invalid)
+
+
+def test_round_trip(text):
+    reader = WktReader(IAU_ZIP)
+    start = time.perf_counter()
+    crs = list(reader)
+    assert time.perf_counter() - start < 2
+    assert reader.member == "iau.wkt"
+    assert len(crs) == 3462
+    assert "".join(item.wkt() + "\n\n" for item in crs) == text
+    assert isinstance(crs[0], BodyCrs)
+    assert isinstance(crs[0].datum.body, Sphere)
+    assert isinstance(crs[1], ProjectionBody)
+    assert crs[1].body_crs is crs[0]
+    # the conversions are shared by the bodies
+    by_code = {item.iau_code: item for item in crs}
+    assert by_code[19910].definition is crs[1].definition
+
+
+def test_memory_of_previous_bodies():
+    crs = iter(WktReader(IAU_ZIP))
+    sun = next(crs)
+    assert sun.iau_code == 1000
+    # the datum of the sun is shared by its CRS
+    assert next(crs).body_crs.datum is sun.datum
+    datum = weakref.ref(sun.datum)
+    del sun
+    while next(crs).iau_code // 100 == 10:
+        pass
+    gc.collect()
+    assert datum() is None
+
+
+def test_bodies(text, tmp_path):
+    path = tmp_path / "iau.wkt"
+    path.write_text(text[: text.index('GEOGCRS["Venus')])
+    bodies = list(WktReader(str(path)).bodies())
+    assert [naif_id for naif_id, _ in bodies] == [10, 199]
+    copy = tmp_path / "copy.wkt"
+    assert WktWriter(str(copy)).write(bodies) == 70
+    assert copy.read_text() == path.read_text()
+
+
+def test_records(text, tmp_path):
+    path = tmp_path / "iau.wkt"
+    start = text.index('GEOGCRS["Phobos')
+    path.write_text(text[start : text.index("\n\nPROJCRS", start)])
+    records = list(WktReader(str(path)).records())
+    assert len(records) == 3
+    assert records[1]["naif_id"] == 401
+    assert records[1]["shape"] == "Triaxial"
+    assert records[1]["semi_median"] == 11400.0
+    assert records[1]["wkt"] == path.read_text().split("\n\n")[1]
+
+
+def test_version_and_projection_without_base(text):
+    block = text.split("\n\n")[1].replace("2015", "2019")
+    crs = WktReader(IAU_ZIP).crs(block)
+    assert crs.body_crs.report.version == "2019"
+    assert crs.wkt() == block
+    assert ReportContext.current().version == "2015"
+
+
+def test_remark(text):
+    block = text[text.index('GEOGCRS["Phobos') :].split("\n\n")[0]
+    block = block.replace(
+        "doi:10.1007/s10569-017-9805-5", "doi:10.1007/s10569-010-9320-4"
+    )
+    crs = WktReader(IAU_ZIP).crs(block)
+    assert isinstance(crs.datum.body, Sphere)
+    assert crs.datum.body.warning == (
+        "Use mean radius as sphere radius for interoperability. "
+    )
+    assert crs.report.doi == "doi:10.1007/s10569-010-9320-4"
+    assert crs.wkt() == block
+
+
+def test_invalid(text):
+    block = text.split("\n\n")[0]
+    with pytest.raises(ValueError, match="expected 1000"):
+        WktReader(IAU_ZIP).crs(block.replace("1000,", "1002,"))
+    with pytest.raises(ValueError, match="does not end with"):
+        WktReader(IAU_ZIP).crs(block.replace("Sun (2015)", "Sun 2015"))
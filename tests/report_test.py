@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from csvforwkt.body import ReportContext
+from csvforwkt.body import Sphere
+from csvforwkt.csvforwkt import CsvforwktLib
+
+IAU_DATA = "data/naifcodes_radii_m_wAsteroids_IAU2015.csv"
+IAU_DOI = "doi:10.1007/s10569-017-9805-5"
+OTHER_DOI = "doi:10.1007/s10569-010-9320-4"
+
+
+def test_report_context():
+    assert ReportContext.current().version == "2015"
+    report = ReportContext("2019", OTHER_DOI)
+    assert report.source == "Source of IAU Coordinate systems: " + OTHER_DOI
+    with ReportContext.use(report):
+        assert Sphere("Mars", 3396190).report is report
+        assert '"Mars (2019) - Sphere"' in Sphere("Mars", 3396190).wkt()
+        # the context is not shared with the other threads
+        current = list()
+        thread = threading.Thread(
+            target=lambda: current.append(ReportContext.current())
+        )
+        thread.start()
+        thread.join()
+        assert current[0].version == "2015"
+    assert ReportContext.current().version == "2015"
+
+
+def test_report_context_in_tasks():
+    async def create(version):
+        with ReportContext.use(ReportContext(version)):
+            await asyncio.sleep(0)
+            return Sphere("Mars", 3396190).wkt()
+
+    async def main():
+        return await asyncio.gather(create("2015"), create("2019"))
+
+    wkts = asyncio.run(main())
+    assert "(2015)" in wkts[0] and "(2019)" not in wkts[0]
+    assert "(2019)" in wkts[1] and "(2015)" not in wkts[1]
+
+
+def test_libraries_in_threads(tmp_path):
+    library_2015 = CsvforwktLib(IAU_DATA, 2015, IAU_DOI, str(tmp_path))
+    crs = library_2015.resolve(49900)
+    library_2019 = CsvforwktLib(IAU_DATA, 2019, OTHER_DOI, str(tmp_path))
+    # the CRS keep the report of their library
+    assert "(2015)" in crs.wkt() and IAU_DOI in crs.wkt()
+
+    def render(library, code):
+        return [library.resolve(code).wkt() for _ in range(20)]
+
+    with ThreadPoolExecutor(4) as executor:
+        futures = [
+            executor.submit(render, library, code)
+            for code in (49900, 49901, 49910, 30100)
+            for library in (library_2015, library_2019)
+        ]
+        results = [future.result() for future in futures]
+    for index, wkts in enumerate(results):
+        version, doi = (
+            ("2015", IAU_DOI) if index % 2 == 0 else ("2019", OTHER_DOI)
+        )
+        other = "2019" if version == "2015" else "2015"
+        for wkt in wkts:
+            assert f"({version})" in wkt and f"({other})" not in wkt
+            assert f", {version}]" in wkt
+            if "REMARK" in wkt:
+                assert doi in wkt
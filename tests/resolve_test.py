@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from csvforwkt.__main__ import parse_cli
+from csvforwkt.csvforwkt import CsvforwktLib
+
+IAU_DATA = "data/naifcodes_radii_m_wAsteroids_IAU2015.csv"
+IAU_DOI = "doi:10.1007/s10569-017-9805-5"
+
+
+def test_resolve_all_codes():
+    crs = CsvforwktLib(IAU_DATA, 2015, IAU_DOI, "/tmp").process()
+    library = CsvforwktLib(IAU_DATA, 2015, IAU_DOI, "/tmp")
+    for body_crs in crs.values():
+        for code, value in body_crs.items():
+            assert library.resolve(code).wkt() == value.wkt()
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        49992,  # Mercator is only for a sphere
+        30112,  # the Moon is only a sphere
+        39912,  # ocentric projection shadowed by the ographic one to east
+        49913,  # unknown offset
+        49903,  # triaxial CRS for a biaxial body
+        99999900,  # unknown body
+    ],
+)
+def test_resolve_not_generated(code):
+    library = CsvforwktLib(IAU_DATA, 2015, IAU_DOI, "/tmp")
+    with pytest.raises(KeyError):
+        library.resolve(code)
+
+
+def test_resolve_cli():
+    options = parse_cli(
+        [
+            "resolve",
+            "--iau_report",
+            IAU_DATA,
+            "--iau_version",
+            "2015",
+            "--iau_doi",
+            IAU_DOI,
+            "49900",
+            "49910",
+        ]
+    )
+    assert options.codes == [49900, 49910]
+    assert options.level == "WARNING"
+    with pytest.raises(SystemExit):
+        parse_cli(["--iau_report", IAU_DATA])
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from csvforwkt.crs import CrsType
+from csvforwkt.csvforwkt import CsvforwktLib
+from csvforwkt.selection import Selection
+
+IAU_DATA = "data/naifcodes_radii_m_wAsteroids_IAU2015.csv"
+IAU_DOI = "doi:10.1007/s10569-017-9805-5"
+
+
+def _codes(crs):
+    return {
+        code: value.wkt()
+        for body in crs.values()
+        for code, value in body.items()
+    }
+
+
+@pytest.fixture(scope="module")
+def full_catalogue():
+    return _codes(CsvforwktLib(IAU_DATA, 2015, IAU_DOI, "/tmp").process())
+
+
+def test_from_strings():
+    selection = Selection.from_strings(
+        bodies="Mars, 301", naif_range="300:", crs_types="Ocentric"
+    )
+    assert not selection.is_all
+    assert Selection().is_all
+    with pytest.raises(ValueError):
+        Selection.from_strings(shapes="cube")
+    with pytest.raises(ValueError):
+        Selection.from_strings(naif_range="300")
+    assert Selection.from_strings(shard="2/4").shard == (2, 4)
+    for shard in ("2", "0/4", "5/4"):
+        with pytest.raises(ValueError):
+            Selection.from_strings(shard=shard)
+
+
+def test_selection_is_a_subset(full_catalogue):
+    selection = Selection.from_strings(
+        bodies="mars,301,599", crs_types="ocentric", projections="10,Mollweide"
+    )
+    library = CsvforwktLib(
+        IAU_DATA, 2015, IAU_DOI, "/tmp", selection=selection
+    )
+    selected = _codes(library.process())
+    assert {code // 100 for code in selected} == {301, 499, 599}
+    assert {code % 100 for code in selected} == {0, 2, 10, 12, 40, 42, 45, 47}
+    for code, wkt in selected.items():
+        assert full_catalogue[code] == wkt
+    streamed = {
+        code: value.wkt()
+        for _, body in library.iter_process()
+        for code, value in body.items()
+    }
+    assert streamed == selected
+
+
+def test_selection_by_code(full_catalogue):
+    selection = Selection(
+        codes=[49901, 49915, 30100],
+        crs_types=[CrsType.OGRAPHIC, CrsType.OCENTRIC],
+    )
+    library = CsvforwktLib(
+        IAU_DATA, 2015, IAU_DOI, "/tmp", selection=selection
+    )
+    assert set(_codes(library.process())) == {49901, 49915, 30100}
+
+
+def test_unknown_projection():
+    with pytest.raises(ValueError):
+        CsvforwktLib(
+            IAU_DATA,
+            2015,
+            IAU_DOI,
+            "/tmp",
+            selection=Selection(projections=[12]),
+        )
+
+
+@pytest.mark.parametrize(
+    "selection",
+    [
+        Selection(),
+        Selection(crs_types=[CrsType.OGRAPHIC], projections=[10, "Mollweide"]),
+        Selection(codes=[49910, 49911, 39920]),
+    ],
+)
+def test_projection_mask(selection):
+    library = CsvforwktLib(IAU_DATA, 2015, IAU_DOI, "/tmp")
+    crs = [
+        library.resolve(code)
+        for code in (39900, 39901, 39902, 49900, 49901, 49902)
+    ]
+    definitions = list(library.catalogue)
+    mask = selection.projection_mask(crs, definitions)
+    assert mask.shape == (len(crs), len(definitions))
+    for row, body_crs in enumerate(crs):
+        for col, definition in enumerate(definitions):
+            assert mask[row, col] == selection.accept_projection(
+                body_crs, definition
+            )
+
+
+def test_projection_stats():
+    library = CsvforwktLib(
+        IAU_DATA, 2015, IAU_DOI, "/tmp", selection=Selection(projections=[10])
+    )
+    crs = library.process()
+    stats = library.projection_stats
+    nb_projections = sum(
+        1 for body in crs.values() for code in body if code % 100 >= 5
+    )
+    assert stats["generated"] == nb_projections
+    assert stats["pairs"] == (
+        stats["equivalent"]
+        + stats["sphere_only"]
+        + stats["selection"]
+        + stats["generated"]
+    )
+    assert stats["selection"] > 0
+
+
+def test_shards(full_catalogue):
+    shards = [
+        _codes(
+            CsvforwktLib(
+                IAU_DATA,
+                2015,
+                IAU_DOI,
+                "/tmp",
+                selection=Selection(shard=shard),
+            ).process()
+        )
+        for shard in ((1, 3), (2, 3), (3, 3))
+    ]
+    for index, codes in enumerate(shards):
+        assert len(codes) > 0
+        assert {code // 100 % 3 for code in codes} == {index}
+    assert {
+        code: wkt for codes in shards for code, wkt in codes.items()
+    } == full_catalogue
+
+
+def test_projection_stats_of_each_run():
+    library = CsvforwktLib(
+        IAU_DATA, 2015, IAU_DOI, "/tmp", selection=Selection(projections=[10])
+    )
+    library.process()
+    stats = library.projection_stats
+    library.process()
+    assert library.projection_stats == stats
+    for _ in library.iter_process():
+        pass
+    assert library.projection_stats == stats
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+import json
+import sys
+import threading
+import types
+import urllib.error
+import urllib.request
+
+import pytest
+
+from csvforwkt.csvforwkt import CsvforwktLib
+from csvforwkt.metrics import PipelineMetrics
+from csvforwkt.server import WktRegistry
+from csvforwkt.server import WktRequestHandler
+from csvforwkt.server import WktServer
+
+IAU_DATA = "data/naifcodes_radii_m_wAsteroids_IAU2015.csv"
+IAU_DOI = "doi:10.1007/s10569-017-9805-5"
+
+
+@pytest.fixture(scope="module")
+def server():
+    metrics = PipelineMetrics()
+    registry = WktRegistry(
+        CsvforwktLib(IAU_DATA, 2015, IAU_DOI, "/tmp", level="WARNING"),
+        metrics,
+    )
+    wkt_server = WktServer(registry, "127.0.0.1", 0, metrics)
+    thread = threading.Thread(target=wkt_server.serve_forever, daemon=True)
+    thread.start()
+    yield wkt_server
+    wkt_server.shutdown()
+    wkt_server.server_close()
+
+
+def test_get(server):
+    library = CsvforwktLib(IAU_DATA, 2015, IAU_DOI, "/tmp")
+    with urllib.request.urlopen(f"{server.url}/49910") as response:
+        assert response.status == 200
+        assert response.read().decode("utf-8") == library.resolve(49910).wkt()
+        etag = response.headers["ETag"]
+
+    request = urllib.request.Request(
+        f"{server.url}/49910", headers={"If-None-Match": etag}
+    )
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(request)
+    assert error.value.code == 304
+
+
+def test_if_none_match():
+    etag = '"abc"'
+    for header in ('"abc"', 'W/"abc"', '"x", W/"abc"', "*", ' "x" ,"abc" '):
+        assert WktRequestHandler._matches(etag, header)
+    for header in ("", '"ab"', '"abcd"', 'W/"x"', '"x,"abc""', "abc"):
+        assert not WktRequestHandler._matches(etag, header)
+
+
+def test_get_codes(server):
+    with urllib.request.urlopen(server.url) as response:
+        codes = json.loads(response.read())
+    assert len(codes) == len(server.registry)
+    assert 49900 in codes
+
+
+@pytest.mark.parametrize(
+    "path,status",
+    [("/49992", 404), ("/abc", 400), ("/49900?format=xml", 400)],
+)
+def test_get_errors(server, path, status):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(f"{server.url}{path}")
+    assert error.value.code == status
+
+
+def test_post(server):
+    request = urllib.request.Request(
+        server.url,
+        data=json.dumps([49900, 49992]).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request) as response:
+        result = json.loads(response.read())
+    assert result["49900"].startswith("GEOGCRS")
+    assert result["49992"] is None
+
+
+def test_post_too_large(server, monkeypatch):
+    monkeypatch.setattr(WktRequestHandler, "MAX_CONTENT_LENGTH", 10)
+    request = urllib.request.Request(
+        server.url, data=json.dumps([49900, 49901, 49902]).encode("utf-8")
+    )
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(request)
+    assert error.value.code == 413
+    assert "at most 10 bytes" in json.loads(error.value.read())["error"]
+
+
+def test_projjson_rejected_by_pyproj(server, monkeypatch):
+    class CRSError(RuntimeError):
+        pass
+
+    class CRS:  # pylint: disable=too-few-public-methods
+        @staticmethod
+        def from_wkt(wkt):
+            raise CRSError("Invalid projection")
+
+    pyproj = types.ModuleType("pyproj")
+    pyproj.CRS = CRS
+    exceptions = types.ModuleType("pyproj.exceptions")
+    exceptions.CRSError = CRSError
+    monkeypatch.setitem(sys.modules, "pyproj", pyproj)
+    monkeypatch.setitem(sys.modules, "pyproj.exceptions", exceptions)
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(f"{server.url}/49910?format=projjson")
+    assert error.value.code == 500
+    message = json.loads(error.value.read())["error"]
+    assert "49910 to PROJJSON: Invalid projection" in message
+    request = urllib.request.Request(
+        server.url,
+        data=json.dumps({"codes": [49910], "format": "projjson"}).encode(
+            "utf-8"
+        ),
+    )
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(request)
+    assert error.value.code == 500
+
+
+def test_metrics(server):
+    with urllib.request.urlopen(server.url) as response:
+        response.read()
+    host, port = server.server_address[0:2]
+    with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+        assert response.headers["Content-Type"].startswith("text/plain")
+        lines = response.read().decode("utf-8").splitlines()
+    assert (
+        'csvforwkt_crs_total{class="BodyCrs",shape="sphere",type="ocentric"} 97'
+        in lines
+    )
+    requests = [
+        line
+        for line in lines
+        if line.startswith(
+            'csvforwkt_http_requests_total{method="GET",status="200"}'
+        )
+    ]
+    assert len(requests) == 1
+    assert int(requests[0].split()[-1]) >= 1
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from csvforwkt import tracing
+from csvforwkt.tracing import TraceFormat
+from csvforwkt.tracing import Tracer
+
+
+@pytest.fixture
+def tracer():
+    current = Tracer()
+    tracing.enable(current)
+    yield current
+    tracing.disable()
+
+
+def test_disabled():
+    with tracing.span("process") as attributes:
+        attributes["crs"] = 1
+    tracer = Tracer()
+    assert tracer.spans == []
+
+
+def test_nested_spans(tracer):
+    with tracing.span("process"):
+        with tracing.span("biaxial") as attributes:
+            for naif_id in (199, 299):
+                with tracing.span("body", naif_id=naif_id):
+                    pass
+            attributes["crs"] = 4
+    paths = [span.path for span in tracer.spans]
+    assert paths == [
+        ("process", "biaxial", "body"),
+        ("process", "biaxial", "body"),
+        ("process", "biaxial"),
+        ("process",),
+    ]
+    process = tracer.spans[-1]
+    biaxial = tracer.spans[-2]
+    assert process.start <= biaxial.start <= biaxial.end <= process.end
+    assert biaxial.attributes == {"crs": 4}
+    assert tracer.spans[0].attributes == {"naif_id": 199}
+
+
+def test_chrome_trace(tracer, tmp_path):
+    with tracing.span("save", crs=2):
+        with tracing.span("wkt", code=19900):
+            pass
+    path = tmp_path / "trace.json"
+    tracer.save(str(path), TraceFormat.CHROME)
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    assert [event["name"] for event in events] == ["save", "wkt"]
+    assert all(event["ph"] == "X" for event in events)
+    assert events[0]["dur"] >= events[1]["dur"]
+    assert events[1]["args"] == {"code": 19900}
+
+
+def test_summary(tracer):
+    with tracing.span("save", bytes=10):
+        for code in (19900, 19901):
+            with tracing.span("wkt", code=code, crs=1):
+                pass
+    lines = tracer.summary().splitlines()
+    assert lines[1].split()[:2] == ["save", "1"]
+    assert lines[1].endswith("bytes=10")
+    assert lines[2].startswith("  wkt")
+    assert lines[2].split()[1] == "2"
+    # the identifiers are not summed
+    assert "code" not in lines[2]
+    assert lines[2].endswith("crs=2")
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+import re
+import time
+
+import pytest
+
+from csvforwkt.__main__ import parse_cli
+from csvforwkt.__main__ import validate
+from csvforwkt import reader
+from csvforwkt import validator
+from csvforwkt.csvforwkt import CsvforwktLib
+from csvforwkt.validator import blocks
+from csvforwkt.validator import skeleton
+from csvforwkt.validator import WktValidator
+
+IAU_DATA = "data/naifcodes_radii_m_wAsteroids_IAU2015.csv"
+IAU_DOI = "doi:10.1007/s10569-017-9805-5"
+
+# possessive quantifiers and atomic groups, Python >= 3.11 only
+POSSESSIVE = re.compile(r"(?<!\\)[*+?}]\+|\(\?>")
+
+
+@pytest.fixture(scope="module")
+def catalogue(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("catalogue")
+    library = CsvforwktLib(IAU_DATA, 2015, IAU_DOI, str(directory))
+    library.save(library.process())
+    return str(directory / "iau.wkt")
+
+
+@pytest.fixture(scope="module")
+def text(catalogue):
+    with open(catalogue, encoding="utf-8") as file:
+        return file.read()
+
+
+def messages(text, complete=True):
+    return [
+        issue.message
+        for issue in WktValidator(complete).validate(text.splitlines(True))
+    ]
+
+
+def test_valid_catalogue(catalogue):
+    validator = WktValidator()
+    start = time.perf_counter()
+    assert validator.validate_file(catalogue) == []
+    assert time.perf_counter() - start < 1
+    assert len(validator.codes) == 3462
+
+
+def test_chunks(text):
+    chunks = [
+        text[index : index + 1000] for index in range(0, len(text), 1000)
+    ]
+    validator = WktValidator()
+    assert validator.validate(chunks) == []
+    assert len(validator.codes) == 3462
+
+
+def test_blocks():
+    assert list(blocks(["A[1]\n", "\n", "  \n", "B[2]\n\nC", "[3]"])) == [
+        (1, "A[1]"),
+        (4, "B[2]"),
+        (6, "C[3]"),
+    ]
+
+
+def test_skeleton():
+    assert skeleton('ID["IAU", 49910, 2015]') == skeleton(
+        'ID["EPSG", 1000, 1]'
+    )
+    assert skeleton("PARAMETER[1.5]") != skeleton("PARAMETER[1.5.2]")
+
+
+@pytest.mark.parametrize(
+    "old,new,message",
+    [
+        ("ORDER[1],", "ORDER[1,", "GEOGCRS not closed"),
+        ("ORDER[1],", "ORDER[1],]", "comma before ] in AXIS"),
+        ("ORDER[1],", "ORDER[1], 5,", "AXIS : value 5 after a keyword"),
+        (
+            "695700000, 0,",
+            "695700000 0,",
+            "ELLIPSOID : missing comma before 0",
+        ),
+        ("PRIMEM[", "PRIMEN[", "unknown keyword PRIMEN"),
+        ("PRIMEM[", "PRIMEN[", "GEOGCRS without PRIMEM"),
+        (
+            "CS[ellipsoidal, 2]",
+            "CS[ellipsoidal, 3]",
+            "2 axes for a CS of dimension 3",
+        ),
+        (
+            'ID["IAU", 1000, 2015],\n\tREMARK',
+            'ID["IAU", 1002, 2015],\n\tREMARK',
+            "GEOGCRS for offset 2, expected GEODCRS",
+        ),
+        (
+            'ID["IAU", 1010, 2015]]',
+            'ID["IAU", 1011, 2015]]',
+            "base CRS 1000 instead of 1001",
+        ),
+        (
+            "1000, 2015]]",
+            "1000, 2016]]",
+            "version 2016 of the base CRS instead of 2015",
+        ),
+    ],
+)
+def test_invalid(text, old, new, message):
+    assert message in messages(text.replace(old, new, 1))
+
+
+def test_duplicated_and_missing_codes(text):
+    crs = text.split("\n\n")
+    assert "duplicated code" in messages(text + "\n\n" + crs[0])
+    without_sphere = "\n\n".join(crs[1:])
+    assert "base CRS 1000 not found" in messages(without_sphere)
+    assert messages(without_sphere, complete=False) == []
+
+
+def test_validate_cli(catalogue, tmp_path, capsys):
+    options = parse_cli(["validate", catalogue])
+    assert options.level == "WARNING"
+    assert validate(options) == 0
+    invalid = tmp_path / "invalid.wkt"
+    with open(catalogue, encoding="utf-8") as file:
+        invalid.write_text(file.read().replace("PRIMEM[", "PRIMEN[", 1))
+    assert validate(parse_cli(["validate", str(invalid)])) == 3
+    assert "unknown keyword PRIMEN" in capsys.readouterr().out
+
+
+def test_patterns_of_older_python():
+    patterns = [
+        value.pattern
+        for module in (validator, reader)
+        for value in vars(module).values()
+        if isinstance(value, re.Pattern)
+    ]
+    assert len(patterns) > 0
+    for pattern in patterns:
+        assert POSSESSIVE.search(pattern) is None, pattern
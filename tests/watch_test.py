@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import time
+import zipfile
+
+import pytest
+
+from csvforwkt.__main__ import parse_cli
+from csvforwkt.csvforwkt import CsvforwktLib
+from csvforwkt.watch import CatalogueWatcher
+from csvforwkt.writer import OutputFormat
+
+IAU_DATA = "data/naifcodes_radii_m_wAsteroids_IAU2015.csv"
+IAU_DOI = "doi:10.1007/s10569-017-9805-5"
+IAU_ZIP = "tests/iau.zip"
+
+
+def edit(path, old, new):
+    with open(path, encoding="utf-8") as file:
+        text = file.read()
+    assert old in text
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text.replace(old, new))
+    # a new modification time even on coarse file systems
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_watch(tmp_path):
+    report = str(tmp_path / "report.csv")
+    shutil.copy(IAU_DATA, report)
+    watcher = CatalogueWatcher(report, 2015, IAU_DOI, str(tmp_path))
+    assert len(watcher.refresh()) == 97
+    with zipfile.ZipFile(IAU_ZIP) as archive:
+        with open(watcher.path, "rb") as file:
+            assert file.read() == archive.read("iau.wkt")
+    assert watcher.refresh() is None
+
+    edit(report, "499,Mars,3389500.00", "499,Mars,3389600.00")
+    start = time.perf_counter()
+    assert watcher.refresh() == [499]
+    assert time.perf_counter() - start < 1
+    edit(
+        report,
+        "\n10,Sun,695700000.00,695700000.00,695700000.00,695700000.00,Direct,,",
+        "",
+    )
+    assert watcher.refresh() == [10]
+
+    expected = tmp_path / "expected"
+    expected.mkdir()
+    library = CsvforwktLib(report, 2015, IAU_DOI, str(expected))
+    library.save(library.process())
+    with open(watcher.path, "rb") as result:
+        assert result.read() == (expected / "iau.wkt").read_bytes()
+
+
+def test_watch_options():
+    options = parse_cli(
+        [
+            "--format",
+            "jsonl",
+            "watch",
+            "--iau_report",
+            IAU_DATA,
+            "--iau_version",
+            "2015",
+            "--iau_doi",
+            IAU_DOI,
+        ]
+    )
+    assert options.interval == 0.5
+    with pytest.raises(ValueError, match="cannot be watched"):
+        CatalogueWatcher(IAU_DATA, 2015, IAU_DOI, "/tmp", OutputFormat.PARQUET)
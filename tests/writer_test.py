@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import pytest
+
+from csvforwkt.csvforwkt import CsvforwktLib
+from csvforwkt.writer import CrsRecord
+from csvforwkt.writer import OutputFormat
+
+IAU_DATA = "data/naifcodes_radii_m_wAsteroids_IAU2015.csv"
+IAU_DOI = "doi:10.1007/s10569-017-9805-5"
+
+
+@pytest.fixture
+def library(tmp_path):
+    return CsvforwktLib(IAU_DATA, 2015, IAU_DOI, str(tmp_path))
+
+
+def test_output_format():
+    assert OutputFormat.from_name("Parquet") == OutputFormat.PARQUET
+    with pytest.raises(ValueError):
+        OutputFormat.from_name("xml")
+
+
+def test_record(library):
+    crs = library.process()
+    record = CrsRecord.create(499, crs[499][49910])
+    assert record["iau_code"] == 49910
+    assert record["naif_id"] == 499
+    assert record["body"] == "Mars"
+    assert record["shape"] == "Sphere"
+    assert record["projection_id"] == 10
+    assert record["projection_method"] == "Equidistant Cylindrical"
+    assert record["wkt"] == crs[499][49910].wkt()
+
+
+def test_save_columnar(library, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    crs = library.process()
+    library.save(crs, "parquet", batch_size=500)
+    parquet_file = pq.ParquetFile(os.path.join(tmp_path, "iau.parquet"))
+    assert parquet_file.metadata.num_rows == sum(
+        len(body_crs) for body_crs in crs.values()
+    )
+    assert parquet_file.num_row_groups > 1
+    table = pq.read_table(
+        os.path.join(tmp_path, "iau.parquet"),
+        filters=[("body", "=", "Mars")],
+    )
+    assert set(table.column("naif_id").to_pylist()) == {499}
+
+
+def test_iter_process(library):
+    crs = library.process()
+    streamed = list(library.iter_process())
+    assert [naif_id for naif_id, _ in streamed] == list(crs.keys())
+    for naif_id, body_crs in streamed:
+        assert list(body_crs.keys()) == list(crs[naif_id].keys())
+
+
+def test_save_jsonl(library, tmp_path):
+    library.save_iter(library.iter_process(), "jsonl", batch_size=10)
+    with open(os.path.join(tmp_path, "iau.jsonl"), encoding="utf-8") as file:
+        records = [json.loads(line) for line in file]
+    mars = [record for record in records if record["code"] == 49910][0]
+    assert mars["naif_id"] == 499
+    assert mars["type"] == "Ocentric"
+    assert mars["projection"]["id"] == 10
+    assert mars["wkt"].startswith('PROJCRS["Mars (2015) - Sphere')